@@ -0,0 +1,70 @@
+"""Add keyset pagination indexes for list endpoints.
+
+Revision ID: 014
+Revises: 013
+Create Date: 2025-07-20
+
+List endpoints page with a seek on ``(created_at, id)`` instead of
+``LIMIT/OFFSET``.  Each index below matches one list query shape exactly -
+optional equality filter first, then the ``created_at DESC, id DESC`` sort
+key - so PostgreSQL can start the range scan at the cursor position and
+stop after ``limit`` rows without sorting.
+
+Indexes are built ``CONCURRENTLY`` so the migration does not block writes on
+the quote, policy, claim and customer tables.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "014"
+down_revision: str = "013"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (index name, table, leading equality column or None)
+KEYSET_INDEXES: list[tuple[str, str, str | None]] = [
+    ("ix_quotes_keyset", "quotes", None),
+    ("ix_quotes_customer_keyset", "quotes", "customer_id"),
+    ("ix_quotes_status_keyset", "quotes", "status"),
+    ("ix_policies_keyset", "policies", None),
+    ("ix_policies_customer_keyset", "policies", "customer_id"),
+    ("ix_policies_status_keyset", "policies", "status"),
+    ("ix_claims_keyset", "claims", None),
+    ("ix_claims_policy_keyset", "claims", "policy_id"),
+    ("ix_claims_status_keyset", "claims", "status"),
+    ("ix_customers_keyset", "customers", None),
+]
+
+
+def upgrade() -> None:
+    """Create composite (filter, created_at, id) indexes."""
+    with op.get_context().autocommit_block():
+        for name, table, leading in KEYSET_INDEXES:
+            columns = [sa.text("created_at DESC"), sa.text("id DESC")]
+            if leading:
+                columns.insert(0, sa.text(leading))
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Drop keyset pagination indexes."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(KEYSET_INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,197 @@
+"""Maintain monthly audit_logs partitions and index them for range scans.
+
+Revision ID: 015
+Revises: 014
+Create Date: 2025-07-22
+
+``audit_logs`` has been range-partitioned by ``created_at`` since revision
+004, but only January-April 2025 partitions were created and nothing ever
+added more, so every insert after that window failed.  This revision:
+
+* replaces ``create_monthly_audit_partition()`` with
+  ``ensure_audit_log_partitions(from_month, months_ahead)``, which creates
+  every missing monthly partition in the window and is safe to run on every
+  boot or from cron;
+* adds ``detach_expired_audit_partitions(retention_months)``, which detaches
+  partitions older than the retention period and moves them to the
+  ``audit_archive`` schema, where they can be dumped and dropped without
+  touching the live table;
+* swaps the B-tree on ``created_at`` for a BRIN index (append-only,
+  time-ordered data - a few pages per partition instead of one entry per
+  row) and adds ``(created_at DESC, id DESC)`` keyset indexes for paging
+  the audit trail.
+
+Indexes on a partitioned parent cannot be built ``CONCURRENTLY``; each
+partition is small, so the brief lock is acceptable here.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "015"
+down_revision: str = "014"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+ARCHIVE_SCHEMA = "audit_archive"
+
+# First month covered by revision 004's partitions.
+FIRST_PARTITION_MONTH = "2025-01-01"
+MONTHS_AHEAD = 3
+
+
+def upgrade() -> None:
+    """Create partition maintenance functions, backfill partitions, re-index."""
+    op.execute(f"CREATE SCHEMA IF NOT EXISTS {ARCHIVE_SCHEMA}")
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION ensure_audit_log_partitions(
+            from_month DATE,
+            months_ahead INTEGER
+        )
+        RETURNS INTEGER AS $$
+        DECLARE
+            month_start DATE := DATE_TRUNC('month', from_month);
+            last_month DATE := DATE_TRUNC(
+                'month', CURRENT_DATE + make_interval(months => months_ahead)
+            );
+            partition_name TEXT;
+            created INTEGER := 0;
+        BEGIN
+            WHILE month_start <= last_month LOOP
+                partition_name := 'audit_logs_' || TO_CHAR(month_start, 'YYYY_MM');
+                IF to_regclass(partition_name) IS NULL
+                   AND to_regclass('audit_archive.' || partition_name) IS NULL THEN
+                    EXECUTE format(
+                        'CREATE TABLE %I PARTITION OF audit_logs FOR VALUES FROM (%L) TO (%L)',
+                        partition_name,
+                        month_start,
+                        month_start + INTERVAL '1 month'
+                    );
+                    created := created + 1;
+                END IF;
+                month_start := month_start + INTERVAL '1 month';
+            END LOOP;
+            RETURN created;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION detach_expired_audit_partitions(
+            retention_months INTEGER
+        )
+        RETURNS SETOF TEXT AS $$
+        DECLARE
+            cutoff DATE := DATE_TRUNC(
+                'month', CURRENT_DATE - make_interval(months => retention_months)
+            );
+            child RECORD;
+        BEGIN
+            FOR child IN
+                SELECT c.relname
+                FROM pg_inherits i
+                JOIN pg_class c ON c.oid = i.inhrelid
+                WHERE i.inhparent = 'audit_logs'::regclass
+                  AND c.relname ~ '^audit_logs_[0-9]{4}_[0-9]{2}$'
+                  AND TO_DATE(SUBSTRING(c.relname FROM 12), 'YYYY_MM') < cutoff
+                ORDER BY c.relname
+            LOOP
+                EXECUTE format(
+                    'ALTER TABLE audit_logs DETACH PARTITION %I', child.relname
+                );
+                EXECUTE format(
+                    'ALTER TABLE %I SET SCHEMA audit_archive', child.relname
+                );
+                RETURN NEXT child.relname;
+            END LOOP;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+
+    # Keep the old entry point working for anything that still calls it.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION create_monthly_audit_partition()
+        RETURNS void AS $$
+        BEGIN
+            PERFORM ensure_audit_log_partitions(CURRENT_DATE, 1);
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+
+    op.execute(
+        f"SELECT ensure_audit_log_partitions("
+        f"DATE '{FIRST_PARTITION_MONTH}', {MONTHS_AHEAD})"
+    )
+
+    op.drop_index("ix_audit_logs_created_at", table_name="audit_logs")
+    op.drop_index("ix_audit_logs_user_id", table_name="audit_logs")
+    op.create_index(
+        "ix_audit_logs_created_at_brin",
+        "audit_logs",
+        ["created_at"],
+        unique=False,
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+    op.create_index(
+        "ix_audit_logs_keyset",
+        "audit_logs",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+    op.create_index(
+        "ix_audit_logs_user_keyset",
+        "audit_logs",
+        ["user_id", sa.text("created_at DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Restore revision 004 indexes and partition function."""
+    op.drop_index("ix_audit_logs_user_keyset", table_name="audit_logs")
+    op.drop_index("ix_audit_logs_keyset", table_name="audit_logs")
+    op.drop_index("ix_audit_logs_created_at_brin", table_name="audit_logs")
+    op.create_index("ix_audit_logs_user_id", "audit_logs", ["user_id"], unique=False)
+    op.create_index(
+        "ix_audit_logs_created_at", "audit_logs", ["created_at"], unique=False
+    )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION create_monthly_audit_partition()
+        RETURNS void AS $$
+        DECLARE
+            partition_date DATE;
+            partition_name TEXT;
+        BEGIN
+            partition_date := DATE_TRUNC('month', CURRENT_DATE + INTERVAL '1 month');
+            partition_name := 'audit_logs_' || TO_CHAR(partition_date, 'YYYY_MM');
+            IF NOT EXISTS (
+                SELECT 1 FROM pg_tables WHERE tablename = partition_name
+            ) THEN
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF audit_logs FOR VALUES FROM (%L) TO (%L)',
+                    partition_name,
+                    partition_date,
+                    partition_date + INTERVAL '1 month'
+                );
+            END IF;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute("DROP FUNCTION IF EXISTS detach_expired_audit_partitions(INTEGER)")
+    op.execute("DROP FUNCTION IF EXISTS ensure_audit_log_partitions(DATE, INTEGER)")
+    # Archived partitions are left in place; they hold retained evidence.
@@ -0,0 +1,109 @@
+"""Add Merkle tree nodes and signed checkpoints for audit_logs.
+
+Revision ID: 016
+Revises: 015
+Create Date: 2025-07-24
+
+``audit_merkle_nodes`` stores every completed perfect subtree of each
+partition's append-only Merkle tree; level 0 rows are the leaves and link
+back to their ``audit_logs`` row.  ``audit_checkpoints`` holds HMAC-signed
+tree heads, each chained to the previous checkpoint's signature.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "016"
+down_revision: str = "015"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create Merkle node and checkpoint tables."""
+    op.create_table(
+        "audit_merkle_nodes",
+        sa.Column("partition_key", sa.String(7), nullable=False),
+        sa.Column("level", sa.SmallInteger(), nullable=False),
+        sa.Column("node_index", sa.BigInteger(), nullable=False),
+        sa.Column("hash", postgresql.BYTEA(), nullable=False),
+        sa.Column("audit_log_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("partition_key", "level", "node_index"),
+        sa.CheckConstraint(
+            "(level = 0) = (audit_log_id IS NOT NULL)",
+            name="ck_audit_merkle_nodes_leaf_link",
+        ),
+    )
+    op.create_index(
+        "ix_audit_merkle_nodes_audit_log_id",
+        "audit_merkle_nodes",
+        ["audit_log_id"],
+        unique=True,
+        postgresql_where=sa.text("level = 0"),
+    )
+
+    op.create_table(
+        "audit_checkpoints",
+        sa.Column(
+            "id",
+            postgresql.UUID(as_uuid=True),
+            nullable=False,
+            server_default=sa.text("gen_random_uuid()"),
+        ),
+        sa.Column("partition_key", sa.String(7), nullable=False),
+        sa.Column("tree_size", sa.BigInteger(), nullable=False),
+        sa.Column("root_hash", postgresql.BYTEA(), nullable=False),
+        sa.Column("previous_hash", postgresql.BYTEA(), nullable=True),
+        sa.Column("signature", postgresql.BYTEA(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.CheckConstraint("tree_size > 0", name="ck_audit_checkpoints_tree_size"),
+    )
+    op.create_index(
+        "ix_audit_checkpoints_partition_size",
+        "audit_checkpoints",
+        ["partition_key", sa.text("tree_size DESC"), sa.text("created_at DESC")],
+        unique=False,
+    )
+
+    # Checkpoints are evidence: make them append-only.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION prevent_audit_checkpoint_changes()
+        RETURNS trigger AS $$
+        BEGIN
+            RAISE EXCEPTION 'audit checkpoints are append-only';
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER audit_checkpoints_append_only
+        BEFORE UPDATE OR DELETE ON audit_checkpoints
+        FOR EACH ROW EXECUTE FUNCTION prevent_audit_checkpoint_changes();
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop Merkle node and checkpoint tables."""
+    op.execute(
+        "DROP TRIGGER IF EXISTS audit_checkpoints_append_only ON audit_checkpoints"
+    )
+    op.execute("DROP FUNCTION IF EXISTS prevent_audit_checkpoint_changes()")
+    op.drop_index("ix_audit_checkpoints_partition_size", table_name="audit_checkpoints")
+    op.drop_table("audit_checkpoints")
+    op.drop_index("ix_audit_merkle_nodes_audit_log_id", table_name="audit_merkle_nodes")
+    op.drop_table("audit_merkle_nodes")
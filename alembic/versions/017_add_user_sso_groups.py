@@ -0,0 +1,56 @@
+"""Add user_sso_groups for set-based SSO group synchronization.
+
+Revision ID: 017
+Revises: 016
+Create Date: 2025-07-25
+
+``user_sso_groups`` holds the IdP groups each user had at their last SSO
+login, per provider.  ``SSOManager._sync_user_groups`` reconciles it with
+one DELETE of groups that disappeared and one INSERT of new ones, so the
+sync log records real additions and removals instead of the full list.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "017"
+down_revision: str = "016"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the user_sso_groups membership table."""
+    op.create_table(
+        "user_sso_groups",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("provider_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("group_name", sa.String(200), nullable=False),
+        sa.Column(
+            "synced_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        sa.ForeignKeyConstraint(
+            ["provider_id"], ["sso_provider_configs.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("user_id", "provider_id", "group_name"),
+    )
+    op.create_index(
+        "ix_user_sso_groups_provider_group",
+        "user_sso_groups",
+        ["provider_id", "group_name"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop the user_sso_groups membership table."""
+    op.drop_index("ix_user_sso_groups_provider_group", table_name="user_sso_groups")
+    op.drop_table("user_sso_groups")
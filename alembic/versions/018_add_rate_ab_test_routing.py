@@ -0,0 +1,100 @@
+"""Add rate A/B test routing tables and quote assignment columns.
+
+Revision ID: 018
+Revises: 017
+Create Date: 2025-07-28
+
+``RateManagementService.schedule_ab_test`` writes ``rate_ab_tests`` and the
+A/B analytics read ``quotes.ab_test_id``/``ab_test_group``, but neither
+existed in the schema.  ``rate_ab_test_assignments`` holds routing counts
+per test and group, which ``ABTestRouter`` adds to in batches.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "018"
+down_revision: str = "017"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create A/B routing tables and record assignments on quotes."""
+    op.create_table(
+        "rate_ab_tests",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("control_version_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("test_version_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("traffic_split", sa.Numeric(4, 3), nullable=False),
+        sa.Column("start_date", sa.Date(), nullable=False),
+        sa.Column("end_date", sa.Date(), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False, server_default="scheduled"),
+        sa.Column("created_by", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_rate_ab_tests")),
+        sa.CheckConstraint(
+            "traffic_split > 0 AND traffic_split < 1",
+            name=op.f("ck_rate_ab_tests_traffic_split"),
+        ),
+        sa.CheckConstraint(
+            "status IN ('scheduled', 'running', 'completed', 'cancelled')",
+            name=op.f("ck_rate_ab_tests_status"),
+        ),
+    )
+    op.create_index(
+        "ix_rate_ab_tests_status_end_date",
+        "rate_ab_tests",
+        ["status", "end_date"],
+        unique=False,
+    )
+
+    op.create_table(
+        "rate_ab_test_assignments",
+        sa.Column("test_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("group_name", sa.String(10), nullable=False),
+        sa.Column("assignments", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        sa.ForeignKeyConstraint(["test_id"], ["rate_ab_tests.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("test_id", "group_name"),
+    )
+
+    op.add_column("quotes", sa.Column("rate_version", sa.String(100), nullable=True))
+    op.add_column(
+        "quotes",
+        sa.Column("ab_test_id", postgresql.UUID(as_uuid=True), nullable=True),
+    )
+    op.add_column("quotes", sa.Column("ab_test_group", sa.String(10), nullable=True))
+    op.create_index(
+        "ix_quotes_ab_test_id",
+        "quotes",
+        ["ab_test_id"],
+        unique=False,
+        postgresql_where=sa.text("ab_test_id IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Drop A/B routing tables and quote assignment columns."""
+    op.drop_index("ix_quotes_ab_test_id", table_name="quotes")
+    op.drop_column("quotes", "ab_test_group")
+    op.drop_column("quotes", "ab_test_id")
+    op.drop_column("quotes", "rate_version")
+    op.drop_table("rate_ab_test_assignments")
+    op.drop_index("ix_rate_ab_tests_status_end_date", table_name="rate_ab_tests")
+    op.drop_table("rate_ab_tests")
@@ -0,0 +1,39 @@
+"""Add the rating breakdown column to quotes.
+
+Revision ID: 019
+Revises: 018
+Create Date: 2025-07-29
+
+``QuoteService.calculate_quote`` stores the facts the rating engine loaded
+and the intermediate kernel stages of each rating in
+``quotes.rating_breakdown`` so that recalculating an edited quote (or a new
+version of it) only recomputes the stages its changes affect.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "019"
+down_revision: str = "018"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add the rating breakdown column."""
+    op.add_column(
+        "quotes",
+        sa.Column(
+            "rating_breakdown", postgresql.JSONB(astext_type=sa.Text()), nullable=True
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop the rating breakdown column."""
+    op.drop_column("quotes", "rating_breakdown")
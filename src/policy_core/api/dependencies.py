@@ -18,7 +18,7 @@ from typing import TYPE_CHECKING
 
 import asyncpg
 from beartype import beartype
-from fastapi import Depends, Header, HTTPException, Security, status
+from fastapi import Depends, Header, HTTPException, Request, Security, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from redis.asyncio import Redis
 
@@ -29,6 +29,7 @@ from ..core.auth.sso_manager import SSOManager
 from ..core.cache import Cache, get_redis_client
 from ..core.config import Settings, get_settings
 from ..core.database import Database, get_database, get_db_session
+from ..core.pagination import KeysetCursor, decode_cursor
 from ..core.security import verify_jwt_token
 from ..models.admin import AdminUser
 from ..schemas.auth import CurrentUser
@@ -98,12 +99,14 @@ async def get_cache() -> Cache:
 
 @beartype
 async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Security(security),
     settings: Settings = Depends(get_settings),
 ) -> CurrentUser:
     """Validate JWT token and return current user.
 
     Args:
+        request: Current request; reuses claims verified by the middleware
         credentials: HTTP Bearer token from request
         settings: Application settings
 
@@ -136,7 +139,11 @@ async def get_current_user(
         )
 
     try:
-        payload = await verify_jwt_token(token, settings.jwt_secret)
+        payload = await verify_jwt_token(
+            token,
+            settings.jwt_secret,
+            claims=getattr(request.state, "token_claims", None),
+        )
         return CurrentUser(
             user_id=payload.sub,
             username=payload.sub,  # In real app, fetch from DB
@@ -158,12 +165,14 @@ async def get_current_user(
 
 @beartype
 async def get_optional_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials | None = Security(security),
     settings: Settings = Depends(get_settings),
 ) -> CurrentUser | None:
     """Optionally validate JWT token if provided.
 
     Args:
+        request: Current request
         credentials: Optional HTTP Bearer token
         settings: Application settings
 
@@ -174,7 +183,7 @@ async def get_optional_user(
         return None
 
     try:
-        return await get_current_user(credentials, settings)
+        return await get_current_user(request, credentials, settings)
     except HTTPException:
         return None
 
@@ -187,12 +196,15 @@ class PaginationParams:
         self,
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
     ) -> None:
         """Initialize pagination parameters.
 
         Args:
             skip: Number of records to skip (offset)
             limit: Maximum number of records to return
+            cursor: Opaque keyset cursor from a previous page; when present
+                it takes precedence over ``skip``
 
         Raises:
             HTTPException: If parameters are invalid
@@ -217,8 +229,20 @@ class PaginationParams:
                 detail="Limit cannot exceed 1000",
             )
 
+        self.after: KeysetCursor | None = None
+        if cursor:
+            decoded = decode_cursor(cursor)
+            if decoded.is_err():
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=decoded.unwrap_err(),
+                )
+            self.after = decoded.ok_value
+            skip = 0
+
         self.skip = skip
         self.limit = limit
+        self.cursor = cursor
 
 
 @beartype
@@ -262,6 +286,7 @@ async def get_optional_bearer_token(
 
 @beartype
 async def get_user_with_demo_fallback(
+    request: Request,
     credentials: HTTPAuthorizationCredentials | None = Depends(
         get_optional_bearer_token
     ),
@@ -273,6 +298,7 @@ async def get_user_with_demo_fallback(
     otherwise returns demo user for development/demo purposes.
 
     Args:
+        request: Current request
         credentials: Optional HTTP Bearer token
         settings: Application settings
 
@@ -292,7 +318,7 @@ async def get_user_with_demo_fallback(
     # If credentials provided, always validate (even in demo mode)
     if credentials:
         try:
-            return await get_current_user(credentials, settings)
+            return await get_current_user(request, credentials, settings)
         except HTTPException:
             # In demo mode, fall back to demo user if JWT fails
             if demo_mode:
@@ -466,11 +492,13 @@ async def get_quote_service(
 @beartype
 async def get_wizard_service(
     redis: Redis = Depends(get_redis),
+    quote_service: QuoteService = Depends(get_quote_service),
 ) -> QuoteWizardService:
     """Provide Quote Wizard service instance.
 
     Args:
         redis: Redis client
+        quote_service: Quote service used to price coverage options
 
     Returns:
         QuoteWizardService: Service instance for wizard operations
@@ -478,7 +506,7 @@ async def get_wizard_service(
     # Wrap redis in our cache interface
     cache = Cache(redis)
 
-    return QuoteWizardService(cache)
+    return QuoteWizardService(cache, quote_service)
 
 
 @beartype
@@ -15,7 +15,6 @@ from beartype import beartype
 from fastapi import Request, Response
 from fastapi.responses import JSONResponse
 from fastapi.security.utils import get_authorization_scheme_param
-from jose import jwt  # type: ignore[import-untyped]
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.status import HTTP_401_UNAUTHORIZED, HTTP_403_FORBIDDEN
 
@@ -24,7 +23,51 @@ from policy_core.core.config import get_settings
 from policy_core.core.database import get_db_session
 
 from ...api.response_patterns import ErrorResponse
-from ...core.auth.oauth2 import APIKeyManager, ScopeValidator
+from ...core.auth.oauth2 import APIKeyManager
+from ...core.auth.oauth2.scopes import parse_scope_string, scope_bit
+from ...core.auth.oauth2.token_verifier import get_token_verifier
+
+# Required scope per /api/v1/<resource> segment and HTTP method
+ROUTE_SCOPES: dict[str, dict[str, str]] = {
+    "quotes": {
+        "GET": "quote:read",
+        "POST": "quote:write",
+        "PUT": "quote:write",
+        "PATCH": "quote:write",
+        "DELETE": "quote:write",
+    },
+    "policies": {
+        "GET": "policy:read",
+        "POST": "policy:write",
+        "PUT": "policy:write",
+        "PATCH": "policy:write",
+        "DELETE": "policy:cancel",
+    },
+    "claims": {
+        "GET": "claim:read",
+        "POST": "claim:write",
+        "PUT": "claim:write",
+        "PATCH": "claim:write",
+    },
+}
+API_V1_PREFIX = "/api/v1/"
+
+
+def required_scope_for(path: str, method: str) -> str | None:
+    """Look up the scope an endpoint requires; None when unrestricted."""
+    if not path.startswith(API_V1_PREFIX):
+        return None
+    resource = path[len(API_V1_PREFIX) :].split("/", 1)[0]
+    if resource == "admin":
+        return "admin:clients"
+
+    scopes = ROUTE_SCOPES.get(resource)
+    if scopes is None:
+        return None
+    scope = scopes.get(method)
+    if scope is None and resource == "claims" and "approve" in path:
+        return "claim:approve"
+    return scope
 
 
 class OAuth2Middleware(BaseHTTPMiddleware):
@@ -47,6 +90,7 @@ class OAuth2Middleware(BaseHTTPMiddleware):
             "/api/v1/oauth2/token",
             "/api/v1/oauth2/authorize",
             "/api/v1/oauth2/.well-known/oauth-authorization-server",
+            "/api/v1/oauth2/.well-known/jwks.json",
         }
 
     @beartype
@@ -121,78 +165,69 @@ class OAuth2Middleware(BaseHTTPMiddleware):
         Returns:
             JSONResponse with error if validation fails, None if successful
         """
-        try:
-            # Decode token
-            payload = jwt.decode(
-                token,
-                self.settings.jwt_secret,
-                algorithms=[self.settings.jwt_algorithm],
+        # Verified claims come from the shared LRU; revocation is checked
+        # against the in-process set kept current over pub/sub.
+        verifier = get_token_verifier()
+        verified = verifier.verify(token)
+        if verified.is_err():
+            # Middleware returns Response directly for errors
+            error = ErrorResponse(error=verified.err_value or "Invalid token")
+            return JSONResponse(
+                status_code=HTTP_401_UNAUTHORIZED, content=error.model_dump()
             )
+        payload = verified.unwrap()
 
-            # Check if token is revoked
-            jti = payload.get("jti")
-            if jti:
-                redis = get_redis_client()
-                revoked = await redis.get(f"revoked_token:{jti}")
-                if revoked:
-                    # Middleware returns Response directly for errors
-                    error = ErrorResponse(error="Token has been revoked")
-                    return JSONResponse(
-                        status_code=HTTP_401_UNAUTHORIZED, content=error.model_dump()
-                    )
+        # Fall back to Redis only while the revocation feed is down
+        jti = payload.get("jti")
+        if jti and not verifier.revocations_synced:
+            redis = get_redis_client()
+            revoked = await redis.get(f"revoked_token:{jti}")
+            if revoked:
+                # Middleware returns Response directly for errors
+                error = ErrorResponse(error="Token has been revoked")
+                return JSONResponse(
+                    status_code=HTTP_401_UNAUTHORIZED, content=error.model_dump()
+                )
 
-            # Enhanced client validation with certificate support
-            client_id = payload.get("client_id")
-            if client_id:
-                # Check if client uses certificate authentication
-                client_cert = request.headers.get("X-Client-Certificate")
-                if client_cert:
-                    result = await self._validate_client_certificate(
-                        request, client_id, client_cert
-                    )
-                    if result:
-                        return result
-
-            # Store token info in request state
-            request.state.auth = {
-                "type": "oauth2",
-                "client_id": client_id,
-                "user_id": payload.get("sub"),
-                "scopes": payload.get("scope", "").split(),
-                "jti": jti,
-                "token_type": payload.get("typ", "access"),
-            }
-
-            # Check required scope for endpoint
-            required_scope = self._get_required_scope(request)
-            if required_scope:
-                token_scopes = request.state.auth["scopes"]
-                if not ScopeValidator.check_scope_permission(
-                    token_scopes, required_scope
-                ):
-                    # Middleware returns Response directly for errors
-                    error = ErrorResponse(
-                        error=f"Insufficient scope. Required: {required_scope}"
-                    )
-                    return JSONResponse(
-                        status_code=HTTP_403_FORBIDDEN, content=error.model_dump()
-                    )
+        # Enhanced client validation with certificate support
+        client_id = payload.get("client_id")
+        if client_id:
+            # Check if client uses certificate authentication
+            client_cert = request.headers.get("X-Client-Certificate")
+            if client_cert:
+                result = await self._validate_client_certificate(
+                    request, client_id, client_cert
+                )
+                if result:
+                    return result
 
-            # Success - token is valid
-            return None
+        # Store token info in request state; get_current_user reuses the
+        # verified claims instead of decoding the token again.
+        token_scopes, token_mask = parse_scope_string(payload.get("scope", ""))
+        request.state.token_claims = payload
+        request.state.auth = {
+            "type": "oauth2",
+            "client_id": client_id,
+            "user_id": payload.get("sub"),
+            "scopes": list(token_scopes),
+            "jti": jti,
+            "token_type": payload.get("typ", "access"),
+        }
 
-        except jwt.ExpiredSignatureError:
-            # Middleware returns Response directly for errors
-            error = ErrorResponse(error="Token has expired")
-            return JSONResponse(
-                status_code=HTTP_401_UNAUTHORIZED, content=error.model_dump()
-            )
-        except jwt.JWTError:
-            # Middleware returns Response directly for errors
-            error = ErrorResponse(error="Invalid token")
-            return JSONResponse(
-                status_code=HTTP_401_UNAUTHORIZED, content=error.model_dump()
-            )
+        # Check required scope for endpoint
+        required_scope = self._get_required_scope(request)
+        if required_scope:
+            if not token_mask & scope_bit(required_scope):
+                # Middleware returns Response directly for errors
+                error = ErrorResponse(
+                    error=f"Insufficient scope. Required: {required_scope}"
+                )
+                return JSONResponse(
+                    status_code=HTTP_403_FORBIDDEN, content=error.model_dump()
+                )
+
+        # Success - token is valid
+        return None
 
     @beartype
     async def _validate_api_key(
@@ -270,40 +305,7 @@ class OAuth2Middleware(BaseHTTPMiddleware):
         Returns:
             Required scope name or None
         """
-        # Map endpoints to required scopes
-        # This is a simplified mapping - in production, this would be more sophisticated
-        path = request.url.path
-        method = request.method
-
-        if path.startswith("/api/v1/quotes"):
-            if method == "GET":
-                return "quote:read"
-            elif method in ["POST", "PUT", "PATCH"]:
-                return "quote:write"
-            elif method == "DELETE":
-                return "quote:write"
-
-        elif path.startswith("/api/v1/policies"):
-            if method == "GET":
-                return "policy:read"
-            elif method in ["POST", "PUT", "PATCH"]:
-                return "policy:write"
-            elif method == "DELETE":
-                return "policy:cancel"
-
-        elif path.startswith("/api/v1/claims"):
-            if method == "GET":
-                return "claim:read"
-            elif method in ["POST", "PUT", "PATCH"]:
-                return "claim:write"
-            elif "approve" in path:
-                return "claim:approve"
-
-        elif path.startswith("/api/v1/admin"):
-            return "admin:clients"
-
-        # Default: no specific scope required
-        return None
+        return required_scope_for(request.url.path, request.method)
 
     @beartype
     async def _validate_client_certificate(
@@ -8,15 +8,13 @@
 
 """Admin quote management endpoints."""
 
-import csv
-import io
-import json
 from datetime import datetime
 from typing import Any
 from uuid import UUID
 
 from beartype import beartype
 from fastapi import APIRouter, Depends, Query, Response
+from fastapi.responses import FileResponse, StreamingResponse
 from pydantic import Field
 
 from policy_core.models.base import BaseModelConfig
@@ -24,6 +22,14 @@ from policy_core.models.base import BaseModelConfig
 from ....models.admin import AdminUser
 from ....models.quote import QuoteOverrideRequest
 from ....schemas.quote import QuoteResponse
+from ....services.quote_export import (
+    MEDIA_TYPES,
+    ExportFormat,
+    ExportJob,
+    ExportJobStatus,
+    QuoteExportFilters,
+    QuoteExportService,
+)
 from ....services.quote_service import QuoteService
 from ...dependencies import get_current_admin_user, get_quote_service
 from ...response_patterns import ErrorResponse
@@ -213,9 +219,9 @@ async def bulk_quote_operation(
                     )
 
         elif operation == "recalculate":
-            # Trigger recalculation
-            for quote_id in batch:
-                result = await quote_service.calculate_quote(quote_id)
+            # Re-rate the batch on the rating worker pool
+            recalculated = await quote_service.recalculate_quotes(batch)
+            for quote_id, result in zip(batch, recalculated, strict=True):
                 if result.is_ok():
                     results["successful"] += 1
                 else:
@@ -252,195 +258,106 @@ async def get_quote_analytics(
     return result.unwrap()
 
 
-@router.get("/export")
+@router.get("/export", response_model=None)
 @beartype
 async def export_quotes(
     response: Response,
-    format: str = Query("csv", regex="^(csv|json|excel)$"),
+    format: ExportFormat = Query(ExportFormat.CSV),
+    gzip: bool = Query(False, description="Gzip the stream (ignored for excel)"),
+    background: bool = Query(
+        False, description="Write the export to disk and return a job handle"
+    ),
     status: str | None = None,
     state: str | None = None,
     created_after: datetime | None = None,
     created_before: datetime | None = None,
     quote_service: QuoteService = Depends(get_quote_service),
     admin_user: AdminUser = Depends(get_current_admin_user),
-) -> dict[str, Any] | ErrorResponse:
-    """Export quotes in various formats."""
+) -> StreamingResponse | ExportJob | ErrorResponse:
+    """Export quotes as a constant-memory stream or a background job."""
     # Check permission
     if "quote:export" not in admin_user.effective_permissions:
         response.status_code = 403
         return ErrorResponse(error="Insufficient permissions")
 
-    # Build query
-    query_parts = ["SELECT * FROM quotes WHERE 1=1"]
-    params = []
-    param_count = 0
-
-    if status:
-        param_count += 1
-        query_parts.append(f"AND status = ${param_count}")
-        params.append(status)
-
-    if state:
-        param_count += 1
-        query_parts.append(f"AND state = ${param_count}")
-        params.append(state)
-
-    if created_after:
-        param_count += 1
-        query_parts.append(f"AND created_at >= ${param_count}")
-        params.append(str(created_after))
-
-    if created_before:
-        param_count += 1
-        query_parts.append(f"AND created_at <= ${param_count}")
-        params.append(str(created_before))
-
-    query = " ".join(query_parts)
-    rows = await quote_service._db.fetch(query, *params)
-
-    # Format data based on requested format
-    if format == "json":
-        data = [dict(row) for row in rows]
-        return {"format": "json", "count": len(data), "data": data}
-    elif format == "csv":
-        # Implement CSV export
-        if not rows:
-            return {
-                "format": "csv",
-                "count": 0,
-                "data": "",
-                "message": "No quotes found for export",
-            }
-
-        # Create CSV output
-        output = io.StringIO()
-
-        # Get column names from first row
-        headers = list(rows[0].keys())
-        writer = csv.DictWriter(output, fieldnames=headers)
-
-        # Write headers
-        writer.writeheader()
-
-        # Write data rows
-        for row in rows:
-            # Convert row to dict and handle JSON/UUID fields
-            row_dict = {}
-            for key, value in row.items():
-                if isinstance(value, (dict, list)):
-                    # Convert complex types to JSON strings
-                    row_dict[key] = json.dumps(value)
-                elif value is None:
-                    row_dict[key] = ""
-                else:
-                    row_dict[key] = str(value)
-            writer.writerow(row_dict)
-
-        csv_content = output.getvalue()
-        output.close()
-
-        return {
-            "format": "csv",
-            "count": len(rows),
-            "data": csv_content,
-            "filename": f"quotes_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-        }
-    else:
-        # Implement Excel export using openpyxl
-        try:
-            import openpyxl  # type: ignore[import-untyped]
-            import pandas as pd  # type: ignore[import-untyped]
-            from openpyxl.styles import (  # type: ignore[import-untyped]
-                Font,
-                PatternFill,
-            )
-            from openpyxl.utils.dataframe import (
-                dataframe_to_rows,  # type: ignore[import-untyped]
-            )
-
-        except ImportError:
-            # Graceful fallback if Excel libraries not available
-            return {
-                "format": "excel",
-                "count": len(rows),
-                "message": "Excel export requires openpyxl and pandas libraries. Please install with: pip install openpyxl pandas",
-                "fallback_csv": True,
-            }
-
-        if not rows:
-            return {
-                "format": "excel",
-                "count": 0,
-                "data": "",
-                "message": "No quotes found for export",
-            }
-
-        # Convert to DataFrame for easier Excel manipulation
-        data = []
-        for row in rows:
-            row_dict = {}
-            for key, value in row.items():
-                if isinstance(value, (dict, list)):
-                    # Convert complex types to JSON strings for Excel
-                    row_dict[key] = json.dumps(value)
-                elif value is None:
-                    row_dict[key] = ""
-                else:
-                    row_dict[key] = value
-            data.append(row_dict)
+    filters = QuoteExportFilters(
+        status=status,
+        state=state,
+        created_after=created_after,
+        created_before=created_before,
+    )
+    export_service = QuoteExportService(quote_service._db)
+
+    if background:
+        response.status_code = 202
+        return export_service.start_job(format, filters, admin_user.id, gzip)
+
+    # A gzipped export is a .gz file download, not a transfer encoding, so
+    # clients keep the compressed bytes instead of inflating them
+    compress = gzip and format != ExportFormat.EXCEL
+    headers = {
+        "Content-Disposition": (
+            f'attachment; filename="{export_service.filename(format, compress)}"'
+        )
+    }
 
-        df = pd.DataFrame(data)
+    return StreamingResponse(
+        export_service.stream(format, filters, compress),
+        media_type="application/gzip" if compress else MEDIA_TYPES[format],
+        headers=headers,
+    )
 
-        # Create Excel workbook
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "Quotes Export"
 
-        # Add headers with styling
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(
-            start_color="366092", end_color="366092", fill_type="solid"
-        )
+@router.get("/export/jobs/{job_id}")
+@beartype
+async def get_export_job(
+    job_id: UUID,
+    response: Response,
+    quote_service: QuoteService = Depends(get_quote_service),
+    admin_user: AdminUser = Depends(get_current_admin_user),
+) -> ExportJob | ErrorResponse:
+    """Get the status of a background export job."""
+    if "quote:export" not in admin_user.effective_permissions:
+        response.status_code = 403
+        return ErrorResponse(error="Insufficient permissions")
 
-        # Write DataFrame to worksheet
-        for r in dataframe_to_rows(df, index=False, header=True):
-            ws.append(r)
+    result = QuoteExportService(quote_service._db).get_job(job_id, admin_user.id)
+    if result.is_err():
+        response.status_code = 404
+        return ErrorResponse(error=result.unwrap_err())
 
-        # Style headers
-        for cell in ws[1]:
-            cell.font = header_font
-            cell.fill = header_fill
+    return result.unwrap()
 
-        # Auto-adjust column widths
-        for column in ws.columns:
-            max_length = 0
-            column = [cell for cell in column]
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except Exception:
-                    pass
-            adjusted_width = min(max_length + 2, 50)  # Cap at 50 characters
-            ws.column_dimensions[column[0].column_letter].width = adjusted_width
-
-        # Save to binary buffer
-        excel_buffer = io.BytesIO()
-        wb.save(excel_buffer)
-        excel_buffer.seek(0)
-
-        # Convert to base64 for JSON response
-        import base64
-
-        excel_b64 = base64.b64encode(excel_buffer.getvalue()).decode("utf-8")
-
-        return {
-            "format": "excel",
-            "count": len(rows),
-            "data": excel_b64,
-            "filename": f"quotes_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
-            "content_type": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        }
+
+@router.get("/export/jobs/{job_id}/download", response_model=None)
+@beartype
+async def download_export_job(
+    job_id: UUID,
+    response: Response,
+    quote_service: QuoteService = Depends(get_quote_service),
+    admin_user: AdminUser = Depends(get_current_admin_user),
+) -> FileResponse | ErrorResponse:
+    """Download the file produced by a completed background export."""
+    if "quote:export" not in admin_user.effective_permissions:
+        response.status_code = 403
+        return ErrorResponse(error="Insufficient permissions")
+
+    export_service = QuoteExportService(quote_service._db)
+    result = export_service.get_job(job_id, admin_user.id)
+    if result.is_err():
+        response.status_code = 404
+        return ErrorResponse(error=result.unwrap_err())
+
+    job = result.unwrap()
+    if job.status != ExportJobStatus.COMPLETED:
+        response.status_code = 409
+        return ErrorResponse(error=f"Export job is {job.status.value}")
+
+    return FileResponse(
+        export_service.job_file(job),
+        media_type="application/gzip" if job.gzip else MEDIA_TYPES[job.format],
+        filename=job.filename,
+    )
 
 
 @router.get("/approvals/pending")
@@ -269,6 +269,67 @@ async def compare_rate_versions(
     return result.unwrap()
 
 
+@router.post("/rate-versions/{current_version_id}/impact/{proposed_version_id}")
+@beartype
+async def simulate_rate_impact(
+    current_version_id: UUID,
+    proposed_version_id: UUID,
+    response: Response,
+    force_refresh: bool = False,
+    rate_service: RateManagementService = Depends(get_rate_management_service),
+    admin_user: AdminUser = Depends(get_current_admin_user),
+) -> dict[str, Any] | ErrorResponse:
+    """Start simulating a proposed rate version against the current book.
+
+    Requires 'rate:read' permission.
+    Re-rates every in-force policy and open quote under both versions in the
+    background and returns a job handle; poll
+    /rate-versions/impact-jobs/{job_id} for premium-change distributions by
+    state, territory, tier and coverage. Results are cached per version
+    pair unless force_refresh, and a running simulation of the same pair is
+    joined instead of started twice.
+    """
+    if "rate:read" not in admin_user.effective_permissions:
+        response.status_code = 403
+        return ErrorResponse(error="Insufficient permissions. Required: rate:read")
+
+    result = await rate_service.simulate_rate_impact(
+        current_version_id, proposed_version_id, admin_user.id, force_refresh
+    )
+
+    if result.is_err():
+        error_msg = result.unwrap_err()
+        response.status_code = 404 if "not found" in error_msg.lower() else 500
+        return ErrorResponse(error=error_msg)
+
+    response.status_code = 202
+    return result.unwrap().model_dump(mode="json")
+
+
+@router.get("/rate-versions/impact-jobs/{job_id}")
+@beartype
+async def get_rate_impact_job(
+    job_id: UUID,
+    response: Response,
+    rate_service: RateManagementService = Depends(get_rate_management_service),
+    admin_user: AdminUser = Depends(get_current_admin_user),
+) -> dict[str, Any] | ErrorResponse:
+    """Get the status of a rate impact simulation, with its result once done.
+
+    Requires 'rate:read' permission.
+    """
+    if "rate:read" not in admin_user.effective_permissions:
+        response.status_code = 403
+        return ErrorResponse(error="Insufficient permissions. Required: rate:read")
+
+    result = rate_service.get_rate_impact_job(job_id)
+    if result.is_err():
+        response.status_code = 404
+        return ErrorResponse(error=result.unwrap_err())
+
+    return result.unwrap().model_dump(mode="json")
+
+
 @router.post("/ab-tests")
 @beartype
 async def create_ab_test(
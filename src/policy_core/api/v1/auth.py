@@ -8,6 +8,7 @@
 
 """Authentication endpoints including SSO support."""
 
+import hashlib
 from uuid import uuid4
 
 import asyncpg
@@ -20,6 +21,7 @@ from policy_core.core.cache import Cache, get_cache
 from policy_core.core.database import Database, get_database
 
 from ...core.auth.sso_manager import SSOManager
+from ...core.password_hasher import PasswordHasherBusyError, get_password_hasher
 from ...core.result_types import Err
 from ...core.security import Security, get_security
 from ..dependencies import get_sso_manager
@@ -126,8 +128,14 @@ async def login(
             response,
         )
 
-    # Verify password
-    if not security.verify_password(request.password, user["password_hash"]):
+    # Verify password off the event loop
+    hasher = get_password_hasher()
+    try:
+        check = await hasher.verify_password(request.password, user["password_hash"])
+    except PasswordHasherBusyError as e:
+        return handle_result(Err(str(e)), response)
+
+    if not check.valid:
         # Update failed login attempts
         await db.execute(
             "UPDATE users SET failed_login_attempts = failed_login_attempts + 1 WHERE id = $1",
@@ -145,6 +153,21 @@ async def login(
         user["id"],
     )
 
+    # Transparently upgrade hashes made with an older work factor
+    if check.needs_rehash:
+        try:
+            new_hash = await hasher.hash_password(request.password)
+        except PasswordHasherBusyError:
+            new_hash = None  # Try again on a later login
+        if new_hash:
+            await db.execute(
+                "UPDATE users SET password_hash = $1 WHERE id = $2 AND password_hash = $3",
+                new_hash,
+                user["id"],
+                user["password_hash"],
+            )
+            hasher.record_rehash()
+
     # Create access token
     token_data = security.create_access_token(
         subject=str(user["id"]),
@@ -367,7 +390,8 @@ async def sso_callback(
         """,
         session_id,
         user.id,
-        security.hash_password(str(session_id)),  # Hash session token
+        # Random session id: a fast digest is enough, no KDF needed
+        hashlib.sha256(str(session_id).encode()).hexdigest(),
         f"sso_{provider}",
         provider,
         request.client.host if request and request.client else None,
@@ -26,6 +26,7 @@ from redis.asyncio import Redis
 from policy_core.api.response_patterns import ErrorResponse, handle_result
 from policy_core.core.cache import Cache
 from policy_core.core.database import Database
+from policy_core.core.pagination import next_cursor
 from policy_core.core.result_types import Err
 
 from ...models.claim import ClaimCreate as ServiceClaimCreate
@@ -236,6 +237,9 @@ class ClaimListResponse(BaseModel):
     total: int = Field(..., ge=0, description="Total number of claims")
     skip: int = Field(..., ge=0, description="Number of items skipped")
     limit: int = Field(..., ge=1, description="Maximum items returned")
+    next_cursor: str | None = Field(
+        None, description="Opaque cursor for the next page, None on the last page"
+    )
 
 
 class ClaimFilter(BaseModel):
@@ -293,7 +297,7 @@ async def list_claims(
     """List claims with pagination and filtering.
 
     Args:
-        pagination: Pagination parameters (skip, limit)
+        pagination: Pagination parameters (skip, limit, cursor)
         filters: Optional filters for claim query
         db: Database session
         redis: Redis client for caching
@@ -303,7 +307,10 @@ async def list_claims(
         ClaimListResponse: Paginated list of claims
     """
     # Check cache first
-    cache_key = f"claims:list:{pagination.skip}:{pagination.limit}:{hash(str(filters))}"
+    cache_key = (
+        f"claims:list:{pagination.cursor or pagination.skip}:{pagination.limit}:"
+        f"{hash(str(filters))}"
+    )
     cached_result = await redis.get(cache_key)
 
     if cached_result:
@@ -325,6 +332,7 @@ async def list_claims(
         status=filters.status.value if filters.status else None,
         limit=pagination.limit,
         offset=pagination.skip,
+        after=pagination.after,
     )
 
     if isinstance(result, Err):
@@ -363,21 +371,18 @@ async def list_claims(
         )
 
     # Get total count
-    count_result = await service.list(
+    count_result = await service.count(
         policy_id=filters.policy_id,
         status=filters.status.value if filters.status else None,
-        limit=1000000,
-        offset=0,
-    )
-
-    total = (
-        len(count_result.ok_value)
-        if count_result.is_ok() and count_result.ok_value is not None
-        else 0
     )
+    total = count_result.ok_value if count_result.is_ok() else 0
 
     list_response = ClaimListResponse(
-        items=claims, total=total, skip=pagination.skip, limit=pagination.limit
+        items=claims,
+        total=total,
+        skip=pagination.skip,
+        limit=pagination.limit,
+        next_cursor=next_cursor(claim_models, pagination.limit),
     )
 
     # Cache the result for 30 seconds (shorter due to frequent updates)
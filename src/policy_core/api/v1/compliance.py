@@ -14,6 +14,7 @@ including control execution, evidence collection, and compliance reporting.
 
 from datetime import datetime, timedelta, timezone
 from typing import Any
+from uuid import UUID
 
 from beartype import beartype
 from fastapi import APIRouter, Depends, Query, Response
@@ -23,16 +24,19 @@ from policy_core.api.dependencies import get_current_user
 from policy_core.api.response_patterns import ErrorResponse, handle_result
 from policy_core.compliance import (
     SOC2_CORE_CONTROLS,
+    AuditPipelineMetrics,
     AvailabilityControlManager,
     ConfidentialityControlManager,
     ControlFramework,
     PrivacyControlManager,
     ProcessingIntegrityManager,
+    RecordVerification,
     SecurityControlManager,
     TrustServiceCriteria,
     get_evidence_collector,
     get_testing_framework,
 )
+from policy_core.core.pagination import decode_cursor, next_cursor
 from policy_core.core.result_types import Err
 from policy_core.models.base import BaseModelConfig
 
@@ -355,6 +359,9 @@ class AuditTrailResponse(BaseModel):
     filters: FiltersData = Field(...)
     # SYSTEM_BOUNDARY - audit records aggregated from logger
     audit_records: list[dict[str, Any]] = Field(...)
+    next_cursor: str | None = Field(
+        default=None, description="Cursor for the next page; null on the last page"
+    )
 
 
 @router.get("/overview", response_model=ComplianceOverviewResponse)
@@ -901,41 +908,87 @@ async def get_audit_trail(
     end_date: datetime | None = Query(None, description="End date for audit trail"),
     control_id: str | None = Query(None, description="Filter by control ID"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records"),
+    cursor: str | None = Query(
+        None, description="Opaque cursor from a previous page's next_cursor"
+    ),
     current_user: CurrentUserData = Depends(get_current_user),
 ) -> AuditTrailResponse | ErrorResponse:
-    """Get compliance audit trail."""
+    """Get compliance audit trail, newest first."""
     try:
         from ...compliance.audit_logger import get_audit_logger
 
+        after = None
+        if cursor:
+            cursor_result = decode_cursor(cursor)
+            if cursor_result.is_err():
+                return handle_result(cursor_result, response)
+            after = cursor_result.ok_value
+
         audit_logger = get_audit_logger()
 
-        # Get audit trail
         trail_result = await audit_logger.get_audit_trail(
-            start_date=start_date, end_date=end_date, control_id=control_id, limit=limit
+            start_date=start_date,
+            end_date=end_date,
+            control_id=control_id,
+            limit=limit,
+            after=after,
         )
 
-        if trail_result.is_err():  # type: ignore[attr-defined]
-            return handle_result(trail_result, response)  # type: ignore[arg-type]
+        if trail_result.is_err():
+            return handle_result(trail_result, response)
 
-        audit_records = trail_result.ok_value  # type: ignore[attr-defined]
+        audit_records = trail_result.ok_value
 
         filters = {
-            "start_date": start_date.isoformat() if start_date else None,
-            "end_date": end_date.isoformat() if end_date else None,
-            "control_id": control_id,
-            "limit": limit,
+            "start_date": start_date.isoformat() if start_date else "",
+            "end_date": end_date.isoformat() if end_date else "",
+            "control_id": control_id or "",
+            "limit": str(limit),
         }
 
         return AuditTrailResponse(
             total_records=len(audit_records),
-            filters=filters,
-            audit_records=audit_records,
+            filters=FiltersData(metadata=filters),
+            audit_records=[record.model_dump(mode="json") for record in audit_records],
+            next_cursor=next_cursor(
+                [
+                    {"created_at": record.timestamp, "id": record.log_id}
+                    for record in audit_records
+                ],
+                limit,
+            ),
         )
 
     except Exception as e:
         return handle_result(Err(f"Failed to get audit trail: {str(e)}"), response)
 
 
+@router.get("/audit-trail/{audit_log_id}/verify", response_model=RecordVerification)
+@beartype
+async def verify_audit_record(
+    audit_log_id: UUID,
+    response: Response,
+    current_user: CurrentUserData = Depends(get_current_user),
+) -> RecordVerification | ErrorResponse:
+    """Prove an audit record against its signed hash-chain checkpoint."""
+    from ...compliance.audit_logger import get_audit_logger
+
+    return handle_result(
+        await get_audit_logger().chain.verify_record(audit_log_id), response
+    )
+
+
+@router.get("/audit-pipeline/metrics", response_model=AuditPipelineMetrics)
+@beartype
+async def get_audit_pipeline_metrics(
+    current_user: CurrentUserData = Depends(get_current_user),
+) -> AuditPipelineMetrics:
+    """Get audit writer queue depth, backpressure and drop counters."""
+    from ...compliance.audit_logger import get_audit_logger
+
+    return get_audit_logger().get_pipeline_metrics()
+
+
 @router.get("/health")
 @beartype
 async def compliance_health_check() -> dict[str, Any]:
@@ -28,6 +28,7 @@ from policy_core.api.response_patterns import (
 )
 from policy_core.core.cache import Cache
 from policy_core.core.database import Database
+from policy_core.core.pagination import KEYSET_ORDER_BY, keyset_predicate, next_cursor
 from policy_core.core.result_types import Err
 
 from ...models.customer import Customer, CustomerCreate, CustomerUpdate
@@ -54,6 +55,9 @@ class CustomerListResponse(BaseModel):
     total: int = Field(..., ge=0, description="Total number of customers")
     skip: int = Field(..., ge=0, description="Number of items skipped")
     limit: int = Field(..., ge=1, description="Maximum items returned")
+    next_cursor: str | None = Field(
+        None, description="Opaque cursor for the next page, None on the last page"
+    )
 
 
 class CustomerFilter(BaseModel):
@@ -97,7 +101,7 @@ async def list_customers(
     """List customers with pagination and filtering.
 
     Args:
-        pagination: Pagination parameters (skip, limit)
+        pagination: Pagination parameters (skip, limit, cursor)
         filters: Optional filters for customer query
         db: Database session
         redis: Redis client for caching
@@ -108,7 +112,8 @@ async def list_customers(
     """
     # Check cache first
     cache_key = (
-        f"customers:list:{pagination.skip}:{pagination.limit}:{hash(str(filters))}"
+        f"customers:list:{pagination.cursor or pagination.skip}:{pagination.limit}:"
+        f"{hash(str(filters))}"
     )
     cached_result = await redis.get(cache_key)
 
@@ -160,27 +165,36 @@ async def list_customers(
     total = await db.fetchval(count_query, *params)
 
     # Build main query with pagination
-    query = "SELECT * FROM customers"
+    query = "SELECT id, external_id, data, created_at, updated_at FROM customers"
+    if pagination.after:
+        param_num = len(params) + 1
+        where_clauses.append(keyset_predicate(param_num))
+        params.extend([pagination.after.created_at, pagination.after.id])
     if where_clauses:
         query += " WHERE " + " AND ".join(where_clauses)
 
-    query += " ORDER BY created_at DESC"
+    query += f" {KEYSET_ORDER_BY}"
 
     # Add pagination params
     param_num = len(params) + 1
     query += f" LIMIT ${param_num}"
-    params.append(str(pagination.limit))
+    params.append(pagination.limit)
 
-    param_num = len(params) + 1
-    query += f" OFFSET ${param_num}"
-    params.append(str(pagination.skip))
+    if not pagination.after:
+        param_num = len(params) + 1
+        query += f" OFFSET ${param_num}"
+        params.append(pagination.skip)
 
     # Execute query
     rows = await db.fetch(query, *params)
     customers = [service._row_to_customer(row) for row in rows]
 
     list_response = CustomerListResponse(
-        items=customers, total=total or 0, skip=pagination.skip, limit=pagination.limit
+        items=customers,
+        total=total or 0,
+        skip=pagination.skip,
+        limit=pagination.limit,
+        next_cursor=next_cursor(customers, pagination.limit),
     )
 
     # Cache the result for 60 seconds
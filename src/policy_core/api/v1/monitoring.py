@@ -15,7 +15,9 @@ from fastapi import APIRouter, Depends, Query, Response
 from pydantic import BaseModel, ConfigDict, Field
 
 from ...core.admin_query_optimizer import AdminQueryOptimizer
+from ...core.auth.oauth2.token_verifier import TokenVerifierStats, get_token_verifier
 from ...core.database import Database, get_database
+from ...core.password_hasher import PasswordHashingMetrics, get_password_hasher
 from ...core.performance_monitor import PerformanceMetrics, get_performance_collector
 from ...core.query_optimizer import QueryOptimizer
 from ...core.result_types import Err
@@ -1073,6 +1075,20 @@ async def reset_performance_metrics() -> PerformanceResetResponse:
     )
 
 
+@router.get("/password-hashing", response_model=PasswordHashingMetrics)
+@beartype
+async def get_password_hashing_metrics() -> PasswordHashingMetrics:
+    """Get password hashing pool latency (p50/p99) and admission counters."""
+    return get_password_hasher().metrics()
+
+
+@router.get("/token-verification", response_model=TokenVerifierStats)
+@beartype
+async def get_token_verification_stats() -> TokenVerifierStats:
+    """Get JWT claims cache hit rates and revocation filter state."""
+    return get_token_verifier().stats()
+
+
 @router.get("/performance/summary", response_model=PerformanceSummaryResponse)
 @beartype
 async def get_performance_summary() -> PerformanceSummaryResponse:
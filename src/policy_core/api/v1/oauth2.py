@@ -14,13 +14,15 @@ from uuid import UUID
 from beartype import beartype
 from fastapi import APIRouter, Depends, Form, Query, Request, Response
 from fastapi.responses import RedirectResponse
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 from policy_core.core.cache import Cache
 from policy_core.core.config import Settings, get_settings
 from policy_core.core.database import Database
 
 from ...core.auth.oauth2 import OAuth2Server
+from ...core.auth.oauth2.signing_keys import get_signing_key_ring
+from ...core.password_hasher import PasswordHasherBusyError
 from ..dependencies import get_db_connection, get_redis
 from ..response_patterns import ErrorResponse
 
@@ -65,6 +67,22 @@ class IntrospectRequest(BaseModel):
     token_type_hint: str | None = None
 
 
+class BatchIntrospectRequest(BaseModel):
+    """Batch token introspection request model."""
+
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        validate_assignment=True,
+        str_strip_whitespace=True,
+        validate_default=True,
+    )
+
+    tokens: list[str] = Field(..., min_length=1, max_length=100)
+    client_id: str | None = None
+    client_secret: str | None = None
+
+
 @beartype
 async def get_oauth2_server(
     db: Any = Depends(get_db_connection),
@@ -79,6 +97,12 @@ async def get_oauth2_server(
     return OAuth2Server(database, cache, settings)
 
 
+def _busy(response: Response, error: PasswordHasherBusyError) -> ErrorResponse:
+    """429 for a client secret check refused by the full hashing queue."""
+    response.status_code = 429
+    return ErrorResponse(error=str(error), error_code="temporarily_unavailable")
+
+
 @router.get("/authorize")
 @beartype
 async def authorize(
@@ -244,6 +268,9 @@ async def token(
 
     if result.is_err():
         error_str = result.unwrap_err()
+        if error_str.startswith("temporarily_unavailable"):
+            response.status_code = 429
+            return ErrorResponse(error=error_str, error_code="temporarily_unavailable")
         response.status_code = 400
         return ErrorResponse(error=error_str, error_code="invalid_request")
 
@@ -254,12 +281,13 @@ async def token(
 @router.post("/introspect")
 @beartype
 async def introspect(
+    response: Response,
     token: str = Form(...),
     token_type_hint: str | None = Form(None),
     client_id: str | None = Form(None),
     client_secret: str | None = Form(None),
     oauth2_server: OAuth2Server = Depends(get_oauth2_server),
-) -> dict[str, Any]:
+) -> dict[str, Any] | ErrorResponse:
     """OAuth2 token introspection endpoint.
 
     This endpoint allows resource servers to query the authorization server
@@ -275,23 +303,57 @@ async def introspect(
     Returns:
         Token introspection response
     """
-    return await oauth2_server.introspect(
-        token=token,
-        token_type_hint=token_type_hint,
-        client_id=client_id,
-        client_secret=client_secret,
-    )
+    try:
+        return await oauth2_server.introspect(
+            token=token,
+            token_type_hint=token_type_hint,
+            client_id=client_id,
+            client_secret=client_secret,
+        )
+    except PasswordHasherBusyError as e:
+        return _busy(response, e)
+
+
+@router.post("/introspect/batch")
+@beartype
+async def introspect_batch(
+    request: BatchIntrospectRequest,
+    response: Response,
+    oauth2_server: OAuth2Server = Depends(get_oauth2_server),
+) -> dict[str, Any] | ErrorResponse:
+    """Introspect up to 100 tokens in one round trip.
+
+    Results are returned in the order of ``tokens``, each shaped like a
+    single ``/introspect`` response.
+
+    Args:
+        request: Tokens and optional client credentials
+        oauth2_server: OAuth2 server instance
+
+    Returns:
+        Introspection responses under ``results``
+    """
+    try:
+        results = await oauth2_server.introspect_many(
+            request.tokens,
+            client_id=request.client_id,
+            client_secret=request.client_secret,
+        )
+    except PasswordHasherBusyError as e:
+        return _busy(response, e)
+    return {"results": results}
 
 
 @router.post("/revoke")
 @beartype
 async def revoke(
+    response: Response,
     token: str = Form(...),
     token_type_hint: str | None = Form(None),
     client_id: str | None = Form(None),
     client_secret: str | None = Form(None),
     oauth2_server: OAuth2Server = Depends(get_oauth2_server),
-) -> dict[str, str]:
+) -> dict[str, str] | ErrorResponse:
     """OAuth2 token revocation endpoint.
 
     This endpoint allows clients to notify the authorization server that a
@@ -307,12 +369,15 @@ async def revoke(
     Returns:
         Empty response on success
     """
-    await oauth2_server.revoke(
-        token=token,
-        token_type_hint=token_type_hint,
-        client_id=client_id,
-        client_secret=client_secret,
-    )
+    try:
+        await oauth2_server.revoke(
+            token=token,
+            token_type_hint=token_type_hint,
+            client_id=client_id,
+            client_secret=client_secret,
+        )
+    except PasswordHasherBusyError as e:
+        return _busy(response, e)
 
     # OAuth2 spec says to always return 200 OK, even if token was invalid
     return {"status": "ok"}
@@ -348,6 +413,7 @@ async def oauth_metadata(
         ],
         "introspection_endpoint": f"{base_url}/api/v1/oauth2/introspect",
         "revocation_endpoint": f"{base_url}/api/v1/oauth2/revoke",
+        "jwks_uri": f"{base_url}/api/v1/oauth2/.well-known/jwks.json",
         "response_types_supported": ["code", "token"],
         "grant_types_supported": [
             "authorization_code",
@@ -379,6 +445,30 @@ async def oauth_metadata(
     }
 
 
+@router.get("/.well-known/jwks.json")
+@beartype
+async def jwks(
+    response: Response,
+    settings: Settings = Depends(get_settings),
+) -> dict[str, Any]:
+    """Public keys for verifying access tokens (RFC 7517).
+
+    Lists every local signing key, including retired keys whose tokens
+    may still be live.  The set is empty while tokens are signed with the
+    shared secret.
+
+    Args:
+        response: FastAPI response object
+        settings: Application settings
+
+    Returns:
+        JWK set
+    """
+    max_age = settings.jwt_jwks_max_age_seconds
+    response.headers["Cache-Control"] = f"public, max-age={max_age}"
+    return get_signing_key_ring().jwks()
+
+
 @router.get("/health")
 @beartype
 async def oauth2_health(
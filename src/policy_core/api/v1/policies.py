@@ -24,6 +24,7 @@ from redis.asyncio import Redis
 from policy_core.api.response_patterns import ErrorResponse, handle_result
 from policy_core.core.cache import Cache
 from policy_core.core.database import Database
+from policy_core.core.pagination import next_cursor
 from policy_core.core.result_types import Err
 
 from ...models.policy import (
@@ -60,6 +61,9 @@ class PolicyListResponse(BaseModel):
     total: int = Field(..., ge=0, description="Total number of policies")
     skip: int = Field(..., ge=0, description="Number of items skipped")
     limit: int = Field(..., ge=1, description="Maximum items returned")
+    next_cursor: str | None = Field(
+        None, description="Opaque cursor for the next page, None on the last page"
+    )
 
 
 class PolicyFilter(BaseModel):
@@ -93,7 +97,7 @@ async def list_policies(
     """List policies with pagination and filtering.
 
     Args:
-        pagination: Pagination parameters (skip, limit)
+        pagination: Pagination parameters (skip, limit, cursor)
         filters: Optional filters for policy query
         db: Database session
         redis: Redis client for caching
@@ -104,7 +108,8 @@ async def list_policies(
     """
     # Check cache first
     cache_key = (
-        f"policies:list:{pagination.skip}:{pagination.limit}:{hash(str(filters))}"
+        f"policies:list:{pagination.cursor or pagination.skip}:{pagination.limit}:"
+        f"{hash(str(filters))}"
     )
     cached_result = await redis.get(cache_key)
 
@@ -129,6 +134,7 @@ async def list_policies(
             status=filters.status.value if filters.status else None,
             limit=pagination.limit,
             offset=pagination.skip,
+            after=pagination.after,
         )
 
         if isinstance(result, Err):
@@ -137,24 +143,18 @@ async def list_policies(
         policies = result.ok_value
 
         # Get total count (using same filters)
-        count_result = await service.list(
+        count_result = await service.count(
             customer_id=filters.customer_id,
             status=filters.status.value if filters.status else None,
-            limit=1000000,  # Large limit to get all
-            offset=0,
-        )
-
-        total = (
-            len(count_result.ok_value)
-            if count_result.is_ok() and count_result.ok_value is not None
-            else 0
         )
+        total = count_result.ok_value if count_result.is_ok() else 0
 
         list_response = PolicyListResponse(
             items=policies,
             total=total,
             skip=pagination.skip,
             limit=pagination.limit,
+            next_cursor=next_cursor(policies, pagination.limit),
         )
         break  # Use the first (and only) yielded connection
 
@@ -18,6 +18,7 @@ from fastapi import APIRouter, BackgroundTasks, Depends, Query, Response
 from pydantic import BaseModel, ConfigDict, Field
 
 from policy_core.api.response_patterns import APIResponseHandler, ErrorResponse
+from policy_core.core.pagination import decode_cursor, next_cursor
 from policy_core.models.base import BaseModelConfig
 
 from ...models.quote import (
@@ -34,6 +35,8 @@ from ...schemas.quote import (
     QuoteResponse,
     QuoteSearchResponse,
     QuoteUpdateRequest,
+    QuoteVariationRequest,
+    QuoteVariationResponse,
     WizardSessionResponse,
 )
 from ...services.performance_monitor import performance_tracker
@@ -298,6 +301,27 @@ async def calculate_quote(
     return _convert_quote_to_response(quote)
 
 
+@router.post("/{quote_id}/variations")
+@beartype
+async def price_quote_variations(
+    quote_id: UUID,
+    variation_request: QuoteVariationRequest,
+    response: Response,
+    quote_service: QuoteService = Depends(get_quote_service),
+    current_user: User | None = Depends(get_optional_user),
+) -> QuoteVariationResponse | ErrorResponse:
+    """Price a what-if grid of coverage limits and deductibles for a quote."""
+    result = await quote_service.price_quote_variations(
+        quote_id, variation_request.axes
+    )
+
+    if result.is_err():
+        return _handle_service_error(result.unwrap_err(), response)
+
+    response.status_code = 200
+    return result.unwrap()
+
+
 @router.post("/{quote_id}/convert", status_code=201)
 @beartype
 async def convert_to_policy(
@@ -334,14 +358,30 @@ async def search_quotes(
     created_before: datetime | None = None,
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None, description="Opaque cursor from next_cursor"),
+    include_details: bool = Query(
+        False, description="Include rating and AI factor breakdowns"
+    ),
     quote_service: QuoteService = Depends(get_quote_service),
     current_user: User | None = Depends(get_optional_user),
 ) -> QuoteSearchResponse | ErrorResponse:
-    """Search quotes with filters."""
+    """Search quotes with filters.
+
+    Pass the returned ``next_cursor`` back as ``cursor`` to page with a
+    keyset seek; ``offset`` is only honoured when no cursor is supplied.
+    """
     # If user is logged in, only show their quotes
     if current_user and current_user.role not in [UserRole.ADMIN, UserRole.SUPER_ADMIN]:
         customer_id = current_user.id
 
+    after = None
+    if cursor:
+        decoded = decode_cursor(cursor)
+        if decoded.is_err():
+            return _handle_service_error(decoded.unwrap_err(), response)
+        after = decoded.ok_value
+        offset = 0
+
     result = await quote_service.search_quotes(
         customer_id=customer_id,
         status=status,
@@ -350,6 +390,8 @@ async def search_quotes(
         created_before=created_before,
         limit=limit,
         offset=offset,
+        after=after,
+        summary=not include_details,
     )
 
     if result.is_err():
@@ -367,6 +409,7 @@ async def search_quotes(
         total=len(quotes),
         limit=limit,
         offset=offset,
+        next_cursor=next_cursor(quotes, limit),
     )
 
 
@@ -19,7 +19,10 @@ The framework implements enterprise-grade compliance automation, evidence collec
 and continuous monitoring to meet SOC 2 Type II requirements.
 """
 
+from .audit_chain import AuditChain, AuditCheckpoint, RecordVerification
 from .audit_logger import AuditLogger, ComplianceEvent
+from .audit_partitions import AuditPartitionMaintenance, PartitionMaintenanceReport
+from .audit_pipeline import AuditPipeline, AuditPipelineMetrics
 from .availability_controls import AvailabilityControlManager
 from .confidentiality_controls import ConfidentialityControlManager
 from .control_framework import (
@@ -37,6 +40,13 @@ from .security_controls import SecurityControlManager
 __all__ = [
     "AuditLogger",
     "ComplianceEvent",
+    "AuditChain",
+    "AuditCheckpoint",
+    "RecordVerification",
+    "AuditPipeline",
+    "AuditPipelineMetrics",
+    "AuditPartitionMaintenance",
+    "PartitionMaintenanceReport",
     "ControlFramework",
     "ControlType",
     "TrustServiceCriteria",
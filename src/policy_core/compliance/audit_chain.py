@@ -0,0 +1,539 @@
+# PolicyCore - Policy Decision Management System
+# Copyright (C) 2025 Luiz Frias <luizf35@gmail.com>
+# Form F[x] Labs
+#
+# This software is dual-licensed under AGPL-3.0 and Commercial License.
+# For commercial licensing, contact: luizf35@gmail.com
+# See LICENSE file for full terms.
+
+"""Tamper-evident Merkle log over ``audit_logs``.
+
+Every monthly ``audit_logs`` partition has an append-only Merkle tree using
+the RFC 6962 hashing rules (``0x00`` leaf prefix, ``0x01`` node prefix).
+The audit writer extends the tree in the same transaction that COPYs a
+batch.  Only completed perfect subtrees are stored in ``audit_merkle_nodes``,
+about two rows per record.  Appending a batch reads just the ``O(log n)``
+current peaks, so the tree is never rehashed.
+
+Periodically the writer stores an HMAC-signed checkpoint with the partition's
+tree size and root.  Each checkpoint also includes the previous checkpoint's
+signature, so the checkpoints form a hash chain of their own.  To verify a
+record, recompute its leaf from the row and fetch ``O(log n)`` sibling
+nodes.  The root that results must equal the signed checkpoint root.
+"""
+
+import hashlib
+import hmac
+import json
+import time
+from collections.abc import Mapping, Sequence
+from datetime import datetime, timezone
+from decimal import Decimal
+from ipaddress import IPv4Address, IPv4Interface, IPv6Address, IPv6Interface
+from typing import Any
+from uuid import UUID
+
+from beartype import beartype
+from pydantic import BaseModel, ConfigDict, Field
+
+from policy_core.core.result_types import Err, Ok, Result
+
+from ..core.config import get_settings
+
+AUDIT_LOG_COLUMNS: tuple[str, ...] = (
+    "id",
+    "user_id",
+    "ip_address",
+    "user_agent",
+    "session_id",
+    "action",
+    "resource_type",
+    "resource_id",
+    "request_method",
+    "request_path",
+    "request_body",
+    "response_status",
+    "risk_score",
+    "security_alerts",
+    "created_at",
+)
+
+_JSON_COLUMNS = frozenset({"request_body", "security_alerts"})
+_LEAF_PREFIX = b"\x00"
+_NODE_PREFIX = b"\x01"
+_SCORE_QUANTUM = Decimal("0.01")
+
+_MODEL_CONFIG = ConfigDict(
+    frozen=True,
+    extra="forbid",
+    validate_assignment=True,
+    str_strip_whitespace=True,
+    validate_default=True,
+)
+
+
+class ProofStep(BaseModel):
+    """One sibling hash on the path from a leaf to the root."""
+
+    model_config = _MODEL_CONFIG
+
+    hash: str = Field(..., min_length=64, max_length=64, description="Hex digest")
+    left: bool = Field(..., description="Whether the sibling is the left child")
+
+
+class AuditCheckpoint(BaseModel):
+    """Signed Merkle root for a partition at a given size."""
+
+    model_config = _MODEL_CONFIG
+
+    partition_key: str = Field(..., pattern=r"^\d{4}_\d{2}$")
+    tree_size: int = Field(..., ge=1)
+    root_hash: str = Field(..., min_length=64, max_length=64)
+    previous_hash: str | None = Field(default=None)
+    signature: str = Field(..., min_length=64, max_length=64)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class RecordVerification(BaseModel):
+    """Result of checking one audit record against its checkpoint."""
+
+    model_config = _MODEL_CONFIG
+
+    audit_log_id: UUID
+    partition_key: str
+    leaf_index: int = Field(..., ge=0)
+    tree_size: int = Field(..., ge=1)
+    expected_root: str
+    actual_root: str
+    proof_length: int = Field(..., ge=0)
+    verified: bool
+
+
+# Hashing primitives
+
+
+def _canonical(column: str, value: Any) -> Any:
+    """Normalize a column value so COPY input and fetched rows hash alike."""
+    if value is None:
+        return None
+    if column in _JSON_COLUMNS and isinstance(value, str):
+        value = json.loads(value)
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc).isoformat()
+    if isinstance(value, Decimal):
+        return str(value.quantize(_SCORE_QUANTUM))
+    if isinstance(value, (IPv4Interface, IPv6Interface)):
+        return str(value.ip)
+    if isinstance(value, (UUID, IPv4Address, IPv6Address)):
+        return str(value)
+    return value
+
+
+@beartype
+def leaf_hash(values: Mapping[str, Any]) -> bytes:
+    """Hash an ``audit_logs`` row given as a column -> value mapping."""
+    payload = json.dumps(
+        [_canonical(column, values.get(column)) for column in AUDIT_LOG_COLUMNS],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(_LEAF_PREFIX + payload.encode()).digest()
+
+
+@beartype
+def node_hash(left: bytes, right: bytes) -> bytes:
+    """Hash two child nodes."""
+    return hashlib.sha256(_NODE_PREFIX + left + right).digest()
+
+
+@beartype
+def partition_key(created_at: datetime) -> str:
+    """Monthly partition suffix (``YYYY_MM``) a timestamp falls in."""
+    if created_at.tzinfo is not None:
+        created_at = created_at.astimezone(timezone.utc)
+    return f"{created_at.year:04d}_{created_at.month:02d}"
+
+
+@beartype
+def peak_positions(tree_size: int) -> list[tuple[int, int]]:
+    """``(level, index)`` of the perfect subtrees making up a tree, left first."""
+    positions: list[tuple[int, int]] = []
+    offset = 0
+    for level in range(tree_size.bit_length() - 1, -1, -1):
+        if tree_size & (1 << level):
+            positions.append((level, offset >> level))
+            offset += 1 << level
+    return positions
+
+
+@beartype
+def bag_peaks(peaks: Sequence[bytes]) -> bytes:
+    """Fold peaks right to left into the RFC 6962 tree head."""
+    root = peaks[-1]
+    for peak in reversed(peaks[:-1]):
+        root = node_hash(peak, root)
+    return root
+
+
+@beartype
+def root_from_proof(leaf: bytes, path: Sequence[ProofStep]) -> bytes:
+    """Recompute the root implied by an inclusion proof."""
+    acc = leaf
+    for step in path:
+        sibling = bytes.fromhex(step.hash)
+        acc = node_hash(sibling, acc) if step.left else node_hash(acc, sibling)
+    return acc
+
+
+@beartype
+def proof_positions(
+    leaf_index: int, tree_size: int
+) -> tuple[list[tuple[int, int]], list[tuple[int, int]], list[tuple[int, int]]]:
+    """Stored nodes needed to prove ``leaf_index`` in a tree of ``tree_size``.
+
+    Returns the siblings inside the leaf's peak (bottom up), the peaks to its
+    right (bagged into one step) and the peaks to its left (nearest first).
+    """
+    peaks = peak_positions(tree_size)
+    for position, (level, index) in enumerate(peaks):
+        if index << level <= leaf_index < (index + 1) << level:
+            siblings = [(depth, (leaf_index >> depth) ^ 1) for depth in range(level)]
+            return siblings, peaks[position + 1 :], list(reversed(peaks[:position]))
+    raise ValueError(f"Leaf {leaf_index} is outside a tree of size {tree_size}")
+
+
+class MerkleFrontier:
+    """Right edge of a Merkle tree, enough to append without rehashing."""
+
+    def __init__(self, tree_size: int, peaks: list[tuple[int, int, bytes]]) -> None:
+        """Start from ``tree_size`` leaves whose peaks are ``(level, index, hash)``."""
+        self.tree_size = tree_size
+        self._peaks = peaks
+
+    def append(self, leaf: bytes) -> list[tuple[int, int, bytes]]:
+        """Add a leaf; return every node completed by it, leaf first."""
+        created = [(0, self.tree_size, leaf)]
+        self._peaks.append(created[0])
+        self.tree_size += 1
+        while len(self._peaks) > 1 and self._peaks[-1][0] == self._peaks[-2][0]:
+            level, index, right = self._peaks.pop()
+            _, _, left = self._peaks.pop()
+            parent = (level + 1, index >> 1, node_hash(left, right))
+            self._peaks.append(parent)
+            created.append(parent)
+        return created
+
+    def root(self) -> bytes:
+        """Current tree head."""
+        return bag_peaks([peak for _, _, peak in self._peaks])
+
+
+class AuditChain:
+    """Maintains, checkpoints and verifies the per-partition Merkle trees."""
+
+    def __init__(
+        self,
+        database: Any,
+        checkpoint_interval: float | None = None,
+        signing_key: str | None = None,
+    ) -> None:
+        """Configure from settings unless overridden."""
+        settings = get_settings()
+        self._database = database
+        self._checkpoint_interval = (
+            checkpoint_interval
+            if checkpoint_interval is not None
+            else settings.audit_checkpoint_interval_seconds
+        )
+        self._key = (signing_key or settings.secret_key).encode()
+        self._last_checkpoint: dict[str, float] = {}
+
+    def sign(self, partition: str, tree_size: int, root: str, previous: str) -> str:
+        """HMAC over a checkpoint's fields."""
+        message = f"{partition}:{tree_size}:{root}:{previous}".encode()
+        return hmac.new(self._key, message, hashlib.sha256).hexdigest()
+
+    async def append(self, conn: Any, rows: Sequence[Mapping[str, Any]]) -> None:
+        """Extend the trees with freshly inserted rows.
+
+        Must run in the transaction that inserted ``rows``; the advisory lock
+        serializes writers from every process on the same partition.
+        """
+        by_partition: dict[str, list[Mapping[str, Any]]] = {}
+        for row in rows:
+            by_partition.setdefault(partition_key(row["created_at"]), []).append(row)
+
+        for partition, partition_rows in by_partition.items():
+            await conn.execute(
+                "SELECT pg_advisory_xact_lock(hashtext($1))", f"audit_chain:{partition}"
+            )
+            frontier = await self._load_frontier(conn, partition)
+
+            nodes: list[tuple[Any, ...]] = []
+            for row in partition_rows:
+                for level, index, digest in frontier.append(leaf_hash(row)):
+                    leaf = level == 0
+                    nodes.append(
+                        (
+                            partition,
+                            level,
+                            index,
+                            digest,
+                            row["id"] if leaf else None,
+                            row["created_at"] if leaf else None,
+                        )
+                    )
+            await conn.copy_records_to_table(
+                "audit_merkle_nodes",
+                records=nodes,
+                columns=(
+                    "partition_key",
+                    "level",
+                    "node_index",
+                    "hash",
+                    "audit_log_id",
+                    "created_at",
+                ),
+            )
+
+            now = time.monotonic()
+            last = self._last_checkpoint.get(partition)
+            if last is None or now - last >= self._checkpoint_interval:
+                await self._store_checkpoint(conn, partition, frontier)
+                self._last_checkpoint[partition] = now
+
+    async def _load_frontier(self, conn: Any, partition: str) -> MerkleFrontier:
+        tree_size = await conn.fetchval(
+            "SELECT COALESCE(MAX(node_index) + 1, 0) FROM audit_merkle_nodes "
+            "WHERE partition_key = $1 AND level = 0",
+            partition,
+        )
+        positions = peak_positions(tree_size or 0)
+        found = await self._fetch_nodes(conn, partition, positions)
+        return MerkleFrontier(
+            tree_size or 0,
+            [(level, index, found[(level, index)]) for level, index in positions],
+        )
+
+    @staticmethod
+    async def _fetch_nodes(
+        conn: Any, partition: str, positions: Sequence[tuple[int, int]]
+    ) -> dict[tuple[int, int], bytes]:
+        if not positions:
+            return {}
+        rows = await conn.fetch(
+            "SELECT n.level, n.node_index, n.hash FROM audit_merkle_nodes n "
+            "JOIN unnest($2::smallint[], $3::bigint[]) AS p(level, node_index) "
+            "USING (level, node_index) WHERE n.partition_key = $1",
+            partition,
+            [level for level, _ in positions],
+            [index for _, index in positions],
+        )
+        found = {(row["level"], row["node_index"]): bytes(row["hash"]) for row in rows}
+        missing = [position for position in positions if position not in found]
+        if missing:
+            raise LookupError(f"Merkle nodes missing for {partition}: {missing}")
+        return found
+
+    async def _store_checkpoint(
+        self, conn: Any, partition: str, frontier: MerkleFrontier
+    ) -> AuditCheckpoint:
+        previous = await conn.fetchval(
+            "SELECT signature FROM audit_checkpoints WHERE partition_key = $1 "
+            "ORDER BY tree_size DESC, created_at DESC LIMIT 1",
+            partition,
+        )
+        previous_hash = bytes(previous).hex() if previous else None
+        root = frontier.root().hex()
+        checkpoint = AuditCheckpoint(
+            partition_key=partition,
+            tree_size=frontier.tree_size,
+            root_hash=root,
+            previous_hash=previous_hash,
+            signature=self.sign(
+                partition, frontier.tree_size, root, previous_hash or ""
+            ),
+        )
+        await conn.execute(
+            "INSERT INTO audit_checkpoints (partition_key, tree_size, root_hash, "
+            "previous_hash, signature, created_at) VALUES ($1, $2, $3, $4, $5, $6)",
+            partition,
+            checkpoint.tree_size,
+            bytes.fromhex(checkpoint.root_hash),
+            bytes.fromhex(previous_hash) if previous_hash else None,
+            bytes.fromhex(checkpoint.signature),
+            checkpoint.created_at,
+        )
+        return checkpoint
+
+    @beartype
+    async def verify_record(
+        self, audit_log_id: UUID
+    ) -> Result[RecordVerification, str]:
+        """Prove one audit record against the newest checkpoint covering it."""
+        try:
+            async with self._database.transaction() as conn:
+                leaf = await conn.fetchrow(
+                    "SELECT partition_key, node_index, created_at "
+                    "FROM audit_merkle_nodes WHERE audit_log_id = $1 AND level = 0",
+                    audit_log_id,
+                )
+                if leaf is None:
+                    return Err(f"Audit record {audit_log_id} is not in the hash chain")
+                partition, leaf_index = leaf["partition_key"], leaf["node_index"]
+
+                checkpoint_row = await conn.fetchrow(
+                    "SELECT tree_size, root_hash, previous_hash, signature "
+                    "FROM audit_checkpoints "
+                    "WHERE partition_key = $1 AND tree_size > $2 "
+                    "ORDER BY tree_size DESC, created_at DESC LIMIT 1",
+                    partition,
+                    leaf_index,
+                )
+                if checkpoint_row is None:
+                    return Err(f"No checkpoint yet covers audit record {audit_log_id}")
+                checkpoint = self._checkpoint_from_row(partition, checkpoint_row)
+                if not self._signature_valid(checkpoint):
+                    return Err(
+                        f"Checkpoint signature invalid for partition {partition}"
+                    )
+
+                record = await conn.fetchrow(
+                    f"SELECT {', '.join(AUDIT_LOG_COLUMNS)} FROM audit_logs "  # nosec B608
+                    "WHERE id = $1 AND created_at = $2",
+                    audit_log_id,
+                    leaf["created_at"],
+                )
+                path = await self._proof(
+                    conn, partition, leaf_index, checkpoint.tree_size
+                )
+        except Exception as e:
+            return Err(f"Audit record verification failed: {str(e)}")
+
+        actual = root_from_proof(leaf_hash(dict(record)), path).hex() if record else ""
+        return Ok(
+            RecordVerification(
+                audit_log_id=audit_log_id,
+                partition_key=partition,
+                leaf_index=leaf_index,
+                tree_size=checkpoint.tree_size,
+                expected_root=checkpoint.root_hash,
+                actual_root=actual,
+                proof_length=len(path),
+                verified=hmac.compare_digest(actual, checkpoint.root_hash),
+            )
+        )
+
+    async def _proof(
+        self, conn: Any, partition: str, leaf_index: int, tree_size: int
+    ) -> list[ProofStep]:
+        siblings, right, left = proof_positions(leaf_index, tree_size)
+        nodes = await self._fetch_nodes(conn, partition, siblings + right + left)
+
+        path = [
+            ProofStep(hash=nodes[position].hex(), left=bool((leaf_index >> depth) & 1))
+            for depth, position in enumerate(siblings)
+        ]
+        if right:
+            path.append(
+                ProofStep(
+                    hash=bag_peaks([nodes[position] for position in right]).hex(),
+                    left=False,
+                )
+            )
+        path.extend(
+            ProofStep(hash=nodes[position].hex(), left=True) for position in left
+        )
+        return path
+
+    @beartype
+    async def verify_checkpoints(
+        self, partition: str
+    ) -> Result[list[AuditCheckpoint], str]:
+        """Check signatures, the checkpoint chain and the latest root.
+
+        The latest root is recomputed from the stored peaks, which costs
+        ``O(log n)`` reads however large the partition is.
+        """
+        try:
+            async with self._database.transaction() as conn:
+                rows = await conn.fetch(
+                    "SELECT tree_size, root_hash, previous_hash, signature "
+                    "FROM audit_checkpoints WHERE partition_key = $1 "
+                    "ORDER BY tree_size, created_at",
+                    partition,
+                )
+                checkpoints = [
+                    self._checkpoint_from_row(partition, row) for row in rows
+                ]
+                if not checkpoints:
+                    return Ok([])
+                latest = checkpoints[-1]
+                positions = peak_positions(latest.tree_size)
+                nodes = await self._fetch_nodes(conn, partition, positions)
+        except Exception as e:
+            return Err(f"Checkpoint verification failed: {str(e)}")
+
+        previous: str | None = None
+        for checkpoint in checkpoints:
+            if not self._signature_valid(checkpoint):
+                return Err(
+                    f"Checkpoint signature invalid: {partition}@{checkpoint.tree_size}"
+                )
+            if checkpoint.previous_hash != previous:
+                return Err(
+                    f"Checkpoint chain broken: {partition}@{checkpoint.tree_size}"
+                )
+            previous = checkpoint.signature
+
+        root = bag_peaks([nodes[position] for position in positions]).hex()
+        if not hmac.compare_digest(root, latest.root_hash):
+            return Err(f"Merkle nodes do not match checkpoint for {partition}")
+        return Ok(checkpoints)
+
+    @beartype
+    async def sample_leaves(self, limit: int = 20) -> Result[list[UUID], str]:
+        """Random chained record ids for continuous spot checks.
+
+        Block sampling keeps the check cheap on a large trail; a small trail
+        may have no sampled page at all, so a short sample is topped up by
+        sorting the whole (small) table randomly instead.
+        """
+        try:
+            rows = await self._database.fetch(
+                "SELECT audit_log_id FROM audit_merkle_nodes "
+                "TABLESAMPLE SYSTEM (1) WHERE level = 0 LIMIT $1",
+                limit,
+            )
+            if len(rows) < limit:
+                rows = await self._database.fetch(
+                    "SELECT audit_log_id FROM audit_merkle_nodes "
+                    "WHERE level = 0 ORDER BY random() LIMIT $1",
+                    limit,
+                )
+        except Exception as e:
+            return Err(f"Failed to sample audit chain: {str(e)}")
+        return Ok([row["audit_log_id"] for row in rows])
+
+    def _checkpoint_from_row(self, partition: str, row: Any) -> AuditCheckpoint:
+        return AuditCheckpoint(
+            partition_key=partition,
+            tree_size=row["tree_size"],
+            root_hash=bytes(row["root_hash"]).hex(),
+            previous_hash=(
+                bytes(row["previous_hash"]).hex() if row["previous_hash"] else None
+            ),
+            signature=bytes(row["signature"]).hex(),
+        )
+
+    def _signature_valid(self, checkpoint: AuditCheckpoint) -> bool:
+        expected = self.sign(
+            checkpoint.partition_key,
+            checkpoint.tree_size,
+            checkpoint.root_hash,
+            checkpoint.previous_hash or "",
+        )
+        return hmac.compare_digest(expected, checkpoint.signature)
@@ -14,7 +14,7 @@ timestamped, and include complete context for SOC 2 evidence collection.
 """
 
 import json
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 from typing import Any
 from uuid import UUID, uuid4
@@ -26,7 +26,11 @@ from policy_core.core.result_types import Err, Ok, Result
 from policy_core.schemas.common import EvidenceContent
 from policy_core.schemas.compliance import AuditLogEntry
 
+from ..core.config import get_settings
 from ..core.database import get_database
+from ..core.pagination import KEYSET_ORDER_BY, KeysetCursor, keyset_predicate
+from .audit_chain import AuditChain
+from .audit_pipeline import AuditPipeline, AuditPipelineMetrics
 
 
 class AuditEventType(str, Enum):
@@ -211,137 +215,120 @@ class ComplianceEvent(BaseModel):
         )
 
 
+_AUDIT_TRAIL_COLUMNS = (
+    "id, created_at, user_id, ip_address, user_agent, action, resource_type, "
+    "resource_id, request_method, request_path, request_body, response_status, "
+    "risk_score, security_alerts"
+)
+
+
+def _json_column(value: Any) -> dict[str, Any]:
+    """Decode a jsonb value whether or not the pool registered a codec."""
+    if not value:
+        return {}
+    if isinstance(value, str):
+        value = json.loads(value)
+    return value if isinstance(value, dict) else {}
+
+
+def _row_to_audit_log_entry(row: Any) -> AuditLogEntry:
+    """Convert an ``audit_logs`` row into a structured entry."""
+    # Import here to avoid circular imports
+    from policy_core.schemas.compliance import RequestBodyData, SecurityAlerts
+
+    request_body = _json_column(row["request_body"])
+    metadata = _json_column(row["security_alerts"])
+
+    request_body_data = None
+    if request_body:
+        request_body_data = RequestBodyData(
+            endpoint=row["request_path"],
+            method=row["request_method"],
+            payload_size=len(json.dumps(request_body).encode("utf-8")),
+            content_type="application/json",
+        )
+
+    resource_id = metadata.get("resource_ref") or row["resource_id"]
+    risk_level = metadata.get("risk_level", RiskLevel.INFO.value)
+
+    return AuditLogEntry(
+        log_id=row["id"],
+        timestamp=row["created_at"],
+        event_type=metadata.get("event_type") or row["action"],
+        user_id=row["user_id"],
+        ip_address=str(row["ip_address"]) if row["ip_address"] else None,
+        user_agent=row["user_agent"],
+        action=row["action"],
+        resource_type=row["resource_type"],
+        resource_id=str(resource_id) if resource_id else None,
+        request_method=row["request_method"],
+        request_path=row["request_path"],
+        request_body=request_body_data,
+        response_status=row["response_status"],
+        risk_level=risk_level,
+        risk_score=float(row["risk_score"] or 0.0),
+        control_references=metadata.get("control_references", []),
+        compliance_tags=metadata.get("compliance_tags", []),
+        evidence_references=metadata.get("evidence_references", []),
+        error_details=metadata.get("error_details"),
+        security_alerts=SecurityAlerts(
+            alerts=[],
+            total_alerts=0,
+            critical_count=0,
+            high_count=0,
+            medium_count=0,
+            low_count=0,
+        ),
+    )
+
+
 class AuditLogger:
     """Enterprise audit logger for SOC 2 compliance."""
 
     def __init__(self, database: Any = None) -> None:
         """Initialize audit logger with database connection."""
         self._database = database or get_database()
-        self._batch_size = 100
-        self._pending_events: list[ComplianceEvent] = []
+        self._pipeline = AuditPipeline(self._database)
 
     @beartype
     async def log_event(self, event: ComplianceEvent) -> Result[None, str]:
-        """Log a single compliance event."""
+        """Log a single compliance event.
+
+        High-risk events return once they are fsynced to the local spool;
+        everything else is buffered.  Neither path waits on PostgreSQL.
+        """
         try:
-            # Immediate write for high-risk events
             if event.risk_level in [RiskLevel.CRITICAL, RiskLevel.HIGH]:
-                await self._write_event_to_database(event)
-            else:
-                # Batch write for lower-risk events
-                self._pending_events.append(event)
-                if len(self._pending_events) >= self._batch_size:
-                    await self._flush_pending_events()
+                await self._pipeline.submit_durable(event)
+            elif not self._pipeline.submit(event):
+                return Err("Audit queue full: low-risk event dropped")
 
             return Ok(None)
 
         except Exception as e:
             return Err(f"Failed to log audit event: {str(e)}")
 
-    @beartype
-    async def _write_event_to_database(self, event: ComplianceEvent) -> None:
-        """Write single event to database."""
-        audit_entry = event.to_audit_log_entry()
-        audit_record = audit_entry.model_dump()
-
-        query = """
-            INSERT INTO audit_logs (
-                id, user_id, ip_address, user_agent, session_id,
-                action, resource_type, resource_id,
-                request_method, request_path, request_body,
-                response_status, risk_score, security_alerts,
-                created_at
-            ) VALUES (
-                $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15
-            )
-        """
+    async def start(self) -> None:
+        """Replay spooled events and start the background writer."""
+        await self._pipeline.start()
 
-        await self._database.execute(
-            query,
-            audit_record["log_id"],
-            audit_record["user_id"],
-            audit_record["ip_address"],
-            audit_record["user_agent"],
-            audit_record["session_id"],
-            audit_record["action"],
-            audit_record["resource_type"],
-            audit_record["resource_id"],
-            audit_record["request_method"],
-            audit_record["request_path"],
-            json.dumps(audit_record["request_body"]),
-            audit_record["response_status"],
-            audit_record["risk_score"],
-            json.dumps(
-                {
-                    "control_references": audit_record["control_references"],
-                    "compliance_tags": audit_record["compliance_tags"],
-                    "evidence_references": audit_record["evidence_references"],
-                }
-            ),
-            audit_record["timestamp"],
-        )
+    async def flush(self) -> None:
+        """Write all buffered events to the database now."""
+        await self._pipeline.flush()
 
-    @beartype
-    async def _flush_pending_events(self) -> None:
-        """Flush all pending events to database."""
-        if not self._pending_events:
-            return
-
-        # Batch insert for efficiency
-        values = []
-        for event in self._pending_events:
-            audit_entry = event.to_audit_log_entry()
-            audit_record = audit_entry.model_dump()
-            values.extend(
-                [
-                    audit_record["log_id"],
-                    audit_record["user_id"],
-                    audit_record["ip_address"],
-                    audit_record["user_agent"],
-                    audit_record["session_id"],
-                    audit_record["action"],
-                    audit_record["resource_type"],
-                    audit_record["resource_id"],
-                    audit_record["request_method"],
-                    audit_record["request_path"],
-                    json.dumps(audit_record["request_body"]),
-                    audit_record["response_status"],
-                    audit_record["risk_score"],
-                    json.dumps(
-                        {
-                            "control_references": audit_record["control_references"],
-                            "compliance_tags": audit_record["compliance_tags"],
-                            "evidence_references": audit_record["evidence_references"],
-                        }
-                    ),
-                    audit_record["timestamp"],
-                ]
-            )
+    async def close(self) -> None:
+        """Drain the pipeline and stop the background writer."""
+        await self._pipeline.close()
 
-        # Generate placeholders for batch insert
-        placeholders = []
-        for i in range(len(self._pending_events)):
-            base = i * 15
-            placeholders.append(
-                f"(${base+1}, ${base+2}, ${base+3}, ${base+4}, ${base+5}, "
-                f"${base+6}, ${base+7}, ${base+8}, ${base+9}, ${base+10}, "
-                f"${base+11}, ${base+12}, ${base+13}, ${base+14}, ${base+15})"
-            )
-
-        # Safe query construction - placeholders are parameterized, not string concatenated
-        query = """
-            INSERT INTO audit_logs (
-                id, user_id, ip_address, user_agent, session_id,
-                action, resource_type, resource_id,
-                request_method, request_path, request_body,
-                response_status, risk_score, security_alerts,
-                created_at
-            ) VALUES """ + ", ".join(
-            placeholders
-        )
+    @property
+    def chain(self) -> AuditChain:
+        """Tamper-evidence chain over the audit records this logger writes."""
+        return self._pipeline.chain
 
-        await self._database.execute(query, *values)
-        self._pending_events.clear()
+    @beartype
+    def get_pipeline_metrics(self) -> AuditPipelineMetrics:
+        """Queue depth, backpressure and drop counters for the pipeline."""
+        return self._pipeline.metrics()
 
     # Convenience methods for common audit events
 
@@ -529,128 +516,58 @@ class AuditLogger:
         event_type: AuditEventType | None = None,
         control_id: str | None = None,
         limit: int = 1000,
-    ) -> list[AuditLogEntry]:
-        """Retrieve audit trail for compliance reporting."""
+        after: KeysetCursor | None = None,
+    ) -> Result[list[AuditLogEntry], str]:
+        """Retrieve audit trail for compliance reporting.
+
+        The query is always bounded on ``created_at`` so PostgreSQL only
+        scans the monthly partitions in range; without ``start_date`` it
+        looks back ``audit_trail_default_days``.  Pages are fetched newest
+        first with a keyset cursor rather than an offset.
+        """
         try:
-            conditions = []
-            params = []
-            param_count = 0
+            end = end_date or datetime.now(timezone.utc)
+            if after is not None and after.created_at < end:
+                # Also prunes partitions newer than the cursor.
+                end = after.created_at
+            start = start_date or end - timedelta(
+                days=get_settings().audit_trail_default_days
+            )
 
-            if start_date:
-                param_count += 1
-                conditions.append(f"created_at >= ${param_count}")
-                params.append(str(start_date))
+            conditions = ["created_at >= $1", "created_at <= $2"]
+            params: list[Any] = [start, end]
 
-            if end_date:
-                param_count += 1
-                conditions.append(f"created_at <= ${param_count}")
-                params.append(str(end_date))
+            if after is not None:
+                conditions.append(keyset_predicate(len(params) + 1))
+                params.extend([after.created_at, after.id])
 
             if user_id:
-                param_count += 1
-                conditions.append(f"user_id = ${param_count}")
-                params.append(str(user_id))
+                params.append(user_id)
+                conditions.append(f"user_id = ${len(params)}")
 
             if event_type:
-                param_count += 1
-                conditions.append(f"action LIKE ${param_count}")
-                params.append(f"%{event_type.value}%")
+                params.append({"event_type": event_type.value})
+                conditions.append(f"security_alerts @> ${len(params)}")
 
             if control_id:
-                param_count += 1
-                conditions.append(
-                    f"security_alerts->'control_references' @> ${param_count}"
-                )
-                params.append(json.dumps([control_id]))
-
-            where_clause = "WHERE " + " AND ".join(conditions) if conditions else ""
-
-            param_count += 1
-            # Safe query construction - where_clause is built from parameterized conditions
-            query = (
-                """
-                SELECT * FROM audit_logs
-                """
-                + where_clause
-                + f"""
-                ORDER BY created_at DESC
-                LIMIT ${param_count}
-            """
-            )
-            params.append(str(limit))
+                params.append({"control_references": [control_id]})
+                conditions.append(f"security_alerts @> ${len(params)}")
+
+            params.append(limit)
+            # Safe query construction - conditions only reference bound parameters
+            query = f"""
+                SELECT {_AUDIT_TRAIL_COLUMNS}
+                FROM audit_logs
+                WHERE {" AND ".join(conditions)}
+                {KEYSET_ORDER_BY}
+                LIMIT ${len(params)}
+            """  # nosec B608
 
             rows = await self._database.fetch(query, *params)
+            return Ok([_row_to_audit_log_entry(row) for row in rows])
 
-            # Convert rows to structured audit log entries
-            audit_records = []
-            for row in rows:
-                record = dict(row)
-                # Parse JSON fields
-                request_body = {}
-                if record.get("request_body"):
-                    request_body = json.loads(record["request_body"])
-
-                security_alerts = {}
-                if record.get("security_alerts"):
-                    security_alerts = json.loads(record["security_alerts"])
-
-                # Import here to avoid circular imports
-                from policy_core.schemas.compliance import (
-                    RequestBodyData,
-                    SecurityAlerts,
-                )
-
-                # Convert request_body dict to RequestBodyData if present
-                request_body_data = None
-                if request_body:
-                    request_body_data = RequestBodyData(
-                        endpoint=record.get("request_path"),
-                        method=record.get("request_method"),
-                        payload_size=(
-                            len(str(request_body).encode("utf-8"))
-                            if request_body
-                            else 0
-                        ),
-                        content_type="application/json",
-                    )
-
-                # Create security alerts from parsed data
-                security_alerts_data = SecurityAlerts(
-                    alerts=[],
-                    total_alerts=0,
-                    critical_count=0,
-                    high_count=0,
-                    medium_count=0,
-                    low_count=0,
-                )
-
-                # Create structured audit log entry
-                audit_entry = AuditLogEntry(
-                    log_id=record["id"],
-                    timestamp=record["created_at"],
-                    event_type=record.get("action", "unknown"),
-                    user_id=record.get("user_id"),
-                    ip_address=record.get("ip_address"),
-                    user_agent=record.get("user_agent"),
-                    action=record.get("action", "unknown"),
-                    resource_type=record.get("resource_type"),
-                    resource_id=record.get("resource_id"),
-                    request_method=record.get("request_method"),
-                    request_path=record.get("request_path"),
-                    request_body=request_body_data,
-                    response_status=record.get("response_status"),
-                    risk_score=record.get("risk_score", 0.0),
-                    control_references=security_alerts.get("control_references", []),
-                    compliance_tags=security_alerts.get("compliance_tags", []),
-                    evidence_references=security_alerts.get("evidence_references", []),
-                    security_alerts=security_alerts_data,
-                )
-                audit_records.append(audit_entry)
-
-            return audit_records
-
-        except Exception:
-            return []
+        except Exception as e:
+            return Err(f"Failed to retrieve audit trail: {str(e)}")
 
     async def __aenter__(self) -> "AuditLogger":
         """Async context manager entry."""
@@ -658,8 +575,7 @@ class AuditLogger:
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Async context manager exit - flush any pending events."""
-        if self._pending_events:
-            await self._flush_pending_events()
+        await self._pipeline.flush()
 
 
 # Global audit logger instance
@@ -0,0 +1,116 @@
+# PolicyCore - Policy Decision Management System
+# Copyright (C) 2025 Luiz Frias <luizf35@gmail.com>
+# Form F[x] Labs
+#
+# This software is dual-licensed under AGPL-3.0 and Commercial License.
+# For commercial licensing, contact: luizf35@gmail.com
+# See LICENSE file for full terms.
+
+"""Monthly partition maintenance for ``audit_logs``.
+
+Partitions are created ahead of time so inserts never hit a missing range,
+and partitions older than the retention period are detached into the
+``audit_archive`` schema.  Both steps call SQL functions installed by
+migration 015, are idempotent, and run once at startup and then on a fixed
+interval.
+"""
+
+import asyncio
+import contextlib
+import logging
+from datetime import date, datetime, timezone
+from typing import Any
+
+from beartype import beartype
+from pydantic import BaseModel, ConfigDict, Field
+
+from policy_core.core.result_types import Err, Ok, Result
+
+from ..core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class PartitionMaintenanceReport(BaseModel):
+    """Outcome of one maintenance run."""
+
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        validate_assignment=True,
+        str_strip_whitespace=True,
+        validate_default=True,
+    )
+
+    partitions_created: int = Field(..., ge=0)
+    partitions_detached: list[str] = Field(default_factory=list)
+    ran_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class AuditPartitionMaintenance:
+    """Create upcoming and archive expired ``audit_logs`` partitions."""
+
+    def __init__(self, database: Any) -> None:
+        """Initialize with a database exposing ``fetchval``/``fetch``."""
+        settings = get_settings()
+        self._database = database
+        self._months_ahead = settings.audit_partition_months_ahead
+        self._retention_months = settings.audit_log_retention_months
+        self._interval = settings.audit_partition_maintenance_hours * 3600
+        self._task: asyncio.Task[None] | None = None
+
+    @beartype
+    async def run(self) -> Result[PartitionMaintenanceReport, str]:
+        """Ensure future partitions exist and detach expired ones."""
+        try:
+            today = datetime.now(timezone.utc).date()
+            created = await self._database.fetchval(
+                "SELECT ensure_audit_log_partitions($1, $2)",
+                date(today.year, today.month, 1),
+                self._months_ahead,
+            )
+            rows = await self._database.fetch(
+                "SELECT detach_expired_audit_partitions($1) AS name",
+                self._retention_months,
+            )
+        except Exception as e:
+            return Err(f"Audit partition maintenance failed: {str(e)}")
+
+        detached = [row["name"] for row in rows]
+        if created or detached:
+            logger.info(
+                "Audit partitions: %d created, %d archived (%s)",
+                created or 0,
+                len(detached),
+                ", ".join(detached),
+            )
+        return Ok(
+            PartitionMaintenanceReport(
+                partitions_created=created or 0, partitions_detached=detached
+            )
+        )
+
+    async def start(self) -> Result[PartitionMaintenanceReport, str]:
+        """Run once now, then keep running every maintenance interval."""
+        result = await self.run()
+        if self._task is None:
+            self._task = asyncio.create_task(
+                self._loop(), name="audit-partition-maintenance"
+            )
+        return result
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            result = await self.run()
+            if result.is_err():
+                logger.warning(result.unwrap_err())
+
+    async def stop(self) -> None:
+        """Cancel the periodic task."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
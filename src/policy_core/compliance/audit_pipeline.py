@@ -0,0 +1,648 @@
+# PolicyCore - Policy Decision Management System
+# Copyright (C) 2025 Luiz Frias <luizf35@gmail.com>
+# Form F[x] Labs
+#
+# This software is dual-licensed under AGPL-3.0 and Commercial License.
+# For commercial licensing, contact: luizf35@gmail.com
+# See LICENSE file for full terms.
+
+"""Asynchronous audit-log write pipeline.
+
+Audit events never touch PostgreSQL on the request path.  They are appended
+to an in-memory buffer that a background writer drains with one
+``INSERT ... SELECT FROM unnest(...)`` per batch either when ``batch_size``
+events are waiting or every ``flush_interval`` seconds, whichever comes
+first, so quiet nodes still persist promptly.  Binary ``COPY`` is not an
+option: pool connections register a text-format jsonb codec, which COPY
+cannot encode.
+
+A batch the database rejects for its data (a constraint or type error) is
+split until the offending rows are isolated; those are written to a local
+dead-letter file and the rest of the batch goes through.  Any other failure
+requeues the batch for an idempotent retry.
+
+CRITICAL and HIGH events additionally go through :class:`AuditSpool`, an
+append-only JSON-lines file.  The caller waits only for the spool fsync -
+which is group-committed across concurrent callers - and never for the
+database.  Spool segments are deleted once every event in them has been
+copied into ``audit_logs``; anything left over after a crash is replayed
+idempotently on the next startup.  Each process holds an exclusive
+``flock`` on its segments, so a worker starting next to live siblings only
+replays segments whose owner has exited.
+
+When the buffer is full, low-risk events are dropped and counted rather
+than blocking callers; durable events are never dropped because they are
+already on disk.
+"""
+
+import asyncio
+import contextlib
+import fcntl
+import ipaddress
+import json
+import logging
+import os
+import time
+from collections import deque
+from decimal import Decimal
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+import asyncpg
+from beartype import beartype
+from pydantic import BaseModel, ConfigDict, Field
+
+from ..core.config import get_settings
+from .audit_chain import AUDIT_LOG_COLUMNS, AuditChain
+
+if TYPE_CHECKING:
+    from .audit_logger import ComplianceEvent
+
+logger = logging.getLogger(__name__)
+
+
+SPOOL_SUFFIX = ".spool"
+DEAD_LETTER_FILE = "dead-letter.jsonl"
+
+# Column types for the unnest() insert, in AUDIT_LOG_COLUMNS order.  jsonb
+# values are sent as text and cast by the server.
+_COLUMN_TYPES: dict[str, str] = {
+    "id": "uuid",
+    "user_id": "uuid",
+    "ip_address": "inet",
+    "user_agent": "text",
+    "session_id": "uuid",
+    "action": "text",
+    "resource_type": "text",
+    "resource_id": "uuid",
+    "request_method": "text",
+    "request_path": "text",
+    "request_body": "jsonb",
+    "response_status": "int4",
+    "risk_score": "numeric",
+    "security_alerts": "jsonb",
+    "created_at": "timestamptz",
+}
+
+
+def _insert_statement(idempotent: bool) -> str:
+    columns = ", ".join(AUDIT_LOG_COLUMNS)
+    json_columns = {c for c, kind in _COLUMN_TYPES.items() if kind == "jsonb"}
+    arrays = ", ".join(
+        f"${position}::{'text' if column in json_columns else _COLUMN_TYPES[column]}[]"
+        for position, column in enumerate(AUDIT_LOG_COLUMNS, start=1)
+    )
+    values = ", ".join(
+        f"{column}::jsonb" if column in json_columns else column
+        for column in AUDIT_LOG_COLUMNS
+    )
+    statement = (
+        f"INSERT INTO audit_logs ({columns}) "  # nosec B608 - fixed columns
+        f"SELECT {values} FROM unnest({arrays}) AS batch ({columns})"
+    )
+    if idempotent:
+        statement += " ON CONFLICT DO NOTHING RETURNING id"
+    return statement
+
+
+INSERT_AUDIT_LOGS = _insert_statement(idempotent=False)
+INSERT_AUDIT_LOGS_IDEMPOTENT = _insert_statement(idempotent=True)
+
+# Errors caused by the rows themselves; retrying the same rows cannot help
+_ROW_ERRORS = (
+    asyncpg.exceptions.DataError,
+    asyncpg.exceptions.IntegrityConstraintViolationError,
+)
+
+
+class AuditPipelineMetrics(BaseModel):
+    """Point-in-time counters for the audit pipeline."""
+
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        validate_assignment=True,
+        str_strip_whitespace=True,
+        validate_default=True,
+    )
+
+    running: bool = Field(..., description="Whether the background writer is up")
+    queue_depth: int = Field(..., ge=0, description="Events waiting to be written")
+    queue_capacity: int = Field(..., ge=1, description="Buffer bound for low risk")
+    enqueued_total: int = Field(..., ge=0)
+    written_total: int = Field(..., ge=0)
+    dropped_total: int = Field(..., ge=0, description="Low-risk events shed")
+    spooled_total: int = Field(..., ge=0, description="Events made durable locally")
+    spool_fsyncs: int = Field(..., ge=0, description="Group-commit fsync calls")
+    replayed_total: int = Field(..., ge=0, description="Events recovered at startup")
+    dead_lettered_total: int = Field(
+        ..., ge=0, description="Events the database rejected, kept on local disk"
+    )
+    flushes_total: int = Field(..., ge=0)
+    flush_failures: int = Field(..., ge=0)
+    last_flush_ms: float = Field(..., ge=0.0)
+
+
+def event_to_copy_record(event: "ComplianceEvent") -> tuple[Any, ...]:
+    """Map an event onto the ``audit_logs`` column order.
+
+    Values are coerced to the column types the insert expects (``inet``,
+    ``uuid``, ``numeric``); identifiers that are not UUIDs are kept in the
+    ``security_alerts`` document instead of failing the whole batch.
+    """
+    try:
+        ip_address = (
+            ipaddress.ip_address(event.ip_address) if event.ip_address else None
+        )
+    except ValueError:
+        ip_address = None
+
+    resource_uuid: UUID | None = None
+    if event.resource_id:
+        with contextlib.suppress(ValueError):
+            resource_uuid = UUID(event.resource_id)
+
+    metadata: dict[str, Any] = {
+        "event_type": event.event_type.value,
+        "risk_level": event.risk_level.value,
+        "control_references": event.control_references,
+        "compliance_tags": event.compliance_tags,
+        "evidence_references": event.evidence_references,
+    }
+    if event.resource_id and resource_uuid is None:
+        metadata["resource_ref"] = event.resource_id
+    if event.error_details:
+        metadata["error_details"] = event.error_details
+
+    # jsonb columns stay Python objects here; see insert_parameters().
+    request_body = (
+        event.event_data.model_dump(mode="json", exclude_none=True)
+        if event.event_data
+        else None
+    )
+
+    return (
+        event.event_id,
+        event.user_id,
+        ip_address,
+        event.user_agent,
+        event.session_id,
+        event.action[:100],
+        (event.resource_type or "system")[:50],
+        resource_uuid,
+        event.request_method,
+        event.request_path,
+        request_body,
+        event.response_status,
+        Decimal(str(round(event.risk_score, 2))),
+        metadata,
+        event.timestamp,
+    )
+
+
+def insert_parameters(records: list[tuple[Any, ...]]) -> list[list[Any]]:
+    """Transpose records into the per-column arrays of the unnest() insert."""
+    parameters: list[list[Any]] = []
+    for column, values in zip(AUDIT_LOG_COLUMNS, zip(*records), strict=True):
+        if _COLUMN_TYPES[column] == "jsonb":
+            parameters.append(
+                [None if v is None else json.dumps(v, default=str) for v in values]
+            )
+        else:
+            parameters.append(list(values))
+    return parameters
+
+
+class AuditSpool:
+    """Append-only local spool with group-commit fsync.
+
+    Each appended line gets a sequence number.  Callers awaiting
+    :meth:`append` share one ``fsync`` per ``fsync_delay`` window, so a burst
+    of critical events costs one disk flush rather than one per event.
+
+    Segments stay locked while this spool owns them; :meth:`recover` skips
+    any segment another live process holds.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        fsync_delay: float = 0.002,
+        segment_max_bytes: int = 8 * 1024 * 1024,
+    ) -> None:
+        """Prepare the spool; :meth:`open` must be called before appending."""
+        self._directory = directory
+        self._fsync_delay = fsync_delay
+        self._segment_max_bytes = segment_max_bytes
+        self._file: Any = None
+        self._path: Path | None = None
+        self._segment_index = 0
+        self._seq = 0
+        self._segment_last_seq = 0
+        # Sealed segments keep their handle open to hold the lock
+        self._sealed: list[tuple[Path, int, Any]] = []
+        self._recovered: list[tuple[Path, Any]] = []
+        self._unflushed: set[int] = set()
+        self._sync_future: asyncio.Future[None] | None = None
+        self.appended_total = 0
+        self.fsyncs = 0
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the spool currently has an active segment."""
+        return self._file is not None
+
+    def recover(self) -> tuple[list[str], list[Path]]:
+        """Return lines left behind by exited processes and their files.
+
+        The recovered files stay locked until :meth:`release_recovered`.
+        """
+        self._directory.mkdir(parents=True, exist_ok=True)
+        lines: list[str] = []
+        paths: list[Path] = []
+        for path in sorted(self._directory.glob(f"*{SPOOL_SUFFIX}")):
+            source = self._lock_orphan(path)
+            if source is None:
+                continue
+            # A torn final line from a crash mid-write is skipped.
+            lines.extend(line for line in source.read().splitlines() if line)
+            self._recovered.append((path, source))
+            paths.append(path)
+        return lines, paths
+
+    @staticmethod
+    def _lock_orphan(path: Path) -> Any:
+        """Open and lock a segment no live process owns, else None."""
+        try:
+            source = path.open("r", encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        try:
+            fcntl.flock(source.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            # Another process may have replayed and removed it meanwhile
+            if os.fstat(source.fileno()).st_ino != path.stat().st_ino:
+                raise FileNotFoundError(path)
+        except (BlockingIOError, FileNotFoundError):
+            source.close()
+            return None
+        return source
+
+    async def dead_letter(self, lines: list[str]) -> None:
+        """Append lines the database rejected to the dead-letter file.
+
+        The file is never replayed; an operator inspects and repairs it.
+        """
+        self._directory.mkdir(parents=True, exist_ok=True)
+        path = self._directory / DEAD_LETTER_FILE
+
+        def write() -> None:
+            with path.open("a", encoding="utf-8") as handle:
+                handle.write("".join(line + "\n" for line in lines))
+                handle.flush()
+                os.fsync(handle.fileno())
+
+        await asyncio.to_thread(write)
+
+    def release_recovered(self, replayed: bool) -> None:
+        """Remove recovered files once replayed and drop their locks."""
+        for path, source in self._recovered:
+            if replayed:
+                path.unlink(missing_ok=True)
+            source.close()
+        self._recovered = []
+
+    def open(self) -> None:
+        """Start a fresh segment for this process."""
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._open_segment()
+
+    def _open_segment(self) -> None:
+        self._segment_index += 1
+        self._path = self._directory / (
+            f"audit-{os.getpid()}-{time.time_ns()}-{self._segment_index}{SPOOL_SUFFIX}"
+        )
+        self._file = self._path.open("a", encoding="utf-8")
+        fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+
+    async def append(self, line: str) -> int:
+        """Append one line and return its sequence once it is on disk."""
+        if self._file is None:
+            self.open()
+
+        self._seq += 1
+        seq = self._seq
+        self._file.write(line + "\n")
+        self._segment_last_seq = seq
+        self._unflushed.add(seq)
+        self.appended_total += 1
+        await self._group_fsync()
+        return seq
+
+    async def _group_fsync(self) -> None:
+        if self._sync_future is not None:
+            await asyncio.shield(self._sync_future)
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._sync_future = future
+        try:
+            # Give concurrent appenders a moment to join this fsync.
+            await asyncio.sleep(self._fsync_delay)
+            self._sync_future = None
+            await self._flush_to_disk()
+            self.fsyncs += 1
+        except BaseException as e:
+            self._sync_future = None
+            future.set_exception(e)
+            future.exception()  # mark retrieved when there are no followers
+            raise
+        future.set_result(None)
+
+    async def _flush_to_disk(self) -> None:
+        handle = self._file
+        if handle is None:
+            return
+        # Appenders write on the loop thread, so the buffer is flushed here
+        # too; only the blocking fsync runs off the loop.
+        handle.flush()
+        await asyncio.to_thread(os.fsync, handle.fileno())
+
+    def mark_written(self, seqs: list[int]) -> None:
+        """Record that ``seqs`` reached PostgreSQL and reclaim spool files."""
+        self._unflushed.difference_update(seqs)
+        oldest_pending = min(self._unflushed) if self._unflushed else None
+
+        still_sealed: list[tuple[Path, int, Any]] = []
+        for path, last_seq, handle in self._sealed:
+            if oldest_pending is None or oldest_pending > last_seq:
+                path.unlink(missing_ok=True)
+                handle.close()
+            else:
+                still_sealed.append((path, last_seq, handle))
+        self._sealed = still_sealed
+
+        if self._file is None:
+            return
+        if oldest_pending is None:
+            # Everything in the active segment is in the database.
+            self._file.seek(0)
+            self._file.truncate()
+        elif self._file.tell() >= self._segment_max_bytes and self._path is not None:
+            self._file.flush()
+            self._sealed.append((self._path, self._segment_last_seq, self._file))
+            self._open_segment()
+
+    def close(self) -> None:
+        """Close the active segment, removing it when nothing is pending.
+
+        Segments with pending lines are unlocked and left for a replay.
+        """
+        for _, _, handle in self._sealed:
+            handle.close()
+        self._sealed = []
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+        if not self._unflushed and self._path is not None:
+            self._path.unlink(missing_ok=True)
+
+
+class AuditPipeline:
+    """Bounded buffer plus background batch writer for ``audit_logs``."""
+
+    def __init__(
+        self,
+        database: Any,
+        spool: AuditSpool | None = None,
+        batch_size: int | None = None,
+        flush_interval: float | None = None,
+        capacity: int | None = None,
+        chain: AuditChain | None = None,
+    ) -> None:
+        """Configure the pipeline from settings unless overridden."""
+        settings = get_settings()
+        self._database = database
+        self._chain = chain or AuditChain(database)
+        self._spool = spool or AuditSpool(
+            Path(settings.audit_spool_dir),
+            fsync_delay=settings.audit_fsync_delay_ms / 1000,
+        )
+        self._batch_size = batch_size or settings.audit_batch_size
+        self._flush_interval = flush_interval or settings.audit_flush_interval_seconds
+        self._capacity = capacity or settings.audit_queue_capacity
+
+        # (event, spool sequence or None)
+        self._buffer: deque[tuple[ComplianceEvent, int | None]] = deque()
+        self._wakeup = asyncio.Event()
+        self._writer: asyncio.Task[None] | None = None
+        self._flush_lock = asyncio.Lock()
+        self._retry_idempotent = False
+        self._closing = False
+
+        self._enqueued = 0
+        self._written = 0
+        self._dropped = 0
+        self._replayed = 0
+        self._dead_lettered = 0
+        self._flushes = 0
+        self._flush_failures = 0
+        self._last_flush_ms = 0.0
+
+    @property
+    def chain(self) -> AuditChain:
+        """Hash chain extended by this pipeline's writes."""
+        return self._chain
+
+    @property
+    def running(self) -> bool:
+        """Whether the background writer task is alive."""
+        return self._writer is not None and not self._writer.done()
+
+    async def start(self) -> None:
+        """Replay any spooled events from a previous run and start the writer."""
+        from .audit_logger import ComplianceEvent
+
+        lines, _ = self._spool.recover()
+        if lines:
+            events = []
+            for line in lines:
+                try:
+                    events.append(ComplianceEvent.model_validate_json(line))
+                except ValueError:
+                    logger.warning("Skipping unreadable audit spool entry")
+            try:
+                rejected = await self._write(events, idempotent=True)
+                await self._dead_letter(rejected)
+                self._replayed += len(events) - len(rejected)
+                self._spool.release_recovered(replayed=True)
+                logger.info("Replayed %d spooled audit events", len(events))
+            except Exception:
+                # Leave the files for the next startup rather than lose them.
+                self._spool.release_recovered(replayed=False)
+                logger.exception("Audit spool replay failed; will retry next start")
+        else:
+            # Only empty segments were left behind
+            self._spool.release_recovered(replayed=True)
+
+        self._spool.open()
+        self._ensure_writer()
+
+    def _ensure_writer(self) -> None:
+        if self.running or self._closing:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._writer = loop.create_task(self._run(), name="audit-log-writer")
+
+    def submit(self, event: "ComplianceEvent") -> bool:
+        """Queue a low-risk event without waiting; False if it was shed."""
+        if len(self._buffer) >= self._capacity:
+            self._dropped += 1
+            return False
+
+        self._enqueue(event, None)
+        return True
+
+    async def submit_durable(self, event: "ComplianceEvent") -> None:
+        """Make an event durable in the local spool, then queue it."""
+        seq = await self._spool.append(event.model_dump_json())
+        self._enqueue(event, seq)
+
+    def _enqueue(self, event: "ComplianceEvent", seq: int | None) -> None:
+        self._buffer.append((event, seq))
+        self._enqueued += 1
+        self._ensure_writer()
+        if len(self._buffer) >= self._batch_size:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        while not self._closing:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), self._flush_interval)
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception:
+                # Failures are counted in flush(); keep the writer alive.
+                logger.exception("Audit log flush failed")
+
+    async def flush(self) -> int:
+        """Write everything currently buffered; returns rows written."""
+        written = 0
+        async with self._flush_lock:
+            while self._buffer:
+                batch = [
+                    self._buffer.popleft()
+                    for _ in range(min(self._batch_size, len(self._buffer)))
+                ]
+                events = [event for event, _ in batch]
+                started = time.perf_counter()
+                try:
+                    rejected = await self._write(events, self._retry_idempotent)
+                    await self._dead_letter(rejected)
+                except Exception:
+                    self._flush_failures += 1
+                    # Put the batch back in order; a retry may overlap rows
+                    # that did commit, so it must be idempotent.
+                    self._buffer.extendleft(reversed(batch))
+                    self._retry_idempotent = True
+                    raise
+
+                self._retry_idempotent = False
+                self._flushes += 1
+                self._written += len(batch) - len(rejected)
+                self._last_flush_ms = (time.perf_counter() - started) * 1000
+                written += len(batch) - len(rejected)
+                # Rejected events are durable in the dead-letter file now
+                self._spool.mark_written([seq for _, seq in batch if seq is not None])
+        return written
+
+    async def _write(
+        self, events: list["ComplianceEvent"], idempotent: bool
+    ) -> list["ComplianceEvent"]:
+        """Insert events, bisecting around rows the database rejects.
+
+        Returns the rejected events; any other error propagates.
+        """
+        try:
+            await self._insert(events, idempotent)
+            return []
+        except _ROW_ERRORS:
+            if len(events) == 1:
+                return events
+        middle = len(events) // 2
+        return await self._write(events[:middle], idempotent) + await self._write(
+            events[middle:], idempotent
+        )
+
+    async def _dead_letter(self, events: list["ComplianceEvent"]) -> None:
+        if not events:
+            return
+        await self._spool.dead_letter([event.model_dump_json() for event in events])
+        self._dead_lettered += len(events)
+        logger.error(
+            "Database rejected %d audit events; kept in %s",
+            len(events),
+            DEAD_LETTER_FILE,
+        )
+
+    async def _insert(self, events: list["ComplianceEvent"], idempotent: bool) -> None:
+        """Insert events into ``audit_logs`` and extend the hash chain.
+
+        The idempotent path inserts with ``ON CONFLICT DO NOTHING`` so replays
+        never duplicate rows; only rows actually inserted are added to the
+        chain.
+        """
+        if not events:
+            return
+
+        records = [event_to_copy_record(event) for event in events]
+        parameters = insert_parameters(records)
+        async with self._database.transaction() as conn:
+            if idempotent:
+                inserted = await conn.fetch(INSERT_AUDIT_LOGS_IDEMPOTENT, *parameters)
+                inserted_ids = {row["id"] for row in inserted}
+                records = [record for record in records if record[0] in inserted_ids]
+            else:
+                await conn.execute(INSERT_AUDIT_LOGS, *parameters)
+
+            await self._chain.append(
+                conn, [dict(zip(AUDIT_LOG_COLUMNS, record)) for record in records]
+            )
+
+    async def close(self) -> None:
+        """Stop the writer after a final drain."""
+        self._closing = True
+        self._wakeup.set()
+        if self._writer is not None:
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._writer
+            self._writer = None
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("Final audit flush failed; spooled events kept")
+        self._spool.close()
+
+    @beartype
+    def metrics(self) -> AuditPipelineMetrics:
+        """Snapshot the pipeline counters."""
+        return AuditPipelineMetrics(
+            running=self.running,
+            queue_depth=len(self._buffer),
+            queue_capacity=self._capacity,
+            enqueued_total=self._enqueued,
+            written_total=self._written,
+            dropped_total=self._dropped,
+            spooled_total=self._spool.appended_total,
+            spool_fsyncs=self._spool.fsyncs,
+            replayed_total=self._replayed,
+            dead_lettered_total=self._dead_lettered,
+            flushes_total=self._flushes,
+            flush_failures=self._flush_failures,
+            last_flush_ms=self._last_flush_ms,
+        )
@@ -29,6 +29,7 @@ from policy_core.core.result_types import Err, Ok, Result
 from policy_core.models.base import BaseModelConfig
 from policy_core.schemas.common import ControlEvidence
 
+from ..core.config import get_settings
 from ..core.database import get_database
 from .audit_logger import AuditLogger, get_audit_logger
 from .control_framework import ControlExecution, ControlStatus
@@ -170,6 +171,7 @@ class ChangeIntegrityResult(BaseModelConfig):
     tampered_records: int
     integrity_percentage: float
     sample_changes: list[ChangeRecordIntegrity]
+    inconclusive: bool = False
 
 
 @beartype
@@ -1078,6 +1080,11 @@ class ProcessingIntegrityManager:
                 findings.append(
                     f"Found {change_integrity.tampered_records} potentially tampered change records"
                 )
+            if change_integrity.inconclusive:
+                findings.append(
+                    "Change integrity inconclusive: no audit records could be "
+                    "verified against a signed checkpoint"
+                )
 
             # Check approval workflows
             approval_check = await self._check_change_approval_workflows()
@@ -1197,45 +1204,48 @@ class ProcessingIntegrityManager:
 
     @beartype
     async def _verify_change_integrity(self) -> ChangeIntegrityResult:
-        """Verify integrity of change records."""
-        # Simulated change integrity verification
-        sample_changes = [
-            ChangeRecordIntegrity(
-                change_id="CHG-001",
-                table="policies",
-                operation="UPDATE",
-                expected_hash="abc123",
-                actual_hash="abc123",
-                tampered=False,
-            ),
-            ChangeRecordIntegrity(
-                change_id="CHG-002",
-                table="customers",
-                operation="INSERT",
-                expected_hash="def456",
-                actual_hash="def456",
-                tampered=False,
-            ),
-            ChangeRecordIntegrity(
-                change_id="CHG-003",
-                table="claims",
-                operation="UPDATE",
-                expected_hash="ghi789",
-                actual_hash="xyz999",
-                tampered=True,
-            ),
-        ]
+        """Verify integrity of change records against the audit hash chain.
+
+        A random sample of records is proven against its signed checkpoint
+        with an O(log n) Merkle path, so the check is cheap enough to run
+        continuously instead of rehashing the whole trail.
+        """
+        chain = self._audit_logger.chain
+        sample_result = await chain.sample_leaves(
+            get_settings().audit_integrity_sample_size
+        )
+        sample_ids = sample_result.ok_value if sample_result.is_ok() else []
+
+        sample_changes: list[ChangeRecordIntegrity] = []
+        for audit_log_id in sample_ids:
+            verification = await chain.verify_record(audit_log_id)
+            if verification.is_err():
+                # Not yet covered by a checkpoint; picked up on a later run.
+                continue
+            proof = verification.ok_value
+            sample_changes.append(
+                ChangeRecordIntegrity(
+                    change_id=str(audit_log_id),
+                    table="audit_logs",
+                    operation=f"partition {proof.partition_key}",
+                    expected_hash=proof.expected_root,
+                    actual_hash=proof.actual_root,
+                    tampered=not proof.verified,
+                )
+            )
 
         tampered_records = sum(1 for change in sample_changes if change.tampered)
+        checked = len(sample_changes)
 
+        # Nothing proven is no evidence of integrity, not a clean result
         return ChangeIntegrityResult(
-            total_changes_checked=len(sample_changes),
+            total_changes_checked=checked,
             tampered_records=tampered_records,
             integrity_percentage=(
-                (len(sample_changes) - tampered_records) / len(sample_changes)
-            )
-            * 100,
+                ((checked - tampered_records) / checked) * 100 if checked else 0.0
+            ),
             sample_changes=sample_changes,
+            inconclusive=checked == 0,
         )
 
     @beartype
@@ -1596,4 +1606,6 @@ class ProcessingIntegrityManager:
             ),
             control_results=control_results,
         )
+
+
 # SYSTEM_BOUNDARY: SOC2 compliance monitoring requires flexible dict structures for audit evidence collection and control testing
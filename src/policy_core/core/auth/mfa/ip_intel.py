@@ -0,0 +1,415 @@
+# PolicyCore - Policy Decision Management System
+# Copyright (C) 2025 Luiz Frias <luizf35@gmail.com>
+# Form F[x] Labs
+#
+# This software is dual-licensed under AGPL-3.0 and Commercial License.
+# For commercial licensing, contact: luizf35@gmail.com
+# See LICENSE file for full terms.
+
+"""Offline IP intelligence for the MFA risk engine.
+
+Geo, ASN, VPN/proxy and Tor signals come from a local index file instead
+of an external service on the login path.  The file holds sorted,
+non-overlapping address ranges as fixed-width arrays that are
+memory-mapped and binary-searched in place::
+
+    header   "=4sHBxIII"  magic, version, byte order, v4 count, v6 count,
+                          metadata length
+    v4       starts[n4] u32, ends[n4] u32, record[n4] u32
+    v6       starts[n6] 16-byte big-endian, ends[n6] 16-byte, record[n6] u32
+    metadata JSON list of [country, city, latitude, longitude, asn, flags]
+
+Coordinates are optional: country-only and flag-only ranges carry ``None``
+rather than a made-up position.
+
+Build it with :func:`build_ip_intel_index` (usually from
+:func:`load_ip_ranges_csv`).  :class:`IPIntelIndex` re-maps the file when
+its inode, size or mtime changes, swapping the snapshot in one
+assignment so lookups never see a half-loaded table.
+"""
+
+import asyncio
+import contextlib
+import csv
+import json
+import logging
+import math
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable
+from functools import lru_cache
+from ipaddress import IPv4Address, ip_address, ip_network
+from pathlib import Path
+
+from beartype import beartype
+from pydantic import BaseModel, ConfigDict, Field
+
+from policy_core.core.config import get_settings
+from policy_core.core.result_types import Err, Ok, Result
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"PCIP"
+FORMAT_VERSION = 1
+_HEADER = struct.Struct("=4sHBxIII")
+_BYTE_ORDER = 0 if sys.byteorder == "little" else 1
+_V6_WIDTH = 16
+
+FLAG_VPN = 1
+FLAG_PROXY = 2
+FLAG_TOR = 4
+_FLAG_NAMES = {"vpn": FLAG_VPN, "proxy": FLAG_PROXY, "tor": FLAG_TOR}
+
+EARTH_RADIUS_KM = 6371.0
+DISTANCE_CACHE_SIZE = 65536
+
+
+class IPRange(BaseModel):
+    """One address range and the intelligence attached to it."""
+
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        validate_assignment=True,
+        str_strip_whitespace=True,
+        validate_default=True,
+    )
+
+    cidr: str = Field(..., min_length=1)
+    country: str = Field(default="", max_length=2)
+    city: str = Field(default="")
+    latitude: float | None = Field(default=None, ge=-90.0, le=90.0)
+    longitude: float | None = Field(default=None, ge=-180.0, le=180.0)
+    asn: int = Field(default=0, ge=0)
+    flags: int = Field(default=0, ge=0)
+
+
+class IPIntel(BaseModel):
+    """Lookup result for a single address."""
+
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        validate_assignment=True,
+        str_strip_whitespace=True,
+        validate_default=True,
+    )
+
+    country: str = Field(default="")
+    city: str = Field(default="")
+    latitude: float | None = Field(default=None)
+    longitude: float | None = Field(default=None)
+    asn: int = Field(default=0, ge=0)
+    is_vpn: bool = Field(default=False)
+    is_proxy: bool = Field(default=False)
+    is_tor: bool = Field(default=False)
+
+
+class _V6Keys:
+    """Sequence view over packed 16-byte keys so ``bisect`` can search them."""
+
+    __slots__ = ("_view", "_count")
+
+    def __init__(self, view: memoryview, count: int) -> None:
+        self._view = view
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> bytes:
+        offset = index * _V6_WIDTH
+        return bytes(self._view[offset : offset + _V6_WIDTH])
+
+
+class _Snapshot:
+    """One memory-mapped version of the index file."""
+
+    def __init__(self, path: Path) -> None:
+        with path.open("rb") as handle:
+            stat = os.fstat(handle.fileno())
+            self.identity = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, byte_order, n4, n6, meta_len = _HEADER.unpack_from(
+            self._mmap, 0
+        )
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} IP index")
+        if byte_order != _BYTE_ORDER:
+            raise ValueError(f"{path} was built on a host with another byte order")
+
+        view = memoryview(self._mmap)
+        offset = _HEADER.size
+        self._v4_starts = view[offset : offset + 4 * n4].cast("I")
+        offset += 4 * n4
+        self._v4_ends = view[offset : offset + 4 * n4].cast("I")
+        offset += 4 * n4
+        self._v4_records = view[offset : offset + 4 * n4].cast("I")
+        offset += 4 * n4
+        self._v6_starts = _V6Keys(view[offset : offset + _V6_WIDTH * n6], n6)
+        offset += _V6_WIDTH * n6
+        self._v6_ends = _V6Keys(view[offset : offset + _V6_WIDTH * n6], n6)
+        offset += _V6_WIDTH * n6
+        self._v6_records = view[offset : offset + 4 * n6].cast("I")
+        offset += 4 * n6
+
+        self._records = [
+            IPIntel(
+                country=country,
+                city=city,
+                latitude=latitude,
+                longitude=longitude,
+                asn=asn,
+                is_vpn=bool(flags & FLAG_VPN),
+                is_proxy=bool(flags & FLAG_PROXY),
+                is_tor=bool(flags & FLAG_TOR),
+            )
+            for country, city, latitude, longitude, asn, flags in json.loads(
+                bytes(view[offset : offset + meta_len])
+            )
+        ]
+        self.ranges = n4 + n6
+
+    def lookup(self, ip: str) -> IPIntel | None:
+        try:
+            address = ip_address(ip)
+        except ValueError:
+            return None
+
+        if isinstance(address, IPv4Address):
+            key4 = int(address)
+            index = bisect_right(self._v4_starts, key4) - 1
+            if index < 0 or key4 > self._v4_ends[index]:
+                return None
+            return self._records[self._v4_records[index]]
+
+        key6 = address.packed
+        index = bisect_right(self._v6_starts, key6) - 1
+        if index < 0 or key6 > self._v6_ends[index]:
+            return None
+        return self._records[self._v6_records[index]]
+
+
+class IPIntelIndex:
+    """Memory-mapped IP range index with hot reload."""
+
+    def __init__(
+        self, path: str | None = None, reload_seconds: float | None = None
+    ) -> None:
+        """Configure the index file and reload interval from settings."""
+        settings = get_settings()
+        configured = path or settings.ip_intel_path
+        self._path = Path(configured) if configured else None
+        self._reload_seconds = reload_seconds or settings.ip_intel_reload_seconds
+        self._snapshot: _Snapshot | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def loaded(self) -> bool:
+        """Whether an index file is currently mapped."""
+        return self._snapshot is not None
+
+    @property
+    def ranges(self) -> int:
+        """Number of ranges in the mapped index."""
+        return self._snapshot.ranges if self._snapshot else 0
+
+    @beartype
+    def reload_if_changed(self) -> Result[bool, str]:
+        """Map the index file again if it was replaced; returns whether it was."""
+        if self._path is None:
+            return Ok(False)
+        try:
+            stat = self._path.stat()
+        except FileNotFoundError:
+            return Err(f"IP intelligence index {self._path} not found")
+
+        identity = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        if self._snapshot is not None and self._snapshot.identity == identity:
+            return Ok(False)
+        try:
+            snapshot = _Snapshot(self._path)
+        except (OSError, ValueError) as e:
+            return Err(f"Failed to load IP intelligence index: {str(e)}")
+
+        # Single assignment: readers see either the old or the new table
+        self._snapshot = snapshot
+        return Ok(True)
+
+    def lookup(self, ip: str) -> IPIntel | None:
+        """Intelligence for ``ip``, or None when it is not covered."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            return None
+        return snapshot.lookup(ip)
+
+    async def start(self) -> None:
+        """Load the index and watch it for replacement."""
+        result = self.reload_if_changed()
+        if result.is_err():
+            logger.warning(result.unwrap_err())
+        if self._path is not None and self._task is None:
+            self._task = asyncio.create_task(self._loop(), name="ip-intel-reload")
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._reload_seconds)
+            result = self.reload_if_changed()
+            if result.is_err():
+                logger.warning(result.unwrap_err())
+            elif result.unwrap():
+                logger.info(f"Reloaded IP intelligence index ({self.ranges} ranges)")
+
+    async def stop(self) -> None:
+        """Stop watching the index file."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+
+@beartype
+def parse_flags(value: str) -> int:
+    """Convert ``"vpn|tor"`` style flag lists to a bitmask."""
+    flags = 0
+    for name in value.lower().replace(",", "|").split("|"):
+        flags |= _FLAG_NAMES.get(name.strip(), 0)
+    return flags
+
+
+def _coordinate(value: str | None) -> float | None:
+    value = (value or "").strip()
+    return float(value) if value else None
+
+
+@beartype
+def load_ip_ranges_csv(path: Path) -> Result[list[IPRange], str]:
+    """Read ``cidr,country,city,latitude,longitude,asn,flags`` rows."""
+    try:
+        with path.open(newline="") as handle:
+            return Ok(
+                [
+                    IPRange(
+                        cidr=row["cidr"],
+                        country=row.get("country") or "",
+                        city=row.get("city") or "",
+                        latitude=_coordinate(row.get("latitude")),
+                        longitude=_coordinate(row.get("longitude")),
+                        asn=int(row.get("asn") or 0),
+                        flags=parse_flags(row.get("flags") or ""),
+                    )
+                    for row in csv.DictReader(handle)
+                ]
+            )
+    except (OSError, KeyError, ValueError) as e:
+        return Err(f"Failed to read IP ranges from {path}: {str(e)}")
+
+
+@beartype
+def build_ip_intel_index(ranges: Iterable[IPRange], dest: Path) -> Result[int, str]:
+    """Write ``ranges`` as an index file, replacing ``dest`` atomically.
+
+    Returns the number of ranges written.  Overlapping ranges are rejected
+    because the binary search assumes each address matches at most one.
+    """
+    records: dict[tuple[str, str, float | None, float | None, int, int], int] = {}
+    v4: list[tuple[int, int, int]] = []
+    v6: list[tuple[bytes, bytes, int]] = []
+
+    try:
+        for item in ranges:
+            network = ip_network(item.cidr, strict=False)
+            key = (
+                item.country,
+                item.city,
+                item.latitude,
+                item.longitude,
+                item.asn,
+                item.flags,
+            )
+            record = records.setdefault(key, len(records))
+            if network.version == 4:
+                v4.append(
+                    (
+                        int(network.network_address),
+                        int(network.broadcast_address),
+                        record,
+                    )
+                )
+            else:
+                v6.append(
+                    (
+                        network.network_address.packed,
+                        network.broadcast_address.packed,
+                        record,
+                    )
+                )
+    except ValueError as e:
+        return Err(f"Invalid IP range: {str(e)}")
+
+    v4.sort()
+    v6.sort()
+    for table in (v4, v6):
+        for previous, current in zip(table, table[1:], strict=False):
+            if current[0] <= previous[1]:
+                return Err("IP ranges overlap; each address must map to one range")
+
+    metadata = json.dumps([list(key) for key in records]).encode()
+    tmp = dest.with_name(dest.name + ".tmp")
+    try:
+        with tmp.open("wb") as handle:
+            handle.write(
+                _HEADER.pack(
+                    MAGIC, FORMAT_VERSION, _BYTE_ORDER, len(v4), len(v6), len(metadata)
+                )
+            )
+            for column in range(3):
+                handle.write(array("I", [row[column] for row in v4]).tobytes())
+            for column in range(2):
+                handle.write(b"".join(row[column] for row in v6))
+            handle.write(array("I", [row[2] for row in v6]).tobytes())
+            handle.write(metadata)
+        os.replace(tmp, dest)
+    except OSError as e:
+        return Err(f"Failed to write IP intelligence index: {str(e)}")
+    return Ok(len(v4) + len(v6))
+
+
+@lru_cache(maxsize=DISTANCE_CACHE_SIZE)
+def _haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = (
+        math.sin(d_phi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def distance_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance, memoized on coordinates rounded to ~1 km."""
+    first = (round(lat1, 2), round(lon1, 2))
+    second = (round(lat2, 2), round(lon2, 2))
+    if second < first:
+        first, second = second, first
+    return _haversine_km(*first, *second)
+
+
+# Global IP intelligence index instance
+_ip_intel_index: IPIntelIndex | None = None
+
+
+@beartype
+def get_ip_intel_index() -> IPIntelIndex:
+    """Get global IP intelligence index instance."""
+    global _ip_intel_index
+    if _ip_intel_index is None:
+        _ip_intel_index = IPIntelIndex()
+    return _ip_intel_index
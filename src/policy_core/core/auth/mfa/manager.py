@@ -220,6 +220,9 @@ class MFAManager:
             # Clear setup data
             await self._cache.delete(f"totp_setup:{user_id}")
 
+            # MFA enrolment feeds the risk engine's cached signals
+            self._risk_engine.invalidate_user_signals(str(user_id))
+
             return Ok(None)
 
         except Exception as e:
@@ -6,9 +6,23 @@
 # For commercial licensing, contact: luizf35@gmail.com
 # See LICENSE file for full terms.
 
-"""Risk-based authentication engine."""
-
+"""Risk-based authentication engine.
+
+Independent signals (device, location, time, failed attempts, account,
+behaviour) are evaluated concurrently, each under its own timeout.  The
+cheap in-process network check runs first, and evaluation stops as soon
+as any signal is definitive (impossible travel, Tor, a locked-out
+failure count), cancelling the signals still in flight.  Per-user facts
+that change rarely - account age, MFA enrolment, usual login hours - are
+held in an in-process TTL cache, and the assessment is logged in the
+background rather than on the login path.
+"""
+
+import asyncio
 import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable
 from datetime import datetime, timezone
 from ipaddress import ip_address, ip_network
 from typing import Any
@@ -22,6 +36,7 @@ from policy_core.core.database import Database
 from policy_core.core.result_types import Err, Ok, Result
 from policy_core.models.base import BaseModelConfig
 
+from .ip_intel import distance_km, get_ip_intel_index
 from .models import MFAMethod, RiskAssessment, RiskFactors, RiskLevel
 
 # Auto-generated models
@@ -61,6 +76,70 @@ class AdditionalContextData(BaseModelConfig):
     metadata: dict[str, str] = Field(default_factory=dict, description="Metadata")
 
 
+# Signal values that settle the assessment on their own
+DEFINITIVE_RISK_SIGNALS: dict[str, float] = {
+    "impossible_travel": 1.0,
+    "tor_network": 0.9,
+    "failed_attempts": 1.0,
+}
+
+# Factors recorded when a signal times out, matching its error handling
+SIGNAL_FAILURE_FACTORS: dict[str, dict[str, float]] = {
+    "device": {"device_check_error": 0.5},
+    "location": {"location_check_error": 0.4},
+}
+
+MAX_CACHED_USER_SIGNALS = 50000
+_MISSING = object()
+
+# Strong references to in-flight assessment log writes
+_background_tasks: set[asyncio.Task[None]] = set()
+
+
+class UserSignalCache:
+    """Per-process TTL cache for slow-changing per-user risk signals."""
+
+    def __init__(self, max_entries: int = MAX_CACHED_USER_SIGNALS) -> None:
+        """Create an empty cache bounded to ``max_entries``."""
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], tuple[Any, float]] = OrderedDict()
+
+    def get(self, kind: str, user_id: str) -> Any:
+        """Cached value, or ``_MISSING`` when absent or expired."""
+        entry = self._entries.get((kind, user_id))
+        if entry is None:
+            return _MISSING
+        if entry[1] <= time.monotonic():
+            del self._entries[(kind, user_id)]
+            return _MISSING
+        return entry[0]
+
+    def put(self, kind: str, user_id: str, value: Any, ttl: float) -> None:
+        """Cache ``value`` (None included) for ``ttl`` seconds."""
+        self._entries[(kind, user_id)] = (value, time.monotonic() + ttl)
+        self._entries.move_to_end((kind, user_id))
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: str) -> None:
+        """Forget every signal cached for ``user_id``."""
+        for key in [key for key in self._entries if key[1] == user_id]:
+            del self._entries[key]
+
+
+# Global user signal cache instance
+_user_signal_cache: UserSignalCache | None = None
+
+
+@beartype
+def get_user_signal_cache() -> UserSignalCache:
+    """Get global user signal cache instance."""
+    global _user_signal_cache
+    if _user_signal_cache is None:
+        _user_signal_cache = UserSignalCache()
+    return _user_signal_cache
+
+
 class RiskEngine:
     """Risk assessment engine for adaptive MFA."""
 
@@ -128,6 +207,11 @@ class RiskEngine:
             **config.get("weights", {}),  # type: ignore[arg-type]
         }
 
+        self._signal_timeout = settings.mfa_risk_signal_timeout_ms / 1000
+        self._user_signal_ttl = settings.mfa_user_signal_ttl_seconds
+        self._user_signals = get_user_signal_cache()
+        self._ip_intel = get_ip_intel_index()
+
         # ------------------------------------------------------------------
         # Log effective configuration (use info level to appear in CI logs)
         # ------------------------------------------------------------------
@@ -164,43 +248,37 @@ class RiskEngine:
             # Initialize risk factors
             risk_factors = RiskFactors()
 
-            # 1. Check device trust
-            device_risk = await self._assess_device_risk(
-                user_id, device_fingerprint, user_agent
-            )
-            risk_factors = self._update_risk_factors(risk_factors, device_risk)
-
-            # 2. Check location and travel patterns
-            location_risk = await self._assess_location_risk(user_id, ip_address)
-            risk_factors = self._update_risk_factors(risk_factors, location_risk)
-
-            # 3. Check network trust
+            # Network trust is an in-process check; a definitive hit here
+            # skips every I/O-bound signal.
             network_risk = self._assess_network_risk(ip_address)
             risk_factors = self._update_risk_factors(risk_factors, network_risk)
+            definitive = self._is_definitive(network_risk)
+
+            if not definitive:
+                signals: dict[str, Awaitable[dict[str, float]]] = {
+                    "device": self._assess_device_risk(
+                        user_id, device_fingerprint, user_agent
+                    ),
+                    "location": self._assess_location_risk(user_id, ip_address),
+                    "time": self._assess_time_risk(user_id),
+                    "failed_attempts": self._assess_failed_attempts(user_id),
+                    "account": self._assess_account_risk(user_id),
+                }
+                if additional_context:
+                    signals["behavior"] = self._assess_behavior_risk(
+                        user_id, additional_context
+                    )
 
-            # 4. Check time-based patterns
-            time_risk = await self._assess_time_risk(user_id)
-            risk_factors = self._update_risk_factors(risk_factors, time_risk)
-
-            # 5. Check recent failed attempts
-            attempt_risk = await self._assess_failed_attempts(user_id)
-            risk_factors = self._update_risk_factors(risk_factors, attempt_risk)
-
-            # 6. Check account age and history
-            account_risk = await self._assess_account_risk(user_id)
-            risk_factors = self._update_risk_factors(risk_factors, account_risk)
-
-            # 7. Check for unusual behavior patterns
-            if additional_context:
-                behavior_risk = await self._assess_behavior_risk(
-                    user_id, additional_context
-                )
-                risk_factors = self._update_risk_factors(risk_factors, behavior_risk)
+                collected, definitive = await self._collect_signals(signals)
+                for factors in collected:
+                    risk_factors = self._update_risk_factors(risk_factors, factors)
 
             # Calculate overall risk score
             risk_score = self._calculate_risk_score(risk_factors)
 
-            # Determine risk level
+            # Determine risk level; a definitive signal is always critical
+            if definitive:
+                risk_score = max(risk_score, self._risk_thresholds[RiskLevel.CRITICAL])
             risk_level = self._determine_risk_level(risk_score)
 
             # Determine MFA requirements
@@ -210,10 +288,12 @@ class RiskEngine:
             # Build reason string
             reason = self._build_risk_reason(risk_factors, risk_level)
 
-            # Log risk assessment
-            await self._log_risk_assessment(
-                user_id, risk_score, risk_factors, risk_level
+            # Log risk assessment off the login path
+            task = asyncio.create_task(
+                self._log_risk_assessment(user_id, risk_score, risk_factors, risk_level)
             )
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
 
             return Ok(
                 RiskAssessment(
@@ -229,6 +309,55 @@ class RiskEngine:
         except Exception as e:
             return Err(f"Failed to assess risk: {str(e)}")
 
+    async def _collect_signals(
+        self, signals: dict[str, Awaitable[dict[str, float]]]
+    ) -> tuple[list[dict[str, float]], bool]:
+        """Run signals concurrently until all finish or one is definitive.
+
+        Returns the factors gathered so far and whether evaluation was cut
+        short.  Signals that time out or fail contribute their
+        :data:`SIGNAL_FAILURE_FACTORS`.
+        """
+        tasks = {
+            asyncio.ensure_future(asyncio.wait_for(signal, self._signal_timeout)): name
+            for name, signal in signals.items()
+        }
+        collected: list[dict[str, float]] = []
+        definitive = False
+        pending = set(tasks)
+
+        try:
+            while pending and not definitive:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    try:
+                        factors = task.result()
+                    except Exception:
+                        factors = dict(SIGNAL_FAILURE_FACTORS.get(tasks[task], {}))
+                    collected.append(factors)
+                    definitive = definitive or self._is_definitive(factors)
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        return collected, definitive
+
+    @staticmethod
+    def _is_definitive(factors: dict[str, float]) -> bool:
+        return any(
+            factors.get(name, 0.0) >= floor
+            for name, floor in DEFINITIVE_RISK_SIGNALS.items()
+        )
+
+    @beartype
+    def invalidate_user_signals(self, user_id: str) -> None:
+        """Drop cached per-user signals, e.g. after MFA enrolment changes."""
+        self._user_signals.invalidate(user_id)
+
     @beartype
     async def _assess_device_risk(
         self, user_id: str, device_fingerprint: str | None, user_agent: str
@@ -276,24 +405,37 @@ class RiskEngine:
         risk_factors = {}
 
         try:
-            # Get location from IP (mock implementation)
+            # Get location from the offline IP intelligence index
             current_location = self._get_location_from_ip(current_ip)
+            if current_location is None:
+                # Uncovered address: nothing to compare, and the last known
+                # location stays as it was
+                return risk_factors
 
             # Get last known location
             last_location_key = f"last_location:{user_id}"
             last_location_data = await self._cache.get(last_location_key)
 
+            # Entries stored for addresses the index does not cover hold a
+            # placeholder, not a real location
+            if last_location_data and (
+                self._get_location_from_ip(str(last_location_data.get("ip", "")))
+                is None
+            ):
+                last_location_data = None
+
             if last_location_data:
                 last_location = last_location_data["location"]
                 last_time = datetime.fromisoformat(last_location_data["timestamp"])
 
-                # Check for impossible travel
+                # Check for impossible travel; skipped when either end has
+                # no coordinates
                 distance = self._calculate_distance(current_location, last_location)
                 time_diff = (
                     datetime.now(timezone.utc) - last_time
                 ).total_seconds() / 3600
 
-                if time_diff > 0:
+                if distance is not None and time_diff > 0:
                     speed = distance / time_diff  # km/h
 
                     if speed > 1000:  # Faster than commercial flight
@@ -301,11 +443,16 @@ class RiskEngine:
                     elif speed > 500:  # Very fast travel
                         risk_factors["fast_travel"] = 0.7
 
-                # Check for new country
-                if current_location["country"] != last_location["country"]:
-                    risk_factors["new_country"] = 0.8
-                elif current_location["city"] != last_location["city"]:
-                    risk_factors["new_city"] = 0.5
+                # Check for a new country or city, where both ends name one
+                if current_location["country"] and last_location.get("country"):
+                    if current_location["country"] != last_location["country"]:
+                        risk_factors["new_country"] = 0.8
+                    elif (
+                        current_location["city"]
+                        and last_location.get("city")
+                        and current_location["city"] != last_location["city"]
+                    ):
+                        risk_factors["new_city"] = 0.5
             else:
                 # First login location
                 risk_factors["new_location"] = 0.6
@@ -366,13 +513,18 @@ class RiskEngine:
                 risk_factors["unusual_hour"] = 0.4
 
             # Check user's typical login pattern
-            pattern_key = f"login_pattern:{user_id}"
-            login_pattern = await self._cache.get(pattern_key)
+            typical_hours = self._user_signals.get("typical_hours", user_id)
+            if typical_hours is _MISSING:
+                login_pattern = await self._cache.get(f"login_pattern:{user_id}")
+                typical_hours = (
+                    login_pattern.get("typical_hours", []) if login_pattern else None
+                )
+                self._user_signals.put(
+                    "typical_hours", user_id, typical_hours, self._user_signal_ttl
+                )
 
-            if login_pattern:
-                typical_hours = login_pattern.get("typical_hours", [])
-                if current_hour not in typical_hours:
-                    risk_factors["atypical_time"] = 0.3
+            if typical_hours is not None and current_hour not in typical_hours:
+                risk_factors["atypical_time"] = 0.3
 
         except Exception:
             pass
@@ -405,7 +557,12 @@ class RiskEngine:
 
         try:
             # Get user account age (mock implementation)
-            account_age_days = await self._get_account_age(user_id)
+            account_age_days = self._user_signals.get("account_age", user_id)
+            if account_age_days is _MISSING:
+                account_age_days = await self._get_account_age(user_id)
+                self._user_signals.put(
+                    "account_age", user_id, account_age_days, self._user_signal_ttl
+                )
 
             if account_age_days < 7:
                 risk_factors["new_account"] = 0.7
@@ -413,7 +570,12 @@ class RiskEngine:
                 risk_factors["young_account"] = 0.4
 
             # Check if account has MFA enabled
-            has_mfa = await self._check_mfa_enabled(user_id)
+            has_mfa = self._user_signals.get("mfa_enabled", user_id)
+            if has_mfa is _MISSING:
+                has_mfa = await self._check_mfa_enabled(user_id)
+                self._user_signals.put(
+                    "mfa_enabled", user_id, has_mfa, self._user_signal_ttl
+                )
             if not has_mfa:
                 risk_factors["no_mfa"] = 0.3
 
@@ -589,37 +751,54 @@ class RiskEngine:
     # Helper methods (mock implementations)
 
     @beartype
-    def _get_location_from_ip(self, ip: str) -> dict[str, str | float]:
-        """Get geographic location from IP (mock)."""
-        # In production, use MaxMind GeoIP2 or similar
+    def _get_location_from_ip(self, ip: str) -> dict[str, str | float | None] | None:
+        """Get geographic location from the IP intelligence index.
+
+        Returns None for addresses the index does not cover.
+        """
+        intel = self._ip_intel.lookup(ip)
+        if intel is None:
+            return None
         return {
-            "country": "US",
-            "city": "New York",
-            "latitude": 40.7128,
-            "longitude": -74.0060,
+            "country": intel.country,
+            "city": intel.city,
+            "latitude": intel.latitude,
+            "longitude": intel.longitude,
         }
 
     @beartype
     def _calculate_distance(
         self,
-        loc1: Loc1Data | dict[str, str | float],
-        loc2: Loc1Data | dict[str, str | float],
-    ) -> float:
-        """Calculate distance between two locations in km (mock)."""
-        # In production, use proper geographic distance calculation
-        return 100.0  # Mock 100km
+        loc1: Loc1Data | dict[str, str | float | None],
+        loc2: Loc1Data | dict[str, str | float | None],
+    ) -> float | None:
+        """Calculate great-circle distance between two locations in km.
+
+        Returns None when either location has no coordinates.
+        """
+        first = loc1 if isinstance(loc1, dict) else loc1.metadata
+        second = loc2 if isinstance(loc2, dict) else loc2.metadata
+        try:
+            return distance_km(
+                float(first["latitude"]),
+                float(first["longitude"]),
+                float(second["latitude"]),
+                float(second["longitude"]),
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
 
     @beartype
     def _is_vpn_or_proxy(self, ip: str) -> bool:
-        """Check if IP is known VPN/proxy (mock)."""
-        # In production, use IP intelligence services
-        return False
+        """Check if IP is a known VPN or proxy."""
+        intel = self._ip_intel.lookup(ip)
+        return intel is not None and (intel.is_vpn or intel.is_proxy)
 
     @beartype
     def _is_tor_exit_node(self, ip: str) -> bool:
-        """Check if IP is Tor exit node (mock)."""
-        # In production, check against Tor exit node list
-        return False
+        """Check if IP is a Tor exit node."""
+        intel = self._ip_intel.lookup(ip)
+        return intel is not None and intel.is_tor
 
     @beartype
     async def _get_account_age(self, user_id: str) -> int:
@@ -0,0 +1,265 @@
+# PolicyCore - Policy Decision Management System
+# Copyright (C) 2025 Luiz Frias <luizf35@gmail.com>
+# Form F[x] Labs
+#
+# This software is dual-licensed under AGPL-3.0 and Commercial License.
+# For commercial licensing, contact: luizf35@gmail.com
+# See LICENSE file for full terms.
+
+"""Per-process API key metadata cache and write-behind usage tracking.
+
+Machine clients call hundreds of times a second with the same key.  Each
+call used to cost a Redis GET for the key metadata and an ``UPDATE
+api_keys SET last_used_at`` on the primary.  This module keeps:
+
+* :class:`APIKeyCache` - validated key metadata (and rejections, for a
+  shorter TTL) in an in-process LRU.  ``revoke_api_key``,
+  ``rotate_api_key`` and ``bulk_revoke_keys`` evict entries on every
+  worker through the ``api_keys:invalidate`` pub/sub channel.
+* :class:`APIKeyUsageTracker` - ``last_used_at`` and request counts
+  aggregated in memory and written in one ``UPDATE ... FROM unnest()``
+  per flush interval.
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID
+
+from beartype import beartype
+from pydantic import BaseModel, ConfigDict, Field
+
+from policy_core.core.cache import RedisType, subscribe_forever
+from policy_core.core.config import get_settings
+from policy_core.core.database import Database
+from policy_core.core.result_types import Err, Ok, Result
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "api_keys:invalidate"
+INVALIDATE_ALL = "*"
+MAX_CACHED_KEYS = 50000
+
+_FLUSH_USAGE_SQL = """
+    UPDATE api_keys AS k
+    SET last_used_at = GREATEST(k.last_used_at, u.last_used_at),
+        use_count = k.use_count + u.uses
+    FROM unnest($1::uuid[], $2::timestamptz[], $3::bigint[])
+        AS u(id, last_used_at, uses)
+    WHERE k.id = u.id
+"""
+
+
+class APIKeyUsage(BaseModel):
+    """Usage recorded in this process and not yet written to the database."""
+
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        validate_assignment=True,
+        str_strip_whitespace=True,
+        validate_default=True,
+    )
+
+    uses: int = Field(default=0, ge=0)
+    last_used_at: datetime | None = Field(default=None)
+
+
+class APIKeyCache:
+    """In-process TTL cache of API key lookups keyed by key hash."""
+
+    def __init__(
+        self,
+        ttl_seconds: float | None = None,
+        negative_ttl_seconds: float | None = None,
+        max_entries: int = MAX_CACHED_KEYS,
+    ) -> None:
+        """Configure TTLs from settings unless overridden."""
+        settings = get_settings()
+        self._ttl = ttl_seconds or settings.api_key_cache_ttl_seconds
+        self._negative_ttl = (
+            negative_ttl_seconds or settings.api_key_negative_cache_ttl_seconds
+        )
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[Result[dict[str, Any], str], float]] = (
+            OrderedDict()
+        )
+        self._listener: asyncio.Task[None] | None = None
+
+    def get(self, key_hash: str) -> Result[dict[str, Any], str] | None:
+        """Return the cached lookup outcome, or None on a miss."""
+        entry = self._entries.get(key_hash)
+        if entry is None:
+            return None
+        if entry[1] <= time.monotonic():
+            del self._entries[key_hash]
+            return None
+        self._entries.move_to_end(key_hash)
+        return entry[0]
+
+    def put(
+        self,
+        key_hash: str,
+        outcome: Result[dict[str, Any], str],
+        expires_at: datetime | None = None,
+    ) -> None:
+        """Cache a validated key, or a rejection for the negative TTL.
+
+        ``expires_at`` caps the entry at the key's own expiry.
+        """
+        ttl = self._ttl if outcome.is_ok() else self._negative_ttl
+        if expires_at is not None:
+            remaining = (expires_at - datetime.now(timezone.utc)).total_seconds()
+            ttl = min(ttl, max(0.0, remaining))
+        self._entries[key_hash] = (outcome, time.monotonic() + ttl)
+        self._entries.move_to_end(key_hash)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    @beartype
+    def invalidate(self, *key_hashes: str) -> None:
+        """Drop entries locally; ``*`` clears everything."""
+        if INVALIDATE_ALL in key_hashes:
+            self._entries.clear()
+            return
+        for key_hash in key_hashes:
+            self._entries.pop(key_hash, None)
+
+    @beartype
+    async def publish_invalidation(self, redis: RedisType, *key_hashes: str) -> None:
+        """Evict entries here and on every other worker."""
+        self.invalidate(*key_hashes)
+        if key_hashes:
+            await redis.publish(INVALIDATION_CHANNEL, " ".join(key_hashes))
+
+    @beartype
+    async def start(self, redis: RedisType) -> None:
+        """Listen for invalidations from other workers."""
+        if self._listener is None:
+            self._listener = asyncio.create_task(
+                subscribe_forever(
+                    redis,
+                    INVALIDATION_CHANNEL,
+                    on_message=lambda data: self.invalidate(*data.split()),
+                    on_subscribed=self._on_subscribed,
+                    on_lost=self._entries.clear,
+                ),
+                name="api-key-cache-invalidation",
+            )
+
+    async def _on_subscribed(self) -> None:
+        # Anything cached before (re)subscribing may have missed an eviction
+        self._entries.clear()
+
+    @beartype
+    async def stop(self) -> None:
+        """Stop listening for invalidations."""
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+
+
+class APIKeyUsageTracker:
+    """Aggregate API key usage in memory and flush it in bulk."""
+
+    def __init__(self, flush_interval_seconds: float | None = None) -> None:
+        """Configure the flush interval from settings unless overridden."""
+        settings = get_settings()
+        self._interval = flush_interval_seconds or settings.api_key_usage_flush_seconds
+        self._pending: dict[str, tuple[int, datetime]] = {}
+        self._task: asyncio.Task[None] | None = None
+        self._database: Database | None = None
+
+    @beartype
+    def record(self, key_id: str) -> None:
+        """Count one request for ``key_id``."""
+        uses, _ = self._pending.get(key_id, (0, None))
+        self._pending[key_id] = (uses + 1, datetime.now(timezone.utc))
+
+    @beartype
+    def pending(self, key_id: str) -> APIKeyUsage:
+        """Usage for ``key_id`` not yet written to the database."""
+        entry = self._pending.get(key_id)
+        if entry is None:
+            return APIKeyUsage()
+        return APIKeyUsage(uses=entry[0], last_used_at=entry[1])
+
+    async def flush(self, database: Database) -> Result[int, str]:
+        """Write all pending usage in one statement; returns keys updated."""
+        if not self._pending:
+            return Ok(0)
+
+        batch, self._pending = self._pending, {}
+        key_ids = list(batch)
+        try:
+            await database.execute(
+                _FLUSH_USAGE_SQL,
+                [UUID(key_id) for key_id in key_ids],
+                [batch[key_id][1] for key_id in key_ids],
+                [batch[key_id][0] for key_id in key_ids],
+            )
+        except Exception as e:
+            # Put the batch back so the next flush retries it
+            for key_id, (uses, last_used_at) in batch.items():
+                newer_uses, newer_last = self._pending.get(key_id, (0, last_used_at))
+                self._pending[key_id] = (
+                    uses + newer_uses,
+                    max(last_used_at, newer_last),
+                )
+            return Err(f"Failed to flush API key usage: {str(e)}")
+        return Ok(len(key_ids))
+
+    async def start(self, database: Database) -> None:
+        """Flush on a fixed interval until stopped."""
+        self._database = database
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop(), name="api-key-usage-flush")
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            if self._database is not None:
+                result = await self.flush(self._database)
+                if result.is_err():
+                    logger.warning(result.unwrap_err())
+
+    async def stop(self) -> None:
+        """Cancel the periodic task and write what is left."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        if self._database is not None:
+            result = await self.flush(self._database)
+            if result.is_err():
+                logger.warning(result.unwrap_err())
+
+
+# Global API key cache and usage tracker instances
+_api_key_cache: APIKeyCache | None = None
+_api_key_usage_tracker: APIKeyUsageTracker | None = None
+
+
+@beartype
+def get_api_key_cache() -> APIKeyCache:
+    """Get global API key cache instance."""
+    global _api_key_cache
+    if _api_key_cache is None:
+        _api_key_cache = APIKeyCache()
+    return _api_key_cache
+
+
+@beartype
+def get_api_key_usage_tracker() -> APIKeyUsageTracker:
+    """Get global API key usage tracker instance."""
+    global _api_key_usage_tracker
+    if _api_key_usage_tracker is None:
+        _api_key_usage_tracker = APIKeyUsageTracker()
+    return _api_key_usage_tracker
@@ -17,11 +17,13 @@ from uuid import UUID
 from beartype import beartype
 from pydantic import Field
 
-from policy_core.core.cache import Cache
+from policy_core.core.cache import Cache, get_redis_client
 from policy_core.core.database import Database
 from policy_core.core.result_types import Err, Ok, Result
 from policy_core.models.base import BaseModelConfig
 
+from .api_key_cache import get_api_key_cache, get_api_key_usage_tracker
+
 # Auto-generated models
 
 
@@ -172,43 +174,14 @@ class APIKeyManager:
             # Hash the key
             key_hash = hashlib.sha256(api_key.encode()).hexdigest()
 
-            # Check cache first
-            cache_key = f"{self._cache_prefix}{key_hash}"
-            cached = await self._cache.get(cache_key)
-
-            if cached:
-                key_info = cached
-            else:
-                # Load from database
-                row = await self._db.fetchrow(
-                    """
-                    SELECT id, client_id, scopes, rate_limit_per_minute,
-                           allowed_ips, expires_at, active
-                    FROM api_keys
-                    WHERE key_hash = $1
-                    """,
-                    key_hash,
-                )
-
-                if not row:
-                    return Err("Invalid API key")
-
-                if not row["active"]:
-                    return Err("API key is disabled")
-
-                if row["expires_at"] and row["expires_at"] < datetime.now(timezone.utc):
-                    return Err("API key has expired")
-
-                key_info = {
-                    "id": str(row["id"]),
-                    "client_id": row["client_id"],
-                    "scopes": row["scopes"],
-                    "rate_limit": row["rate_limit_per_minute"],
-                    "allowed_ips": row["allowed_ips"],
-                }
-
-                # Cache for future lookups
-                await self._cache.set(cache_key, key_info, 3600)
+            # In-process cache first (includes recent rejections)
+            local_cache = get_api_key_cache()
+            lookup = local_cache.get(key_hash)
+            if lookup is None:
+                lookup = await self._lookup_key(key_hash)
+            if lookup.is_err():
+                return lookup
+            key_info = lookup.unwrap()
 
             # Check IP allowlist
             if key_info.get("allowed_ips") and request_ip:
@@ -232,14 +205,64 @@ class APIKeyManager:
             if not rate_limit_ok:
                 return Err("Rate limit exceeded")
 
-            # Update last used
-            await self._update_last_used(key_info["id"])
+            # Counted in memory; written in bulk by the usage tracker
+            get_api_key_usage_tracker().record(key_info["id"])
 
             return Ok(key_info)
 
         except Exception as e:
             return Err(f"Failed to validate API key: {str(e)}")
 
+    @beartype
+    async def _lookup_key(self, key_hash: str) -> Result[dict[str, Any], str]:
+        """Load key metadata from Redis or the database and cache the outcome.
+
+        Args:
+            key_hash: SHA-256 of the presented key
+
+        Returns:
+            Result containing key info or the rejection reason
+        """
+        local_cache = get_api_key_cache()
+        cache_key = f"{self._cache_prefix}{key_hash}"
+        cached = await self._cache.get(cache_key)
+        if cached:
+            local_cache.put(key_hash, Ok(cached))
+            return Ok(cached)
+
+        # Load from database
+        row = await self._db.fetchrow(
+            """
+            SELECT id, client_id, scopes, rate_limit_per_minute,
+                   allowed_ips, expires_at, active
+            FROM api_keys
+            WHERE key_hash = $1
+            """,
+            key_hash,
+        )
+
+        outcome: Result[dict[str, Any], str]
+        if not row:
+            outcome = Err("Invalid API key")
+        elif not row["active"]:
+            outcome = Err("API key is disabled")
+        elif row["expires_at"] and row["expires_at"] < datetime.now(timezone.utc):
+            outcome = Err("API key has expired")
+        else:
+            key_info = {
+                "id": str(row["id"]),
+                "client_id": row["client_id"],
+                "scopes": row["scopes"],
+                "rate_limit": row["rate_limit_per_minute"],
+                "allowed_ips": row["allowed_ips"],
+            }
+            # Cache for future lookups
+            await self._cache.set(cache_key, key_info, 3600)
+            outcome = Ok(key_info)
+
+        local_cache.put(key_hash, outcome, row["expires_at"] if row else None)
+        return outcome
+
     @beartype
     async def revoke_api_key(
         self,
@@ -278,8 +301,9 @@ class APIKeyManager:
                 reason,
             )
 
-            # Invalidate cache
+            # Invalidate cache here and on every worker
             await self._cache.delete(f"{self._cache_prefix}{key_hash}")
+            await get_api_key_cache().publish_invalidation(get_redis_client(), key_hash)
 
             return Ok(True)
 
@@ -418,27 +442,6 @@ class APIKeyManager:
 
         return count <= limit_per_minute
 
-    @beartype
-    async def _update_last_used(self, key_id: str) -> None:
-        """Update last used timestamp for API key.
-
-        Args:
-            key_id: API key ID
-        """
-        try:
-            await self._db.execute(
-                """
-                UPDATE api_keys
-                SET last_used_at = $2, use_count = use_count + 1
-                WHERE id = $1
-                """,
-                UUID(key_id),
-                datetime.now(timezone.utc),
-            )
-        except Exception:
-            # Don't fail the request if we can't update last used
-            pass
-
     @beartype
     async def get_usage_statistics(
         self,
@@ -468,6 +471,14 @@ class APIKeyManager:
             if not key_info:
                 return Err("API key not found")
 
+            # Add usage counted in this process but not yet flushed
+            pending = get_api_key_usage_tracker().pending(str(key_id))
+            last_used_at = key_info["last_used_at"]
+            if pending.last_used_at and (
+                last_used_at is None or pending.last_used_at > last_used_at
+            ):
+                last_used_at = pending.last_used_at
+
             # Calculate usage over time (this would require a separate usage log table)
             # For now, return basic stats
             stats = {
@@ -475,8 +486,8 @@ class APIKeyManager:
                 "name": key_info["name"],
                 "client_id": key_info["client_id"],
                 "created_at": key_info["created_at"],
-                "last_used_at": key_info["last_used_at"],
-                "total_requests": key_info["use_count"],
+                "last_used_at": last_used_at,
+                "total_requests": (key_info["use_count"] or 0) + pending.uses,
                 "period_days": days,
             }
 
@@ -501,33 +512,32 @@ class APIKeyManager:
             Result containing number of revoked keys or error
         """
         try:
-            # Count keys to be revoked
-            count = await self._db.fetchval(
-                """
-                SELECT COUNT(*) FROM api_keys
-                WHERE client_id = $1 AND active = true
-                """,
-                client_id,
-            )
+            # Revoke all active keys for the client; Database.fetch reads
+            # from the replica, so the UPDATE needs a primary connection
+            async with self._db.transaction() as conn:
+                rows = await conn.fetch(
+                    """
+                    UPDATE api_keys
+                    SET active = false,
+                        revoked_at = $2,
+                        revocation_reason = $3
+                    WHERE client_id = $1 AND active = true
+                    RETURNING key_hash
+                    """,
+                    client_id,
+                    datetime.now(timezone.utc),
+                    reason,
+                )
+            key_hashes = [row["key_hash"] for row in rows]
 
-            # Revoke all active keys for the client
-            await self._db.execute(
-                """
-                UPDATE api_keys
-                SET active = false,
-                    revoked_at = $2,
-                    revocation_reason = $3
-                WHERE client_id = $1 AND active = true
-                """,
-                client_id,
-                datetime.now(timezone.utc),
-                reason,
+            # Clear cache for all affected keys, here and on every worker
+            for key_hash in key_hashes:
+                await self._cache.delete(f"{self._cache_prefix}{key_hash}")
+            await get_api_key_cache().publish_invalidation(
+                get_redis_client(), *key_hashes
             )
 
-            # Clear cache for all affected keys
-            await self._cache.clear_pattern(f"{self._cache_prefix}*")
-
-            return Ok(count or 0)
+            return Ok(len(key_hashes))
 
         except Exception as e:
             return Err(f"Failed to bulk revoke API keys: {str(e)}")
@@ -0,0 +1,163 @@
+# PolicyCore - Policy Decision Management System
+# Copyright (C) 2025 Luiz Frias <luizf35@gmail.com>
+# Form F[x] Labs
+#
+# This software is dual-licensed under AGPL-3.0 and Commercial License.
+# For commercial licensing, contact: luizf35@gmail.com
+# See LICENSE file for full terms.
+
+"""Per-process OAuth2 client registry.
+
+The token endpoint resolves the same handful of service clients thousands
+of times a second: once for rate limiting, once to authenticate and once
+more to read the token lifetime.  :class:`OAuth2ClientRegistry` keeps
+client rows in an in-process LRU (unknown client ids for a shorter TTL)
+and remembers secrets that already passed the Argon2 check, so a busy
+``client_credentials`` caller costs neither a query nor a hash per token.
+
+``OAuth2AdminService`` evicts a client on every worker through the
+``oauth2:clients:invalidate`` pub/sub channel whenever its configuration
+or secret changes.
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import hmac
+import secrets
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from beartype import beartype
+
+from policy_core.core.cache import RedisType, subscribe_forever
+from policy_core.core.config import get_settings
+
+INVALIDATION_CHANNEL = "oauth2:clients:invalidate"
+INVALIDATE_ALL = "*"
+MAX_CACHED_CLIENTS = 10000
+NEGATIVE_TTL_SECONDS = 5.0
+
+
+class _Entry:
+    """Cached client row plus digests of secrets already verified for it."""
+
+    __slots__ = ("client", "expires", "verified")
+
+    def __init__(self, client: dict[str, Any] | None, expires: float) -> None:
+        self.client = client
+        self.expires = expires
+        self.verified: set[bytes] = set()
+
+
+class OAuth2ClientRegistry:
+    """In-process TTL cache of OAuth2 client configuration."""
+
+    def __init__(
+        self,
+        ttl_seconds: float | None = None,
+        max_entries: int = MAX_CACHED_CLIENTS,
+    ) -> None:
+        """Configure the TTL from settings unless overridden."""
+        self._ttl = ttl_seconds or get_settings().oauth2_client_cache_ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        # Keyed digests, so cached secrets are useless outside this process
+        self._digest_key = secrets.token_bytes(32)
+        self._listener: asyncio.Task[None] | None = None
+
+    async def resolve(
+        self,
+        client_id: str,
+        loader: Callable[[str], Awaitable[dict[str, Any] | None]],
+    ) -> dict[str, Any] | None:
+        """Return the cached client, loading it with ``loader`` on a miss."""
+        entry = self._entries.get(client_id)
+        if entry is not None and entry.expires > time.monotonic():
+            self._entries.move_to_end(client_id)
+            return entry.client
+
+        client = await loader(client_id)
+        ttl = self._ttl if client is not None else min(self._ttl, NEGATIVE_TTL_SECONDS)
+        self._entries[client_id] = _Entry(client, time.monotonic() + ttl)
+        self._entries.move_to_end(client_id)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return client
+
+    def _digest(self, secret: str) -> bytes:
+        return hmac.new(self._digest_key, secret.encode(), hashlib.sha256).digest()
+
+    def secret_verified(self, client_id: str, secret: str) -> bool:
+        """Whether ``secret`` already passed verification for the cached client."""
+        entry = self._entries.get(client_id)
+        return (
+            entry is not None
+            and entry.expires > time.monotonic()
+            and self._digest(secret) in entry.verified
+        )
+
+    def remember_secret(self, client_id: str, secret: str) -> None:
+        """Record a successful secret check until the client is evicted."""
+        entry = self._entries.get(client_id)
+        if entry is not None and entry.client is not None:
+            entry.verified.add(self._digest(secret))
+
+    @beartype
+    def invalidate(self, *client_ids: str) -> None:
+        """Drop entries locally; ``*`` clears everything."""
+        if INVALIDATE_ALL in client_ids:
+            self._entries.clear()
+            return
+        for client_id in client_ids:
+            self._entries.pop(client_id, None)
+
+    @beartype
+    async def publish_invalidation(self, redis: RedisType, *client_ids: str) -> None:
+        """Evict clients here and on every other worker."""
+        self.invalidate(*client_ids)
+        if client_ids:
+            await redis.publish(INVALIDATION_CHANNEL, " ".join(client_ids))
+
+    @beartype
+    async def start(self, redis: RedisType) -> None:
+        """Listen for invalidations from other workers."""
+        if self._listener is None:
+            self._listener = asyncio.create_task(
+                subscribe_forever(
+                    redis,
+                    INVALIDATION_CHANNEL,
+                    on_message=lambda data: self.invalidate(*data.split()),
+                    on_subscribed=self._on_subscribed,
+                    on_lost=self._entries.clear,
+                ),
+                name="oauth2-client-invalidation",
+            )
+
+    async def _on_subscribed(self) -> None:
+        # Anything cached before (re)subscribing may have missed an eviction
+        self._entries.clear()
+
+    @beartype
+    async def stop(self) -> None:
+        """Stop listening for invalidations."""
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+
+
+# Global OAuth2 client registry instance
+_client_registry: OAuth2ClientRegistry | None = None
+
+
+@beartype
+def get_client_registry() -> OAuth2ClientRegistry:
+    """Get global OAuth2 client registry instance."""
+    global _client_registry
+    if _client_registry is None:
+        _client_registry = OAuth2ClientRegistry()
+    return _client_registry
@@ -0,0 +1,160 @@
+# PolicyCore - Policy Decision Management System
+# Copyright (C) 2025 Luiz Frias <luizf35@gmail.com>
+# Form F[x] Labs
+#
+# This software is dual-licensed under AGPL-3.0 and Commercial License.
+# For commercial licensing, contact: luizf35@gmail.com
+# See LICENSE file for full terms.
+
+"""Per-process cache of OAuth2 introspection responses.
+
+Resource servers introspect the token of every request they receive, so
+the same token is introspected over and over.  :class:`IntrospectionCache`
+keeps responses keyed by the token's SHA-256 hex digest (the same digest
+refresh tokens are stored under):
+
+* active responses live for ``oauth2_introspection_cache_ttl_seconds``,
+  capped at the token's own ``exp``;
+* inactive responses live for the shorter negative TTL;
+* an active access token is re-checked against the local JWT revocation
+  set on every hit.
+
+``OAuth2Server.revoke``, refresh token rotation and the admin revocation
+paths evict entries on every worker through the
+``oauth2:introspection:invalidate`` pub/sub channel.
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any
+
+from beartype import beartype
+
+from policy_core.core.cache import Cache, RedisType, subscribe_forever
+from policy_core.core.config import get_settings
+
+from .token_verifier import get_token_verifier
+
+INVALIDATION_CHANNEL = "oauth2:introspection:invalidate"
+INVALIDATE_ALL = "*"
+MAX_CACHED_RESPONSES = 100000
+
+
+@beartype
+def token_digest(token: str) -> str:
+    """SHA-256 hex digest used to key tokens at rest and in caches."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class IntrospectionCache:
+    """In-process TTL cache of introspection responses."""
+
+    def __init__(
+        self,
+        ttl_seconds: float | None = None,
+        negative_ttl_seconds: float | None = None,
+        max_entries: int = MAX_CACHED_RESPONSES,
+    ) -> None:
+        """Configure TTLs from settings unless overridden."""
+        settings = get_settings()
+        self._ttl = ttl_seconds or settings.oauth2_introspection_cache_ttl_seconds
+        self._negative_ttl = (
+            negative_ttl_seconds or settings.oauth2_introspection_negative_ttl_seconds
+        )
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[dict[str, Any], float]] = OrderedDict()
+        self._listener: asyncio.Task[None] | None = None
+
+    def get(self, digest: str) -> dict[str, Any] | None:
+        """Return a copy of the cached response, or None on a miss."""
+        entry = self._entries.get(digest)
+        if entry is None:
+            return None
+        response, expires = entry
+        if expires <= time.monotonic():
+            del self._entries[digest]
+            return None
+
+        jti = response.get("jti")
+        if jti and get_token_verifier().is_revoked(str(jti)):
+            del self._entries[digest]
+            return None
+
+        self._entries.move_to_end(digest)
+        return dict(response)
+
+    def put(self, digest: str, response: dict[str, Any]) -> None:
+        """Cache ``response`` for the positive or negative TTL."""
+        if response.get("active"):
+            ttl = self._ttl
+            exp = response.get("exp")
+            if isinstance(exp, int | float):
+                ttl = min(ttl, exp - time.time())
+            if ttl <= 0:
+                return
+        else:
+            ttl = self._negative_ttl
+
+        self._entries[digest] = (dict(response), time.monotonic() + ttl)
+        self._entries.move_to_end(digest)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    @beartype
+    def invalidate(self, *digests: str) -> None:
+        """Drop entries locally; ``*`` clears everything."""
+        if INVALIDATE_ALL in digests:
+            self._entries.clear()
+            return
+        for digest in digests:
+            self._entries.pop(digest, None)
+
+    async def publish_invalidation(self, cache: Cache, *digests: str) -> None:
+        """Evict entries here and on every other worker."""
+        self.invalidate(*digests)
+        if digests:
+            await cache.publish(INVALIDATION_CHANNEL, " ".join(digests))
+
+    @beartype
+    async def start(self, redis: RedisType) -> None:
+        """Listen for invalidations from other workers."""
+        if self._listener is None:
+            self._listener = asyncio.create_task(
+                subscribe_forever(
+                    redis,
+                    INVALIDATION_CHANNEL,
+                    on_message=lambda data: self.invalidate(*data.split()),
+                    on_subscribed=self._on_subscribed,
+                    on_lost=self._entries.clear,
+                ),
+                name="oauth2-introspection-invalidation",
+            )
+
+    async def _on_subscribed(self) -> None:
+        # Anything cached before (re)subscribing may have missed an eviction
+        self._entries.clear()
+
+    @beartype
+    async def stop(self) -> None:
+        """Stop listening for invalidations."""
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+
+
+# Global introspection cache instance
+_introspection_cache: IntrospectionCache | None = None
+
+
+@beartype
+def get_introspection_cache() -> IntrospectionCache:
+    """Get global introspection cache instance."""
+    global _introspection_cache
+    if _introspection_cache is None:
+        _introspection_cache = IntrospectionCache()
+    return _introspection_cache
@@ -0,0 +1,270 @@
+# PolicyCore - Policy Decision Management System
+# Copyright (C) 2025 Luiz Frias <luizf35@gmail.com>
+# Form F[x] Labs
+#
+# This software is dual-licensed under AGPL-3.0 and Commercial License.
+# For commercial licensing, contact: luizf35@gmail.com
+# See LICENSE file for full terms.
+
+"""Write-behind persistence for OAuth2 refresh tokens.
+
+Issuing a token used to wait on an ``INSERT INTO oauth2_refresh_tokens``.
+:class:`RefreshTokenWriter` instead buffers new rows and writes them in
+one ``INSERT ... SELECT FROM unnest()`` per flush interval (or as soon as
+a batch fills).  Until a row reaches the database it is mirrored in Redis
+under ``refresh_token:<hash>``, so any worker can redeem or introspect a
+token the moment it is issued.
+
+The database stays authoritative once it has a row: lookups consult it
+first and only fall back to the buffer or the mirror when the token has
+not been flushed yet.  Revoking an unflushed token upserts it with
+``revoked_at`` set, and the batched insert skips hashes that already
+exist, so a late flush cannot resurrect it.
+
+Rows whose client or user has since been deleted are left out of the insert
+and logged, so one orphan cannot fail every later flush.  If the database
+is unreachable the buffer is bounded by ``oauth2_refresh_token_max_pending``;
+past it the oldest tokens are dropped with an error log.
+"""
+
+import asyncio
+import contextlib
+import logging
+from datetime import datetime
+from uuid import UUID
+
+from beartype import beartype
+from pydantic import BaseModel, ConfigDict, Field
+
+from policy_core.core.cache import Cache
+from policy_core.core.config import get_settings
+from policy_core.core.database import Database
+from policy_core.core.result_types import Err, Ok, Result
+
+logger = logging.getLogger(__name__)
+
+MIRROR_PREFIX = "refresh_token:"
+MIRROR_TTL_SECONDS = 300
+
+# Returns the hashes left out because their client or user no longer exists
+_FLUSH_SQL = """
+    WITH batch AS (
+        SELECT *
+        FROM unnest(
+            $1::text[], $2::text[], $3::uuid[], $4::text[],
+            $5::timestamptz[], $6::timestamptz[]
+        ) AS u(token_hash, client_id, user_id, scopes, expires_at, created_at)
+    ), valid AS (
+        SELECT b.*
+        FROM batch b
+        WHERE EXISTS (
+            SELECT 1 FROM oauth2_clients c WHERE c.client_id = b.client_id
+        )
+        AND (
+            b.user_id IS NULL
+            OR EXISTS (SELECT 1 FROM users WHERE users.id = b.user_id)
+        )
+    ), inserted AS (
+        INSERT INTO oauth2_refresh_tokens (
+            token_hash, client_id, user_id, scopes, expires_at, created_at
+        )
+        SELECT v.token_hash, v.client_id, v.user_id,
+               string_to_array(v.scopes, ' '), v.expires_at, v.created_at
+        FROM valid v
+        ON CONFLICT (token_hash) DO NOTHING
+    )
+    SELECT b.token_hash
+    FROM batch b
+    WHERE NOT EXISTS (SELECT 1 FROM valid v WHERE v.token_hash = b.token_hash)
+"""
+
+_REVOKE_UNFLUSHED_SQL = """
+    INSERT INTO oauth2_refresh_tokens (
+        token_hash, client_id, user_id, scopes, expires_at, created_at, revoked_at
+    ) VALUES ($1, $2, $3, $4, $5, $6, $7)
+    ON CONFLICT (token_hash) DO UPDATE
+    SET revoked_at = EXCLUDED.revoked_at
+    WHERE oauth2_refresh_tokens.revoked_at IS NULL
+"""
+
+
+class RefreshTokenRecord(BaseModel):
+    """A refresh token row waiting to be written."""
+
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        validate_assignment=True,
+        str_strip_whitespace=True,
+        validate_default=True,
+    )
+
+    token_hash: str = Field(..., min_length=1)
+    client_id: str = Field(..., min_length=1)
+    user_id: UUID | None = Field(default=None)
+    scopes: list[str] = Field(default_factory=list)
+    expires_at: datetime = Field(...)
+    created_at: datetime = Field(...)
+
+
+class RefreshTokenWriter:
+    """Buffer refresh token inserts and flush them in bulk."""
+
+    def __init__(
+        self,
+        flush_interval_seconds: float | None = None,
+        max_batch: int | None = None,
+        max_pending: int | None = None,
+    ) -> None:
+        """Configure batching from settings unless overridden."""
+        settings = get_settings()
+        self._interval = (
+            flush_interval_seconds or settings.oauth2_refresh_token_flush_seconds
+        )
+        self._max_batch = max_batch or settings.oauth2_refresh_token_batch_size
+        self._max_pending = max(
+            max_pending or settings.oauth2_refresh_token_max_pending, self._max_batch
+        )
+        # Insertion order is issue order, so the first entries are the oldest
+        self._pending: dict[str, RefreshTokenRecord] = {}
+        self._batch_full = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._database: Database | None = None
+
+    @property
+    def pending_count(self) -> int:
+        """Number of tokens not yet written to the database."""
+        return len(self._pending)
+
+    async def record(self, cache: Cache, token: RefreshTokenRecord) -> None:
+        """Queue ``token`` and mirror it in Redis for other workers."""
+        self._pending[token.token_hash] = token
+        self._trim_pending()
+        if len(self._pending) >= self._max_batch:
+            self._batch_full.set()
+        await cache.set(
+            f"{MIRROR_PREFIX}{token.token_hash}",
+            token.model_dump(mode="json"),
+            MIRROR_TTL_SECONDS,
+        )
+
+    async def lookup(self, cache: Cache, token_hash: str) -> RefreshTokenRecord | None:
+        """Find a token that may not have been flushed yet."""
+        token = self._pending.get(token_hash)
+        if token is not None:
+            return token
+        mirrored = await cache.get(f"{MIRROR_PREFIX}{token_hash}")
+        if not mirrored:
+            return None
+        return RefreshTokenRecord.model_validate(mirrored)
+
+    async def revoke_unflushed(
+        self,
+        database: Database,
+        cache: Cache,
+        token: RefreshTokenRecord,
+        revoked_at: datetime,
+    ) -> None:
+        """Persist ``token`` as revoked, whichever worker still buffers it."""
+        self._pending.pop(token.token_hash, None)
+        await database.execute(
+            _REVOKE_UNFLUSHED_SQL,
+            token.token_hash,
+            token.client_id,
+            token.user_id,
+            token.scopes,
+            token.expires_at,
+            token.created_at,
+            revoked_at,
+        )
+        await cache.delete(f"{MIRROR_PREFIX}{token.token_hash}")
+
+    def _trim_pending(self) -> None:
+        """Drop the oldest tokens beyond ``max_pending``."""
+        excess = len(self._pending) - self._max_pending
+        if excess <= 0:
+            return
+        for token_hash in list(self._pending)[:excess]:
+            del self._pending[token_hash]
+        logger.error("Refresh token buffer full; dropped %d unpersisted tokens", excess)
+
+    async def flush(self, database: Database) -> Result[int, str]:
+        """Write all buffered tokens in one statement; returns rows queued.
+
+        Tokens whose client or user was deleted are dropped, not retried.
+        """
+        if not self._pending:
+            return Ok(0)
+
+        batch, self._pending = list(self._pending.values()), {}
+        self._batch_full.clear()
+        try:
+            # A write: never route it to a read replica
+            async with database.transaction() as conn:
+                orphans = await conn.fetch(
+                    _FLUSH_SQL,
+                    [token.token_hash for token in batch],
+                    [token.client_id for token in batch],
+                    [token.user_id for token in batch],
+                    [" ".join(token.scopes) for token in batch],
+                    [token.expires_at for token in batch],
+                    [token.created_at for token in batch],
+                )
+        except Exception as e:
+            # Put the batch back ahead of newer tokens so the next flush
+            # retries it
+            self._pending = {
+                **{token.token_hash: token for token in batch},
+                **self._pending,
+            }
+            self._trim_pending()
+            return Err(f"Failed to flush refresh tokens: {str(e)}")
+
+        if orphans:
+            logger.warning(
+                "Dropped %d refresh tokens whose client or user no longer exists",
+                len(orphans),
+            )
+        return Ok(len(batch))
+
+    async def start(self, database: Database) -> None:
+        """Flush on a fixed interval, or early when a batch fills."""
+        self._database = database
+        if self._task is None:
+            self._task = asyncio.create_task(
+                self._loop(), name="oauth2-refresh-token-flush"
+            )
+
+    async def _loop(self) -> None:
+        while True:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._batch_full.wait(), self._interval)
+            if self._database is not None:
+                result = await self.flush(self._database)
+                if result.is_err():
+                    logger.warning(result.unwrap_err())
+
+    async def stop(self) -> None:
+        """Cancel the periodic task and write what is left."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        if self._database is not None:
+            result = await self.flush(self._database)
+            if result.is_err():
+                logger.warning(result.unwrap_err())
+
+
+# Global refresh token writer instance
+_refresh_token_writer: RefreshTokenWriter | None = None
+
+
+@beartype
+def get_refresh_token_writer() -> RefreshTokenWriter:
+    """Get global refresh token writer instance."""
+    global _refresh_token_writer
+    if _refresh_token_writer is None:
+        _refresh_token_writer = RefreshTokenWriter()
+    return _refresh_token_writer
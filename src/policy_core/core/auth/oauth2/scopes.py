@@ -6,8 +6,16 @@
 # For commercial licensing, contact: luizf35@gmail.com
 # See LICENSE file for full terms.
 
-"""OAuth2 scope definitions and validation."""
+"""OAuth2 scope definitions and validation.
 
+The scope graph is compiled at import: every scope name is interned to a
+single bit and its transitive ``includes`` closure is precomputed as a
+mask, so a permission check is one AND.  Token scope lists and strings
+are memoized to masks because the same few combinations repeat on every
+request.
+"""
+
+import functools
 from enum import Enum
 
 from beartype import beartype
@@ -159,6 +167,70 @@ SCOPES: dict[str, Scope] = {
 }
 
 
+# Compiled scope graph
+_SCOPE_BITS: dict[str, int] = {}
+_SCOPE_CLOSURES: dict[str, int] = {}
+SCOPE_MASK_CACHE_SIZE = 4096
+
+
+def scope_bit(name: str) -> int:
+    """Interned bit for a scope name.
+
+    Names outside :data:`SCOPES` get a fresh bit that includes nothing else,
+    matching how :meth:`ScopeValidator.expand_scopes` treats them.
+    """
+    bit = _SCOPE_BITS.get(name)
+    if bit is None:
+        bit = 1 << len(_SCOPE_BITS)
+        _SCOPE_BITS[name] = bit
+        _SCOPE_CLOSURES[name] = bit
+    return bit
+
+
+def _compile_scope_graph() -> None:
+    for name, scope in SCOPES.items():
+        scope_bit(name)
+        for included in scope.includes:
+            scope_bit(included)
+
+    # Propagate includes until the closure is stable
+    changed = True
+    while changed:
+        changed = False
+        for name, scope in SCOPES.items():
+            closure = _SCOPE_CLOSURES[name]
+            for included in scope.includes:
+                closure |= _SCOPE_CLOSURES[included]
+            if closure != _SCOPE_CLOSURES[name]:
+                _SCOPE_CLOSURES[name] = closure
+                changed = True
+
+
+_compile_scope_graph()
+
+
+@functools.lru_cache(maxsize=SCOPE_MASK_CACHE_SIZE)
+def scopes_mask(scopes: tuple[str, ...]) -> int:
+    """Mask of the given scopes and everything they include."""
+    mask = 0
+    for name in scopes:
+        closure = _SCOPE_CLOSURES.get(name)
+        mask |= closure if closure is not None else scope_bit(name)
+    return mask
+
+
+@functools.lru_cache(maxsize=SCOPE_MASK_CACHE_SIZE)
+def parse_scope_string(scope: str) -> tuple[tuple[str, ...], int]:
+    """Split a space-delimited OAuth2 ``scope`` claim and compute its mask."""
+    names = tuple(scope.split())
+    return names, scopes_mask(names)
+
+
+def scope_names(mask: int) -> set[str]:
+    """Scope names whose bits are set in ``mask``."""
+    return {name for name, bit in _SCOPE_BITS.items() if mask & bit}
+
+
 class ScopeValidator:
     """Validate and expand OAuth2 scopes."""
 
@@ -204,24 +276,7 @@ class ScopeValidator:
         Returns:
             Set of expanded scope names including all dependencies
         """
-        expanded = set()
-
-        @beartype
-        def add_scope_with_includes(scope_name: str) -> None:
-            if scope_name in expanded:
-                return
-
-            expanded.add(scope_name)
-
-            scope = SCOPES.get(scope_name)
-            if scope and scope.includes:
-                for included in scope.includes:
-                    add_scope_with_includes(included)
-
-        for scope in scopes:
-            add_scope_with_includes(scope)
-
-        return expanded
+        return scope_names(scopes_mask(tuple(scopes)))
 
     @staticmethod
     @beartype
@@ -238,8 +293,7 @@ class ScopeValidator:
         Returns:
             True if token has the required scope (directly or through inclusion)
         """
-        expanded = ScopeValidator.expand_scopes(token_scopes)
-        return required_scope in expanded
+        return bool(scopes_mask(tuple(token_scopes)) & scope_bit(required_scope))
 
     @staticmethod
     @beartype
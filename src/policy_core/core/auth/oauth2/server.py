@@ -14,17 +14,27 @@ from datetime import datetime, timedelta, timezone
 from typing import Any
 from uuid import UUID, uuid4
 
+import jwt
 from beartype import beartype
-from jose import JWTError, jwt  # type: ignore[import-untyped]
 from passlib.context import CryptContext
 from pydantic import Field
 
-from policy_core.core.cache import Cache
+from policy_core.core.cache import Cache, get_redis_client
 from policy_core.core.config import Settings
 from policy_core.core.database import Database
+from policy_core.core.password_hasher import (
+    PasswordHasherBusyError,
+    get_password_hasher,
+)
 from policy_core.core.result_types import Err, Ok, Result
 from policy_core.models.base import BaseModelConfig
 
+from .client_registry import get_client_registry
+from .introspection_cache import get_introspection_cache, token_digest
+from .refresh_tokens import RefreshTokenRecord, get_refresh_token_writer
+from .signing_keys import get_signing_key_ring
+from .token_verifier import get_token_verifier
+
 # Auto-generated models
 
 
@@ -142,7 +152,9 @@ class OAuth2Server:
 
             if client_type == "confidential":
                 client_secret = self._generate_client_secret()
-                client_secret_hash = pwd_context.hash(client_secret)
+                client_secret_hash = await get_password_hasher().run(
+                    pwd_context.hash, client_secret
+                )
 
             # Store in database
             await self._db.execute(
@@ -280,9 +292,10 @@ class OAuth2Server:
                     )
 
                 tokens = await self._generate_tokens(
-                    client_id,
+                    client,
                     user_id,
                     requested_scopes,
+                    include_refresh_token=False,
                 )
 
                 return Ok(
@@ -348,7 +361,7 @@ class OAuth2Server:
             # Handle different grant types
             if grant_type == "authorization_code":
                 return await self._handle_authorization_code_grant(
-                    code, redirect_uri, client_id, code_verifier
+                    code, redirect_uri, client_id, code_verifier, client
                 )
 
             elif grant_type == "refresh_token":
@@ -373,6 +386,8 @@ class OAuth2Server:
             else:
                 return Err("unsupported_grant_type")
 
+        except PasswordHasherBusyError as e:
+            return Err(f"temporarily_unavailable: {str(e)}")
         except OAuth2Error as e:
             return Err(f"{e.error}: {e.error_description or e.error}")
         except Exception as e:
@@ -396,6 +411,9 @@ class OAuth2Server:
 
         Returns:
             Token introspection response
+
+        Raises:
+            PasswordHasherBusyError: The client secret could not be checked
         """
         # Authenticate client if credentials provided
         if client_id and client_secret:
@@ -403,40 +421,97 @@ class OAuth2Server:
             if not client:
                 return {"active": False}
 
-        # Try to decode as JWT first
-        try:
-            payload = jwt.decode(
-                token,
-                self._settings.jwt_secret,
-                algorithms=[self._settings.jwt_algorithm],
+        return (await self._introspect_tokens([token]))[0]
+
+    @beartype
+    async def introspect_many(
+        self,
+        tokens: list[str],
+        client_id: str | None = None,
+        client_secret: str | None = None,
+    ) -> list[dict[str, Any]]:  # SYSTEM_BOUNDARY - OAuth2 introspection responses
+        """Introspect several tokens with one client check.
+
+        Args:
+            tokens: Tokens to introspect
+            client_id: Client identifier for authentication
+            client_secret: Client secret for authentication
+
+        Returns:
+            Introspection responses in the order of ``tokens``
+
+        Raises:
+            PasswordHasherBusyError: The client secret could not be checked
+        """
+        if client_id and client_secret:
+            client = await self._authenticate_client(client_id, client_secret)
+            if not client:
+                return [{"active": False} for _ in tokens]
+
+        return await self._introspect_tokens(tokens)
+
+    async def _introspect_tokens(
+        self, tokens: list[str]
+    ) -> list[dict[str, Any]]:  # SYSTEM_BOUNDARY - OAuth2 introspection responses
+        """Introspect tokens through the response cache.
+
+        Access tokens are verified locally; refresh tokens that miss the
+        cache are looked up together.
+        """
+        cache = get_introspection_cache()
+        digests = [token_digest(token) for token in tokens]
+        responses: list[dict[str, Any] | None] = [cache.get(d) for d in digests]
+        refresh_indexes: list[int] = []
+
+        for index, token in enumerate(tokens):
+            if responses[index] is not None:
+                continue
+            # Try to decode as JWT first
+            try:
+                payload = get_signing_key_ring().decode(token)
+            except jwt.InvalidTokenError:
+                # Not a valid JWT, might be a refresh token
+                refresh_indexes.append(index)
+                continue
+            response = await self._access_token_response(payload)
+            cache.put(digests[index], response)
+            responses[index] = response
+
+        if refresh_indexes:
+            rows = await self._find_refresh_tokens(
+                [digests[index] for index in refresh_indexes]
             )
+            for index in refresh_indexes:
+                response = self._refresh_token_response(rows.get(digests[index]))
+                cache.put(digests[index], response)
+                responses[index] = response
 
-            # Check if token is still valid
-            exp = payload.get("exp", 0)
-            if datetime.fromtimestamp(exp, tz=timezone.utc) < datetime.now(
-                timezone.utc
-            ):
-                return {"active": False}
+        return [response or {"active": False} for response in responses]
 
-            # Check if token is revoked
-            jti = payload.get("jti")
-            if jti and await self._is_token_revoked(jti):
-                return {"active": False}
+    async def _access_token_response(
+        self, payload: dict[str, Any]  # SYSTEM_BOUNDARY - JWT claims
+    ) -> dict[str, Any]:  # SYSTEM_BOUNDARY - OAuth2 token introspection response
+        """Introspection response for verified access token claims."""
+        # Check if token is still valid
+        exp = payload.get("exp", 0)
+        if datetime.fromtimestamp(exp, tz=timezone.utc) < datetime.now(timezone.utc):
+            return {"active": False}
 
-            return {
-                "active": True,
-                "scope": payload.get("scope", ""),
-                "client_id": payload.get("client_id"),
-                "username": payload.get("sub"),
-                "exp": payload.get("exp"),
-                "iat": payload.get("iat"),
-                "jti": jti,
-                "token_type": "access_token",
-            }
+        # Check if token is revoked
+        jti = payload.get("jti")
+        if jti and await self._is_token_revoked(jti):
+            return {"active": False}
 
-        except JWTError:
-            # Not a valid JWT, might be a refresh token
-            return await self._introspect_refresh_token(token)
+        return {
+            "active": True,
+            "scope": payload.get("scope", ""),
+            "client_id": payload.get("client_id"),
+            "username": payload.get("sub"),
+            "exp": payload.get("exp"),
+            "iat": payload.get("iat"),
+            "jti": jti,
+            "token_type": "access_token",
+        }
 
     @beartype
     async def revoke(
@@ -456,6 +531,9 @@ class OAuth2Server:
 
         Returns:
             Result indicating success or error
+
+        Raises:
+            PasswordHasherBusyError: The client secret could not be checked
         """
         # Authenticate client if credentials provided
         if client_id and client_secret:
@@ -465,11 +543,8 @@ class OAuth2Server:
 
         # Try to decode as JWT
         try:
-            payload = jwt.decode(
-                token,
-                self._settings.jwt_secret,
-                algorithms=[self._settings.jwt_algorithm],
-                options={"verify_exp": False},  # Allow expired tokens
+            payload = get_signing_key_ring().decode(
+                token, verify_exp=False  # Allow expired tokens
             )
 
             jti = payload.get("jti")
@@ -483,10 +558,17 @@ class OAuth2Server:
                     "1",
                     ttl,
                 )
+                # Push to every worker's in-process revocation set
+                await get_token_verifier().publish_revocation(
+                    get_redis_client(), jti, int(exp)
+                )
+                await get_introspection_cache().publish_invalidation(
+                    self._cache, token_digest(token)
+                )
 
                 return Ok(True)
 
-        except JWTError:
+        except jwt.InvalidTokenError:
             pass
 
         # Try as refresh token
@@ -508,11 +590,18 @@ class OAuth2Server:
     async def _get_client(
         self, client_id: str
     ) -> dict[str, Any] | None:  # SYSTEM_BOUNDARY - Database row mapping
-        """Get client configuration from database."""
+        """Get client configuration, cached in-process per worker."""
+        return await get_client_registry().resolve(client_id, self._load_client)
+
+    async def _load_client(
+        self, client_id: str
+    ) -> dict[str, Any] | None:  # SYSTEM_BOUNDARY - Database row mapping
+        """Load client configuration from database."""
         row = await self._db.fetchrow(
             """
             SELECT client_id, client_secret_hash, client_name, client_type,
-                   redirect_uris, allowed_grant_types, allowed_scopes
+                   redirect_uris, allowed_grant_types, allowed_scopes,
+                   token_lifetime
             FROM oauth2_clients
             WHERE client_id = $1 AND is_active = true
             """,
@@ -544,9 +633,17 @@ class OAuth2Server:
         if not client_secret or not client.get("client_secret_hash"):
             return None
 
-        if not pwd_context.verify(client_secret, client["client_secret_hash"]):
+        # Skip the Argon2 check for a secret this worker already verified
+        registry = get_client_registry()
+        if registry.secret_verified(client_id, client_secret):
+            return client
+
+        if not await get_password_hasher().run(
+            pwd_context.verify, client_secret, client["client_secret_hash"]
+        ):
             return None
 
+        registry.remember_secret(client_id, client_secret)
         return client
 
     @beartype
@@ -582,15 +679,13 @@ class OAuth2Server:
     @beartype
     async def _generate_tokens(
         self,
-        client_id: str,
+        client: dict[str, Any],  # SYSTEM_BOUNDARY - Database row mapping
         user_id: UUID | None,
         scopes: list[str],
+        include_refresh_token: bool = True,
     ) -> dict[str, str]:  # SYSTEM_BOUNDARY - OAuth2 token storage format
-        """Generate access and refresh tokens."""
-        # Get client configuration for token lifetime
-        client = await self._get_client(client_id)
-        if not client:
-            raise OAuth2Error("invalid_client", "Client not found")
+        """Generate an access token and, unless excluded, a refresh token."""
+        client_id = client["client_id"]
 
         # Use client-specific token lifetime if configured
         token_lifetime = client.get("token_lifetime")
@@ -622,29 +717,23 @@ class OAuth2Server:
         else:
             access_payload["typ"] = "client"
 
-        access_token = jwt.encode(
-            access_payload,
-            self._settings.jwt_secret,
-            algorithm=self._settings.jwt_algorithm,
-        )
+        access_token = get_signing_key_ring().sign(access_payload)
 
-        # Refresh token (opaque token)
-        refresh_token = secrets.token_urlsafe(32)
+        if not include_refresh_token:
+            return {"access_token": access_token}
 
-        # Store refresh token
-        await self._db.execute(
-            """
-            INSERT INTO oauth2_refresh_tokens (
-                token_hash, client_id, user_id, scopes,
-                expires_at, created_at
-            ) VALUES ($1, $2, $3, $4, $5, $6)
-            """,
-            hashlib.sha256(refresh_token.encode()).hexdigest(),
-            client_id,
-            user_id,
-            scopes,
-            now + self._refresh_token_expire,
-            now,
+        # Refresh token (opaque token), persisted by the batched writer
+        refresh_token = secrets.token_urlsafe(32)
+        await get_refresh_token_writer().record(
+            self._cache,
+            RefreshTokenRecord(
+                token_hash=hashlib.sha256(refresh_token.encode()).hexdigest(),
+                client_id=client_id,
+                user_id=user_id,
+                scopes=scopes,
+                expires_at=now + self._refresh_token_expire,
+                created_at=now,
+            ),
         )
 
         return {
@@ -659,6 +748,7 @@ class OAuth2Server:
         redirect_uri: str | None,
         client_id: str | None,
         code_verifier: str | None = None,
+        client: dict[str, Any] | None = None,  # SYSTEM_BOUNDARY - Database row
     ) -> Result[dict[str, Any], str]:
         """Handle authorization code grant type with enhanced PKCE validation."""
         if not code:
@@ -723,9 +813,13 @@ class OAuth2Server:
         await self._cache.delete(f"auth_code:{code}")
 
         # Generate tokens
+        if client is None:
+            client = await self._get_client(client_id)
+        if client is None:
+            raise OAuth2Error("invalid_client", "Client not found")
         user_id = UUID(code_data["user_id"]) if code_data.get("user_id") else None
         tokens = await self._generate_tokens(
-            client_id,
+            client,
             user_id,
             code_data["scopes"],
         )
@@ -750,7 +844,7 @@ class OAuth2Server:
         self,
         refresh_token: str | None,
         scope: str | None,
-        client: ClientData,
+        client: dict[str, Any],  # SYSTEM_BOUNDARY - Database row mapping
     ) -> Result[dict[str, Any], str]:
         """Handle refresh token grant type."""
         if not refresh_token:
@@ -759,17 +853,10 @@ class OAuth2Server:
         # Hash token for lookup
         token_hash = hashlib.sha256(refresh_token.encode()).hexdigest()
 
-        # Get refresh token from database
-        row = await self._db.fetchrow(
-            """
-            SELECT client_id, user_id, scopes, expires_at
-            FROM oauth2_refresh_tokens
-            WHERE token_hash = $1 AND revoked_at IS NULL
-            """,
-            token_hash,
-        )
+        # Get refresh token from database or the unflushed write buffer
+        row = await self._find_refresh_token(token_hash)
 
-        if not row:
+        if not row or row["revoked_at"] is not None:
             return Err("invalid_grant: Invalid refresh token")
 
         # Check expiration
@@ -796,21 +883,13 @@ class OAuth2Server:
         # Generate new tokens
         user_id = row["user_id"]
         tokens = await self._generate_tokens(
-            client["client_id"],
+            client,
             user_id,
             scopes,
         )
 
         # Optionally revoke old refresh token (rotation)
-        await self._db.execute(
-            """
-            UPDATE oauth2_refresh_tokens
-            SET revoked_at = $2
-            WHERE token_hash = $1
-            """,
-            token_hash,
-            datetime.now(timezone.utc),
-        )
+        await self._mark_refresh_token_revoked(token_hash, row)
 
         return Ok(
             {
@@ -825,7 +904,7 @@ class OAuth2Server:
     @beartype
     async def _handle_client_credentials_grant(
         self,
-        client: ClientData,
+        client: dict[str, Any],  # SYSTEM_BOUNDARY - Database row mapping
         scope: str | None,
     ) -> Result[dict[str, Any], str]:
         """Handle client credentials grant type."""
@@ -851,9 +930,10 @@ class OAuth2Server:
 
         # Generate tokens (no user_id for client credentials)
         tokens = await self._generate_tokens(
-            client["client_id"],
+            client,
             None,
             requested_scopes,
+            include_refresh_token=False,
         )
 
         # Client credentials don't get refresh tokens
@@ -872,7 +952,7 @@ class OAuth2Server:
         username: str | None,
         password: str | None,
         scope: str | None,
-        client: ClientData,
+        client: dict[str, Any],  # SYSTEM_BOUNDARY - Database row mapping
     ) -> Result[dict[str, Any], str]:
         """Handle password grant type (only for trusted clients)."""
         # This grant type should only be used by highly trusted clients
@@ -903,7 +983,7 @@ class OAuth2Server:
 
         # Generate tokens
         tokens = await self._generate_tokens(
-            client["client_id"],
+            client,
             user_id,
             scopes,
         )
@@ -954,11 +1034,16 @@ class OAuth2Server:
                 # Customer doesn't have password set (might use SSO only)
                 return None
 
-            if not pwd_context.verify(password, password_hash):
+            if not await get_password_hasher().run(
+                pwd_context.verify, password, password_hash
+            ):
                 return None
 
             return UUID(customer_row["id"]) if customer_row["id"] else None
 
+        except PasswordHasherBusyError:
+            # Surface overload instead of reporting bad credentials
+            raise
         except Exception:
             # Authentication failure should not expose internal errors
             return None
@@ -966,28 +1051,20 @@ class OAuth2Server:
     @beartype
     async def _is_token_revoked(self, jti: str) -> bool:
         """Check if token has been revoked."""
+        verifier = get_token_verifier()
+        if verifier.revocations_synced:
+            return verifier.is_revoked(jti)
         revoked = await self._cache.get(f"revoked_token:{jti}")
         return revoked is not None
 
-    @beartype
-    async def _introspect_refresh_token(
-        self, token: str
+    @staticmethod
+    def _refresh_token_response(
+        row: dict[str, Any] | None,  # SYSTEM_BOUNDARY - Database row mapping
     ) -> dict[
         str, Any
     ]:  # SYSTEM_BOUNDARY - OAuth2 refresh token introspection response
-        """Introspect a refresh token."""
-        token_hash = hashlib.sha256(token.encode()).hexdigest()
-
-        row = await self._db.fetchrow(
-            """
-            SELECT client_id, user_id, scopes, expires_at, created_at
-            FROM oauth2_refresh_tokens
-            WHERE token_hash = $1 AND revoked_at IS NULL
-            """,
-            token_hash,
-        )
-
-        if not row:
+        """Introspection response for a refresh token row."""
+        if not row or row["revoked_at"] is not None:
             return {"active": False}
 
         if row["expires_at"] < datetime.now(timezone.utc):
@@ -1008,21 +1085,94 @@ class OAuth2Server:
         """Revoke a refresh token."""
         token_hash = hashlib.sha256(token.encode()).hexdigest()
 
-        result = await self._db.execute(
+        row = await self._find_refresh_token(token_hash)
+        if not row or row["revoked_at"] is not None:
+            return Err("Token not found or already revoked")
+
+        await self._mark_refresh_token_revoked(token_hash, row)
+        return Ok(True)
+
+    async def _find_refresh_token(
+        self, token_hash: str
+    ) -> dict[str, Any] | None:  # SYSTEM_BOUNDARY - Database row mapping
+        """Find a refresh token, including ones not yet flushed.
+
+        The database is authoritative once it has a row; the write buffer
+        and its Redis mirror only answer for tokens it has not seen yet.
+        """
+        row = await self._db.fetchrow(
             """
-            UPDATE oauth2_refresh_tokens
-            SET revoked_at = $2
-            WHERE token_hash = $1 AND revoked_at IS NULL
+            SELECT client_id, user_id, scopes, expires_at, created_at, revoked_at
+            FROM oauth2_refresh_tokens
+            WHERE token_hash = $1
             """,
             token_hash,
-            datetime.now(timezone.utc),
         )
+        if row:
+            return {**dict(row), "pending": None}
+        return await self._find_unflushed_refresh_token(token_hash)
+
+    async def _find_refresh_tokens(
+        self, token_hashes: list[str]
+    ) -> dict[str, dict[str, Any]]:  # SYSTEM_BOUNDARY - Database row mapping
+        """Batch form of :meth:`_find_refresh_token`, keyed by hash."""
+        rows = await self._db.fetch(
+            """
+            SELECT token_hash, client_id, user_id, scopes, expires_at,
+                   created_at, revoked_at
+            FROM oauth2_refresh_tokens
+            WHERE token_hash = ANY($1::text[])
+            """,
+            token_hashes,
+        )
+        found = {row["token_hash"]: {**dict(row), "pending": None} for row in rows}
+        for token_hash in token_hashes:
+            if token_hash not in found:
+                pending = await self._find_unflushed_refresh_token(token_hash)
+                if pending is not None:
+                    found[token_hash] = pending
+        return found
+
+    async def _find_unflushed_refresh_token(
+        self, token_hash: str
+    ) -> dict[str, Any] | None:  # SYSTEM_BOUNDARY - Database row mapping
+        """Look a token up in the write buffer and its Redis mirror."""
+        pending = await get_refresh_token_writer().lookup(self._cache, token_hash)
+        if pending is None:
+            return None
+        return {
+            "client_id": pending.client_id,
+            "user_id": pending.user_id,
+            "scopes": pending.scopes,
+            "expires_at": pending.expires_at,
+            "created_at": pending.created_at,
+            "revoked_at": None,
+            "pending": pending,
+        }
 
-        # Check if any row was updated
-        if result and "UPDATE" in result:
-            return Ok(True)
+    async def _mark_refresh_token_revoked(
+        self,
+        token_hash: str,
+        row: dict[str, Any],  # SYSTEM_BOUNDARY - Database row mapping
+    ) -> None:
+        """Revoke a refresh token found by :meth:`_find_refresh_token`."""
+        now = datetime.now(timezone.utc)
+        if row["pending"] is not None:
+            await get_refresh_token_writer().revoke_unflushed(
+                self._db, self._cache, row["pending"], now
+            )
         else:
-            return Err("Token not found or already revoked")
+            await self._db.execute(
+                """
+                UPDATE oauth2_refresh_tokens
+                SET revoked_at = $2
+                WHERE token_hash = $1 AND revoked_at IS NULL
+                """,
+                token_hash,
+                now,
+            )
+
+        await get_introspection_cache().publish_invalidation(self._cache, token_hash)
 
     @beartype
     async def _log_token_exchange(
@@ -1090,11 +1240,7 @@ class OAuth2Server:
         now = datetime.now(timezone.utc)
         window_key = f"rate_limit:{client_id}:{operation}:{now.strftime('%Y%m%d%H%M')}"
 
-        current_count = await self._cache.incr(window_key)
-
-        # Set expiration on first increment
-        if current_count == 1:
-            await self._cache.expire(window_key, 60)
+        current_count = await self._cache.incr_window(window_key, 60)
 
         if current_count > limit:
             return Err(
@@ -1153,4 +1299,6 @@ class OAuth2Server:
                 "error": str(e),
                 "server_time": datetime.now(timezone.utc).isoformat(),
             }
+
+
 # SYSTEM_BOUNDARY: OAuth2 server infrastructure requires flexible dict structures for token management and client configuration
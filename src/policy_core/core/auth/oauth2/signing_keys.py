@@ -0,0 +1,341 @@
+# PolicyCore - Policy Decision Management System
+# Copyright (C) 2025 Luiz Frias <luizf35@gmail.com>
+# Form F[x] Labs
+#
+# This software is dual-licensed under AGPL-3.0 and Commercial License.
+# For commercial licensing, contact: luizf35@gmail.com
+# See LICENSE file for full terms.
+
+"""Asymmetric JWT signing keys, rotation and JWKS publication.
+
+Tokens used to be signed with the shared ``jwt_secret``, so anything that
+wanted to validate one needed the secret.  With ``jwt_signing_keys_dir``
+set, :class:`SigningKeyRing` signs with an Ed25519 (``EdDSA``) or P-256
+(``ES256``) private key instead and stamps its ``kid`` in the header:
+
+* every ``<kid>.pem`` in the directory is loaded and published at once;
+  the newest kid (kids from :func:`generate_signing_key` sort by creation
+  time) whose file is older than ``jwt_jwks_max_age_seconds`` signs unless
+  ``jwt_active_kid`` pins one.  Waiting out the JWKS cache lifetime means
+  verifiers holding a cached key set have fetched the new key before the
+  first token it signs.  Older keys keep verifying the tokens they issued
+  until they are deleted.
+* verification looks the ``kid`` up in a dict of public keys.  An unknown
+  ``kid`` re-reads the directory (at most once a second), so a node picks
+  up a key another node rotated to without a restart.
+* :meth:`SigningKeyRing.jwks` is served at ``/.well-known/jwks.json`` so
+  other services can verify tokens locally, and :meth:`add_jwks` lets a
+  verify-only node import that document.
+
+Tokens without a ``kid`` are still checked against ``jwt_secret`` while
+``jwt_allow_symmetric_tokens`` is on, which covers tokens issued before
+the switch and deployments that never configure a key directory.
+"""
+
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import jwt
+from beartype import beartype
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+from jwt.types import Options
+
+from policy_core.core.config import get_settings
+from policy_core.core.result_types import Err, Ok, Result
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_ALGORITHMS = ("EdDSA", "ES256")
+UNKNOWN_KID_RELOAD_SECONDS = 1.0
+
+
+class _KeyEntry:
+    """One verification key and, for local keys, its private half."""
+
+    __slots__ = (
+        "kid",
+        "algorithm",
+        "private_key",
+        "public_key",
+        "local",
+        "published_at",
+    )
+
+    def __init__(
+        self,
+        kid: str,
+        algorithm: str,
+        public_key: Any,
+        private_key: Any = None,
+        local: bool = True,
+        published_at: float = 0.0,
+    ) -> None:
+        self.kid = kid
+        self.algorithm = algorithm
+        self.public_key = public_key
+        self.private_key = private_key
+        self.local = local
+        self.published_at = published_at
+
+
+def _algorithm_for(private_key: Any) -> str:
+    if isinstance(private_key, ed25519.Ed25519PrivateKey):
+        return "EdDSA"
+    if isinstance(private_key, ec.EllipticCurvePrivateKey) and isinstance(
+        private_key.curve, ec.SECP256R1
+    ):
+        return "ES256"
+    raise ValueError("signing keys must be Ed25519 or P-256")
+
+
+class SigningKeyRing:
+    """Kid-indexed signing and verification keys."""
+
+    def __init__(
+        self,
+        key_dir: str | None = None,
+        active_kid: str | None = None,
+        reload_seconds: float | None = None,
+        publish_seconds: float | None = None,
+    ) -> None:
+        """Configure the key directory from settings unless overridden."""
+        settings = get_settings()
+        configured = key_dir or settings.jwt_signing_keys_dir
+        self._key_dir = Path(configured) if configured else None
+        self._pinned_kid = active_kid or settings.jwt_active_kid
+        self._reload_seconds = reload_seconds or settings.jwt_key_reload_seconds
+        self._publish_seconds = (
+            publish_seconds
+            if publish_seconds is not None
+            else settings.jwt_jwks_max_age_seconds
+        )
+        self._secret = settings.jwt_secret
+        self._symmetric_algorithm = settings.jwt_algorithm
+        self._allow_symmetric = settings.jwt_allow_symmetric_tokens
+
+        self._keys: dict[str, _KeyEntry] = {}
+        self._local: dict[str, _KeyEntry] = {}
+        self._active: _KeyEntry | None = None
+        self._jwks: dict[str, Any] = {"keys": []}
+        self._signature: tuple[tuple[str, int, int], ...] | None = None
+        self._last_check = 0.0
+        self._lock = threading.Lock()
+
+        if self._key_dir is not None:
+            result = self.reload_if_changed()
+            if result.is_err():
+                logger.warning(result.unwrap_err())
+
+    @property
+    def active_kid(self) -> str | None:
+        """Kid that signs new tokens, or None when signing with the secret."""
+        return self._active.kid if self._active else None
+
+    @property
+    def algorithm(self) -> str:
+        """Algorithm new tokens are signed with."""
+        return self._active.algorithm if self._active else self._symmetric_algorithm
+
+    def _directory_signature(self) -> tuple[tuple[str, int, int], ...]:
+        assert self._key_dir is not None
+        entries = []
+        for path in sorted(self._key_dir.glob("*.pem")):
+            stat = path.stat()
+            entries.append((path.name, stat.st_mtime_ns, stat.st_size))
+        return tuple(entries)
+
+    @beartype
+    def reload_if_changed(self) -> Result[bool, str]:
+        """Re-read the key directory if its files changed; returns whether so."""
+        if self._key_dir is None:
+            return Ok(False)
+
+        with self._lock:
+            self._last_check = time.monotonic()
+            try:
+                signature = self._directory_signature()
+                if signature == self._signature:
+                    # A pending key may have been published long enough
+                    self._active = self._local[self._choose_active(self._local)]
+                    return Ok(False)
+
+                loaded: dict[str, _KeyEntry] = {}
+                for path in sorted(self._key_dir.glob("*.pem")):
+                    private_key = serialization.load_pem_private_key(
+                        path.read_bytes(), password=None
+                    )
+                    kid = path.stem
+                    loaded[kid] = _KeyEntry(
+                        kid,
+                        _algorithm_for(private_key),
+                        private_key.public_key(),
+                        private_key,
+                        published_at=path.stat().st_mtime,
+                    )
+            except (OSError, ValueError, TypeError) as e:
+                return Err(f"Failed to load JWT signing keys: {str(e)}")
+
+            if not loaded:
+                return Err(f"No signing keys found in {self._key_dir}")
+            active_kid = self._choose_active(loaded)
+            if active_kid not in loaded:
+                return Err(f"Active signing key {active_kid} not found")
+
+            # Keep imported public keys; swap the local set in one step
+            imported = {kid: key for kid, key in self._keys.items() if not key.local}
+            self._keys = {**imported, **loaded}
+            self._local = loaded
+            self._active = loaded[active_kid]
+            self._jwks = {"keys": [self._to_jwk(key) for key in loaded.values()]}
+            self._signature = signature
+            return Ok(True)
+
+    def _choose_active(self, loaded: dict[str, _KeyEntry]) -> str:
+        """Pinned kid, else the newest key published for a full JWKS max-age."""
+        if self._pinned_kid:
+            return self._pinned_kid
+        cutoff = time.time() - self._publish_seconds
+        published = [kid for kid, key in loaded.items() if key.published_at <= cutoff]
+        # A new ring has no published key yet and must sign with something
+        return max(published or loaded)
+
+    def _maybe_reload(self, interval: float) -> None:
+        if (
+            self._key_dir is not None
+            and time.monotonic() - self._last_check >= interval
+        ):
+            result = self.reload_if_changed()
+            if result.is_err():
+                logger.warning(result.unwrap_err())
+
+    @staticmethod
+    def _to_jwk(key: _KeyEntry) -> dict[str, Any]:
+        if key.algorithm == "EdDSA":
+            jwk = jwt.algorithms.OKPAlgorithm.to_jwk(key.public_key, as_dict=True)
+        else:
+            jwk = jwt.algorithms.ECAlgorithm.to_jwk(key.public_key, as_dict=True)
+        return {**jwk, "kid": key.kid, "alg": key.algorithm, "use": "sig"}
+
+    def sign(self, payload: dict[str, Any]) -> str:
+        """Encode ``payload`` with the active key (or the shared secret)."""
+        self._maybe_reload(self._reload_seconds)
+        active = self._active
+        if active is None:
+            return jwt.encode(
+                payload, self._secret, algorithm=self._symmetric_algorithm
+            )
+        return jwt.encode(
+            payload,
+            active.private_key,
+            algorithm=active.algorithm,
+            headers={"kid": active.kid},
+        )
+
+    def decode(self, token: str, verify_exp: bool = True) -> dict[str, Any]:
+        """Verify ``token`` and return its claims.
+
+        Raises ``jwt.ExpiredSignatureError`` or ``jwt.InvalidTokenError``.
+        """
+        kid = jwt.get_unverified_header(token).get("kid")
+        options: Options = {"verify_exp": verify_exp, "verify_aud": False}
+
+        if kid is None:
+            if not self._allow_symmetric:
+                raise jwt.InvalidTokenError("Token has no key id")
+            return jwt.decode(
+                token,
+                self._secret,
+                algorithms=[self._symmetric_algorithm],
+                options=options,
+            )
+
+        key = self._keys.get(kid)
+        if key is None:
+            # Another node may have rotated to a key we have not loaded yet
+            self._maybe_reload(UNKNOWN_KID_RELOAD_SECONDS)
+            key = self._keys.get(kid)
+            if key is None:
+                raise jwt.InvalidTokenError(f"Unknown signing key {kid}")
+
+        return jwt.decode(
+            token, key.public_key, algorithms=[key.algorithm], options=options
+        )
+
+    @beartype
+    def jwks(self) -> dict[str, Any]:  # SYSTEM_BOUNDARY - RFC 7517 key set
+        """Public keys of every local signing key as a JWK set."""
+        return self._jwks
+
+    @beartype
+    def add_jwks(
+        self, jwks: dict[str, Any]  # SYSTEM_BOUNDARY - RFC 7517 key set
+    ) -> Result[int, str]:
+        """Import public keys published by another node; returns keys added."""
+        added = 0
+        try:
+            for jwk in jwks.get("keys", []):
+                if jwk.get("use", "sig") != "sig" or "kid" not in jwk:
+                    continue
+                parsed = jwt.PyJWK(jwk)
+                if parsed.algorithm_name not in SUPPORTED_ALGORITHMS:
+                    continue
+                if jwk["kid"] not in self._keys:
+                    added += 1
+                self._keys[jwk["kid"]] = _KeyEntry(
+                    jwk["kid"], parsed.algorithm_name, parsed.key, local=False
+                )
+        except (jwt.PyJWKError, TypeError, ValueError) as e:
+            return Err(f"Invalid JWK set: {str(e)}")
+        return Ok(added)
+
+
+@beartype
+def generate_signing_key(key_dir: Path, algorithm: str = "EdDSA") -> Result[str, str]:
+    """Create a new private key in ``key_dir``; returns its kid.
+
+    Kids start with a UTC timestamp so the newest key sorts last and
+    becomes the active one on the next reload.
+    """
+    if algorithm not in SUPPORTED_ALGORITHMS:
+        return Err(f"Unsupported signing algorithm: {algorithm}")
+
+    private_key: Any = (
+        ed25519.Ed25519PrivateKey.generate()
+        if algorithm == "EdDSA"
+        else ec.generate_private_key(ec.SECP256R1())
+    )
+    kid = f"{datetime.now(timezone.utc):%Y%m%d%H%M%S}-{algorithm.lower()}"
+    pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    try:
+        key_dir.mkdir(parents=True, exist_ok=True)
+        tmp = key_dir / f".{kid}.tmp"
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(pem)
+        os.replace(tmp, key_dir / f"{kid}.pem")
+    except OSError as e:
+        return Err(f"Failed to write signing key: {str(e)}")
+    return Ok(kid)
+
+
+# Global signing key ring instance
+_signing_key_ring: SigningKeyRing | None = None
+
+
+@beartype
+def get_signing_key_ring() -> SigningKeyRing:
+    """Get global signing key ring instance."""
+    global _signing_key_ring
+    if _signing_key_ring is None:
+        _signing_key_ring = SigningKeyRing()
+    return _signing_key_ring
@@ -0,0 +1,290 @@
+# PolicyCore - Policy Decision Management System
+# Copyright (C) 2025 Luiz Frias <luizf35@gmail.com>
+# Form F[x] Labs
+#
+# This software is dual-licensed under AGPL-3.0 and Commercial License.
+# For commercial licensing, contact: luizf35@gmail.com
+# See LICENSE file for full terms.
+
+"""In-process JWT verification with a local revocation list.
+
+Every authenticated request used to pay for a full signature check and a
+Redis ``GET revoked_token:{jti}`` round trip, and ``get_current_user``
+then decoded the same token again.  :class:`TokenVerifier` keeps:
+
+* a verified-claims LRU keyed by the token's SHA-256 digest.  Entries
+  expire with the token's own ``exp`` so a cached token can never outlive
+  its signature, and an EdDSA/ES256 signature is checked once per token
+  rather than once per request.
+* a revocation set: a bloom filter answering "definitely not revoked"
+  for almost every jti, backed by an exact ``jti -> exp`` map for the
+  rare positive.
+
+The revocation set is seeded from the ``oauth2:revoked_jtis`` sorted set
+(scored by expiry) and kept current from the ``oauth2:revocations``
+pub/sub channel that :meth:`OAuth2Server.revoke` publishes to.  While the
+subscription is down :attr:`TokenVerifier.revocations_synced` is False and
+callers fall back to the per-request Redis lookup.
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Any
+
+import jwt
+from beartype import beartype
+from pydantic import BaseModel, ConfigDict, Field
+
+from policy_core.core.cache import RedisType, subscribe_forever
+from policy_core.core.config import get_settings
+from policy_core.core.result_types import Err, Ok, Result
+
+from .signing_keys import get_signing_key_ring
+
+logger = logging.getLogger(__name__)
+
+REVOCATION_CHANNEL = "oauth2:revocations"
+REVOCATION_INDEX_KEY = "oauth2:revoked_jtis"
+RESUBSCRIBE_DELAY_SECONDS = 1.0
+
+
+class TokenVerifierStats(BaseModel):
+    """Hit rates for the verified-claims cache and revocation filter."""
+
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        validate_assignment=True,
+        str_strip_whitespace=True,
+        validate_default=True,
+    )
+
+    cached_tokens: int = Field(..., ge=0)
+    cache_hits: int = Field(..., ge=0)
+    cache_misses: int = Field(..., ge=0)
+    revoked_jtis: int = Field(..., ge=0)
+    bloom_positives: int = Field(
+        ..., ge=0, description="Lookups that needed the exact revocation map"
+    )
+    revocations_synced: bool
+
+
+class BloomFilter:
+    """Fixed-size bloom filter over string keys."""
+
+    def __init__(self, bits: int, hashes: int = 4) -> None:
+        """Allocate ``bits`` bits probed ``hashes`` times per key."""
+        self._bits = bits
+        self._hashes = hashes
+        self._array = bytearray((bits + 7) // 8)
+
+    def _positions(self, key: str) -> list[int]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self._bits for i in range(self._hashes)]
+
+    def add(self, key: str) -> None:
+        """Set the bits for ``key``."""
+        for position in self._positions(key):
+            self._array[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        """False means ``key`` was definitely never added."""
+        return all(
+            self._array[position >> 3] & (1 << (position & 7))
+            for position in self._positions(key)
+        )
+
+
+class RevocationSet:
+    """Revoked jtis held until their tokens expire."""
+
+    def __init__(self, bloom_bits: int) -> None:
+        """Create an empty set with a filter of ``bloom_bits`` bits."""
+        self._bloom_bits = bloom_bits
+        self._bloom = BloomFilter(bloom_bits)
+        self._expiry: dict[str, float] = {}
+        self._next_prune = 0.0
+        self.bloom_positives = 0
+
+    def __len__(self) -> int:
+        """Number of revoked jtis still tracked."""
+        return len(self._expiry)
+
+    def add(self, jti: str, exp: float) -> None:
+        """Record a revocation that matters until ``exp``."""
+        self._expiry[jti] = max(exp, self._expiry.get(jti, 0.0))
+        self._bloom.add(jti)
+
+    def contains(self, jti: str, now: float) -> bool:
+        """Whether ``jti`` is revoked, consulting the map only on a bloom hit."""
+        if jti not in self._bloom:
+            return False
+        self.bloom_positives += 1
+        exp = self._expiry.get(jti)
+        return exp is not None and exp > now
+
+    def prune(self, now: float) -> None:
+        """Drop expired jtis and rebuild the filter without them."""
+        if now < self._next_prune:
+            return
+        self._next_prune = now + 60
+        live = {jti: exp for jti, exp in self._expiry.items() if exp > now}
+        if len(live) == len(self._expiry):
+            return
+        self._expiry = live
+        self._bloom = BloomFilter(self._bloom_bits)
+        for jti in live:
+            self._bloom.add(jti)
+
+
+class TokenVerifier:
+    """Decode each access token once and check revocation locally."""
+
+    def __init__(
+        self, max_entries: int | None = None, bloom_bits: int = 1 << 20
+    ) -> None:
+        """Size the claims cache from settings unless overridden."""
+        self._settings = get_settings()
+        self._max_entries = max_entries or self._settings.jwt_claims_cache_size
+        self._claims: OrderedDict[bytes, tuple[dict[str, Any], float]] = OrderedDict()
+        self._revocations = RevocationSet(bloom_bits)
+        self._hits = 0
+        self._misses = 0
+        self._synced = False
+        self._listener: asyncio.Task[None] | None = None
+
+    @property
+    def revocations_synced(self) -> bool:
+        """Whether the local revocation set is known to be current."""
+        return self._synced
+
+    @beartype
+    def verify(self, token: str) -> Result[dict[str, Any], str]:
+        """Return the token's verified claims or why it was rejected.
+
+        Errors use the middleware's wording: ``Token has expired``,
+        ``Token has been revoked`` and ``Invalid token``.
+        """
+        now = time.time()
+        key = hashlib.sha256(token.encode("utf-8")).digest()
+        cached = self._claims.get(key)
+
+        if cached is not None and cached[1] > now:
+            self._hits += 1
+            self._claims.move_to_end(key)
+            claims = cached[0]
+        else:
+            if cached is not None:
+                del self._claims[key]
+                return Err("Token has expired")
+            self._misses += 1
+            try:
+                claims = get_signing_key_ring().decode(token)
+            except jwt.ExpiredSignatureError:
+                return Err("Token has expired")
+            except jwt.InvalidTokenError:
+                return Err("Invalid token")
+            exp = claims.get("exp")
+            if isinstance(exp, int | float):
+                self._claims[key] = (claims, float(exp))
+                if len(self._claims) > self._max_entries:
+                    self._claims.popitem(last=False)
+
+        jti = claims.get("jti")
+        if jti and self._revocations.contains(str(jti), now):
+            return Err("Token has been revoked")
+        return Ok(claims)
+
+    @beartype
+    def is_revoked(self, jti: str) -> bool:
+        """Check the local revocation set only."""
+        return self._revocations.contains(jti, time.time())
+
+    @beartype
+    def mark_revoked(self, jti: str, exp: float) -> None:
+        """Apply a revocation locally."""
+        self._revocations.add(jti, exp)
+        self._revocations.prune(time.time())
+
+    @beartype
+    async def publish_revocation(self, redis: RedisType, jti: str, exp: int) -> None:
+        """Record a revocation in Redis and notify every worker."""
+        self.mark_revoked(jti, float(exp))
+        await redis.zadd(REVOCATION_INDEX_KEY, {jti: exp})
+        await redis.zremrangebyscore(REVOCATION_INDEX_KEY, "-inf", time.time())
+        await redis.publish(REVOCATION_CHANNEL, f"{jti} {exp}")
+
+    @beartype
+    async def start(self, redis: RedisType) -> None:
+        """Subscribe to revocations, then load the current set."""
+        if self._listener is None:
+            self._listener = asyncio.create_task(
+                subscribe_forever(
+                    redis,
+                    REVOCATION_CHANNEL,
+                    on_message=self._apply_message,
+                    on_subscribed=lambda: self._load_snapshot(redis),
+                    on_lost=self._mark_unsynced,
+                    retry_delay=RESUBSCRIBE_DELAY_SECONDS,
+                ),
+                name="jwt-revocation-sync",
+            )
+
+    @beartype
+    async def stop(self) -> None:
+        """Cancel the subscription."""
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+        self._synced = False
+
+    async def _load_snapshot(self, redis: RedisType) -> None:
+        entries = await redis.zrangebyscore(
+            REVOCATION_INDEX_KEY, time.time(), "+inf", withscores=True
+        )
+        for jti, exp in entries:
+            self._revocations.add(str(jti), float(exp))
+        self._synced = True
+
+    def _apply_message(self, data: str) -> None:
+        jti, _, exp = data.partition(" ")
+        try:
+            self.mark_revoked(jti, float(exp))
+        except ValueError:
+            logger.warning("Malformed revocation message: %r", data)
+
+    def _mark_unsynced(self) -> None:
+        self._synced = False
+
+    @beartype
+    def stats(self) -> TokenVerifierStats:
+        """Snapshot cache and revocation counters."""
+        return TokenVerifierStats(
+            cached_tokens=len(self._claims),
+            cache_hits=self._hits,
+            cache_misses=self._misses,
+            revoked_jtis=len(self._revocations),
+            bloom_positives=self._revocations.bloom_positives,
+            revocations_synced=self._synced,
+        )
+
+
+# Global token verifier instance
+_token_verifier: TokenVerifier | None = None
+
+
+@beartype
+def get_token_verifier() -> TokenVerifier:
+    """Get global token verifier instance."""
+    global _token_verifier
+    if _token_verifier is None:
+        _token_verifier = TokenVerifier()
+    return _token_verifier
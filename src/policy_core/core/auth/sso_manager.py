@@ -8,6 +8,7 @@
 
 """SSO provider management and user provisioning."""
 
+import secrets
 from typing import Any
 from uuid import UUID, uuid4
 
@@ -25,6 +26,83 @@ from .providers.google import GoogleSSOProvider
 from .providers.okta import OktaSSOProvider
 from .sso_base import SSOProvider, SSOUserInfo
 
+ROLE_PRIORITY = {"system": 4, "admin": 3, "underwriter": 2, "agent": 1}
+
+# One lookup covers both "already linked" and "same email, not linked yet"
+_FIND_SSO_USER_SQL = """
+    SELECT id FROM (
+        SELECT u.id, 0 AS match_rank
+        FROM users u
+        JOIN user_sso_links l ON u.id = l.user_id
+        WHERE l.provider = $1 AND l.provider_user_id = $2
+        UNION ALL
+        SELECT id, 1 AS match_rank FROM users WHERE email = $3
+    ) candidates
+    ORDER BY match_rank
+    LIMIT 1
+"""
+
+_CREATE_SSO_USER_SQL = """
+    WITH upserted AS (
+        INSERT INTO users
+        (email, password_hash, first_name, last_name, role, is_active, last_login_at)
+        VALUES ($1, $2, $3, $4, 'agent', true, CURRENT_TIMESTAMP)
+        ON CONFLICT (email) DO UPDATE SET last_login_at = EXCLUDED.last_login_at
+        RETURNING id, email, first_name, last_name, role, is_active
+    ), linked AS (
+        INSERT INTO user_sso_links
+        (user_id, provider, provider_user_id, profile_data, last_login_at)
+        SELECT id, $5, $6, $7, CURRENT_TIMESTAMP FROM upserted
+        ON CONFLICT (provider, provider_user_id) DO UPDATE
+        SET profile_data = EXCLUDED.profile_data,
+            last_login_at = EXCLUDED.last_login_at
+    )
+    SELECT * FROM upserted
+"""
+
+_UPDATE_SSO_USER_SQL = """
+    WITH linked AS (
+        INSERT INTO user_sso_links
+        (user_id, provider, provider_user_id, profile_data, last_login_at)
+        VALUES ($1, $2, $3, $4, CURRENT_TIMESTAMP)
+        ON CONFLICT (provider, provider_user_id) DO UPDATE
+        SET profile_data = EXCLUDED.profile_data,
+            last_login_at = EXCLUDED.last_login_at
+    )
+    UPDATE users SET last_login_at = CURRENT_TIMESTAMP
+    WHERE id = $1
+    RETURNING id, email, first_name, last_name, role, is_active
+"""
+
+# Set-diff of stored memberships against the IdP's groups, the sync log and
+# the mapped roles, in one round trip whatever the number of groups
+_SYNC_GROUPS_SQL = """
+    WITH removed AS (
+        DELETE FROM user_sso_groups
+        WHERE user_id = $1 AND provider_id = $2
+          AND NOT (group_name = ANY($3::text[]))
+        RETURNING group_name
+    ), added AS (
+        INSERT INTO user_sso_groups (user_id, provider_id, group_name)
+        SELECT $1, $2, unnest($3::text[])
+        ON CONFLICT (user_id, provider_id, group_name) DO NOTHING
+        RETURNING group_name
+    ), logged AS (
+        INSERT INTO sso_group_sync_logs
+        (provider_id, user_id, sync_type, groups_added, groups_removed,
+         status, last_sync)
+        SELECT $2, $1, 'incremental',
+               (SELECT array_agg(group_name) FROM added),
+               (SELECT array_agg(group_name) FROM removed),
+               'success', CURRENT_TIMESTAMP
+    )
+    SELECT array(
+        SELECT internal_role FROM sso_group_mappings
+        WHERE provider_id = $2 AND auto_assign = true
+          AND sso_group_name = ANY($3::text[])
+    ) AS mapped_roles
+"""
+
 
 class User(BaseModelConfig):
     """User model for SSO integration."""
@@ -303,53 +381,40 @@ class SSOManager:
 
         try:
             async with self._db.transaction():
-                # Check if user exists by SSO link
+                # Existing SSO link first, then an unlinked account by email
                 existing = await self._db.fetchrow(
-                    """
-                    SELECT u.* FROM users u
-                    JOIN user_sso_links l ON u.id = l.user_id
-                    WHERE l.provider = $1 AND l.provider_user_id = $2
-                    """,
+                    _FIND_SSO_USER_SQL,
                     provider_name,
                     sso_info.provider_user_id,
+                    sso_info.email,
                 )
 
-                if existing:
-                    # Update user info
-                    user = await self._update_user_from_sso(
-                        UUID(existing["id"]), sso_info
-                    )
-                else:
-                    # Check if email already exists
-                    email_user = await self._db.fetchrow(
-                        "SELECT * FROM users WHERE email = $1", sso_info.email
-                    )
-
-                    if email_user:
-                        # Link existing user to SSO
-                        user = await self._link_user_to_sso(
-                            UUID(email_user["id"]), provider_name, sso_info
-                        )
-                    else:
-                        # Check if auto-provisioning is allowed
-                        config = self._provider_configs.get(provider_name)
-                        if not config:
-                            return Err(
-                                f"Provider '{provider_name}' configuration not found"
-                            )
-
-                        auto_create = await self._check_auto_provisioning(
-                            provider_name, sso_info, config
+                if not existing:
+                    # Check if auto-provisioning is allowed
+                    config = self._provider_configs.get(provider_name)
+                    if not config:
+                        return Err(
+                            f"Provider '{provider_name}' configuration not found"
                         )
 
-                        if isinstance(auto_create, Err):
-                            return auto_create
+                    auto_create = await self._check_auto_provisioning(
+                        provider_name, sso_info, config
+                    )
+
+                    if isinstance(auto_create, Err):
+                        return auto_create
 
-                        # Create new user
-                        user = await self._create_user_from_sso(sso_info, provider_name)
+                # Create, link or refresh the user in one statement
+                user = await self._upsert_user_from_sso(
+                    sso_info,
+                    provider_name,
+                    UUID(str(existing["id"])) if existing else None,
+                )
 
                 # Update groups/roles
-                await self._sync_user_groups(user.id, provider_name, sso_info.groups)
+                user = await self._sync_user_groups(
+                    user, provider_name, sso_info.groups
+                )
 
                 # Log successful authentication
                 await self._log_auth_event(
@@ -418,22 +483,9 @@ class SSOManager:
 
         return Ok(True)
 
-    @beartype
-    async def _create_user_from_sso(
-        self,
-        sso_info: SSOUserInfo,
-        provider_name: str,
-    ) -> User:
-        """Create new user from SSO information.
-
-        Args:
-            sso_info: SSO user information
-            provider_name: Name of the SSO provider
-
-        Returns:
-            Created user
-        """
-        # Extract name parts
+    @staticmethod
+    def _split_name(sso_info: SSOUserInfo) -> tuple[str, str]:
+        """First and last name from SSO claims, falling back to the email."""
         first_name = sso_info.given_name or ""
         last_name = sso_info.family_name or ""
 
@@ -447,92 +499,52 @@ class SSOManager:
             # Use email username as fallback
             first_name = sso_info.email.split("@")[0]
 
-        # Create user with random password (won't be used with SSO)
-        import secrets
-
-        random_password = secrets.token_urlsafe(32)
-
-        user_id = await self._db.fetchval(
-            """
-            INSERT INTO users (email, password_hash, first_name, last_name, role, is_active)
-            VALUES ($1, $2, $3, $4, $5, true)
-            RETURNING id
-            """,
-            sso_info.email,
-            f"sso:{random_password}",  # Prefix to indicate SSO user
-            first_name,
-            last_name,
-            "agent",  # Default role
-        )
-
-        # Create SSO link
-        await self._db.execute(
-            """
-            INSERT INTO user_sso_links
-            (user_id, provider, provider_user_id, profile_data, last_login_at)
-            VALUES ($1, $2, $3, $4, CURRENT_TIMESTAMP)
-            """,
-            user_id,
-            provider_name,
-            sso_info.provider_user_id,
-            sso_info.raw_claims,
-        )
-
-        # Get full user record
-        row = await self._db.fetchrow("SELECT * FROM users WHERE id = $1", user_id)
-
-        if not row:
-            raise ValueError(f"User {user_id} not found after creation")
-
-        return User(
-            id=user_id,
-            email=row["email"],
-            first_name=row["first_name"],
-            last_name=row["last_name"],
-            role=row["role"],
-            is_active=row["is_active"],
-        )
+        return first_name, last_name
 
     @beartype
-    async def _update_user_from_sso(
+    async def _upsert_user_from_sso(
         self,
-        user_id: UUID,
         sso_info: SSOUserInfo,
+        provider_name: str,
+        user_id: UUID | None,
     ) -> User:
-        """Update existing user from SSO information.
+        """Create or refresh a user and its SSO link in one statement.
 
         Args:
-            user_id: User ID
             sso_info: SSO user information
+            provider_name: Name of the SSO provider
+            user_id: Existing user to link and refresh, or None to create one
 
         Returns:
-            Updated user
+            Created or updated user
         """
-        # Update SSO link
-        await self._db.execute(
-            """
-            UPDATE user_sso_links
-            SET profile_data = $1, last_login_at = CURRENT_TIMESTAMP
-            WHERE user_id = $2 AND provider = $3
-            """,
-            sso_info.raw_claims,
-            user_id,
-            sso_info.provider,
-        )
-
-        # Update user last login
-        await self._db.execute(
-            "UPDATE users SET last_login_at = CURRENT_TIMESTAMP WHERE id = $1", user_id
-        )
-
-        # Get updated user
-        row = await self._db.fetchrow("SELECT * FROM users WHERE id = $1", user_id)
+        if user_id is None:
+            first_name, last_name = self._split_name(sso_info)
+            # Random password (never used with SSO); the prefix marks SSO users
+            row = await self._db.fetchrow(
+                _CREATE_SSO_USER_SQL,
+                sso_info.email,
+                f"sso:{secrets.token_urlsafe(32)}",
+                first_name,
+                last_name,
+                provider_name,
+                sso_info.provider_user_id,
+                sso_info.raw_claims,
+            )
+        else:
+            row = await self._db.fetchrow(
+                _UPDATE_SSO_USER_SQL,
+                user_id,
+                provider_name,
+                sso_info.provider_user_id,
+                sso_info.raw_claims,
+            )
 
         if not row:
-            raise ValueError(f"User {user_id} not found after update")
+            raise ValueError(f"User {sso_info.email} not found after upsert")
 
         return User(
-            id=user_id,
+            id=UUID(str(row["id"])),
             email=row["email"],
             first_name=row["first_name"],
             last_name=row["last_name"],
@@ -540,102 +552,57 @@ class SSOManager:
             is_active=row["is_active"],
         )
 
-    @beartype
-    async def _link_user_to_sso(
-        self,
-        user_id: UUID,
-        provider_name: str,
-        sso_info: SSOUserInfo,
-    ) -> User:
-        """Link existing user to SSO provider.
-
-        Args:
-            user_id: User ID
-            provider_name: Name of the SSO provider
-            sso_info: SSO user information
-
-        Returns:
-            Linked user
-        """
-        # Create SSO link
-        await self._db.execute(
-            """
-            INSERT INTO user_sso_links
-            (user_id, provider, provider_user_id, profile_data, last_login_at)
-            VALUES ($1, $2, $3, $4, CURRENT_TIMESTAMP)
-            ON CONFLICT (provider, provider_user_id) DO UPDATE
-            SET profile_data = EXCLUDED.profile_data,
-                last_login_at = EXCLUDED.last_login_at
-            """,
-            user_id,
+    async def _provider_id(self, provider_name: str) -> UUID | None:
+        """Database ID of a provider, from the loaded configuration if possible."""
+        config = self._provider_configs.get(provider_name)
+        if config is not None:
+            return UUID(config.provider_id)
+        provider_id = await self._db.fetchval(
+            "SELECT id FROM sso_provider_configs WHERE provider_name = $1",
             provider_name,
-            sso_info.provider_user_id,
-            sso_info.raw_claims,
         )
-
-        return await self._update_user_from_sso(user_id, sso_info)
+        return UUID(str(provider_id)) if provider_id else None
 
     @beartype
     async def _sync_user_groups(
         self,
-        user_id: UUID,
+        user: User,
         provider_name: str,
         sso_groups: list[str],
-    ) -> None:
+    ) -> User:
         """Synchronize user groups from SSO provider.
 
+        Stored memberships are reconciled against ``sso_groups`` as a single
+        set-diff; the role is only written when the mapped role changes.
+
         Args:
-            user_id: User ID
+            user: User to synchronize
             provider_name: Name of the SSO provider
             sso_groups: List of groups from SSO provider
+
+        Returns:
+            The user, with its role updated from group mappings
         """
+        provider_id = None
         try:
-            # Get provider ID
-            provider_id = await self._db.fetchval(
-                "SELECT id FROM sso_provider_configs WHERE provider_name = $1",
-                provider_name,
-            )
-
+            provider_id = await self._provider_id(provider_name)
             if not provider_id:
-                return
+                return user
 
-            # Get group mappings
-            mappings = await self._db.fetch(
-                """
-                SELECT sso_group_name, internal_role
-                FROM sso_group_mappings
-                WHERE provider_id = $1 AND auto_assign = true
-                """,
-                provider_id,
+            mapped_roles = await self._db.fetchval(
+                _SYNC_GROUPS_SQL, user.id, provider_id, sorted(set(sso_groups))
             )
 
-            # Map SSO groups to internal roles
-            mapped_roles = []
-            for mapping in mappings:
-                if mapping["sso_group_name"] in sso_groups:
-                    mapped_roles.append(mapping["internal_role"])
-
-            # Update user role if mappings found
+            # Update user role if mappings found, using highest privilege role
             if mapped_roles:
-                # Use highest privilege role
-                role_priority = {"system": 4, "admin": 3, "underwriter": 2, "agent": 1}
-                highest_role = max(mapped_roles, key=lambda r: role_priority.get(r, 0))
-
-                await self._db.execute(
-                    "UPDATE users SET role = $1 WHERE id = $2", highest_role, user_id
-                )
-
-            # Log group sync
-            await self._db.execute(
-                """
-                INSERT INTO sso_group_sync_logs
-                (provider_id, user_id, sync_type, groups_added, status, last_sync)
-                VALUES ($1, $2, 'full', $3, 'success', CURRENT_TIMESTAMP)
-                """,
-                provider_id,
-                user_id,
-                sso_groups,
-            )
+                highest_role = max(mapped_roles, key=lambda r: ROLE_PRIORITY.get(r, 0))
+                if highest_role != user.role:
+                    await self._db.execute(
+                        "UPDATE users SET role = $1 WHERE id = $2",
+                        highest_role,
+                        user.id,
+                    )
+                    user = user.model_copy(update={"role": highest_role})
 
         except Exception as e:
             # Log sync failure
@@ -643,13 +610,15 @@ class SSOManager:
                 """
                 INSERT INTO sso_group_sync_logs
                 (provider_id, user_id, sync_type, status, error_message, last_sync)
-                VALUES ($1, $2, 'full', 'failed', $3, CURRENT_TIMESTAMP)
+                VALUES ($1, $2, 'incremental', 'failed', $3, CURRENT_TIMESTAMP)
                 """,
                 provider_id or uuid4(),
-                user_id,
+                user.id,
                 str(e),
             )
 
+        return user
+
     @beartype
     async def _log_auth_event(
         self,
@@ -736,4 +705,6 @@ class SSOManager:
             if isinstance(provider_result, Ok):
                 self._providers[provider_name] = provider_result.value
                 self._provider_configs[provider_name] = config
+
+
 # SYSTEM_BOUNDARY: Authentication infrastructure requires flexible dict structures for SSO provider configuration and session management
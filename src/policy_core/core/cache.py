@@ -10,8 +10,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import builtins
 import json
+import logging
+from collections.abc import Awaitable, Callable
 from datetime import timedelta
 from typing import TYPE_CHECKING, Any
 
@@ -28,8 +31,11 @@ __all__ = [
     "close_redis_pool",
     "get_redis_client",
     "RedisType",
+    "subscribe_forever",
 ]
 
+logger = logging.getLogger(__name__)
+
 if TYPE_CHECKING:
     from redis.asyncio import Redis as RedisType
 else:
@@ -276,6 +282,18 @@ class Cache:
         result = await self._redis.incr(key, amount)  # type: ignore[attr-defined]
         return int(result)
 
+    @beartype
+    async def incr_window(self, key: str, seconds: int) -> int:
+        """Increment a fixed-window counter and set its expiry in one round trip."""
+        if self._redis is None:
+            raise RuntimeError("Cache not connected")
+
+        pipe = self._redis.pipeline(transaction=False)  # type: ignore[attr-defined]
+        pipe.incr(key)
+        pipe.expire(key, seconds, nx=True)
+        count, _ = await pipe.execute()
+        return int(count)
+
     @beartype
     async def expire(self, key: str, seconds: int) -> bool:
         """Set key expiration."""
@@ -361,6 +379,15 @@ class Cache:
         result = await self._redis.hincrby(key, field, amount)  # type: ignore[attr-defined]
         return int(result)
 
+    @beartype
+    async def publish(self, channel: str, message: str) -> int:
+        """Publish message on a pub/sub channel; returns receiver count."""
+        if self._redis is None:
+            raise RuntimeError("Cache not connected")
+
+        result = await self._redis.publish(channel, message)  # type: ignore[attr-defined]
+        return int(result)
+
 
 # Global cache instance
 _cache: Cache | None = None
@@ -399,3 +426,39 @@ def get_redis_client() -> RedisType:
     if cache._redis is None:
         raise RuntimeError("Redis not connected")
     return cache._redis
+
+
+async def subscribe_forever(
+    redis_client: RedisType,
+    channel: str,
+    on_message: Callable[[str], None],
+    on_subscribed: Callable[[], Awaitable[None]],
+    on_lost: Callable[[], None],
+    retry_delay: float = 1.0,
+) -> None:
+    """Deliver messages published on ``channel`` until cancelled.
+
+    ``on_subscribed`` runs after every (re)subscription, so callers can load
+    a snapshot without missing anything published in between.  ``on_lost``
+    runs whenever the subscription drops; the loop then resubscribes after
+    ``retry_delay`` seconds.
+    """
+    while True:
+        pubsub = redis_client.pubsub()
+        try:
+            await pubsub.subscribe(channel)
+            await on_subscribed()
+            async for message in pubsub.listen():
+                if message.get("type") == "message":
+                    on_message(str(message["data"]))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("Subscription to %s lost: %s", channel, e)
+        finally:
+            on_lost()
+            try:
+                await pubsub.close()
+            except Exception:  # nosec B110 - best-effort cleanup
+                pass
+        await asyncio.sleep(retry_delay)
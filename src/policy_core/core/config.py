@@ -149,6 +149,133 @@ class Settings(BaseSettings):
         le=1440,  # Max 24 hours
         description="JWT token expiration in minutes",
     )
+    jwt_signing_keys_dir: str | None = Field(
+        default=None,
+        description="Directory of <kid>.pem Ed25519/P-256 keys for asymmetric JWTs",
+    )
+    jwt_active_kid: str | None = Field(
+        default=None,
+        description="Signing key to use; defaults to the newest kid in the directory",
+    )
+    jwt_key_reload_seconds: float = Field(
+        default=30.0,
+        gt=0.0,
+        le=3600.0,
+        description="How often the signing key directory is checked for rotation",
+    )
+    jwt_jwks_max_age_seconds: int = Field(
+        default=300,
+        ge=0,
+        le=86400,
+        description=(
+            "How long clients may cache the JWKS; a new signing key is "
+            "published this long before it signs"
+        ),
+    )
+    jwt_allow_symmetric_tokens: bool = Field(
+        default=True,
+        description="Accept tokens without a kid that are signed with jwt_secret",
+    )
+    bcrypt_rounds: int = Field(
+        default=12,
+        ge=4,
+        le=16,
+        description="bcrypt work factor; older hashes are upgraded on login",
+    )
+    password_hash_workers: int = Field(
+        default=4,
+        ge=1,
+        le=64,
+        description="Threads dedicated to password hashing per worker process",
+    )
+    password_hash_max_pending: int = Field(
+        default=64,
+        ge=1,
+        le=10000,
+        description="Queued plus running hash operations before callers get 429",
+    )
+    jwt_claims_cache_size: int = Field(
+        default=10000,
+        ge=100,
+        le=1000000,
+        description="Verified JWT claim sets cached per worker process",
+    )
+    api_key_cache_ttl_seconds: float = Field(
+        default=60.0,
+        gt=0.0,
+        le=3600.0,
+        description="How long validated API key metadata is cached in-process",
+    )
+    api_key_negative_cache_ttl_seconds: float = Field(
+        default=10.0,
+        gt=0.0,
+        le=600.0,
+        description="How long rejected API keys are cached in-process",
+    )
+    api_key_usage_flush_seconds: float = Field(
+        default=10.0,
+        gt=0.0,
+        le=3600.0,
+        description="Interval between bulk writes of API key usage counters",
+    )
+    oauth2_client_cache_ttl_seconds: float = Field(
+        default=60.0,
+        gt=0.0,
+        le=3600.0,
+        description="How long OAuth2 client configuration is cached in-process",
+    )
+    oauth2_refresh_token_flush_seconds: float = Field(
+        default=0.5,
+        gt=0.0,
+        le=60.0,
+        description="Interval between bulk inserts of issued refresh tokens",
+    )
+    oauth2_refresh_token_batch_size: int = Field(
+        default=500,
+        ge=1,
+        le=10000,
+        description="Buffered refresh tokens that trigger an early flush",
+    )
+    oauth2_refresh_token_max_pending: int = Field(
+        default=50000,
+        ge=1,
+        le=1000000,
+        description="Unpersisted refresh tokens kept while the database is down",
+    )
+    oauth2_introspection_cache_ttl_seconds: float = Field(
+        default=60.0,
+        gt=0.0,
+        le=3600.0,
+        description="How long an active introspection response is reused",
+    )
+    oauth2_introspection_negative_ttl_seconds: float = Field(
+        default=10.0,
+        gt=0.0,
+        le=300.0,
+        description="How long an inactive introspection response is reused",
+    )
+    mfa_risk_signal_timeout_ms: float = Field(
+        default=50.0,
+        gt=0.0,
+        le=5000.0,
+        description="Time budget for each MFA risk signal before it counts as failed",
+    )
+    mfa_user_signal_ttl_seconds: float = Field(
+        default=300.0,
+        gt=0.0,
+        le=86400.0,
+        description="How long per-user MFA risk signals are cached in-process",
+    )
+    ip_intel_path: str | None = Field(
+        default=None,
+        description="Offline IP intelligence index used for geo/VPN/Tor risk signals",
+    )
+    ip_intel_reload_seconds: float = Field(
+        default=60.0,
+        gt=0.0,
+        le=86400.0,
+        description="How often the IP intelligence index file is checked for changes",
+    )
 
     # OpenAI (Optional)
     openai_api_key: str | None = Field(
@@ -204,6 +331,170 @@ class Settings(BaseSettings):
         description="Request timeout in seconds",
     )
 
+    # Exports
+    export_dir: str = Field(
+        default="/tmp/policy_core_exports",  # nosec B108 - overridden per deployment
+        min_length=1,
+        description="Local directory for export spool files and background jobs",
+    )
+    export_chunk_rows: int = Field(
+        default=500,
+        ge=10,
+        le=10000,
+        description="Rows fetched per cursor round trip and encoded per chunk",
+    )
+    export_job_retention_hours: int = Field(
+        default=24,
+        ge=1,
+        le=168,
+        description="How long finished background export files are kept",
+    )
+
+    # Rate Impact Simulation
+    rating_impact_workers: int = Field(
+        default=0,
+        ge=0,
+        le=64,
+        description="Worker processes for book re-rating (0 = one per CPU)",
+    )
+    rating_impact_chunk_rows: int = Field(
+        default=20000,
+        ge=100,
+        le=200000,
+        description="Policies and quotes re-rated per worker task",
+    )
+    rating_impact_cache_ttl_seconds: int = Field(
+        default=21600,
+        ge=60,
+        le=604800,
+        description="How long a simulation result is reused for a version pair",
+    )
+
+    # Rate A/B Test Routing
+    rate_ab_sync_seconds: float = Field(
+        default=30.0,
+        gt=0.0,
+        le=3600.0,
+        description="Interval between A/B test reloads and assignment count flushes",
+    )
+
+    # Catastrophe Loading
+    rating_cat_grid_path: str | None = Field(
+        default=None,
+        description="Catastrophe loading grid file (bundled grid when unset)",
+    )
+
+    # State Rule Packs
+    rating_state_rules_path: str | None = Field(
+        default=None,
+        description="State rating rules file (bundled rules when unset)",
+    )
+
+    # Incremental Re-rating
+    rating_breakdown_ttl_seconds: int = Field(
+        default=3600,
+        ge=0,
+        le=86400,
+        description="How long a quote's loaded rating context is reused (0 = reload)",
+    )
+    rating_verify_incremental: bool = Field(
+        default=False,
+        description="Check incremental re-ratings against a full rating",
+    )
+
+    # Rating Worker Pool
+    rating_pool_workers: int = Field(
+        default=0,
+        ge=0,
+        le=64,
+        description="Worker processes for batch rating (0 = one per CPU, less one)",
+    )
+    rating_pool_chunk_size: int = Field(
+        default=32,
+        ge=1,
+        le=10000,
+        description="Quotes sent to a worker per task",
+    )
+    rating_pool_max_chunks: int = Field(
+        default=8,
+        ge=1,
+        le=256,
+        description="Chunks queued or running before batch callers wait",
+    )
+    rating_pool_niceness: int = Field(
+        default=10,
+        ge=0,
+        le=19,
+        description="Scheduling priority reduction of batch rating workers",
+    )
+
+    # Audit Log Pipeline
+    audit_spool_dir: str = Field(
+        default="/tmp/policy_core_audit_spool",  # nosec B108 - overridden per deployment
+        min_length=1,
+        description="Local directory for the durable audit event spool",
+    )
+    audit_queue_capacity: int = Field(
+        default=10000,
+        ge=100,
+        le=1000000,
+        description="Buffered audit events before low-risk events are dropped",
+    )
+    audit_batch_size: int = Field(
+        default=500,
+        ge=1,
+        le=10000,
+        description="Audit events written per batch insert",
+    )
+    audit_flush_interval_seconds: float = Field(
+        default=1.0,
+        gt=0.0,
+        le=60.0,
+        description="Maximum time an audit event waits in the buffer",
+    )
+    audit_fsync_delay_ms: float = Field(
+        default=2.0,
+        ge=0.0,
+        le=100.0,
+        description="Window for grouping concurrent spool fsyncs",
+    )
+    audit_checkpoint_interval_seconds: float = Field(
+        default=60.0,
+        ge=1.0,
+        le=86400.0,
+        description="Minimum time between signed audit hash-chain checkpoints",
+    )
+    audit_integrity_sample_size: int = Field(
+        default=20,
+        ge=1,
+        le=1000,
+        description="Audit records proven per continuous integrity check",
+    )
+    audit_partition_months_ahead: int = Field(
+        default=3,
+        ge=1,
+        le=24,
+        description="Monthly audit_logs partitions created in advance",
+    )
+    audit_log_retention_months: int = Field(
+        default=84,
+        ge=1,
+        le=240,
+        description="Months of audit_logs kept live before archiving partitions",
+    )
+    audit_partition_maintenance_hours: int = Field(
+        default=24,
+        ge=1,
+        le=168,
+        description="Interval between audit partition maintenance runs",
+    )
+    audit_trail_default_days: int = Field(
+        default=30,
+        ge=1,
+        le=3660,
+        description="Look-back window for audit trail queries without a start date",
+    )
+
     # Risk Engine Configuration
     risk_engine_config: dict = Field(
         default_factory=dict,
@@ -911,6 +911,33 @@ class Database:
         async with self.acquire_read() as conn:
             return await conn.fetchval(query, *args)
 
+    async def stream(
+        self, query: str, *args: Any, prefetch: int = 500
+    ) -> AsyncIterator[asyncpg.Record]:
+        """Iterate over a result set through a server-side cursor.
+
+        Rows are fetched ``prefetch`` at a time inside a read-only
+        transaction, so memory stays bounded no matter how large the result
+        is.  The connection is held for the lifetime of the iteration, which
+        is why pool acquisition is not wrapped in ``asyncio.timeout``.
+        """
+        if self._direct_conn is not None:
+            async with self._direct_conn.transaction(readonly=True):
+                async for record in self._direct_conn.cursor(
+                    query, *args, prefetch=prefetch
+                ):
+                    yield record
+            return
+
+        pool = self._read_pool or self._pool
+        if pool is None:
+            raise RuntimeError("Database not connected")
+
+        async with pool.acquire(timeout=self._settings.database_pool_timeout) as conn:
+            async with conn.transaction(readonly=True):
+                async for record in conn.cursor(query, *args, prefetch=prefetch):
+                    yield record
+
     @contextlib.asynccontextmanager
     @beartype
     async def transaction(self) -> AsyncIterator[asyncpg.Connection]:
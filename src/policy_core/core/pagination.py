@@ -0,0 +1,115 @@
+# PolicyCore - Policy Decision Management System
+# Copyright (C) 2025 Luiz Frias <luizf35@gmail.com>
+# Form F[x] Labs
+#
+# This software is dual-licensed under AGPL-3.0 and Commercial License.
+# For commercial licensing, contact: luizf35@gmail.com
+# See LICENSE file for full terms.
+
+"""Keyset (seek) pagination with opaque cursor tokens.
+
+List endpoints order rows by ``(created_at DESC, id DESC)``.  Instead of
+``OFFSET n`` - which makes PostgreSQL walk and discard ``n`` rows - the
+client receives an opaque token holding the sort key of the last row it saw,
+and the next page is fetched with a row-value comparison that the composite
+``(created_at, id)`` indexes satisfy directly.  Page 10,000 therefore costs
+the same as page 1.
+"""
+
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from beartype import beartype
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+from .result_types import Err, Ok, Result
+
+# Bumped whenever the token layout changes so stale cursors are rejected
+# instead of silently seeking to the wrong position.
+CURSOR_VERSION = 1
+
+
+@beartype
+class KeysetCursor(BaseModel):
+    """Sort key of the last row returned on a page."""
+
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        validate_assignment=True,
+        str_strip_whitespace=True,
+        validate_default=True,
+    )
+
+    created_at: datetime = Field(..., description="created_at of the last row")
+    id: UUID = Field(..., description="Primary key of the last row")
+
+
+@beartype
+def encode_cursor(cursor: KeysetCursor) -> str:
+    """Encode a cursor as a compact, URL-safe opaque token."""
+    payload = json.dumps(
+        [CURSOR_VERSION, cursor.created_at.isoformat(), cursor.id.hex],
+        separators=(",", ":"),
+    ).encode()
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode("ascii")
+
+
+@beartype
+def decode_cursor(token: str) -> Result[KeysetCursor, str]:
+    """Decode an opaque cursor token produced by :func:`encode_cursor`."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        version, created_at, row_id = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, ValueError, TypeError):
+        return Err("Invalid pagination cursor")
+
+    if version != CURSOR_VERSION:
+        return Err("Invalid pagination cursor: restart from the first page")
+
+    try:
+        return Ok(
+            KeysetCursor(created_at=datetime.fromisoformat(created_at), id=UUID(row_id))
+        )
+    except (ValidationError, ValueError, TypeError):
+        return Err("Invalid pagination cursor")
+
+
+@beartype
+def keyset_predicate(first_param: int, table_alias: str = "") -> str:
+    """Build the seek predicate for a descending ``(created_at, id)`` order.
+
+    Args:
+        first_param: Positional index of the ``created_at`` parameter; the id
+            is bound at ``first_param + 1``.
+        table_alias: Optional alias prefix when the query joins tables.
+
+    Returns:
+        SQL fragment such as ``(created_at, id) < ($3, $4)``
+    """
+    prefix = f"{table_alias}." if table_alias else ""
+    return f"({prefix}created_at, {prefix}id) < (${first_param}, ${first_param + 1})"
+
+
+KEYSET_ORDER_BY = "ORDER BY created_at DESC, id DESC"
+
+
+@beartype
+def next_cursor(items: Sequence[Any], limit: int) -> str | None:
+    """Return the token for the page after ``items``, or None on the last page.
+
+    ``items`` may be models or records exposing ``created_at`` and ``id``.
+    A short page means the listing is exhausted.
+    """
+    if not items or len(items) < limit:
+        return None
+
+    last = items[-1]
+    created_at = last["created_at"] if isinstance(last, dict) else last.created_at
+    row_id = last["id"] if isinstance(last, dict) else last.id
+    return encode_cursor(KeysetCursor(created_at=created_at, id=row_id))
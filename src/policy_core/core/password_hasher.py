@@ -0,0 +1,227 @@
+# PolicyCore - Policy Decision Management System
+# Copyright (C) 2025 Luiz Frias <luizf35@gmail.com>
+# Form F[x] Labs
+#
+# This software is dual-licensed under AGPL-3.0 and Commercial License.
+# For commercial licensing, contact: luizf35@gmail.com
+# See LICENSE file for full terms.
+
+"""Off-loop password hashing.
+
+bcrypt and argon2 deliberately burn 50-300 ms of CPU per call.  Run inline
+on the event loop, a burst of logins stalls every other request on the
+worker, WebSocket heartbeats included.  :class:`PasswordHasher` runs all
+KDF work on a small dedicated thread pool instead.  Both ``bcrypt`` and
+``argon2-cffi`` release the GIL while hashing, so threads scale across
+cores without the pickling overhead of a process pool.
+
+Admission is bounded.  Once ``max_pending`` operations are queued or
+running, new callers get :class:`PasswordHasherBusyError` immediately
+rather than adding to the backlog, so a login storm costs at most
+``workers`` cores and never grows an unbounded queue.
+"""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+import bcrypt
+from beartype import beartype
+from pydantic import BaseModel, ConfigDict, Field
+
+from .config import get_settings
+
+T = TypeVar("T")
+
+BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+LATENCY_WINDOW = 2048
+MIN_PASSWORD_LENGTH = 8
+
+
+class PasswordHasherBusyError(RuntimeError):
+    """Raised when the hashing queue is full."""
+
+
+class PasswordCheck(BaseModel):
+    """Outcome of a password verification."""
+
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        validate_assignment=True,
+        str_strip_whitespace=True,
+        validate_default=True,
+    )
+
+    valid: bool = Field(..., description="Whether the password matched")
+    needs_rehash: bool = Field(
+        default=False, description="Hash uses outdated parameters; rehash on login"
+    )
+
+
+class PasswordHashingMetrics(BaseModel):
+    """Latency and admission counters for the hashing pool."""
+
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        validate_assignment=True,
+        str_strip_whitespace=True,
+        validate_default=True,
+    )
+
+    workers: int = Field(..., ge=1)
+    max_pending: int = Field(..., ge=1)
+    in_flight: int = Field(..., ge=0, description="Queued plus running operations")
+    completed_total: int = Field(..., ge=0)
+    rejected_total: int = Field(..., ge=0, description="Calls refused while full")
+    rehashed_total: int = Field(..., ge=0)
+    p50_ms: float = Field(..., ge=0.0, description="Median wait plus hash time")
+    p99_ms: float = Field(..., ge=0.0)
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+@beartype
+def bcrypt_cost(hashed_password: str) -> int | None:
+    """Work factor encoded in a bcrypt hash, or None for other schemes."""
+    if not hashed_password.startswith(BCRYPT_PREFIXES):
+        return None
+    try:
+        return int(hashed_password.split("$")[2])
+    except (IndexError, ValueError):
+        return None
+
+
+class PasswordHasher:
+    """Bounded thread pool for bcrypt and other password KDFs."""
+
+    def __init__(
+        self,
+        rounds: int | None = None,
+        workers: int | None = None,
+        max_pending: int | None = None,
+    ) -> None:
+        """Configure from settings unless overridden."""
+        settings = get_settings()
+        self._rounds = rounds or settings.bcrypt_rounds
+        self._workers = workers or settings.password_hash_workers
+        self._max_pending = max_pending or settings.password_hash_max_pending
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._workers, thread_name_prefix="password-hash"
+        )
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+        self._rehashed = 0
+        self._latencies_ms: deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    @property
+    def rounds(self) -> int:
+        """bcrypt work factor used for new hashes."""
+        return self._rounds
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a CPU-bound KDF call on the pool.
+
+        Also used for passlib contexts (argon2) elsewhere so that every
+        password operation shares one bound.
+        """
+        if self._in_flight >= self._max_pending:
+            self._rejected += 1
+            raise PasswordHasherBusyError(
+                "Too many requests: password hashing queue is full, retry shortly"
+            )
+
+        self._in_flight += 1
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self._in_flight -= 1
+            self._completed += 1
+            self._latencies_ms.append((time.perf_counter() - started) * 1000)
+
+    @beartype
+    async def hash_password(self, password: str) -> str:
+        """Hash a password with bcrypt at the configured work factor."""
+        if len(password) < MIN_PASSWORD_LENGTH:
+            raise ValueError("Password must be at least 8 characters long")
+
+        return await self.run(self._hash_sync, password)
+
+    def _hash_sync(self, password: str) -> str:
+        salt = bcrypt.gensalt(rounds=self._rounds)
+        return str(bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8"))
+
+    @beartype
+    async def verify_password(
+        self, password: str, hashed_password: str
+    ) -> PasswordCheck:
+        """Verify a password and report whether its hash should be upgraded."""
+        valid = await self.run(self._verify_sync, password, hashed_password)
+        return PasswordCheck(
+            valid=valid, needs_rehash=valid and self.needs_rehash(hashed_password)
+        )
+
+    @staticmethod
+    def _verify_sync(password: str, hashed_password: str) -> bool:
+        try:
+            return bool(
+                bcrypt.checkpw(
+                    password.encode("utf-8"), hashed_password.encode("utf-8")
+                )
+            )
+        except Exception:
+            return False
+
+    @beartype
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Whether a bcrypt hash was made with a different work factor."""
+        cost = bcrypt_cost(hashed_password)
+        return cost is not None and cost != self._rounds
+
+    def record_rehash(self) -> None:
+        """Count a transparent rehash performed by a caller."""
+        self._rehashed += 1
+
+    @beartype
+    def metrics(self) -> PasswordHashingMetrics:
+        """Snapshot latency percentiles and admission counters."""
+        latencies = sorted(self._latencies_ms)
+        return PasswordHashingMetrics(
+            workers=self._workers,
+            max_pending=self._max_pending,
+            in_flight=self._in_flight,
+            completed_total=self._completed,
+            rejected_total=self._rejected,
+            rehashed_total=self._rehashed,
+            p50_ms=_percentile(latencies, 0.50),
+            p99_ms=_percentile(latencies, 0.99),
+        )
+
+    def shutdown(self) -> None:
+        """Stop the worker threads."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Global password hasher instance
+_password_hasher: PasswordHasher | None = None
+
+
+@beartype
+def get_password_hasher() -> PasswordHasher:
+    """Get global password hasher instance."""
+    global _password_hasher
+    if _password_hasher is None:
+        _password_hasher = PasswordHasher()
+    return _password_hasher
@@ -9,6 +9,7 @@
 """Security utilities for JWT, password hashing, and authentication."""
 
 from datetime import datetime, timedelta, timezone
+from typing import Any
 
 import bcrypt
 import jwt
@@ -71,11 +72,15 @@ class Security:
         self._jwt_secret = settings.jwt_secret
         self._jwt_algorithm = settings.jwt_algorithm
         self._jwt_expiration_minutes = settings.jwt_expiration_minutes
-        self._bcrypt_rounds = 12
+        self._bcrypt_rounds = settings.bcrypt_rounds
 
     @beartype
     def hash_password(self, password: str) -> str:
-        """Hash password using bcrypt."""
+        """Hash password using bcrypt.
+
+        Blocks for the full bcrypt cost; async code should use
+        ``get_password_hasher().hash_password`` instead.
+        """
         if len(password) < 8:
             raise ValueError("Password must be at least 8 characters long")
 
@@ -87,7 +92,11 @@ class Security:
 
     @beartype
     def verify_password(self, password: str, hashed_password: str) -> bool:
-        """Verify password against hash."""
+        """Verify password against hash.
+
+        Blocks for the full bcrypt cost; async code should use
+        ``get_password_hasher().verify_password`` instead.
+        """
         try:
             password_bytes = password.encode("utf-8")
             hashed_bytes = hashed_password.encode("utf-8")
@@ -120,11 +129,9 @@ class Security:
             "scopes": scopes or [],
         }
 
-        token = jwt.encode(
-            payload,
-            self._jwt_secret,
-            algorithm=self._jwt_algorithm,
-        )
+        from .auth.oauth2.signing_keys import get_signing_key_ring
+
+        token = get_signing_key_ring().sign(payload)
 
         return TokenData(
             access_token=token,
@@ -134,12 +141,10 @@ class Security:
     @beartype
     def decode_token(self, token: str) -> TokenPayload | None:
         """Decode and validate JWT token."""
+        from .auth.oauth2.signing_keys import get_signing_key_ring
+
         try:
-            payload = jwt.decode(
-                token,
-                self._jwt_secret,
-                algorithms=[self._jwt_algorithm],
-            )
+            payload = get_signing_key_ring().decode(token)
 
             return TokenPayload(
                 sub=payload["sub"],
@@ -215,34 +220,45 @@ def get_security() -> Security:
 
 
 @beartype
-async def verify_jwt_token(token: str, secret: str) -> JWTDecodeResult:
+async def verify_jwt_token(
+    token: str,
+    secret: str,
+    claims: dict[str, Any] | None = None,  # SYSTEM_BOUNDARY - JWT claims
+) -> JWTDecodeResult:
     """Verify JWT token and return payload.
 
     Args:
         token: JWT token to verify
         secret: JWT secret (unused, uses settings)
+        claims: Claims already verified for this request by the OAuth2
+            middleware (``request.state.token_claims``); skips the lookup
 
     Returns:
         dict: Token payload
 
     Raises:
-        Exception: If token is invalid or expired
+        Exception: If token is invalid, expired or revoked
     """
-    security = get_security()
-    token_payload = security.decode_token(token)
-
-    if token_payload is None:
-        raise ValueError("Invalid or expired token")
-
-    # Convert TokenPayload to JWTDecodeResult for type safety
-    return JWTDecodeResult(
-        sub=token_payload.sub,
-        exp=int(token_payload.exp.timestamp()),
-        iat=int(token_payload.iat.timestamp()),
-        jti=token_payload.jti,
-        type=token_payload.type,
-        scopes=token_payload.scopes,
-    )
+    if claims is None:
+        from .auth.oauth2.token_verifier import get_token_verifier
+
+        verified = get_token_verifier().verify(token)
+        if verified.is_err():
+            raise ValueError(verified.unwrap_err())
+        claims = verified.unwrap()
+
+    # Convert claims to JWTDecodeResult for type safety
+    try:
+        return JWTDecodeResult(
+            sub=claims["sub"],
+            exp=int(claims["exp"]),
+            iat=int(claims["iat"]),
+            jti=claims["jti"],
+            type=claims.get("type", "access"),
+            scopes=claims.get("scopes") or claims.get("scope", "").split(),
+        )
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError("Invalid or expired token") from e
 
 
 @beartype
@@ -261,11 +261,70 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     await db.connect()
     logger.info("✅ Database connection pool initialized")
 
+    # Make sure audit_logs partitions exist before anything writes to them
+    from .compliance.audit_partitions import AuditPartitionMaintenance
+
+    audit_partitions = AuditPartitionMaintenance(db)
+    partition_result = await audit_partitions.start()
+    if partition_result.is_err():
+        logger.warning(f"⚠️ {partition_result.unwrap_err()}")
+    else:
+        logger.info("✅ Audit log partitions maintained")
+
+    # Replay spooled audit events and start the background audit writer
+    from .compliance.audit_logger import get_audit_logger
+
+    audit_logger = get_audit_logger()
+    await audit_logger.start()
+    logger.info("✅ Audit log pipeline started")
+
     # Initialize Redis pool
     cache = get_cache()
     await cache.connect()
     logger.info("✅ Redis connection pool initialized")
 
+    # Keep the in-process JWT revocation set in sync across workers
+    from .core.auth.oauth2.token_verifier import get_token_verifier
+    from .core.cache import get_redis_client
+
+    token_verifier = get_token_verifier()
+    await token_verifier.start(get_redis_client())
+
+    # API key metadata cache invalidation and write-behind usage counters
+    from .core.auth.oauth2.api_key_cache import (
+        get_api_key_cache,
+        get_api_key_usage_tracker,
+    )
+
+    api_key_cache = get_api_key_cache()
+    await api_key_cache.start(get_redis_client())
+    api_key_usage = get_api_key_usage_tracker()
+    await api_key_usage.start(db)
+
+    # OAuth2 client registry invalidation and batched refresh token writes
+    from .core.auth.oauth2.client_registry import get_client_registry
+    from .core.auth.oauth2.introspection_cache import get_introspection_cache
+    from .core.auth.oauth2.refresh_tokens import get_refresh_token_writer
+
+    client_registry = get_client_registry()
+    await client_registry.start(get_redis_client())
+    introspection_cache = get_introspection_cache()
+    await introspection_cache.start(get_redis_client())
+    refresh_token_writer = get_refresh_token_writer()
+    await refresh_token_writer.start(db)
+
+    # Rate version A/B routing table and batched assignment counts
+    from .services.rating.ab_routing import get_ab_test_router
+
+    ab_test_router = get_ab_test_router()
+    await ab_test_router.start(db, get_redis_client())
+
+    # Offline IP intelligence for MFA risk signals
+    from .core.auth.mfa.ip_intel import get_ip_intel_index
+
+    ip_intel = get_ip_intel_index()
+    await ip_intel.start()
+
     # Initialize WebSocket manager
     from .websocket.app import get_manager
 
@@ -296,14 +355,46 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     await websocket_manager.stop()
     logger.info("✅ WebSocket manager stopped")
 
+    await ip_intel.stop()
+
+    # Write outstanding API key usage and refresh tokens while the database
+    # is still reachable
+    await api_key_usage.stop()
+    await refresh_token_writer.stop()
+    await ab_test_router.stop()
+
+    # Drain buffered audit events while the database is still reachable
+    await audit_logger.close()
+    logger.info("✅ Audit log pipeline drained")
+    await audit_partitions.stop()
+
     # Close database connections
     await db.disconnect()
     logger.info("✅ Database connections closed")
 
     # Close Redis connections
+    await token_verifier.stop()
+    await api_key_cache.stop()
+    await client_registry.stop()
+    await introspection_cache.stop()
     await cache.disconnect()
     logger.info("✅ Redis connections closed")
 
+    # Stop password hashing threads
+    from .core.password_hasher import get_password_hasher
+
+    get_password_hasher().shutdown()
+
+    # Stop batch rating worker processes
+    from .services.rating.worker_pool import shutdown_rating_worker_pool
+
+    shutdown_rating_worker_pool()
+
+    # Stop rate impact simulation worker processes
+    from .services.rating.impact_simulation import shutdown_impact_executor
+
+    shutdown_impact_executor()
+
 
 @beartype
 def create_app() -> FastAPI:
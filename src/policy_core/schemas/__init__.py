@@ -81,6 +81,8 @@ from .quote import (
     QuoteResponse,
     QuoteSearchRequest,
     QuoteUpdateRequest,
+    QuoteVariationRequest,
+    QuoteVariationResponse,
 )
 
 __all__ = [
@@ -104,6 +106,8 @@ __all__ = [
     "QuoteSearchRequest",
     "QuoteBulkActionRequest",
     "QuoteBulkActionResponse",
+    "QuoteVariationRequest",
+    "QuoteVariationResponse",
     # Admin schemas
     "AdminRoleCreateRequest",
     "AdminRoleUpdateRequest",
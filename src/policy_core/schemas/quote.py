@@ -12,14 +12,16 @@ from __future__ import annotations
 
 from datetime import date, datetime
 from decimal import Decimal
+from typing import Literal
 from uuid import UUID
 
 from beartype import beartype
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from ..models.quote import (
     AIRiskFactors,
     CoverageSelection,
+    CoverageType,
     Discount,
     DriverInfo,
     PaymentDetails,
@@ -151,6 +153,7 @@ class QuoteSearchResponse(BaseModel):
     total: int
     limit: int
     offset: int
+    next_cursor: str | None = None
 
 
 @beartype
@@ -339,6 +342,100 @@ class QuoteCompareResponse(BaseModel):
     best_value_quote_id: UUID | None
 
 
+@beartype
+class CoverageTermAxis(BaseModel):
+    """One axis of a what-if grid: values tried for a coverage term."""
+
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        validate_assignment=True,
+        str_strip_whitespace=True,
+        validate_default=True,
+    )
+
+    coverage_type: CoverageType
+    term: Literal["limit", "deductible"]
+    values: list[Decimal] = Field(..., min_length=1, max_length=10)
+
+    @field_validator("values")
+    @classmethod
+    def validate_values(cls, v: list[Decimal]) -> list[Decimal]:
+        """Ensure values are non-negative and distinct."""
+        if any(value < 0 for value in v):
+            raise ValueError("values must be non-negative")
+        if len(set(v)) != len(v):
+            raise ValueError("values must be distinct")
+        return v
+
+
+@beartype
+class QuoteVariationRequest(BaseModel):
+    """Request schema for pricing a grid of coverage-term variations."""
+
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        validate_assignment=True,
+        str_strip_whitespace=True,
+        validate_default=True,
+    )
+
+    axes: list[CoverageTermAxis] = Field(..., min_length=1, max_length=3)
+
+    @field_validator("axes")
+    @classmethod
+    def validate_axes(cls, v: list[CoverageTermAxis]) -> list[CoverageTermAxis]:
+        """Ensure each coverage term is varied on one axis only."""
+        terms = [(axis.coverage_type, axis.term) for axis in v]
+        if len(set(terms)) != len(terms):
+            raise ValueError("each coverage term may appear on one axis only")
+        return v
+
+
+@beartype
+class QuoteVariationCell(BaseModel):
+    """Premium at one point of a what-if grid."""
+
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        validate_assignment=True,
+        str_strip_whitespace=True,
+        validate_default=True,
+    )
+
+    values: list[Decimal] = Field(..., description="Value on each axis")
+    base_premium: Decimal | None = None
+    total_premium: Decimal | None = None
+    error: str | None = Field(default=None, description="Why it was not priced")
+
+
+@beartype
+class QuoteVariationResponse(BaseModel):
+    """Response schema for a what-if premium matrix.
+
+    ``cells`` holds the cartesian product of the axes in row-major order,
+    so ``shape`` gives the length of each axis.
+    """
+
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        validate_assignment=True,
+        str_strip_whitespace=True,
+        validate_default=True,
+    )
+
+    quote_id: UUID
+    base_premium: Decimal
+    total_premium: Decimal
+    rate_version: str
+    axes: list[CoverageTermAxis]
+    shape: list[int]
+    cells: list[QuoteVariationCell]
+
+
 @beartype
 class QuoteConvertRequest(BaseModel):
     """Request schema for converting quote to policy."""
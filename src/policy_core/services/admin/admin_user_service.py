@@ -17,6 +17,10 @@ from pydantic import Field
 
 from policy_core.core.cache import Cache
 from policy_core.core.database import Database
+from policy_core.core.password_hasher import (
+    PasswordHasherBusyError,
+    get_password_hasher,
+)
 from policy_core.core.result_types import Err, Ok, Result
 from policy_core.models.base import BaseModelConfig
 
@@ -94,7 +98,12 @@ class AdminUserService:
             return Err(f"Admin user with email {admin_data.email} already exists")
 
         # Hash password
-        password_hash = pwd_context.hash(admin_data.password)
+        try:
+            password_hash = await get_password_hasher().run(
+                pwd_context.hash, admin_data.password
+            )
+        except PasswordHasherBusyError as e:
+            return Err(str(e))
 
         # Split full name into first and last name
         name_parts = admin_data.full_name.strip().split(" ", 1)
@@ -17,7 +17,12 @@ from uuid import UUID, uuid4
 from beartype import beartype
 from pydantic import ConfigDict, Field
 
-from policy_core.core.cache import Cache
+from policy_core.core.auth.oauth2.client_registry import get_client_registry
+from policy_core.core.auth.oauth2.introspection_cache import (
+    INVALIDATE_ALL,
+    get_introspection_cache,
+)
+from policy_core.core.cache import Cache, get_redis_client
 from policy_core.core.database import Database
 from policy_core.core.result_types import Err, Ok, Result
 from policy_core.models.base import BaseModelConfig
@@ -362,6 +367,9 @@ class OAuth2AdminService:
 
             # Clear cache
             await self._cache.clear_pattern(f"{self._client_cache_prefix}*")
+            await get_client_registry().publish_invalidation(
+                get_redis_client(), client_id
+            )
 
             # Log update
             await self._log_oauth2_activity(
@@ -424,6 +432,9 @@ class OAuth2AdminService:
 
             # Clear cache
             await self._cache.clear_pattern(f"{self._client_cache_prefix}*")
+            await get_client_registry().publish_invalidation(
+                get_redis_client(), client_id
+            )
 
             # Log secret regeneration
             await self._log_oauth2_activity(
@@ -618,6 +629,9 @@ class OAuth2AdminService:
             # Clear token cache
             await self._cache.clear_pattern("oauth2_token:*")
             await self._cache.clear_pattern("revoked_token:*")
+            await get_introspection_cache().publish_invalidation(
+                self._cache, INVALIDATE_ALL
+            )
 
             # Log revocation
             await self._log_oauth2_activity(
@@ -783,6 +797,9 @@ class OAuth2AdminService:
             # Clear caches
             await self._cache.clear_pattern("oauth2_token:*")
             await self._cache.clear_pattern("revoked_token:*")
+            await get_introspection_cache().publish_invalidation(
+                self._cache, INVALIDATE_ALL
+            )
 
         except Exception:
             # Log error but don't fail the main operation
@@ -25,6 +25,12 @@ from policy_core.core.database import Database
 from policy_core.core.result_types import Err, Ok, Result
 from policy_core.models.base import BaseModelConfig
 
+from ..rating.ab_routing import ABTestRouter
+from ..rating.impact_simulation import (
+    ImpactSimulationJob,
+    RateImpactSimulation,
+    RateImpactSimulator,
+)
 from ..rating.rate_tables import RateTableService
 
 # Auto-generated models
@@ -70,6 +76,7 @@ class RateManagementService:
         self._db = db
         self._cache = cache
         self._rate_table_service = RateTableService(db, cache)
+        self._impact_simulator = RateImpactSimulator(db, cache)
 
     @beartype
     async def create_rate_table_version(
@@ -230,12 +237,51 @@ class RateManagementService:
 
         comparison = comparison_result.value
 
+        # Book-level simulations take minutes, so only reuse a finished one
+        simulation = await self._impact_simulator.get_cached(version_id_1, version_id_2)
+        comparison["book_impact"] = (
+            simulation.model_dump(mode="json") if simulation else None
+        )
+
         # Add business impact analysis
-        impact_analysis = await self._analyze_rate_impact(comparison["differences"])
+        impact_analysis = await self._analyze_rate_impact(
+            comparison["differences"], simulation
+        )
         comparison["business_impact"] = impact_analysis
 
         return Ok(comparison)
 
+    @beartype
+    async def simulate_rate_impact(
+        self,
+        current_version_id: UUID,
+        proposed_version_id: UUID,
+        requested_by: UUID,
+        force_refresh: bool = False,
+    ) -> Result[ImpactSimulationJob, str]:
+        """Start re-rating the in-force book and open quotes under both versions.
+
+        Returns a job handle; a simulation of the same pair that is already
+        running is joined rather than started again.
+        """
+        current = await self._rate_table_service.get_rate_version(current_version_id)
+        if isinstance(current, Err):
+            return current
+        proposed = await self._rate_table_service.get_rate_version(proposed_version_id)
+        if isinstance(proposed, Err):
+            return proposed
+
+        return Ok(
+            self._impact_simulator.start_job(
+                current.value, proposed.value, requested_by, force_refresh
+            )
+        )
+
+    @beartype
+    def get_rate_impact_job(self, job_id: UUID) -> Result[ImpactSimulationJob, str]:
+        """Look up a background impact simulation."""
+        return self._impact_simulator.get_job(job_id)
+
     @beartype
     async def schedule_ab_test(
         self,
@@ -456,27 +502,9 @@ class RateManagementService:
     @beartype
     async def _configure_ab_test_routing(self, test_id: UUID) -> None:
         """Configure routing for A/B test."""
-        # Store routing configuration in cache for fast lookups
-        test_data = await self._db.fetchrow(
-            "SELECT * FROM rate_ab_tests WHERE id = $1", test_id
-        )
-
-        if test_data:
-            config = {
-                "test_id": str(test_id),
-                "control_version": str(test_data["control_version_id"]),
-                "test_version": str(test_data["test_version_id"]),
-                "traffic_split": float(test_data["traffic_split"]),
-                "start_date": test_data["start_date"].isoformat(),
-                "end_date": test_data["end_date"].isoformat(),
-            }
-
-            # Cache for quick routing decisions
-            await self._cache.set(
-                f"ab_test:config:{test_id}",
-                json.dumps(config),
-                86400 * 90,  # 90 days max
-            )
+        # Every worker routes from an in-process table; have them reload it
+        # now instead of at their next sync
+        await ABTestRouter.publish_refresh(self._cache)
 
     @beartype
     async def _log_rate_activity(
@@ -514,8 +542,25 @@ class RateManagementService:
         print(f"Rate version {version_id} approved by {approved_by}")
 
     @beartype
-    async def _analyze_rate_impact(self, differences: dict[str, Any]) -> dict[str, Any]:
+    async def _analyze_rate_impact(
+        self,
+        differences: dict[str, Any],
+        simulation: RateImpactSimulation | None = None,
+    ) -> dict[str, Any]:
         """Analyze business impact of rate changes."""
+        if simulation is not None:
+            overall = simulation.overall
+            change = overall.premium_change_pct
+            return {
+                "estimated_premium_impact": f"{change:+.1f}%",
+                "affected_policies": overall.increased + overall.decreased,
+                "revenue_impact": (
+                    f"{overall.proposed_premium - overall.current_premium:+,.2f} "
+                    f"across {overall.count} policies and quotes"
+                ),
+                "recommendation": self._get_rate_change_recommendation(change),
+            }
+
         modified = differences.get("modified", {})
 
         if not modified:
@@ -639,7 +684,12 @@ class RateManagementService:
                 -- Test metrics
                 COUNT(*) FILTER (WHERE q.ab_test_group = 'test') as test_quotes,
                 AVG(q.total_premium) FILTER (WHERE q.ab_test_group = 'test') as test_avg_premium,
-                COUNT(*) FILTER (WHERE q.ab_test_group = 'test' AND q.status = 'bound') as test_conversions
+                COUNT(*) FILTER (WHERE q.ab_test_group = 'test' AND q.status = 'bound') as test_conversions,
+                -- Routing decisions, flushed in batches by the routers
+                (SELECT COALESCE(SUM(a.assignments), 0) FROM rate_ab_test_assignments a
+                 WHERE a.test_id = t.id AND a.group_name = 'control') as control_assignments,
+                (SELECT COALESCE(SUM(a.assignments), 0) FROM rate_ab_test_assignments a
+                 WHERE a.test_id = t.id AND a.group_name = 'test') as test_assignments
             FROM rate_ab_tests t
             LEFT JOIN quotes q ON q.ab_test_id = t.id
             WHERE t.start_date <= $2 AND t.end_date >= $1
@@ -670,12 +720,14 @@ class RateManagementService:
                         "end": row["end_date"],
                     },
                     "control_performance": {
+                        "assignments": row["control_assignments"],
                         "quotes": row["control_quotes"],
                         "avg_premium": float(row["control_avg_premium"] or 0),
                         "conversions": row["control_conversions"],
                         "conversion_rate": control_rate,
                     },
                     "test_performance": {
+                        "assignments": row["test_assignments"],
                         "quotes": row["test_quotes"],
                         "avg_premium": float(row["test_avg_premium"] or 0),
                         "conversions": row["test_conversions"],
@@ -757,4 +809,6 @@ class RateManagementService:
             return "decreasing"
         else:
             return "stable"
+
+
 # SYSTEM_BOUNDARY: Rate management requires flexible dict structures for pricing rule configuration and territory-specific settings
@@ -20,6 +20,7 @@ from policy_core.core.result_types import Err, Ok, Result
 
 from ..core.cache import Cache
 from ..core.database import Database
+from ..core.pagination import KEYSET_ORDER_BY, KeysetCursor, keyset_predicate
 from ..models.claim import (
     Claim,
     ClaimCreate,
@@ -45,6 +46,25 @@ class ClaimService:
         self._cache = cache
         self._cache_ttl = 3600  # 1 hour
 
+    # List views skip the supporting-document array and other bulky JSONB
+    # content; only the keys ``_row_to_claim`` reads are projected.
+    _LIST_COLUMNS = """
+        id, claim_number, policy_id, status, amount_claimed, amount_approved,
+        submitted_at, resolved_at, created_at, updated_at,
+        jsonb_strip_nulls(jsonb_build_object(
+            'type', data->'type',
+            'priority', data->'priority',
+            'incident_date', data->'incident_date',
+            'incident_location', data->'incident_location',
+            'description', data->'description',
+            'denial_reason', data->'denial_reason',
+            'adjuster_id', data->'adjuster_id',
+            'adjuster_notes', data->'adjuster_notes',
+            'approved_at', data->'approved_at',
+            'paid_at', data->'paid_at'
+        )) AS data
+    """
+
     @beartype
     @performance_monitor("create_claim")
     async def create(
@@ -157,9 +177,14 @@ class ClaimService:
         status: str | None = None,
         limit: int = 10,
         offset: int = 0,
+        after: KeysetCursor | None = None,
     ) -> Result[list[Claim], str]:
-        """List claims with optional filters."""
-        query_parts = ["SELECT * FROM claims WHERE 1=1"]
+        """List claims with optional filters.
+
+        When ``after`` is given the page is located with a keyset seek on
+        ``(created_at, id)`` and ``offset`` is ignored.
+        """
+        query_parts = [f"SELECT {self._LIST_COLUMNS} FROM claims WHERE 1=1"]
         params: list[Any] = []
         param_count = 0
 
@@ -173,15 +198,21 @@ class ClaimService:
             query_parts.append(f"AND status = ${param_count}")
             params.append(status)
 
-        query_parts.append("ORDER BY submitted_at DESC")
+        if after:
+            query_parts.append(f"AND {keyset_predicate(param_count + 1)}")
+            params.extend([after.created_at, after.id])
+            param_count += 2
+
+        query_parts.append(KEYSET_ORDER_BY)
 
         param_count += 1
         query_parts.append(f"LIMIT ${param_count}")
-        params.append(str(limit))
+        params.append(limit)
 
-        param_count += 1
-        query_parts.append(f"OFFSET ${param_count}")
-        params.append(str(offset))
+        if not after:
+            param_count += 1
+            query_parts.append(f"OFFSET ${param_count}")
+            params.append(offset)
 
         query = " ".join(query_parts)
         rows = await self._db.fetch(query, *params)
@@ -189,6 +220,27 @@ class ClaimService:
         claims = [self._row_to_claim(row) for row in rows]
         return Ok(claims)
 
+    @beartype
+    async def count(
+        self,
+        policy_id: UUID | None = None,
+        status: str | None = None,
+    ) -> Result[int, str]:
+        """Count claims matching the same filters as :meth:`list`."""
+        query_parts = ["SELECT COUNT(*) FROM claims WHERE 1=1"]
+        params: list[Any] = []
+
+        if policy_id:
+            params.append(policy_id)
+            query_parts.append(f"AND policy_id = ${len(params)}")
+
+        if status:
+            params.append(status)
+            query_parts.append(f"AND status = ${len(params)}")
+
+        total = await self._db.fetchval(" ".join(query_parts), *params)
+        return Ok(int(total or 0))
+
     @beartype
     async def update(
         self,
@@ -18,6 +18,7 @@ from policy_core.core.result_types import Err, Ok, Result
 
 from ..core.cache import Cache
 from ..core.database import Database
+from ..core.pagination import KEYSET_ORDER_BY, KeysetCursor, keyset_predicate
 from ..models.customer import Customer, CustomerCreate, CustomerUpdate
 from ..models.update_data import CustomerUpdateData
 from ..schemas.common import PolicySummary
@@ -158,16 +159,31 @@ class CustomerService:
         self,
         limit: int = 10,
         offset: int = 0,
+        after: KeysetCursor | None = None,
     ) -> Result[list[Customer], str]:
-        """List customers with pagination."""
-        query = """
-            SELECT id, external_id, data, created_at, updated_at
-            FROM customers
-            ORDER BY created_at DESC
-            LIMIT $1 OFFSET $2
+        """List customers with pagination.
+
+        When ``after`` is given the page is located with a keyset seek on
+        ``(created_at, id)`` and ``offset`` is ignored.
         """
+        if after:
+            query = f"""
+                SELECT id, external_id, data, created_at, updated_at
+                FROM customers
+                WHERE {keyset_predicate(1)}
+                {KEYSET_ORDER_BY}
+                LIMIT $3
+            """
+            rows = await self._db.fetch(query, after.created_at, after.id, limit)
+        else:
+            query = f"""
+                SELECT id, external_id, data, created_at, updated_at
+                FROM customers
+                {KEYSET_ORDER_BY}
+                LIMIT $1 OFFSET $2
+            """
+            rows = await self._db.fetch(query, limit, offset)
 
-        rows = await self._db.fetch(query, limit, offset)
         customers = [self._row_to_customer(row) for row in rows]
 
         return Ok(customers)
@@ -20,6 +20,7 @@ from policy_core.core.result_types import Err, Ok, Result
 
 from ..core.cache import Cache
 from ..core.database import Database
+from ..core.pagination import KEYSET_ORDER_BY, KeysetCursor, keyset_predicate
 from ..models.policy import Policy, PolicyCreate, PolicyStatus, PolicyType, PolicyUpdate
 from .cache_keys import CacheKeys
 from .performance_monitor import performance_monitor
@@ -39,6 +40,23 @@ class PolicyService:
         self._cache = cache
         self._cache_ttl = 3600  # 1 hour
 
+    # List views only need the scalar columns plus the handful of JSONB keys
+    # ``_row_to_policy`` reads; projecting them keeps large policy documents
+    # off the wire for every row of every page.  Absent keys are stripped
+    # rather than sent as nulls so ``_row_to_policy`` falls back to defaults.
+    _LIST_COLUMNS = """
+        id, customer_id, policy_number, status, effective_date,
+        expiration_date, created_at, updated_at,
+        jsonb_strip_nulls(jsonb_build_object(
+            'type', data->'type',
+            'premium', data->'premium',
+            'coverage_amount', data->'coverage_amount',
+            'deductible', data->'deductible',
+            'notes', data->'notes',
+            'cancelled_at', data->'cancelled_at'
+        )) AS data
+    """
+
     @beartype
     @performance_monitor("create_policy")
     async def create(
@@ -136,9 +154,14 @@ class PolicyService:
         status: str | None = None,
         limit: int = 10,
         offset: int = 0,
+        after: KeysetCursor | None = None,
     ) -> Result[list[Policy], str]:
-        """List policies with optional filters."""
-        query_parts = ["SELECT * FROM policies WHERE 1=1"]
+        """List policies with optional filters.
+
+        When ``after`` is given the page is located with a keyset seek on
+        ``(created_at, id)`` and ``offset`` is ignored.
+        """
+        query_parts = [f"SELECT {self._LIST_COLUMNS} FROM policies WHERE 1=1"]
         params: list[Any] = []
         param_count = 0
 
@@ -152,15 +175,21 @@ class PolicyService:
             query_parts.append(f"AND status = ${param_count}")
             params.append(status)
 
-        query_parts.append("ORDER BY created_at DESC")
+        if after:
+            query_parts.append(f"AND {keyset_predicate(param_count + 1)}")
+            params.extend([after.created_at, after.id])
+            param_count += 2
+
+        query_parts.append(KEYSET_ORDER_BY)
 
         param_count += 1
         query_parts.append(f"LIMIT ${param_count}")
-        params.append(str(limit))
+        params.append(limit)
 
-        param_count += 1
-        query_parts.append(f"OFFSET ${param_count}")
-        params.append(str(offset))
+        if not after:
+            param_count += 1
+            query_parts.append(f"OFFSET ${param_count}")
+            params.append(offset)
 
         query = " ".join(query_parts)
         rows = await self._db.fetch(query, *params)
@@ -168,6 +197,28 @@ class PolicyService:
         policies = [self._row_to_policy(row) for row in rows]
         return Ok(policies)
 
+    @beartype
+    @performance_monitor("count_policies")
+    async def count(
+        self,
+        customer_id: UUID | None = None,
+        status: str | None = None,
+    ) -> Result[int, str]:
+        """Count policies matching the same filters as :meth:`list`."""
+        query_parts = ["SELECT COUNT(*) FROM policies WHERE 1=1"]
+        params: list[Any] = []
+
+        if customer_id:
+            params.append(customer_id)
+            query_parts.append(f"AND customer_id = ${len(params)}")
+
+        if status:
+            params.append(status)
+            query_parts.append(f"AND status = ${len(params)}")
+
+        total = await self._db.fetchval(" ".join(query_parts), *params)
+        return Ok(int(total or 0))
+
     @beartype
     @performance_monitor("update_policy")
     async def update(
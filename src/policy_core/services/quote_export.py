@@ -0,0 +1,543 @@
+# PolicyCore - Policy Decision Management System
+# Copyright (C) 2025 Luiz Frias <luizf35@gmail.com>
+# Form F[x] Labs
+#
+# This software is dual-licensed under AGPL-3.0 and Commercial License.
+# For commercial licensing, contact: luizf35@gmail.com
+# See LICENSE file for full terms.
+
+"""Constant-memory quote export pipeline.
+
+Rows are pulled from a server-side cursor (:meth:`Database.stream`) and
+encoded into byte chunks as they arrive, so the worker never holds more than
+one prefetch batch plus one encoded chunk regardless of how many quotes match.
+Chunks can be gzip-compressed on the fly and are handed straight to a
+``StreamingResponse``.
+
+XLSX needs a zip container, so Excel exports are written in row batches
+into a zip entry on local disk, off the event loop, and the finished file is
+streamed back.  Very large
+exports can instead run as background jobs that leave the file in
+``settings.export_dir`` and return a download handle.
+"""
+
+import asyncio
+import csv
+import io
+import json
+import logging
+import os
+import tempfile
+import zipfile
+import zlib
+from collections.abc import AsyncIterator, Iterable
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from enum import Enum
+from pathlib import Path
+from typing import Any, ClassVar
+from uuid import UUID, uuid4
+from xml.sax.saxutils import escape
+
+from beartype import beartype
+from pydantic import Field
+
+from policy_core.core.result_types import Err, Ok, Result
+from policy_core.models.base import BaseModelConfig
+
+from ..core.config import get_settings
+from ..core.database import Database
+
+logger = logging.getLogger(__name__)
+
+# Bytes read per chunk when streaming a finished export file back.
+FILE_CHUNK_BYTES = 64 * 1024
+
+
+class ExportFormat(str, Enum):
+    """Supported export encodings."""
+
+    CSV = "csv"
+    JSON = "json"
+    NDJSON = "ndjson"
+    EXCEL = "excel"
+
+
+class ExportJobStatus(str, Enum):
+    """Lifecycle of a background export job."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+MEDIA_TYPES: dict[ExportFormat, str] = {
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.JSON: "application/json",
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.EXCEL: (
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    ),
+}
+
+FILE_EXTENSIONS: dict[ExportFormat, str] = {
+    ExportFormat.CSV: "csv",
+    ExportFormat.JSON: "json",
+    ExportFormat.NDJSON: "ndjson",
+    ExportFormat.EXCEL: "xlsx",
+}
+
+
+@beartype
+class QuoteExportFilters(BaseModelConfig):
+    """Filters accepted by the quote export."""
+
+    status: str | None = Field(default=None, description="Quote status")
+    state: str | None = Field(default=None, description="Two-letter state code")
+    created_after: datetime | None = Field(default=None, description="Lower bound")
+    created_before: datetime | None = Field(default=None, description="Upper bound")
+
+
+@beartype
+class ExportJob(BaseModelConfig):
+    """Handle for a background export written to local disk."""
+
+    job_id: UUID = Field(..., description="Job identifier")
+    format: ExportFormat = Field(..., description="Export encoding")
+    gzip: bool = Field(default=False, description="Whether output is gzipped")
+    status: ExportJobStatus = Field(default=ExportJobStatus.PENDING)
+    requested_by: UUID = Field(..., description="Admin who requested the export")
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    completed_at: datetime | None = Field(default=None)
+    row_count: int = Field(default=0, ge=0, description="Rows written so far")
+    filename: str = Field(..., description="Download filename")
+    error: str | None = Field(default=None, description="Failure reason")
+
+
+@beartype
+def build_export_query(filters: QuoteExportFilters) -> tuple[str, list[Any]]:
+    """Build the export query and its positional parameters."""
+    query_parts = ["SELECT * FROM quotes WHERE 1=1"]
+    params: list[Any] = []
+
+    if filters.status:
+        params.append(filters.status)
+        query_parts.append(f"AND status = ${len(params)}")
+
+    if filters.state:
+        params.append(filters.state)
+        query_parts.append(f"AND state = ${len(params)}")
+
+    if filters.created_after:
+        params.append(filters.created_after)
+        query_parts.append(f"AND created_at >= ${len(params)}")
+
+    if filters.created_before:
+        params.append(filters.created_before)
+        query_parts.append(f"AND created_at <= ${len(params)}")
+
+    # Stable order so repeated exports of the same window are diffable.
+    query_parts.append("ORDER BY created_at, id")
+    return " ".join(query_parts), params
+
+
+@beartype
+def _json_default(value: Any) -> Any:
+    """Serialize the scalar types asyncpg returns."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    raise TypeError(f"Unsupported export value: {type(value).__name__}")
+
+
+@beartype
+def _cell(value: Any) -> str:
+    """Flatten a column value into a single text cell."""
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=_json_default)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+async def encode_csv(rows: AsyncIterator[Any], chunk_rows: int) -> AsyncIterator[bytes]:
+    """Encode records as CSV, yielding one chunk per ``chunk_rows`` rows."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    pending = 0
+    header_written = False
+
+    async for row in rows:
+        if not header_written:
+            writer.writerow(list(row.keys()))
+            header_written = True
+        writer.writerow([_cell(value) for value in row.values()])
+        pending += 1
+        if pending >= chunk_rows:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+async def encode_ndjson(
+    rows: AsyncIterator[Any], chunk_rows: int
+) -> AsyncIterator[bytes]:
+    """Encode records as newline-delimited JSON."""
+    lines: list[str] = []
+    async for row in rows:
+        lines.append(json.dumps(dict(row), default=_json_default))
+        if len(lines) >= chunk_rows:
+            yield ("\n".join(lines) + "\n").encode()
+            lines.clear()
+
+    if lines:
+        yield ("\n".join(lines) + "\n").encode()
+
+
+async def encode_json_array(
+    rows: AsyncIterator[Any], chunk_rows: int
+) -> AsyncIterator[bytes]:
+    """Encode records as a single JSON array without materializing it."""
+    yield b"["
+    first = True
+    lines: list[str] = []
+    async for row in rows:
+        lines.append(json.dumps(dict(row), default=_json_default))
+        if len(lines) >= chunk_rows:
+            prefix = "" if first else ","
+            yield (prefix + ",".join(lines)).encode()
+            first = False
+            lines.clear()
+
+    if lines:
+        yield (("" if first else ",") + ",".join(lines)).encode()
+    yield b"]"
+
+
+async def gzip_chunks(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Gzip an async byte stream incrementally."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+class XlsxStreamWriter:
+    """Minimal single-sheet XLSX writer with O(1) memory per row.
+
+    Cells are written as inline strings directly into the worksheet zip entry,
+    so there is no shared-string table to accumulate.  The header row uses a
+    bold cell style.
+    """
+
+    _CONTENT_TYPES = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" '
+        'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '<Override PartName="/xl/styles.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        "</Types>"
+    )
+    _ROOT_RELS = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/'
+        'officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+        "</Relationships>"
+    )
+    _WORKBOOK = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="Quotes Export" sheetId="1" r:id="rId1"/></sheets>'
+        "</workbook>"
+    )
+    _WORKBOOK_RELS = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/'
+        'officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+        '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/'
+        'officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+        "</Relationships>"
+    )
+    _STYLES = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        '<fonts count="2"><font/><font><b/></font></fonts>'
+        '<fills count="1"><fill><patternFill patternType="none"/></fill></fills>'
+        '<borders count="1"><border/></borders>'
+        '<cellStyleXfs count="1"><xf/></cellStyleXfs>'
+        '<cellXfs count="2"><xf/><xf fontId="1" applyFont="1"/></cellXfs>'
+        "</styleSheet>"
+    )
+
+    def __init__(self, path: Path) -> None:
+        """Open ``path`` and start the worksheet entry."""
+        self._zip = zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED)
+        self._zip.writestr("[Content_Types].xml", self._CONTENT_TYPES)
+        self._zip.writestr("_rels/.rels", self._ROOT_RELS)
+        self._zip.writestr("xl/workbook.xml", self._WORKBOOK)
+        self._zip.writestr("xl/_rels/workbook.xml.rels", self._WORKBOOK_RELS)
+        self._zip.writestr("xl/styles.xml", self._STYLES)
+        self._sheet = self._zip.open("xl/worksheets/sheet1.xml", "w", force_zip64=True)
+        self._sheet.write(
+            b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+            b"<sheetData>"
+        )
+        self.rows_written = 0
+
+    def write_row(self, values: Iterable[str], header: bool = False) -> None:
+        """Append one row of text cells."""
+        style = ' s="1"' if header else ""
+        cells = "".join(
+            f'<c t="inlineStr"{style}><is><t xml:space="preserve">'
+            f"{escape(value)}</t></is></c>"
+            for value in values
+        )
+        self._sheet.write(f"<row>{cells}</row>".encode())
+        self.rows_written += 1
+
+    def write_rows(self, rows: Iterable[Iterable[str]]) -> None:
+        """Append several rows of text cells."""
+        for values in rows:
+            self.write_row(values)
+
+    def close(self) -> None:
+        """Finish the worksheet and close the archive."""
+        self._sheet.write(b"</sheetData></worksheet>")
+        self._sheet.close()
+        self._zip.close()
+
+
+class QuoteExportService:
+    """Stream quote exports and run large exports as background jobs."""
+
+    # Job registry is process-local; handles are only valid on the node that
+    # produced the file, which is where the download request is routed.
+    _jobs: ClassVar[dict[UUID, ExportJob]] = {}
+    _tasks: ClassVar[dict[UUID, asyncio.Task[None]]] = {}
+
+    def __init__(self, db: Database) -> None:
+        """Initialize export service with dependency validation."""
+        if not db or not hasattr(db, "stream"):
+            raise ValueError("Database with streaming cursor support required")
+
+        settings = get_settings()
+        self._db = db
+        self._chunk_rows = settings.export_chunk_rows
+        self._export_dir = Path(settings.export_dir)
+        self._job_ttl = timedelta(hours=settings.export_job_retention_hours)
+
+    def stream(
+        self,
+        export_format: ExportFormat,
+        filters: QuoteExportFilters,
+        compress: bool = False,
+    ) -> AsyncIterator[bytes]:
+        """Return an async byte stream for the requested export.
+
+        ``compress`` is ignored for Excel, which is already a zip container.
+        """
+        if export_format == ExportFormat.EXCEL:
+            return self._stream_xlsx(filters)
+        chunks = self._encode(export_format, self._rows(filters))
+        return gzip_chunks(chunks) if compress else chunks
+
+    @beartype
+    def filename(self, export_format: ExportFormat, compress: bool) -> str:
+        """Build a timestamped download filename."""
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        suffix = ".gz" if compress and export_format != ExportFormat.EXCEL else ""
+        return f"quotes_export_{stamp}.{FILE_EXTENSIONS[export_format]}{suffix}"
+
+    @beartype
+    def start_job(
+        self,
+        export_format: ExportFormat,
+        filters: QuoteExportFilters,
+        requested_by: UUID,
+        compress: bool = False,
+    ) -> ExportJob:
+        """Start a background export and return its handle immediately."""
+        self._purge_expired_jobs()
+        compress = compress and export_format != ExportFormat.EXCEL
+        job = ExportJob(
+            job_id=uuid4(),
+            format=export_format,
+            gzip=compress,
+            requested_by=requested_by,
+            filename=self.filename(export_format, compress),
+        )
+        self._jobs[job.job_id] = job
+        self._tasks[job.job_id] = asyncio.create_task(
+            self._run_job(job, filters), name=f"quote-export-{job.job_id}"
+        )
+        return job
+
+    @beartype
+    def get_job(self, job_id: UUID, requested_by: UUID) -> Result[ExportJob, str]:
+        """Look up a background export job started by ``requested_by``.
+
+        Another admin's job is reported as not found, so job ids cannot be
+        probed for other users' exports.
+        """
+        job = self._jobs.get(job_id)
+        if job is None or job.requested_by != requested_by:
+            return Err("Export job not found")
+        return Ok(job)
+
+    @beartype
+    def job_file(self, job: ExportJob) -> Path:
+        """Local path of a job's output file."""
+        return self._export_dir / f"{job.job_id}_{job.filename}"
+
+    async def _rows(self, filters: QuoteExportFilters) -> AsyncIterator[Any]:
+        """Yield matching rows from a server-side cursor."""
+        query, params = build_export_query(filters)
+        async for row in self._db.stream(query, *params, prefetch=self._chunk_rows):
+            yield row
+
+    def _encode(
+        self, export_format: ExportFormat, rows: AsyncIterator[Any]
+    ) -> AsyncIterator[bytes]:
+        """Pick the text encoder for ``export_format``."""
+        if export_format == ExportFormat.CSV:
+            return encode_csv(rows, self._chunk_rows)
+        if export_format == ExportFormat.NDJSON:
+            return encode_ndjson(rows, self._chunk_rows)
+        return encode_json_array(rows, self._chunk_rows)
+
+    async def _write_xlsx(self, filters: QuoteExportFilters, path: Path) -> int:
+        """Write matching rows into an XLSX file, returning the row count.
+
+        Deflating and writing the archive run in a worker thread, one batch
+        of ``chunk_rows`` rows at a time.
+        """
+        writer = await asyncio.to_thread(XlsxStreamWriter, path)
+        rows = 0
+        batch: list[list[str]] = []
+        try:
+            async for row in self._rows(filters):
+                if rows == 0:
+                    await asyncio.to_thread(writer.write_row, list(row.keys()), True)
+                batch.append([_cell(value) for value in row.values()])
+                rows += 1
+                if len(batch) >= self._chunk_rows:
+                    await asyncio.to_thread(writer.write_rows, batch)
+                    batch = []
+            if batch:
+                await asyncio.to_thread(writer.write_rows, batch)
+        finally:
+            await asyncio.to_thread(writer.close)
+        return rows
+
+    async def _stream_xlsx(self, filters: QuoteExportFilters) -> AsyncIterator[bytes]:
+        """Build the workbook in a temp file and stream it back."""
+        self._export_dir.mkdir(parents=True, exist_ok=True)
+        fd, name = tempfile.mkstemp(suffix=".xlsx", dir=self._export_dir)
+        os.close(fd)
+        path = Path(name)
+        try:
+            await self._write_xlsx(filters, path)
+            async for chunk in read_file_chunks(path):
+                yield chunk
+        finally:
+            path.unlink(missing_ok=True)
+
+    async def _run_job(self, job: ExportJob, filters: QuoteExportFilters) -> None:
+        """Execute a background export, updating the registry as it goes."""
+        self._jobs[job.job_id] = job.model_copy(
+            update={"status": ExportJobStatus.RUNNING}
+        )
+        self._export_dir.mkdir(parents=True, exist_ok=True)
+        path = self.job_file(job)
+        rows = 0
+
+        try:
+            if job.format == ExportFormat.EXCEL:
+                rows = await self._write_xlsx(filters, path)
+            else:
+                counted = _RowCounter(self._rows(filters))
+                chunks = self._encode(job.format, counted)
+                if job.gzip:
+                    chunks = gzip_chunks(chunks)
+                with path.open("wb") as output:
+                    async for chunk in chunks:
+                        await asyncio.to_thread(output.write, chunk)
+                rows = counted.count
+        except Exception as e:
+            logger.exception("Quote export job %s failed", job.job_id)
+            path.unlink(missing_ok=True)
+            self._jobs[job.job_id] = self._jobs[job.job_id].model_copy(
+                update={"status": ExportJobStatus.FAILED, "error": str(e)}
+            )
+            return
+        finally:
+            self._tasks.pop(job.job_id, None)
+
+        self._jobs[job.job_id] = self._jobs[job.job_id].model_copy(
+            update={
+                "status": ExportJobStatus.COMPLETED,
+                "row_count": rows,
+                "completed_at": datetime.now(timezone.utc),
+            }
+        )
+
+    def _purge_expired_jobs(self) -> None:
+        """Drop finished jobs (and their files) past the retention window.
+
+        A job whose task is gone has finished: completed, failed or was
+        cancelled, possibly leaving a partial file behind.  Jobs without a
+        completion time expire on their creation time.
+        """
+        cutoff = datetime.now(timezone.utc) - self._job_ttl
+        for job_id, job in list(self._jobs.items()):
+            if job_id in self._tasks:
+                continue
+            if (job.completed_at or job.created_at) < cutoff:
+                self.job_file(job).unlink(missing_ok=True)
+                del self._jobs[job_id]
+
+
+class _RowCounter:
+    """Async iterator wrapper that counts the rows passing through."""
+
+    def __init__(self, rows: AsyncIterator[Any]) -> None:
+        self._rows = rows
+        self.count = 0
+
+    def __aiter__(self) -> "_RowCounter":
+        return self
+
+    async def __anext__(self) -> Any:
+        row = await self._rows.__anext__()
+        self.count += 1
+        return row
+
+
+async def read_file_chunks(path: Path) -> AsyncIterator[bytes]:
+    """Read a file in fixed-size chunks without blocking the event loop."""
+    with path.open("rb") as source:
+        while True:
+            chunk = await asyncio.to_thread(source.read, FILE_CHUNK_BYTES)
+            if not chunk:
+                break
+            yield chunk
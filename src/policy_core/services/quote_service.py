@@ -9,6 +9,7 @@
 """Quote generation and management service."""
 
 import asyncio
+import itertools
 import json
 from datetime import date, datetime, timedelta
 from decimal import Decimal
@@ -17,15 +18,18 @@ from uuid import UUID, uuid4
 
 import asyncpg
 from beartype import beartype
+from pydantic import ValidationError
 
 from policy_core.core.result_types import Err, Ok, Result
 from policy_core.models.base import BaseModelConfig
 
 from ..core.cache import Cache
 from ..core.database import Database
+from ..core.pagination import KEYSET_ORDER_BY, KeysetCursor, keyset_predicate
 from ..models.quote import (
     BaseModelConfig,
     CoverageSelection,
+    CoverageType,
     Discount,
     DriverInfo,
     Field,
@@ -38,15 +42,28 @@ from ..models.quote import (
     QuoteUpdate,
     VehicleInfo,
 )
+from ..schemas.quote import (
+    CoverageTermAxis,
+    QuoteVariationCell,
+    QuoteVariationResponse,
+)
 from .performance_monitor import performance_monitor
 
 # Optional imports for production features
 try:
-    from .rating_engine import RatingEngine
+    from .rating_engine import (
+        PremiumRequest,
+        RatingBreakdown,
+        RatingEngine,
+        RatingResult,
+    )
 
     HAS_RATING_ENGINE = True
 except ImportError:
+    PremiumRequest = None  # type: ignore[assignment,misc]
+    RatingBreakdown = None  # type: ignore[assignment,misc]
     RatingEngine = None  # type: ignore[assignment,misc]
+    RatingResult = None  # type: ignore[assignment,misc]
     HAS_RATING_ENGINE = False
 
 try:
@@ -57,6 +74,20 @@ except ImportError:
     ConnectionManager = None  # type: ignore[assignment,misc]
     HAS_WEBSOCKET = False
 
+# Projection for list views: the rating and AI breakdowns are the largest
+# JSONB documents on a quote and are only rendered on the detail view, so
+# they are replaced by empty objects (the models' defaults) in listings.
+QUOTE_SUMMARY_COLUMNS = """
+    id, quote_number, customer_id, status, product_type, state, zip_code,
+    effective_date, email, phone, preferred_contact, vehicle_info, drivers,
+    coverage_selections, base_premium, total_premium, monthly_premium,
+    discounts_applied, surcharges_applied, total_discount_amount,
+    total_surcharge_amount, '{}'::jsonb AS rating_factors, rating_tier,
+    ai_risk_score, '{}'::jsonb AS ai_risk_factors, expires_at,
+    converted_to_policy_id, converted_at, created_by, updated_by,
+    referral_source, version, parent_quote_id, created_at, updated_at
+"""
+
 
 # Auto-generated models
 
@@ -207,14 +238,11 @@ class QuoteService:
             await self._update_quote_status(quote_id, QuoteStatus.CALCULATING)
 
             # Initialize rating engine if available
-            if self._rating_engine and not getattr(
-                self._rating_engine, "_initialized", False
-            ):
-                init_result = await self._rating_engine.initialize()
+            if self._rating_engine:
+                init_result = await self._initialize_rating_engine()
                 if isinstance(init_result, Err):
                     await self._update_quote_status(quote_id, QuoteStatus.DRAFT)
                     return init_result
-                self._rating_engine._initialized = True
 
             # ALWAYS require rating engine - NO FALLBACKS
             if not self._rating_engine:
@@ -224,7 +252,8 @@ class QuoteService:
                     "Contact system administrator to configure rating service."
                 )
 
-            # Calculate rating using actual engine
+            # Calculate rating using actual engine, re-rating incrementally
+            # from the previous breakdown when there is one
             rating_result = await self._rating_engine.calculate_premium(
                 state=quote.state,
                 product_type=quote.product_type,
@@ -232,86 +261,276 @@ class QuoteService:
                 drivers=quote.drivers,
                 coverage_selections=quote.coverage_selections,
                 customer_id=quote.customer_id,
+                previous=await self._get_rating_breakdown(quote_id),
             )
 
             if isinstance(rating_result, Err):
                 await self._update_quote_status(quote_id, QuoteStatus.DRAFT)
                 return rating_result
 
-            rating_obj = rating_result.unwrap()
-            # Convert RatingResult to dict for consistency
-            rating = {
-                "base_premium": rating_obj.base_premium,
-                "total_premium": rating_obj.total_premium,
-                "discounts": [d.model_dump() for d in rating_obj.discounts],
-                "surcharges": rating_obj.surcharges,
-                "total_discount_amount": rating_obj.total_discount_amount,
-                "total_surcharge_amount": rating_obj.total_surcharge_amount,
-                "factors": rating_obj.rating_factors.model_dump(),  # Convert structured model to dict
-                "tier": rating_obj.tier,
-                "ai_risk_score": rating_obj.ai_risk_score,
-                "ai_risk_factors": rating_obj.ai_risk_factors,
-            }
+            return await self._apply_rating(quote_id, rating_result.unwrap())
 
-            # Calculate monthly (10% down + 9 payments)
-            down_payment = rating["total_premium"] * Decimal("0.10")
-            monthly = (rating["total_premium"] - down_payment) / 9
-
-            # Update quote with pricing
-            update_query = """
-                UPDATE quotes SET
-                    base_premium = $2,
-                    total_premium = $3,
-                    monthly_premium = $4,
-                    discounts_applied = $5::jsonb,
-                    surcharges_applied = $6::jsonb,
-                    total_discount_amount = $7,
-                    total_surcharge_amount = $8,
-                    rating_factors = $9::jsonb,
-                    rating_tier = $10,
-                    ai_risk_score = $11,
-                    ai_risk_factors = $12::jsonb,
-                    status = $13,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE id = $1
-                RETURNING *
-            """
+        except Exception as e:
+            return Err(f"Calculation error: {str(e)}")
 
-            row = await self._db.fetchrow(
-                update_query,
-                quote_id,
-                rating["base_premium"],
-                rating["total_premium"],
-                monthly.quantize(Decimal("0.01")),
-                rating.get("discounts", []),
-                rating.get("surcharges", []),
-                rating.get("total_discount_amount", Decimal("0")),
-                rating.get("total_surcharge_amount", Decimal("0")),
-                rating.get("factors", {}),
-                rating.get("tier", "STANDARD"),
-                rating.get("ai_risk_score"),
-                rating.get("ai_risk_factors", {}),
-                QuoteStatus.QUOTED,
-            )
+    async def _apply_rating(
+        self, quote_id: UUID, rating_obj: "RatingResult"
+    ) -> Result[Quote, str]:
+        """Store a rating result on the quote and announce the new price."""
+        # Convert RatingResult to dict for consistency
+        rating = {
+            "base_premium": rating_obj.base_premium,
+            "total_premium": rating_obj.total_premium,
+            "discounts": [d.model_dump() for d in rating_obj.discounts],
+            "surcharges": rating_obj.surcharges,
+            "total_discount_amount": rating_obj.total_discount_amount,
+            "total_surcharge_amount": rating_obj.total_surcharge_amount,
+            "factors": rating_obj.rating_factors.model_dump(),  # Convert structured model to dict
+            "tier": rating_obj.tier,
+            "ai_risk_score": rating_obj.ai_risk_score,
+            "ai_risk_factors": rating_obj.ai_risk_factors,
+            "rate_version": rating_obj.rate_version,
+            "ab_test_id": rating_obj.ab_test_id,
+            "ab_test_group": rating_obj.ab_test_group,
+            "breakdown": (
+                rating_obj.breakdown.model_dump(mode="json")
+                if rating_obj.breakdown
+                else None
+            ),
+        }
 
-            if not row:
-                return Err("Failed to update quote with pricing")
+        # Calculate monthly (10% down + 9 payments)
+        down_payment = rating["total_premium"] * Decimal("0.10")
+        monthly = (rating["total_premium"] - down_payment) / 9
 
-            quote = self._row_to_quote(row)
+        # Update quote with pricing
+        update_query = """
+            UPDATE quotes SET
+                base_premium = $2,
+                total_premium = $3,
+                monthly_premium = $4,
+                discounts_applied = $5::jsonb,
+                surcharges_applied = $6::jsonb,
+                total_discount_amount = $7,
+                total_surcharge_amount = $8,
+                rating_factors = $9::jsonb,
+                rating_tier = $10,
+                ai_risk_score = $11,
+                ai_risk_factors = $12::jsonb,
+                status = $13,
+                rate_version = $14,
+                ab_test_id = $15,
+                ab_test_group = $16,
+                rating_breakdown = $17::jsonb,
+                updated_at = CURRENT_TIMESTAMP
+            WHERE id = $1
+            RETURNING *
+        """
 
-            # Invalidate cache
-            await self._cache.delete(f"{self._cache_prefix}{quote_id}")
+        row = await self._db.fetchrow(
+            update_query,
+            quote_id,
+            rating["base_premium"],
+            rating["total_premium"],
+            monthly.quantize(Decimal("0.01")),
+            rating.get("discounts", []),
+            rating.get("surcharges", []),
+            rating.get("total_discount_amount", Decimal("0")),
+            rating.get("total_surcharge_amount", Decimal("0")),
+            rating.get("factors", {}),
+            rating.get("tier", "STANDARD"),
+            rating.get("ai_risk_score"),
+            rating.get("ai_risk_factors", {}),
+            QuoteStatus.QUOTED,
+            rating["rate_version"],
+            rating["ab_test_id"],
+            rating["ab_test_group"],
+            rating["breakdown"],
+        )
 
-            # Track pricing event
-            await self._track_quote_priced(quote)
+        if not row:
+            return Err("Failed to update quote with pricing")
 
-            # Send real-time update (placeholder for WebSocket)
-            await self._send_realtime_update(quote)
+        quote = self._row_to_quote(row)
 
-            return Ok(quote)
+        # Invalidate cache
+        await self._cache.delete(f"{self._cache_prefix}{quote_id}")
+
+        # Track pricing event
+        await self._track_quote_priced(quote)
+
+        # Send real-time update (placeholder for WebSocket)
+        await self._send_realtime_update(quote)
+
+        return Ok(quote)
+
+    @beartype
+    @performance_monitor("recalculate_quotes")
+    async def recalculate_quotes(
+        self, quote_ids: list[UUID]
+    ) -> list[Result[Quote, str]]:
+        """Recalculate many quotes, returning one result per id in order.
+
+        Unlike calling :meth:`calculate_quote` in a loop, the ratings are
+        priced together on the batch worker pool so a large job does not
+        hold the event loop that serves interactive quotes.
+        """
+        if not self._rating_engine:
+            return [
+                Err(
+                    "Rating engine not configured. "
+                    "Service must be initialized with RatingEngine instance. "
+                    "Contact system administrator to configure rating service."
+                )
+                for _ in quote_ids
+            ]
+        init_result = await self._initialize_rating_engine()
+        if isinstance(init_result, Err):
+            return [init_result for _ in quote_ids]
+
+        results: list[Result[Quote, str]] = []
+        requests: dict[int, PremiumRequest] = {}
+        for index, quote_id in enumerate(quote_ids):
+            try:
+                quote_result = await self.get_quote(quote_id)
+                if isinstance(quote_result, Err):
+                    results.append(quote_result)
+                    continue
+                quote = quote_result.unwrap()
+                if not quote:
+                    results.append(Err("Quote not found"))
+                    continue
+
+                request = PremiumRequest(
+                    state=quote.state,
+                    product_type=quote.product_type,
+                    vehicle_info=quote.vehicle_info,
+                    drivers=quote.drivers,
+                    coverage_selections=quote.coverage_selections,
+                    customer_id=quote.customer_id,
+                    previous=await self._get_rating_breakdown(quote_id),
+                )
+                await self._update_quote_status(quote_id, QuoteStatus.CALCULATING)
+                requests[index] = request
+                results.append(Err("Quote not rated"))
+            except Exception as e:
+                results.append(Err(f"Calculation error: {str(e)}"))
+
+        ratings = await self._rating_engine.calculate_premium_batch(
+            list(requests.values())
+        )
+        for index, rating_result in zip(requests, ratings, strict=True):
+            quote_id = quote_ids[index]
+            try:
+                if rating_result.is_err():
+                    await self._update_quote_status(quote_id, QuoteStatus.DRAFT)
+                    results[index] = Err(rating_result.unwrap_err())
+                else:
+                    results[index] = await self._apply_rating(
+                        quote_id, rating_result.unwrap()
+                    )
+            except Exception as e:
+                results[index] = Err(f"Calculation error: {str(e)}")
+        return results
+
+    @beartype
+    @performance_monitor("quote_variations", max_duration_ms=500)
+    async def price_quote_variations(
+        self, quote_id: UUID, axes: list[CoverageTermAxis]
+    ) -> Result[QuoteVariationResponse, str]:
+        """Price a grid of coverage-term variations of a quote.
+
+        The quote is rated once and each combination of axis values is
+        repriced incrementally.  Nothing is persisted.
+        """
+        try:
+            quote_result = await self.get_quote(quote_id)
+            if isinstance(quote_result, Err):
+                return quote_result
+
+            quote = quote_result.unwrap()
+            if not quote:
+                return Err("Quote not found")
+
+            if not self._rating_engine:
+                return Err(
+                    "Rating engine not configured. "
+                    "Service must be initialized with RatingEngine instance. "
+                    "Contact system administrator to configure rating service."
+                )
+            init_result = await self._initialize_rating_engine()
+            if isinstance(init_result, Err):
+                return init_result
+
+            current = {c.coverage_type: c for c in quote.coverage_selections}
+            missing = [
+                a.coverage_type.value for a in axes if a.coverage_type not in current
+            ]
+            if missing:
+                return Err(f"Quote has no coverage to vary for: {missing}")
+
+            # Row-major: the last axis varies fastest
+            grid = list(itertools.product(*(axis.values for axis in axes)))
+            invalid: dict[int, str] = {}
+            variants: list[list[CoverageSelection]] = []
+            for index, point in enumerate(grid):
+                changed: dict[CoverageType, dict[str, Any]] = {}
+                for axis, value in zip(axes, point):
+                    fields = changed.setdefault(
+                        axis.coverage_type, current[axis.coverage_type].model_dump()
+                    )
+                    fields[axis.term] = value
+                try:
+                    variants.append(
+                        [CoverageSelection.model_validate(f) for f in changed.values()]
+                    )
+                except ValidationError as e:
+                    invalid[index] = str(e.errors()[0]["msg"])
+
+            pricing = await self._rating_engine.price_variations(
+                state=quote.state,
+                product_type=quote.product_type,
+                vehicle_info=quote.vehicle_info,
+                drivers=quote.drivers,
+                coverage_selections=quote.coverage_selections,
+                variants=variants,
+                customer_id=quote.customer_id,
+            )
+            if isinstance(pricing, Err):
+                return pricing
+
+            priced = iter(pricing.value.variants)
+            cells = []
+            for index, point in enumerate(grid):
+                if index in invalid:
+                    cells.append(
+                        QuoteVariationCell(values=list(point), error=invalid[index])
+                    )
+                    continue
+                variant = next(priced)
+                cells.append(
+                    QuoteVariationCell(
+                        values=list(point),
+                        base_premium=variant.base_premium,
+                        total_premium=variant.total_premium,
+                        error=variant.error,
+                    )
+                )
+
+            return Ok(
+                QuoteVariationResponse(
+                    quote_id=quote_id,
+                    base_premium=pricing.value.base_premium,
+                    total_premium=pricing.value.total_premium,
+                    rate_version=pricing.value.rate_version,
+                    axes=axes,
+                    shape=[len(axis.values) for axis in axes],
+                    cells=cells,
+                )
+            )
 
         except Exception as e:
-            return Err(f"Calculation error: {str(e)}")
+            return Err(f"Variation pricing error: {str(e)}")
 
     @beartype
     @performance_monitor("update_quote")
@@ -481,9 +700,20 @@ class QuoteService:
         created_before: datetime | None = None,
         limit: int = 20,
         offset: int = 0,
+        after: KeysetCursor | None = None,
+        summary: bool = False,
     ) -> Ok[list[Quote]] | Err[str]:
-        """Search quotes with filters."""
-        query_parts = ["SELECT * FROM quotes WHERE 1=1"]
+        """Search quotes with filters.
+
+        Args:
+            after: Keyset cursor from the previous page; when given, the page
+                is located by seeking on ``(created_at, id)`` and ``offset``
+                is ignored.
+            summary: Skip the heavy rating/AI JSONB breakdowns, which list
+                views never render.
+        """
+        columns = QUOTE_SUMMARY_COLUMNS if summary else "*"
+        query_parts = [f"SELECT {columns} FROM quotes WHERE 1=1"]
         params: list[Any] = []
         param_count = 0
 
@@ -505,22 +735,28 @@ class QuoteService:
         if created_after:
             param_count += 1
             query_parts.append(f"AND created_at >= ${param_count}")
-            params.append(str(created_after))
+            params.append(created_after)
 
         if created_before:
             param_count += 1
             query_parts.append(f"AND created_at <= ${param_count}")
-            params.append(str(created_before))
+            params.append(created_before)
+
+        if after:
+            query_parts.append(f"AND {keyset_predicate(param_count + 1)}")
+            params.extend([after.created_at, after.id])
+            param_count += 2
 
-        query_parts.append("ORDER BY created_at DESC")
+        query_parts.append(KEYSET_ORDER_BY)
 
         param_count += 1
         query_parts.append(f"LIMIT ${param_count}")
-        params.append(str(limit))
+        params.append(limit)
 
-        param_count += 1
-        query_parts.append(f"OFFSET ${param_count}")
-        params.append(str(offset))
+        if not after:
+            param_count += 1
+            query_parts.append(f"OFFSET ${param_count}")
+            params.append(offset)
 
         query = " ".join(query_parts)
         rows = await self._db.fetch(query, *params)
@@ -714,6 +950,35 @@ class QuoteService:
 
     # Private helper methods
 
+    async def _get_rating_breakdown(self, quote_id: UUID) -> "RatingBreakdown | None":
+        """Rating breakdown of the quote, or of the version it was edited from."""
+        raw = await self._db.fetchval(
+            """
+            SELECT COALESCE(q.rating_breakdown, p.rating_breakdown)
+            FROM quotes q
+            LEFT JOIN quotes p ON p.id = q.parent_quote_id
+            WHERE q.id = $1
+            """,
+            quote_id,
+        )
+        if not raw or RatingBreakdown is None:
+            return None
+        try:
+            return RatingBreakdown.model_validate(raw)
+        except ValidationError:
+            # Written by an older release; rate in full and replace it
+            return None
+
+    async def _initialize_rating_engine(self) -> Result[bool, str]:
+        """Preload the rating engine on first use."""
+        if getattr(self._rating_engine, "_initialized", False):
+            return Ok(True)
+        init_result = await self._rating_engine.initialize()
+        if isinstance(init_result, Err):
+            return init_result
+        self._rating_engine._initialized = True
+        return Ok(True)
+
     @beartype
     @performance_monitor("generate_quote_number")
     async def _generate_quote_number(self) -> str:
@@ -1435,4 +1700,5 @@ class QuoteService:
         except Exception as e:
             return Err(f"Failed to verify admin permissions: {str(e)}")
 
+
 # SYSTEM_BOUNDARY: Quote service requires flexible dict structures for quote data aggregation and customer interaction tracking
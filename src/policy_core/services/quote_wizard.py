@@ -9,7 +9,9 @@
 """Multi-step quote wizard state management."""
 
 import json
+import logging
 from datetime import date, datetime, timedelta
+from decimal import Decimal
 from typing import Any
 from uuid import UUID, uuid4
 
@@ -20,6 +22,18 @@ from policy_core.core.result_types import Err, Ok, Result
 from policy_core.models.base import BaseModelConfig
 
 from ..core.cache import Cache
+from ..models.quote import CoverageType
+from ..schemas.quote import CoverageTermAxis
+from .quote_service import QuoteService
+from .rating.state_rules import get_state_rule_book
+
+logger = logging.getLogger(__name__)
+
+# Options priced on the coverage step once the session has a quote
+_OPTION_DEDUCTIBLES = [
+    Decimal(amount) for amount in ("250", "500", "750", "1000", "2000")
+]
+_OPTION_LIMITS = [Decimal(amount) for amount in ("25000", "50000", "100000", "300000")]
 
 # Auto-generated models
 
@@ -141,9 +155,14 @@ class WizardValidation(BaseModel):
 class QuoteWizardService:
     """Manage multi-step quote wizard state."""
 
-    def __init__(self, cache: Cache) -> None:
-        """Initialize wizard service."""
+    def __init__(self, cache: Cache, quote_service: QuoteService | None = None) -> None:
+        """Initialize wizard service.
+
+        With ``quote_service`` the coverage step also prices common limit and
+        deductible options of the session's quote.
+        """
         self._cache = cache
+        self._quote_service = quote_service
         self._cache_prefix = "wizard:"
         self._session_ttl = 3600  # 1 hour
         self._steps = self._initialize_wizard_steps()
@@ -925,23 +944,66 @@ class QuoteWizardService:
                     },
                 }
 
+                if state.quote_id is not None:
+                    option_pricing = await self._price_coverage_options(state.quote_id)
+                    if option_pricing is not None:
+                        intelligence["option_pricing"] = option_pricing
+
         return Ok(intelligence)
 
+    async def _price_coverage_options(self, quote_id: UUID) -> dict[str, Any] | None:
+        """Premium matrix of collision deductibles by liability limits."""
+        if self._quote_service is None:
+            return None
+
+        quote_result = await self._quote_service.get_quote(quote_id)
+        if isinstance(quote_result, Err) or quote_result.value is None:
+            return None
+        present = {c.coverage_type for c in quote_result.value.coverage_selections}
+
+        axes = []
+        if CoverageType.COLLISION in present:
+            axes.append(
+                CoverageTermAxis(
+                    coverage_type=CoverageType.COLLISION,
+                    term="deductible",
+                    values=_OPTION_DEDUCTIBLES,
+                )
+            )
+        for liability in (CoverageType.BODILY_INJURY, CoverageType.LIABILITY):
+            if liability in present:
+                axes.append(
+                    CoverageTermAxis(
+                        coverage_type=liability, term="limit", values=_OPTION_LIMITS
+                    )
+                )
+                break
+        if not axes:
+            return None
+
+        # Option pricing is advisory; the step works without it
+        pricing = await self._quote_service.price_quote_variations(quote_id, axes)
+        if isinstance(pricing, Err):
+            logger.warning(
+                "Option pricing failed for quote %s: %s", quote_id, pricing.unwrap_err()
+            )
+            return None
+        return pricing.value.model_dump(mode="json")
+
     def _get_required_coverages_for_state(self, state: str) -> list[str]:
         """Get required coverages for specific state."""
-        state_requirements = {
-            "CA": ["bodily_injury", "property_damage"],
-            "TX": ["bodily_injury", "property_damage"],
-            "NY": ["bodily_injury", "property_damage", "personal_injury_protection"],
-        }
-        return state_requirements.get(state, ["bodily_injury", "property_damage"])
+        book = get_state_rule_book()
+        if state not in book.states:
+            return ["bodily_injury", "property_damage"]
+        return list(book.rules(state).required_coverages)
 
     def _get_state_minimum_liability(self, state: str) -> int:
         """Get minimum liability coverage for state."""
-        minimums = {
-            "CA": 15000,  # $15K/$30K/$5K
-            "TX": 30000,  # $30K/$60K/$25K
-            "NY": 25000,  # $25K/$50K/$10K
-        }
-        return minimums.get(state, 15000)
+        book = get_state_rule_book()
+        if state not in book.states:
+            return 15000
+        minimums = book.rules(state).minimum_limits
+        return int(minimums.get("bodily_injury_per_person", 15000))
+
+
 # SYSTEM_BOUNDARY: Quote wizard requires flexible dict structures for multi-step workflow management and form state tracking
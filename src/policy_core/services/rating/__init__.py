@@ -36,18 +36,23 @@ from .performance_optimizer import RatingPerformanceOptimizer as PerformanceOpti
 from .rate_tables import RateTableService
 from .rating_engine import RatingEngine
 from .state_rules import (
-    CaliforniaRules,
-    FloridaRules,
-    MichiganRules,
-    NewYorkRules,
-    PennsylvaniaRules,
+    CompiledStateRules,
     StateRatingRules,
-    TexasRules,
+    StateRuleBook,
+    StateRulePack,
+    get_state_rule_book,
     get_state_rules,
+    reload_state_rule_book,
     validate_coverage_limits,
 )
 from .surcharge_calculator import SurchargeCalculator
 from .territory_management import TerritoryDefinition, TerritoryManager
+from .worker_pool import (
+    RatingJob,
+    RatingWorkerPool,
+    get_rating_worker_pool,
+    shutdown_rating_worker_pool,
+)
 
 __all__ = [
     # Main Engine
@@ -78,12 +83,16 @@ __all__ = [
     "RateTableService",
     # State rules
     "StateRatingRules",
-    "CaliforniaRules",
-    "TexasRules",
-    "NewYorkRules",
-    "FloridaRules",
-    "MichiganRules",
-    "PennsylvaniaRules",
+    "StateRulePack",
+    "CompiledStateRules",
+    "StateRuleBook",
+    "get_state_rule_book",
+    "reload_state_rule_book",
     "get_state_rules",
     "validate_coverage_limits",
+    # Batch rating workers
+    "RatingJob",
+    "RatingWorkerPool",
+    "get_rating_worker_pool",
+    "shutdown_rating_worker_pool",
 ]
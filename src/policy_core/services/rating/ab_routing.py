@@ -0,0 +1,310 @@
+# PolicyCore - Policy Decision Management System
+# Copyright (C) 2025 Luiz Frias <luizf35@gmail.com>
+# Form F[x] Labs
+#
+# This software is dual-licensed under AGPL-3.0 and Commercial License.
+# For commercial licensing, contact: luizf35@gmail.com
+# See LICENSE file for full terms.
+
+"""Deterministic A/B routing between rate versions.
+
+:class:`ABTestRouter` keeps the scheduled and running ``rate_ab_tests`` in an
+in-process table keyed by (state, product), each side resolved to a
+precompiled :class:`~policy_core.schemas.rating.CoverageRates` snapshot of
+its rate version.  Assigning a quote is a dict lookup and a hash:
+
+* the routing key (customer id, or the quote fingerprint for anonymous
+  quotes) is hashed together with the test id, so a customer always lands
+  in the same group of a test but groups are independent across tests;
+* the 64-bit hash is compared against ``traffic_split * 2**64``.
+
+Assignment counts accumulate in memory and are added to
+``rate_ab_test_assignments`` in one statement per sync interval, which is
+also when the test table is reloaded.  Scheduling a test publishes on
+``rating:ab_tests:refresh`` so every worker reloads immediately.
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import logging
+from collections import Counter
+from datetime import date
+from decimal import Decimal
+from typing import Any, NamedTuple
+from uuid import UUID
+
+from beartype import beartype
+from pydantic import ValidationError
+
+from policy_core.core.cache import Cache, RedisType, subscribe_forever
+from policy_core.core.config import get_settings
+from policy_core.core.result_types import Err, Ok, Result
+from policy_core.core.types import DatabaseLike
+
+from ...schemas.rating import CoverageRates
+from .rate_tables import table_scope
+
+logger = logging.getLogger(__name__)
+
+REFRESH_CHANNEL = "rating:ab_tests:refresh"
+CONTROL_GROUP = "control"
+TEST_GROUP = "test"
+
+_HASH_SPACE = 2**64
+
+_LOAD_SQL = """
+    SELECT t.id, t.traffic_split, t.start_date, t.end_date,
+           c.id AS control_version_id, c.table_name AS control_table_name,
+           c.version_number AS control_version_number,
+           c.rate_data AS control_rate_data,
+           v.id AS test_version_id, v.table_name AS test_table_name,
+           v.version_number AS test_version_number,
+           v.rate_data AS test_rate_data
+    FROM rate_ab_tests t
+    JOIN rate_table_versions c ON c.id = t.control_version_id
+    JOIN rate_table_versions v ON v.id = t.test_version_id
+    WHERE t.status IN ('scheduled', 'running')
+      AND t.end_date >= CURRENT_DATE
+    ORDER BY t.start_date, t.id
+"""
+
+_FLUSH_SQL = """
+    INSERT INTO rate_ab_test_assignments (test_id, group_name, assignments)
+    SELECT * FROM unnest($1::uuid[], $2::text[], $3::bigint[])
+    ON CONFLICT (test_id, group_name) DO UPDATE
+    SET assignments = rate_ab_test_assignments.assignments
+                      + EXCLUDED.assignments,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+
+class RateSnapshot(NamedTuple):
+    """Rates of one version, ready for the rating hot path."""
+
+    version_id: UUID
+    label: str
+    rates: CoverageRates
+
+
+class ABTestRoute(NamedTuple):
+    """One A/B test as loaded into the routing table."""
+
+    test_id: UUID
+    control: RateSnapshot
+    test: RateSnapshot
+    threshold: int
+    start_date: date
+    end_date: date
+
+
+class RateAssignment(NamedTuple):
+    """The group and rate snapshot a quote was routed to."""
+
+    test_id: UUID
+    group: str
+    snapshot: RateSnapshot
+
+
+@beartype
+def routing_bucket(test_id: UUID, routing_key: str) -> int:
+    """Stable 64-bit bucket of ``routing_key`` within one test."""
+    digest = hashlib.blake2b(
+        f"{test_id}:{routing_key}".encode(), digest_size=8
+    ).digest()
+    return int.from_bytes(digest, "big")
+
+
+def _snapshot(version_id: UUID, table_name: str, number: int, raw: Any) -> RateSnapshot:
+    rate_data = json.loads(raw) if isinstance(raw, str) else raw
+    rates = {**rate_data.get("base_rates", {}), **rate_data.get("coverages", {})}
+    return RateSnapshot(
+        version_id=version_id,
+        # Matches quotes.rate_version as joined by the rate analytics
+        label=f"{table_name}_v{number}",
+        rates=CoverageRates(
+            **{
+                name: Decimal(str(value))
+                for name, value in rates.items()
+                if name in CoverageRates.model_fields
+            }
+        ),
+    )
+
+
+class ABTestRouter:
+    """In-process routing table for rate version A/B tests."""
+
+    def __init__(self, sync_interval_seconds: float | None = None) -> None:
+        """Configure the sync interval from settings unless overridden."""
+        self._interval = sync_interval_seconds or get_settings().rate_ab_sync_seconds
+        self._routes: dict[tuple[str, str], tuple[ABTestRoute, ...]] = {}
+        self._counts: Counter[tuple[UUID, str]] = Counter()
+        self._refresh_requested = asyncio.Event()
+        self._database: DatabaseLike | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._listener: asyncio.Task[None] | None = None
+
+    @property
+    def pending_counts(self) -> dict[tuple[UUID, str], int]:
+        """Assignments not yet flushed, by (test id, group)."""
+        return dict(self._counts)
+
+    def assign(
+        self,
+        state: str,
+        product_type: str,
+        routing_key: str,
+        today: date | None = None,
+        record: bool = True,
+    ) -> RateAssignment | None:
+        """Route a quote; ``None`` when no test covers its state and product.
+
+        With ``record=False`` the lookup is not counted as an assignment,
+        for pricing that is not a real quote of either group.
+        """
+        routes = self._routes.get((state, product_type))
+        if not routes:
+            return None
+        today = today or date.today()
+        for route in routes:
+            if route.start_date <= today <= route.end_date:
+                if routing_bucket(route.test_id, routing_key) < route.threshold:
+                    group, snapshot = TEST_GROUP, route.test
+                else:
+                    group, snapshot = CONTROL_GROUP, route.control
+                if record:
+                    self._counts[(route.test_id, group)] += 1
+                return RateAssignment(route.test_id, group, snapshot)
+        return None
+
+    async def refresh(self, database: DatabaseLike) -> Result[int, str]:
+        """Reload the routing table; returns the number of routable tests."""
+        try:
+            rows = await database.fetch(_LOAD_SQL)
+        except Exception as e:
+            return Err(f"Failed to load rate A/B tests: {str(e)}")
+
+        routes: dict[tuple[str, str], list[ABTestRoute]] = {}
+        for row in rows:
+            scope = table_scope(row["control_table_name"])
+            if scope[0] is None or scope[1] is None:
+                logger.warning(
+                    "A/B test %s: cannot route %s", row["id"], row["control_table_name"]
+                )
+                continue
+            try:
+                route = ABTestRoute(
+                    test_id=row["id"],
+                    control=_snapshot(
+                        row["control_version_id"],
+                        row["control_table_name"],
+                        row["control_version_number"],
+                        row["control_rate_data"],
+                    ),
+                    test=_snapshot(
+                        row["test_version_id"],
+                        row["test_table_name"],
+                        row["test_version_number"],
+                        row["test_rate_data"],
+                    ),
+                    threshold=int(float(row["traffic_split"]) * _HASH_SPACE),
+                    start_date=row["start_date"],
+                    end_date=row["end_date"],
+                )
+            except (ValidationError, ValueError, TypeError, AttributeError) as e:
+                logger.warning("A/B test %s has unusable rates: %s", row["id"], e)
+                continue
+            routes.setdefault((scope[0], scope[1]), []).append(route)
+
+        # Swap the whole table so assign() never sees a partial reload
+        self._routes = {key: tuple(value) for key, value in routes.items()}
+        return Ok(sum(len(value) for value in routes.values()))
+
+    async def flush(self, database: DatabaseLike) -> Result[int, str]:
+        """Add buffered assignment counts in one statement."""
+        if not self._counts:
+            return Ok(0)
+
+        counts, self._counts = self._counts, Counter()
+        keys = list(counts)
+        try:
+            await database.execute(
+                _FLUSH_SQL,
+                [test_id for test_id, _ in keys],
+                [group for _, group in keys],
+                [counts[key] for key in keys],
+            )
+        except Exception as e:
+            # Keep the counts so the next flush retries them
+            self._counts.update(counts)
+            return Err(f"Failed to flush A/B assignment counts: {str(e)}")
+        return Ok(sum(counts.values()))
+
+    @staticmethod
+    async def publish_refresh(cache: Cache) -> None:
+        """Ask every worker to reload the routing table."""
+        await cache.publish(REFRESH_CHANNEL, "refresh")
+
+    @beartype
+    async def start(self, database: DatabaseLike, redis: RedisType) -> None:
+        """Load the table, then keep it and the counters in sync."""
+        self._database = database
+        if self._listener is None:
+            self._listener = asyncio.create_task(
+                subscribe_forever(
+                    redis,
+                    REFRESH_CHANNEL,
+                    on_message=lambda _: self._refresh_requested.set(),
+                    on_subscribed=self._on_subscribed,
+                    on_lost=lambda: None,
+                ),
+                name="rate-ab-test-refresh",
+            )
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop(), name="rate-ab-test-sync")
+
+    async def _on_subscribed(self) -> None:
+        # A test scheduled while unsubscribed would otherwise wait a full interval
+        self._refresh_requested.set()
+
+    async def _loop(self) -> None:
+        while True:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._refresh_requested.wait(), self._interval)
+            self._refresh_requested.clear()
+            if self._database is None:
+                continue
+            for result in (
+                await self.refresh(self._database),
+                await self.flush(self._database),
+            ):
+                if result.is_err():
+                    logger.warning(result.unwrap_err())
+
+    async def stop(self) -> None:
+        """Stop syncing and write outstanding assignment counts."""
+        for task in (self._listener, self._task):
+            if task is not None:
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        self._listener = self._task = None
+        if self._database is not None:
+            result = await self.flush(self._database)
+            if result.is_err():
+                logger.warning(result.unwrap_err())
+
+
+# Global A/B test router instance
+_ab_test_router: ABTestRouter | None = None
+
+
+@beartype
+def get_ab_test_router() -> ABTestRouter:
+    """Get global A/B test router instance."""
+    global _ab_test_router
+    if _ab_test_router is None:
+        _ab_test_router = ABTestRouter()
+    return _ab_test_router
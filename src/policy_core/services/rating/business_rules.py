@@ -22,10 +22,10 @@ from beartype import beartype
 # mapping after recent enhancements, so existing iteration logic continues to
 # work while we eliminate duplicate placeholder types.
 from policy_core.core.result_types import Err, Ok, Result  # noqa: E402
-from policy_core.schemas.rating import RatingFactors  # noqa: E402
 
 # Domain models
 from ...models.quote import CoverageSelection, DriverInfo, VehicleInfo  # noqa: E402
+from ...schemas.rating import RatingFactors  # noqa: E402
 
 # Backward-compat alias so type hints elsewhere remain valid without an
 # invasive refactor.  After callers are updated, this alias can be removed.
@@ -99,7 +99,7 @@ class RatingBusinessRules:
         }
 
     @beartype
-    async def validate_premium_calculation(
+    def validate_premium_calculation(
         self,
         state: str,
         product_type: str,
@@ -133,49 +133,47 @@ class RatingBusinessRules:
 
         try:
             # Validate factor ranges
-            factor_violations = await self._validate_factor_ranges(factors)
+            factor_violations = self._validate_factor_ranges(factors)
             violations.extend(factor_violations)
 
             # Validate premium reasonableness
-            premium_violations = await self._validate_premium_reasonableness(
+            premium_violations = self._validate_premium_reasonableness(
                 base_premium, total_premium, factors
             )
             violations.extend(premium_violations)
 
             # Validate discount stacking
-            discount_violations = await self._validate_discount_stacking(
+            discount_violations = self._validate_discount_stacking(
                 discounts, base_premium
             )
             violations.extend(discount_violations)
 
             # Validate surcharge logic
-            surcharge_violations = await self._validate_surcharge_logic(
+            surcharge_violations = self._validate_surcharge_logic(
                 surcharges, drivers, vehicle_info
             )
             violations.extend(surcharge_violations)
 
             # Validate coverage appropriateness
-            coverage_violations = await self._validate_coverage_appropriateness(
+            coverage_violations = self._validate_coverage_appropriateness(
                 coverage_selections, vehicle_info, drivers, state
             )
             violations.extend(coverage_violations)
 
             # Validate driver eligibility
             if drivers:
-                driver_violations = await self._validate_driver_eligibility(
-                    drivers, state
-                )
+                driver_violations = self._validate_driver_eligibility(drivers, state)
                 violations.extend(driver_violations)
 
             # Validate vehicle eligibility
             if vehicle_info:
-                vehicle_violations = await self._validate_vehicle_eligibility(
+                vehicle_violations = self._validate_vehicle_eligibility(
                     vehicle_info, state
                 )
                 violations.extend(vehicle_violations)
 
             # Validate regulatory compliance
-            regulatory_violations = await self._validate_regulatory_compliance(
+            regulatory_violations = self._validate_regulatory_compliance(
                 state, factors, total_premium, coverage_selections
             )
             violations.extend(regulatory_violations)
@@ -186,7 +184,7 @@ class RatingBusinessRules:
             return Err(f"Business rule validation failed: {str(e)}")
 
     @beartype
-    async def _validate_factor_ranges(
+    def _validate_factor_ranges(
         self, factors: FactorsMetrics
     ) -> list[BusinessRuleViolation]:
         """Validate that all factors are within acceptable ranges."""
@@ -248,7 +246,7 @@ class RatingBusinessRules:
         return violations
 
     @beartype
-    async def _validate_premium_reasonableness(
+    def _validate_premium_reasonableness(
         self,
         base_premium: Decimal,
         total_premium: Decimal,
@@ -321,7 +319,7 @@ class RatingBusinessRules:
         return violations
 
     @beartype
-    async def _validate_discount_stacking(
+    def _validate_discount_stacking(
         self,
         discounts: list[Any],
         base_premium: Decimal,
@@ -388,7 +386,7 @@ class RatingBusinessRules:
         return violations
 
     @beartype
-    async def _validate_surcharge_logic(
+    def _validate_surcharge_logic(
         self,
         surcharges: list[dict[str, Any]],
         drivers: list[DriverInfo],
@@ -443,7 +441,7 @@ class RatingBusinessRules:
         return violations
 
     @beartype
-    async def _validate_coverage_appropriateness(
+    def _validate_coverage_appropriateness(
         self,
         coverage_selections: list[CoverageSelection],
         vehicle_info: VehicleInfo | None,
@@ -504,7 +502,7 @@ class RatingBusinessRules:
         return violations
 
     @beartype
-    async def _validate_driver_eligibility(
+    def _validate_driver_eligibility(
         self, drivers: list[DriverInfo], state: str
     ) -> list[BusinessRuleViolation]:
         """Validate driver eligibility and risk factors."""
@@ -574,7 +572,7 @@ class RatingBusinessRules:
         return violations
 
     @beartype
-    async def _validate_vehicle_eligibility(
+    def _validate_vehicle_eligibility(
         self, vehicle_info: VehicleInfo, state: str
     ) -> list[BusinessRuleViolation]:
         """Validate vehicle eligibility and characteristics."""
@@ -618,7 +616,7 @@ class RatingBusinessRules:
         return violations
 
     @beartype
-    async def _validate_regulatory_compliance(
+    def _validate_regulatory_compliance(
         self,
         state: str,
         factors: FactorsMetrics,
@@ -714,4 +712,6 @@ class RatingBusinessRules:
             "violations_by_severity": by_severity,
             "compliance_status": "fail" if by_severity["error"] else "pass",
         }
+
+
 # SYSTEM_BOUNDARY: Rating calculations require flexible dict structures for state-specific rules and territory factors
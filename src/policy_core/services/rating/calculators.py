@@ -22,6 +22,7 @@
 # modules (e.g., `premium.py`, `risk.py`, `ai.py`, `discounts.py`) and expose
 # a public `policy_core.services.rating` package facade.
 
+import functools
 import math
 from datetime import datetime
 from decimal import ROUND_HALF_UP, Decimal, getcontext
@@ -45,6 +46,8 @@ from policy_core.schemas.rating import (
 
 from ...core.result_types import Err, Ok, Result
 from ..performance_monitor import performance_monitor
+from .catastrophe import get_catastrophe_grid
+from .glm import INVERSE_LINKS, CompiledGLM, get_glm_registry
 
 # Auto-generated models
 
@@ -1688,73 +1691,24 @@ class StatisticalRatingModels:
         Returns:
             Result containing calculated factor or error
         """
-        try:
-            # Convert legacy dict inputs
-            features_result = _to_features_metrics(features)
-            if features_result.is_err():
-                return Err(features_result.unwrap_err())
-            features = features_result.unwrap()
-
-            coeffs_result = _to_coefficients_metrics(coefficients)
-            if coeffs_result.is_err():
-                return Err(coeffs_result.unwrap_err())
-            coefficients = coeffs_result.unwrap()
-
-            if not features:
-                return Err("Features are required for GLM calculation")
-            if not coefficients:
-                return Err("Coefficients are required for GLM calculation")
-
-            # Calculate linear predictor
-            linear_predictor = coefficients.intercept
-
-            # Add feature contributions
-            if hasattr(features, "driver_age") and hasattr(coefficients, "driver_age"):
-                linear_predictor += coefficients.driver_age * features.driver_age
-            if hasattr(features, "vehicle_age") and hasattr(
-                coefficients, "vehicle_age"
-            ):
-                linear_predictor += coefficients.vehicle_age * features.vehicle_age
-            if hasattr(features, "annual_mileage") and hasattr(
-                coefficients, "annual_mileage"
-            ):
-                linear_predictor += (
-                    coefficients.annual_mileage * features.annual_mileage
-                )
-            if hasattr(features, "urban_indicator") and hasattr(
-                coefficients, "urban_indicator"
-            ):
-                linear_predictor += (
-                    coefficients.urban_indicator * features.urban_indicator
-                )
-            if hasattr(features, "prior_claims") and hasattr(
-                coefficients, "prior_claims"
-            ):
-                linear_predictor += coefficients.prior_claims * features.prior_claims
-            if hasattr(features, "vehicle_value") and hasattr(
-                coefficients, "vehicle_value"
-            ):
-                linear_predictor += coefficients.vehicle_value * features.vehicle_value
-            if hasattr(features, "vehicle_safety_score") and hasattr(
-                coefficients, "vehicle_safety_score"
-            ):
-                linear_predictor += (
-                    coefficients.vehicle_safety_score * features.vehicle_safety_score
-                )
-
-            # Apply inverse link function
-            if link_function == "log":
-                factor = math.exp(linear_predictor)
-            elif link_function == "logit":
-                factor = 1 / (1 + math.exp(-linear_predictor))
-            elif link_function == "identity":
-                factor = linear_predictor
-            else:
-                return Err(f"Unsupported link function: {link_function}")
+        if not features:
+            return Err("Features are required for GLM calculation")
+        if not coefficients:
+            return Err("Coefficients are required for GLM calculation")
+        if link_function not in INVERSE_LINKS:
+            return Err(f"Unsupported link function: {link_function}")
 
-            # Ensure factor is within reasonable bounds
-            factor = max(0.1, min(10.0, factor))
-            return Ok(factor)
+        try:
+            # Compiled once per distinct coefficient set and link
+            values = (
+                coefficients.model_dump()
+                if isinstance(coefficients, CoefficientsMetrics)
+                else coefficients
+            )
+            model_res = _compiled_glm(tuple(sorted(values.items())), link_function)
+            if model_res.is_err():
+                return Err(model_res.unwrap_err())
+            return Ok(model_res.unwrap().score_one(features))
 
         except Exception as e:
             return Err(f"GLM calculation failed: {str(e)}")
@@ -1866,64 +1820,14 @@ class StatisticalRatingModels:
                 return Err(territory_res.unwrap_err())
             territory_profile = territory_res.unwrap()
 
-            # Proceed
-            # Frequency model (Poisson regression simulation)
-            glm_features = GLMFeatures(
-                driver_age=driver_profile.age,
-                vehicle_age=vehicle_profile.age,
-                annual_mileage=vehicle_profile.annual_mileage,
-                urban_indicator=1.0 if territory_profile.urban else 0.0,
-                prior_claims=driver_profile.prior_claims,
-                vehicle_value=vehicle_profile.value,
-                vehicle_safety_score=len(vehicle_profile.safety_features) / 10,
-            )
-
-            freq_coeffs = GLMCoefficients(
-                intercept=-3.0,
-                driver_age=0.01,
-                vehicle_age=0.02,
-                annual_mileage=0.0001,
-                urban_indicator=0.5,
-                prior_claims=0.3,
-                vehicle_value=0.00005,
-                vehicle_safety_score=-0.1,
-            )
-
-            # Convert to dict for legacy-compatible helper
-            freq_factor_res = (
-                StatisticalRatingModels.calculate_generalized_linear_model_factor(
-                    glm_features.model_dump(),
-                    freq_coeffs.model_dump(),
-                    link_function="log",
+            models = get_glm_registry().get()
+            scores = models.score(
+                models.feature_matrix(
+                    [_glm_risk(driver_profile, vehicle_profile, territory_profile)]
                 )
             )
-            if freq_factor_res.is_err():
-                return Err(f"Frequency model failed: {freq_factor_res.unwrap_err()}")
-            frequency_factor = freq_factor_res.unwrap()
-
-            # Severity model (Gamma regression simulation)
-            sev_features = glm_features.model_dump()
-            sev_coeffs = GLMCoefficients(
-                intercept=10.0,
-                driver_age=0.02,
-                vehicle_age=0.03,
-                annual_mileage=0.0002,
-                urban_indicator=0.8,
-                prior_claims=0.5,
-                vehicle_value=0.0001,
-                vehicle_safety_score=-0.2,
-            )
-
-            sev_factor_res = (
-                StatisticalRatingModels.calculate_generalized_linear_model_factor(
-                    sev_features,
-                    sev_coeffs.model_dump(),
-                    link_function="identity",
-                )
-            )
-            if sev_factor_res.is_err():
-                return Err(f"Severity model failed: {sev_factor_res.unwrap_err()}")
-            severity_factor = sev_factor_res.unwrap()
+            frequency_factor = float(scores["frequency"][0])
+            severity_factor = float(scores["severity"][0])
 
             return Ok(
                 FrequencySeverityResult(
@@ -1931,7 +1835,7 @@ class StatisticalRatingModels:
                     severity_factor=severity_factor,
                     expected_claims=frequency_factor,
                     expected_severity=severity_factor * 5000,  # Base severity $5,000
-                    pure_premium_factor=frequency_factor * severity_factor,
+                    pure_premium_factor=float(scores["pure_premium"][0]),
                 )
             )
 
@@ -1943,9 +1847,9 @@ class StatisticalRatingModels:
     def calculate_catastrophe_loading(
         zip_code: str,
         coverage_types: list[str],
-        dwelling_characteristics: DwellingCharacteristics
-        | dict[str, Any]
-        | None = None,
+        dwelling_characteristics: (
+            DwellingCharacteristics | dict[str, Any] | None
+        ) = None,
     ) -> Result[float, str]:
         """Calculate catastrophe loading factor.
 
@@ -1962,48 +1866,11 @@ class StatisticalRatingModels:
             if not zip_code:
                 return Err("ZIP code is required for catastrophe loading")
 
-            # Initialize base loading
-            cat_loading = 1.0
-
-            # Hurricane/windstorm loading
-            if zip_code.startswith(("3", "7", "2")):  # FL, TX, LA coastal areas
-                if "comprehensive" in coverage_types or "collision" in coverage_types:
-                    cat_loading *= 1.15  # 15% hurricane loading
-
-            # Earthquake loading
-            elif zip_code.startswith(("9", "8")):  # CA, WA earthquake zones
-                if "comprehensive" in coverage_types:
-                    cat_loading *= 1.08  # 8% earthquake loading
-
-            # Hail loading
-            elif zip_code.startswith(("7", "6")):  # TX, CO hail corridor
-                if "comprehensive" in coverage_types:
-                    cat_loading *= 1.05  # 5% hail loading
-
-            # Wildfire loading
-            elif zip_code.startswith(("8", "9")):  # Mountain West
-                if "comprehensive" in coverage_types:
-                    cat_loading *= 1.06  # 6% wildfire loading
-
-            # Apply dwelling-specific adjustments if available
-            if dwelling_characteristics is not None:
-                dc_res = _to_dwelling_characteristics(dwelling_characteristics)
-                if dc_res.is_err():
-                    return Err(dc_res.unwrap_err())
-                dc = dc_res.unwrap()
-
-                if dc is not None:
-                    # Construction adjustments
-                    if dc.construction_type == "masonry":
-                        cat_loading *= 0.95
-                    elif dc.construction_type == "mobile_home":
-                        cat_loading *= 1.25
-
-                    # Roof adjustments for hail-resistant materials
-                    if dc.roof_type == "impact_resistant":
-                        cat_loading *= 0.90
-
-            return Ok(cat_loading)
+            return Ok(
+                get_catastrophe_grid().loading(
+                    zip_code, coverage_types, dwelling_characteristics
+                )
+            )
 
         except Exception as e:
             return Err(f"Catastrophe loading calculation failed: {str(e)}")
@@ -2495,20 +2362,6 @@ def _to_factor_request_list(
     return Ok(converted)
 
 
-@beartype
-def _to_features_metrics(
-    data: FeaturesMetrics | dict[str, Any],
-) -> Result[FeaturesMetrics, str]:
-    if isinstance(data, FeaturesMetrics):
-        return Ok(data)
-    if isinstance(data, dict):
-        try:
-            return Ok(FeaturesMetrics.model_validate(data))
-        except ValidationError as exc:  # type: ignore[name-defined]
-            return Err(f"Invalid features metrics: {exc}")
-    return Err("Unsupported features metrics type. Expected FeaturesMetrics or dict.")
-
-
 @beartype
 def _to_coefficients_metrics(
     data: CoefficientsMetrics | dict[str, Any],
@@ -2525,6 +2378,39 @@ def _to_coefficients_metrics(
     )
 
 
+@functools.lru_cache(maxsize=256)
+def _compiled_glm(
+    coefficients: tuple[tuple[str, Any], ...], link_function: str
+) -> Result[CompiledGLM, str]:
+    coeffs_result = _to_coefficients_metrics(dict(coefficients))
+    if coeffs_result.is_err():
+        return Err(coeffs_result.unwrap_err())
+    return Ok(
+        CompiledGLM.compile(
+            "adhoc",
+            "adhoc",
+            coeffs_result.unwrap(),
+            link=link_function,
+            standard_only=True,
+        )
+    )
+
+
+def _glm_risk(
+    driver: DriverProfile, vehicle: VehicleProfile, territory: TerritoryProfile
+) -> dict[str, float]:
+    """Rating features of one risk, as consumed by the GLM model sets."""
+    return {
+        "driver_age": driver.age,
+        "vehicle_age": vehicle.age,
+        "annual_mileage": vehicle.annual_mileage,
+        "urban_indicator": 1.0 if territory.urban else 0.0,
+        "prior_claims": driver.prior_claims,
+        "vehicle_value": vehicle.value,
+        "vehicle_safety_score": len(vehicle.safety_features) / 10,
+    }
+
+
 @beartype
 def _to_exposure_data(
     data: ExposureData | dict[str, Any],
@@ -2591,19 +2477,3 @@ def _to_territory_profile(
         except ValidationError as exc:  # type: ignore[name-defined]
             return Err(f"Invalid territory profile: {exc}")
     return Err("Unsupported territory profile type. Expected TerritoryProfile or dict.")
-
-
-@beartype
-def _to_dwelling_characteristics(
-    data: DwellingCharacteristics | dict[str, Any] | None,
-) -> Result[DwellingCharacteristics | None, str]:
-    if data is None or isinstance(data, DwellingCharacteristics):
-        return Ok(data)
-    if isinstance(data, dict):
-        try:
-            return Ok(DwellingCharacteristics.model_validate(data))
-        except ValidationError as exc:  # type: ignore[name-defined]
-            return Err(f"Invalid dwelling characteristics: {exc}")
-    return Err(
-        "Unsupported dwelling characteristics type. Expected DwellingCharacteristics, dict, or None."
-    )
@@ -0,0 +1,228 @@
+# PolicyCore - Policy Decision Management System
+# Copyright (C) 2025 Luiz Frias <luizf35@gmail.com>
+# Form F[x] Labs
+#
+# This software is dual-licensed under AGPL-3.0 and Commercial License.
+# For commercial licensing, contact: luizf35@gmail.com
+# See LICENSE file for full terms.
+
+"""Catastrophe loading grid keyed by ZIP5 and peril.
+
+The grid is compiled from a versioned JSON file (``data/catastrophe_grid.json``
+unless ``rating_cat_grid_path`` points elsewhere) into one ``uint8`` zone
+index per (peril, numeric ZIP) and a small table of loadings per zone, so a
+lookup is two array reads per peril regardless of how many zones are defined.
+
+Perils stack multiplicatively, each applying only to the coverages it names.
+Dwelling modifiers are a (attribute, value) -> factor table.  Zone changes
+ship as a new data file and :func:`reload_catastrophe_grid`; no code changes.
+"""
+
+import json
+import logging
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from beartype import beartype
+from numpy.typing import NDArray
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from policy_core.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_GRID_PATH = Path(__file__).parent / "data" / "catastrophe_grid.json"
+
+ZIP_SPACE = 100_000
+# Zone 0 of every peril is "no loading"
+_MAX_ZONES = 255
+
+
+class CatZone(BaseModel):
+    """A ZIP5 range and the loading it carries for one peril."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    zip_from: str = Field(..., pattern=r"^\d{5}$")
+    zip_to: str = Field(..., pattern=r"^\d{5}$")
+    loading: float = Field(..., gt=0.0, le=10.0)
+
+    @model_validator(mode="after")
+    def _ordered(self) -> "CatZone":
+        if self.zip_to < self.zip_from:
+            raise ValueError(f"zip_to {self.zip_to} precedes zip_from {self.zip_from}")
+        return self
+
+
+class CatPeril(BaseModel):
+    """Zones of one peril; later zones override earlier overlapping ones."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    coverages: list[str] = Field(..., min_length=1)
+    zones: list[CatZone] = Field(default_factory=list)
+
+
+class CatGridFile(BaseModel):
+    """Schema of a catastrophe grid data file."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    version: str = Field(..., min_length=1)
+    perils: dict[str, CatPeril]
+    dwelling_modifiers: dict[str, dict[str, float]] = Field(default_factory=dict)
+
+
+@beartype
+def zip_index(zip_code: str) -> int:
+    """Numeric ZIP5 of a ZIP or ZIP+4 code."""
+    zip5 = zip_code.strip()[:5]
+    if len(zip5) != 5 or not zip5.isdigit():
+        raise ValueError(f"Invalid ZIP code: {zip_code!r}")
+    return int(zip5)
+
+
+class CatastropheGrid:
+    """Compiled catastrophe loadings for O(1) scalar and vectorized lookup."""
+
+    def __init__(self, spec: CatGridFile) -> None:
+        """Compile a validated grid file."""
+        self.version = spec.version
+        self.perils = tuple(spec.perils)
+        self.zones = np.zeros((len(self.perils), ZIP_SPACE), dtype=np.uint8)
+        levels: list[list[float]] = []
+        for p, peril in enumerate(spec.perils.values()):
+            peril_levels = [1.0]
+            for zone in peril.zones:
+                if zone.loading not in peril_levels:
+                    peril_levels.append(zone.loading)
+                self.zones[p, int(zone.zip_from) : int(zone.zip_to) + 1] = (
+                    peril_levels.index(zone.loading)
+                )
+            if len(peril_levels) > _MAX_ZONES:
+                raise ValueError(f"Too many distinct loadings for {self.perils[p]}")
+            levels.append(peril_levels)
+
+        width = max((len(row) for row in levels), default=1)
+        self.levels = np.ones((len(self.perils), width), dtype=np.float64)
+        for p, row in enumerate(levels):
+            self.levels[p, : len(row)] = row
+
+        self._coverage_perils: dict[str, NDArray[np.bool_]] = {}
+        for p, peril in enumerate(spec.perils.values()):
+            for coverage in peril.coverages:
+                mask = self._coverage_perils.setdefault(
+                    coverage, np.zeros(len(self.perils), dtype=np.bool_)
+                )
+                mask[p] = True
+        self.dwelling_modifiers = {
+            attribute: dict(factors)
+            for attribute, factors in spec.dwelling_modifiers.items()
+        }
+
+    @classmethod
+    def load(cls, path: Path) -> "CatastropheGrid":
+        """Load and compile a grid file."""
+        spec = CatGridFile.model_validate(json.loads(path.read_text()))
+        return cls(spec)
+
+    def peril_mask(self, coverage_types: Iterable[str]) -> NDArray[np.bool_]:
+        """Perils that apply to any of ``coverage_types``."""
+        mask = np.zeros(len(self.perils), dtype=np.bool_)
+        for coverage in coverage_types:
+            covered = self._coverage_perils.get(coverage)
+            if covered is not None:
+                mask |= covered
+        return mask
+
+    def peril_loadings(self, zip_code: str) -> dict[str, float]:
+        """Loading of every peril at a ZIP, whatever the coverage."""
+        column = self.zones[:, zip_index(zip_code)]
+        return {
+            peril: float(self.levels[p, column[p]])
+            for p, peril in enumerate(self.perils)
+        }
+
+    def dwelling_factor(self, dwelling: Mapping[str, Any] | BaseModel | None) -> float:
+        """Product of the modifiers matching the dwelling's attributes."""
+        if dwelling is None:
+            return 1.0
+        factor = 1.0
+        for attribute, factors in self.dwelling_modifiers.items():
+            value = (
+                getattr(dwelling, attribute, None)
+                if isinstance(dwelling, BaseModel)
+                else dwelling.get(attribute)
+            )
+            factor *= factors.get(value, 1.0) if isinstance(value, str) else 1.0
+        return factor
+
+    def loading(
+        self,
+        zip_code: str,
+        coverage_types: Iterable[str],
+        dwelling: Mapping[str, Any] | BaseModel | None = None,
+    ) -> float:
+        """Catastrophe loading of one risk."""
+        column = self.zones[:, zip_index(zip_code)]
+        mask = self.peril_mask(coverage_types)
+        factor = 1.0
+        for p in np.flatnonzero(mask):
+            factor *= float(self.levels[p, column[p]])
+        return factor * self.dwelling_factor(dwelling)
+
+    def loadings(
+        self,
+        zips: NDArray[np.integer[Any]],
+        peril_masks: NDArray[np.bool_],
+        dwelling_factors: NDArray[np.float64] | None = None,
+    ) -> NDArray[np.float64]:
+        """Loadings of many risks.
+
+        Args:
+            zips: Numeric ZIP5 per risk, shape ``(n,)``
+            peril_masks: Applicable perils per risk, shape ``(n, perils)``
+            dwelling_factors: Optional dwelling factor per risk
+
+        Returns:
+            Loading per risk
+        """
+        perils = np.arange(len(self.perils))[:, None]
+        per_peril = self.levels[perils, self.zones[:, zips]].T
+        result = np.prod(np.where(peril_masks, per_peril, 1.0), axis=1)
+        if dwelling_factors is not None:
+            result = result * dwelling_factors
+        return result
+
+
+# Global catastrophe grid instance
+_catastrophe_grid: CatastropheGrid | None = None
+
+
+@beartype
+def get_catastrophe_grid() -> CatastropheGrid:
+    """Get global catastrophe grid, loading it on first use."""
+    global _catastrophe_grid
+    if _catastrophe_grid is None:
+        _catastrophe_grid = _load_configured()
+    return _catastrophe_grid
+
+
+@beartype
+def reload_catastrophe_grid(path: Path | None = None) -> CatastropheGrid:
+    """Swap in a grid from ``path`` or the configured file.
+
+    The current grid stays in place if the new file does not validate.
+    """
+    global _catastrophe_grid
+    grid = CatastropheGrid.load(path) if path is not None else _load_configured()
+    _catastrophe_grid = grid
+    logger.info("Loaded catastrophe grid version %s", grid.version)
+    return grid
+
+
+def _load_configured() -> CatastropheGrid:
+    configured = get_settings().rating_cat_grid_path
+    return CatastropheGrid.load(Path(configured) if configured else DEFAULT_GRID_PATH)
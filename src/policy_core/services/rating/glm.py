@@ -0,0 +1,315 @@
+# PolicyCore - Policy Decision Management System
+# Copyright (C) 2025 Luiz Frias <luizf35@gmail.com>
+# Form F[x] Labs
+#
+# This software is dual-licensed under AGPL-3.0 and Commercial License.
+# For commercial licensing, contact: luizf35@gmail.com
+# See LICENSE file for full terms.
+
+"""Compiled generalized linear models for rating.
+
+A :class:`CompiledGLM` is built once from a coefficient mapping: the
+coefficients become a dense vector over a fixed feature order, and the
+inverse link is a vectorized NumPy function.  Scoring a block of risks is
+then one matrix-vector product::
+
+    model = CompiledGLM.compile("frequency", "2024.1", coefficients, "log")
+    factors = model.score(build_feature_matrix(risks, model.feature_names))
+
+Models are grouped by version into a :class:`GLMModelSet` (frequency,
+severity and optionally pure premium) held in a :class:`GLMModelRegistry`.
+"""
+
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any
+
+import numpy as np
+from beartype import beartype
+from numpy.typing import NDArray
+from pydantic import BaseModel
+
+# Rating features and the value assumed when a risk does not supply one.
+# Mirrors the defaults of ``FeaturesMetrics``; features outside this list
+# default to zero.
+GLM_FEATURE_DEFAULTS: dict[str, float] = {
+    "driver_age": 30.0,
+    "vehicle_age": 5.0,
+    "annual_mileage": 12000.0,
+    "urban_indicator": 0.0,
+    "prior_claims": 0.0,
+    "vehicle_value": 25000.0,
+    "vehicle_safety_score": 0.0,
+}
+
+# Factors are kept within the range the rating engine accepts
+DEFAULT_BOUNDS = (0.1, 10.0)
+
+FloatArray = NDArray[np.float64]
+
+
+def _expit(eta: FloatArray) -> FloatArray:
+    # Split by sign so neither branch overflows
+    out = np.empty_like(eta)
+    positive = eta >= 0
+    out[positive] = 1.0 / (1.0 + np.exp(-eta[positive]))
+    exp_eta = np.exp(eta[~positive])
+    out[~positive] = exp_eta / (1.0 + exp_eta)
+    return out
+
+
+INVERSE_LINKS: dict[str, Callable[[FloatArray], FloatArray]] = {
+    "log": np.exp,
+    "logit": _expit,
+    "identity": lambda eta: eta,
+}
+
+
+def build_feature_matrix(
+    risks: Sequence[Mapping[str, Any] | BaseModel],
+    feature_names: Sequence[str],
+) -> FloatArray:
+    """Lay risks out as rows over ``feature_names``.
+
+    Missing or ``None`` features take their default; unknown attributes of
+    a risk are ignored.
+    """
+    defaults = np.array([GLM_FEATURE_DEFAULTS.get(name, 0.0) for name in feature_names])
+    matrix = np.tile(defaults, (len(risks), 1))
+    for i, risk in enumerate(risks):
+        values = risk.model_dump() if isinstance(risk, BaseModel) else risk
+        for j, name in enumerate(feature_names):
+            value = values.get(name)
+            if value is not None:
+                matrix[i, j] = float(value)
+    return matrix
+
+
+class CompiledGLM:
+    """A GLM with coefficients laid out for vectorized scoring."""
+
+    __slots__ = (
+        "name",
+        "version",
+        "link",
+        "feature_names",
+        "intercept",
+        "coefficients",
+        "bounds",
+        "_inverse_link",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        version: str,
+        link: str,
+        feature_names: tuple[str, ...],
+        intercept: float,
+        coefficients: FloatArray,
+        bounds: tuple[float, float] | None = DEFAULT_BOUNDS,
+    ) -> None:
+        """Use :meth:`compile` unless the arrays are already laid out."""
+        if link not in INVERSE_LINKS:
+            raise ValueError(f"Unsupported link function: {link}")
+        if coefficients.shape != (len(feature_names),):
+            raise ValueError("One coefficient is required per feature")
+        self.name = name
+        self.version = version
+        self.link = link
+        self.feature_names = feature_names
+        self.intercept = intercept
+        self.coefficients = coefficients
+        self.bounds = bounds
+        self._inverse_link = INVERSE_LINKS[link]
+
+    @classmethod
+    def compile(
+        cls,
+        name: str,
+        version: str,
+        coefficients: Mapping[str, Any] | BaseModel,
+        link: str = "log",
+        bounds: tuple[float, float] | None = DEFAULT_BOUNDS,
+        standard_only: bool = False,
+    ) -> "CompiledGLM":
+        """Compile a coefficient mapping with an ``intercept`` entry.
+
+        The feature order is the standard rating features followed by any
+        extra coefficients in name order; ``standard_only`` drops the extras.
+        """
+        values = (
+            coefficients.model_dump()
+            if isinstance(coefficients, BaseModel)
+            else dict(coefficients)
+        )
+        if "intercept" not in values:
+            raise ValueError("Coefficients must include an intercept")
+        intercept = float(values.pop("intercept"))
+        standard = [name for name in GLM_FEATURE_DEFAULTS if name in values]
+        extra = [] if standard_only else sorted(set(values) - set(GLM_FEATURE_DEFAULTS))
+        feature_names = tuple(standard + extra)
+        return cls(
+            name=name,
+            version=version,
+            link=link,
+            feature_names=feature_names,
+            intercept=intercept,
+            coefficients=np.array(
+                [float(values[feature]) for feature in feature_names]
+            ),
+            bounds=bounds,
+        )
+
+    def feature_matrix(
+        self, risks: Sequence[Mapping[str, Any] | BaseModel]
+    ) -> FloatArray:
+        """Lay risks out in this model's feature order."""
+        return build_feature_matrix(risks, self.feature_names)
+
+    def score(self, matrix: FloatArray) -> FloatArray:
+        """Mean response for each row of a feature matrix."""
+        eta = matrix @ self.coefficients + self.intercept
+        mu = self._inverse_link(np.asarray(eta, dtype=np.float64))
+        if self.bounds is not None:
+            mu = np.clip(mu, *self.bounds)
+        return mu
+
+    def score_one(self, risk: Mapping[str, Any] | BaseModel) -> float:
+        """Score a single risk."""
+        return float(self.score(self.feature_matrix([risk]))[0])
+
+
+class GLMModelSet:
+    """The named models of one rating model version."""
+
+    def __init__(
+        self,
+        version: str,
+        frequency: CompiledGLM,
+        severity: CompiledGLM,
+        pure_premium: CompiledGLM | None = None,
+    ) -> None:
+        """Group models that share a version."""
+        self.version = version
+        self.frequency = frequency
+        self.severity = severity
+        self.pure_premium = pure_premium
+        # One matrix serves every model in the set
+        names: dict[str, None] = {}
+        for model in self.models.values():
+            names.update(dict.fromkeys(model.feature_names))
+        self.feature_names = tuple(names)
+        self._columns = {
+            name: np.array(
+                [self.feature_names.index(feature) for feature in model.feature_names],
+                dtype=np.intp,
+            )
+            for name, model in self.models.items()
+        }
+
+    @property
+    def models(self) -> dict[str, CompiledGLM]:
+        """Models in this set by name."""
+        models = {"frequency": self.frequency, "severity": self.severity}
+        if self.pure_premium is not None:
+            models["pure_premium"] = self.pure_premium
+        return models
+
+    def feature_matrix(
+        self, risks: Sequence[Mapping[str, Any] | BaseModel]
+    ) -> FloatArray:
+        """Lay risks out over the union of the set's features."""
+        return build_feature_matrix(risks, self.feature_names)
+
+    def score(self, matrix: FloatArray) -> dict[str, FloatArray]:
+        """Score every model; pure premium defaults to frequency x severity."""
+        scores = {
+            name: model.score(matrix[:, self._columns[name]])
+            for name, model in self.models.items()
+        }
+        if "pure_premium" not in scores:
+            scores["pure_premium"] = scores["frequency"] * scores["severity"]
+        return scores
+
+
+class GLMModelRegistry:
+    """Model sets by version; the most recently registered is current."""
+
+    def __init__(self) -> None:
+        """Start empty."""
+        self._sets: dict[str, GLMModelSet] = {}
+        self._current: str | None = None
+
+    @beartype
+    def register(self, model_set: GLMModelSet, make_current: bool = True) -> None:
+        """Add or replace a version."""
+        self._sets[model_set.version] = model_set
+        if make_current or self._current is None:
+            self._current = model_set.version
+
+    def get(self, version: str | None = None) -> GLMModelSet:
+        """Model set of ``version``, or the current one."""
+        key = version or self._current
+        if key is None or key not in self._sets:
+            raise KeyError(f"No GLM model set for version {key!r}")
+        return self._sets[key]
+
+    @property
+    def versions(self) -> list[str]:
+        """Registered versions."""
+        return list(self._sets)
+
+
+DEFAULT_MODEL_VERSION = "2024.1"
+
+
+def _default_model_set() -> GLMModelSet:
+    # Poisson frequency and severity relativities used by
+    # StatisticalRatingModels.calculate_frequency_severity_model
+    return GLMModelSet(
+        version=DEFAULT_MODEL_VERSION,
+        frequency=CompiledGLM.compile(
+            "frequency",
+            DEFAULT_MODEL_VERSION,
+            {
+                "intercept": -3.0,
+                "driver_age": 0.01,
+                "vehicle_age": 0.02,
+                "annual_mileage": 0.0001,
+                "urban_indicator": 0.5,
+                "prior_claims": 0.3,
+                "vehicle_value": 0.00005,
+                "vehicle_safety_score": -0.1,
+            },
+            link="log",
+        ),
+        severity=CompiledGLM.compile(
+            "severity",
+            DEFAULT_MODEL_VERSION,
+            {
+                "intercept": 10.0,
+                "driver_age": 0.02,
+                "vehicle_age": 0.03,
+                "annual_mileage": 0.0002,
+                "urban_indicator": 0.8,
+                "prior_claims": 0.5,
+                "vehicle_value": 0.0001,
+                "vehicle_safety_score": -0.2,
+            },
+            link="identity",
+        ),
+    )
+
+
+# Global GLM model registry instance
+_glm_registry: GLMModelRegistry | None = None
+
+
+@beartype
+def get_glm_registry() -> GLMModelRegistry:
+    """Get global GLM model registry, seeded with the default models."""
+    global _glm_registry
+    if _glm_registry is None:
+        _glm_registry = GLMModelRegistry()
+        _glm_registry.register(_default_model_set())
+    return _glm_registry
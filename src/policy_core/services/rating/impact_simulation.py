@@ -0,0 +1,782 @@
+# PolicyCore - Policy Decision Management System
+# Copyright (C) 2025 Luiz Frias <luizf35@gmail.com>
+# Form F[x] Labs
+#
+# This software is dual-licensed under AGPL-3.0 and Commercial License.
+# For commercial licensing, contact: luizf35@gmail.com
+# See LICENSE file for full terms.
+
+"""Book-of-business impact simulation for proposed rate versions.
+
+Diffing two rate versions says how the rates moved, not what that does to
+customers.  :class:`RateImpactSimulator` re-rates every in-force policy
+(through the quote it was bound from) and every open quote under both the
+current and the proposed version, and reports premium-change distributions
+overall and by source, state, territory, tier and coverage.
+
+* The book is streamed from a server-side cursor and cut into chunks of
+  ``rating_impact_chunk_rows`` rows.
+* Each chunk is re-rated in a worker process as arrays: a coverage-limit
+  matrix times each version's rate vector, times the product of the stored
+  rating factors clipped to each version's factor bounds.  Discounts keep
+  their stored share of the factored premium and surcharges their stored
+  amount, so only what a rate version controls moves.
+* Workers return per-group histograms of the percentage change.  These
+  merge by addition, so chunks can finish in any order, and percentiles
+  are read off the merged histogram.
+* Results are cached in Redis per (current, proposed) version pair.
+
+A full-book simulation takes minutes, so the API starts it as a background
+job (:meth:`RateImpactSimulator.start_job`) and clients poll its status.
+At most one job runs per version pair; a second request joins the running
+one.  Every job shares one process pool of ``rating_impact_workers``, so
+concurrent jobs for different pairs queue for the same CPUs instead of each
+starting a pool of their own.
+"""
+
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import time
+from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from enum import Enum
+from typing import Any, ClassVar, NamedTuple
+from uuid import UUID, uuid4
+
+import numpy as np
+from beartype import beartype
+from pydantic import Field
+
+from policy_core.core.cache import Cache
+from policy_core.core.config import get_settings
+from policy_core.core.database import Database
+from policy_core.core.result_types import Err, Ok, Result
+from policy_core.models.base import BaseModelConfig
+
+from ...schemas.rating import RateTableData
+from .rate_tables import RateTableVersion, table_scope
+
+logger = logging.getLogger(__name__)
+
+CACHE_PREFIX = "rating:impact:"
+
+# Percentage-change histogram: 0.5 point bins from -50% to +50%, plus one
+# underflow and one overflow bin
+BIN_EDGES = np.linspace(-50.0, 50.0, 201)
+BIN_COUNT = len(BIN_EDGES) + 1
+
+# Coverage aliases used by stored quotes
+COVERAGE_ALIASES = {"liability": "bodily_injury"}
+
+DEFAULT_TERRITORY = "default"
+
+# Row layout produced by the book query
+(
+    _SOURCE,
+    _STATE,
+    _ZIP,
+    _TIER,
+    _COVERAGES,
+    _FACTORS,
+    _BASE,
+    _DISCOUNT,
+    _SURCHARGE,
+) = range(9)
+
+_BOOK_SQL = """
+    SELECT 'policy' AS source, q.state, q.zip_code, q.rating_tier,
+           q.coverage_selections, q.rating_factors, q.base_premium,
+           q.total_discount_amount, q.total_surcharge_amount
+    FROM quotes q
+    JOIN policies p ON p.id = q.converted_to_policy_id
+    WHERE p.status = 'active'
+      AND p.effective_date <= CURRENT_DATE
+      AND (p.expiration_date IS NULL OR p.expiration_date > CURRENT_DATE)
+      AND q.base_premium IS NOT NULL
+      AND ($1::text IS NULL OR q.state = $1)
+      AND ($2::text IS NULL OR q.product_type = $2)
+    UNION ALL
+    SELECT 'quote' AS source, q.state, q.zip_code, q.rating_tier,
+           q.coverage_selections, q.rating_factors, q.base_premium,
+           q.total_discount_amount, q.total_surcharge_amount
+    FROM quotes q
+    WHERE q.status = 'quoted'
+      AND q.converted_to_policy_id IS NULL
+      AND (q.expires_at IS NULL OR q.expires_at > CURRENT_TIMESTAMP)
+      AND q.base_premium IS NOT NULL
+      AND ($1::text IS NULL OR q.state = $1)
+      AND ($2::text IS NULL OR q.product_type = $2)
+"""
+
+
+@beartype
+class PremiumChangeDistribution(BaseModelConfig):
+    """Premium change across one slice of the book."""
+
+    count: int = Field(..., ge=0)
+    increased: int = Field(..., ge=0)
+    decreased: int = Field(..., ge=0)
+    current_premium: float = Field(..., description="Total current premium")
+    proposed_premium: float = Field(..., description="Total proposed premium")
+    premium_change_pct: float = Field(
+        ..., description="Change in total premium, in percent"
+    )
+    min_change_pct: float = Field(...)
+    max_change_pct: float = Field(...)
+    p05_change_pct: float = Field(...)
+    p25_change_pct: float = Field(...)
+    p50_change_pct: float = Field(...)
+    p75_change_pct: float = Field(...)
+    p95_change_pct: float = Field(...)
+    histogram: list[int] = Field(
+        ..., description="Counts per bin of RateImpactSimulation.bin_edges"
+    )
+
+
+@beartype
+class RateImpactSimulation(BaseModelConfig):
+    """Simulated impact of replacing one rate version with another."""
+
+    current_version_id: UUID = Field(...)
+    proposed_version_id: UUID = Field(...)
+    simulated_at: datetime = Field(...)
+    elapsed_seconds: float = Field(..., ge=0)
+    rows_simulated: int = Field(..., ge=0)
+    rows_skipped: int = Field(
+        ..., ge=0, description="Rows with no rated coverage or zero premium"
+    )
+    bin_edges: list[float] = Field(
+        ..., description="Histogram edges; bins below the first and above the last"
+    )
+    overall: PremiumChangeDistribution = Field(...)
+    by_source: dict[str, PremiumChangeDistribution] = Field(default_factory=dict)
+    by_state: dict[str, PremiumChangeDistribution] = Field(default_factory=dict)
+    by_territory: dict[str, PremiumChangeDistribution] = Field(default_factory=dict)
+    by_tier: dict[str, PremiumChangeDistribution] = Field(default_factory=dict)
+    by_coverage: dict[str, PremiumChangeDistribution] = Field(default_factory=dict)
+
+
+class ImpactJobStatus(str, Enum):
+    """Lifecycle of a background impact simulation."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@beartype
+class ImpactSimulationJob(BaseModelConfig):
+    """Handle for a background impact simulation."""
+
+    job_id: UUID = Field(..., description="Job identifier")
+    current_version_id: UUID = Field(...)
+    proposed_version_id: UUID = Field(...)
+    status: ImpactJobStatus = Field(default=ImpactJobStatus.PENDING)
+    requested_by: UUID = Field(..., description="Admin who started the job")
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    completed_at: datetime | None = Field(default=None)
+    result: RateImpactSimulation | None = Field(
+        default=None, description="Simulation, once completed"
+    )
+    error: str | None = Field(default=None, description="Failure reason")
+
+
+class RatingPlan(NamedTuple):
+    """Everything a worker needs to re-rate rows under both versions.
+
+    Row 0 of ``rates``/``lower``/``upper`` is the current version, row 1 the
+    proposed one.  Factors neither version defines keep their stored value.
+    """
+
+    coverages: tuple[str, ...]
+    rates: np.ndarray
+    factor_names: tuple[str, ...]
+    lower: np.ndarray
+    upper: np.ndarray
+    territories: dict[tuple[str, str], str]
+
+
+def build_rating_plan(
+    current: RateTableData,
+    proposed: RateTableData,
+    territories: dict[tuple[str, str], str] | None = None,
+) -> RatingPlan:
+    """Lay both versions out as aligned arrays."""
+    versions = (current, proposed)
+    coverages = tuple(
+        sorted({name for version in versions for name in _version_rates(version)})
+    )
+    factor_names = tuple(
+        sorted({name for version in versions for name in version.factors})
+    )
+
+    rates = np.zeros((2, len(coverages)))
+    lower = np.full((2, len(factor_names)), -np.inf)
+    upper = np.full((2, len(factor_names)), np.inf)
+    for v, version in enumerate(versions):
+        version_rates = _version_rates(version)
+        for c, name in enumerate(coverages):
+            rates[v, c] = float(version_rates.get(name, 0))
+        for k, name in enumerate(factor_names):
+            factor = version.factors.get(name)
+            if factor is not None:
+                lower[v, k] = factor.min_value
+                upper[v, k] = factor.max_value
+
+    return RatingPlan(
+        coverages=coverages,
+        rates=rates,
+        factor_names=factor_names,
+        lower=lower,
+        upper=upper,
+        territories=territories or {},
+    )
+
+
+def _version_rates(version: RateTableData) -> dict[str, Decimal]:
+    # Per-coverage rates live in ``coverages``; ``base_rates`` fills gaps
+    return {**version.base_rates, **version.coverages}
+
+
+class GroupStats:
+    """Mergeable premium-change statistics for one group."""
+
+    __slots__ = (
+        "count",
+        "increased",
+        "decreased",
+        "current",
+        "proposed",
+        "minimum",
+        "maximum",
+        "histogram",
+    )
+
+    def __init__(self) -> None:
+        """Start empty."""
+        self.count = 0
+        self.increased = 0
+        self.decreased = 0
+        self.current = 0.0
+        self.proposed = 0.0
+        self.minimum = float("inf")
+        self.maximum = float("-inf")
+        self.histogram = np.zeros(BIN_COUNT, dtype=np.int64)
+
+    def merge(self, other: "GroupStats") -> None:
+        """Fold another partial into this one."""
+        self.count += other.count
+        self.increased += other.increased
+        self.decreased += other.decreased
+        self.current += other.current
+        self.proposed += other.proposed
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        self.histogram += other.histogram
+
+    def percentile(self, q: float) -> float:
+        """Estimate the ``q``-th percentile by interpolating within a bin."""
+        if self.count == 0:
+            return 0.0
+        rank = q / 100.0 * self.count
+        cumulative = np.cumsum(self.histogram)
+        b = int(np.searchsorted(cumulative, rank, side="left"))
+        b = min(b, BIN_COUNT - 1)
+        # Open-ended bins are bounded by the observed extremes
+        low = BIN_EDGES[b - 1] if b > 0 else self.minimum
+        high = BIN_EDGES[b] if b < len(BIN_EDGES) else self.maximum
+        in_bin = int(self.histogram[b])
+        before = int(cumulative[b]) - in_bin
+        fraction = (rank - before) / in_bin if in_bin else 0.0
+        value = low + (high - low) * fraction
+        return float(min(max(value, self.minimum), self.maximum))
+
+    def to_distribution(self) -> PremiumChangeDistribution:
+        """Summarize as a response model."""
+        empty = self.count == 0
+        change = (
+            (self.proposed - self.current) / self.current * 100.0
+            if self.current
+            else 0.0
+        )
+        return PremiumChangeDistribution(
+            count=self.count,
+            increased=self.increased,
+            decreased=self.decreased,
+            current_premium=round(self.current, 2),
+            proposed_premium=round(self.proposed, 2),
+            premium_change_pct=round(change, 4),
+            min_change_pct=0.0 if empty else round(self.minimum, 4),
+            max_change_pct=0.0 if empty else round(self.maximum, 4),
+            p05_change_pct=round(self.percentile(5), 4),
+            p25_change_pct=round(self.percentile(25), 4),
+            p50_change_pct=round(self.percentile(50), 4),
+            p75_change_pct=round(self.percentile(75), 4),
+            p95_change_pct=round(self.percentile(95), 4),
+            histogram=self.histogram.tolist(),
+        )
+
+
+class ImpactPartial:
+    """Per-dimension group statistics for some subset of the book."""
+
+    DIMENSIONS = ("overall", "source", "state", "territory", "tier", "coverage")
+
+    def __init__(self) -> None:
+        """Start empty."""
+        self.rows = 0
+        self.skipped = 0
+        self.groups: dict[str, dict[str, GroupStats]] = {
+            dimension: {} for dimension in self.DIMENSIONS
+        }
+
+    def merge(self, other: "ImpactPartial") -> None:
+        """Fold another partial into this one."""
+        self.rows += other.rows
+        self.skipped += other.skipped
+        for dimension, groups in other.groups.items():
+            mine = self.groups[dimension]
+            for key, stats in groups.items():
+                if key in mine:
+                    mine[key].merge(stats)
+                else:
+                    mine[key] = stats
+
+    def add(
+        self,
+        dimension: str,
+        keys: Sequence[str],
+        current: np.ndarray,
+        proposed: np.ndarray,
+    ) -> None:
+        """Accumulate rows grouped by ``keys``."""
+        if len(keys) == 0:
+            return
+        change = (proposed - current) / current * 100.0
+        bins = np.searchsorted(BIN_EDGES, change, side="right")
+        labels, inverse = np.unique(np.asarray(keys, dtype=object), return_inverse=True)
+        n_groups = len(labels)
+
+        counts = np.bincount(inverse, minlength=n_groups)
+        increased = np.bincount(inverse, weights=change > 0, minlength=n_groups)
+        decreased = np.bincount(inverse, weights=change < 0, minlength=n_groups)
+        current_sums = np.bincount(inverse, weights=current, minlength=n_groups)
+        proposed_sums = np.bincount(inverse, weights=proposed, minlength=n_groups)
+        minimum = np.full(n_groups, np.inf)
+        maximum = np.full(n_groups, -np.inf)
+        np.minimum.at(minimum, inverse, change)
+        np.maximum.at(maximum, inverse, change)
+        histograms = np.bincount(
+            inverse * BIN_COUNT + bins, minlength=n_groups * BIN_COUNT
+        ).reshape(n_groups, BIN_COUNT)
+
+        groups = self.groups[dimension]
+        for g, label in enumerate(labels):
+            stats = GroupStats()
+            stats.count = int(counts[g])
+            stats.increased = int(increased[g])
+            stats.decreased = int(decreased[g])
+            stats.current = float(current_sums[g])
+            stats.proposed = float(proposed_sums[g])
+            stats.minimum = float(minimum[g])
+            stats.maximum = float(maximum[g])
+            stats.histogram = histograms[g].astype(np.int64)
+            if label in groups:
+                groups[label].merge(stats)
+            else:
+                groups[label] = stats
+
+
+def _init_worker(niceness: int) -> None:
+    # Simulations are batch work; let interactive requests win the CPU
+    if niceness and hasattr(os, "nice"):
+        os.nice(niceness)
+
+
+def _json(value: Any) -> Any:
+    return json.loads(value) if isinstance(value, str | bytes) else value
+
+
+def simulate_chunk(rows: Sequence[Sequence[Any]], plan: RatingPlan) -> ImpactPartial:
+    """Re-rate one chunk of book rows under both versions.
+
+    Runs in a worker process of the shared pool, so the plan travels with
+    each chunk.
+    """
+    n = len(rows)
+    coverage_index = {name: c for c, name in enumerate(plan.coverages)}
+    factor_index = {name: k for k, name in enumerate(plan.factor_names)}
+    limits = np.zeros((n, len(plan.coverages)))
+    factors = np.ones((n, len(plan.factor_names)))
+    fixed_factors = np.ones(n)
+    stored_base = np.zeros(n)
+    discount = np.zeros(n)
+    surcharge = np.zeros(n)
+    sources: list[str] = []
+    states: list[str] = []
+    territories: list[str] = []
+    tiers: list[str] = []
+
+    for i, row in enumerate(rows):
+        for selection in _json(row[_COVERAGES]) or ():
+            coverage = selection.get("coverage_type")
+            c = coverage_index.get(COVERAGE_ALIASES.get(coverage, coverage))
+            if c is not None:
+                limits[i, c] += float(selection.get("limit") or 0)
+
+        for name, value in (_json(row[_FACTORS]) or {}).items():
+            if isinstance(value, bool) or not isinstance(value, int | float):
+                continue
+            k = factor_index.get(name)
+            if k is None:
+                fixed_factors[i] *= value
+            else:
+                factors[i, k] = value
+
+        stored_base[i] = float(row[_BASE] or 0)
+        discount[i] = float(row[_DISCOUNT] or 0)
+        surcharge[i] = float(row[_SURCHARGE] or 0)
+        state = row[_STATE] or "unknown"
+        sources.append(row[_SOURCE])
+        states.append(state)
+        territories.append(
+            f"{state}:"
+            + plan.territories.get((state, row[_ZIP] or ""), DEFAULT_TERRITORY)
+        )
+        tiers.append(row[_TIER] or "unrated")
+
+    # Discounts keep their stored share of the factored premium
+    stored_factored = stored_base * np.prod(factors, axis=1) * fixed_factors
+    discount_share = np.divide(
+        discount,
+        stored_factored,
+        out=np.zeros(n),
+        where=stored_factored > 0,
+    )
+    keep = 1.0 - np.clip(discount_share, 0.0, 1.0)
+
+    # Composite factor per version, each clipped to that version's bounds
+    composite = [
+        np.prod(np.clip(factors, plan.lower[v], plan.upper[v]), axis=1)
+        * fixed_factors
+        * keep
+        for v in (0, 1)
+    ]
+    coverage_premium = [limits * plan.rates[v] / 1000.0 for v in (0, 1)]
+    premium = [
+        coverage_premium[v].sum(axis=1) * composite[v] + surcharge for v in (0, 1)
+    ]
+
+    partial = ImpactPartial()
+    rated = (coverage_premium[0].sum(axis=1) > 0) & (premium[0] > 0)
+    partial.rows = n
+    partial.skipped = int(n - rated.sum())
+    index = np.flatnonzero(rated)
+    current, proposed = premium[0][index], premium[1][index]
+
+    partial.add("overall", ["all"] * len(index), current, proposed)
+    for dimension, keys in (
+        ("source", sources),
+        ("state", states),
+        ("territory", territories),
+        ("tier", tiers),
+    ):
+        partial.add(dimension, [keys[i] for i in index], current, proposed)
+
+    for c, name in enumerate(plan.coverages):
+        current_cov = coverage_premium[0][:, c] * composite[0]
+        proposed_cov = coverage_premium[1][:, c] * composite[1]
+        covered = current_cov > 0
+        count = int(covered.sum())
+        if count:
+            partial.add(
+                "coverage",
+                [name] * count,
+                current_cov[covered],
+                proposed_cov[covered],
+            )
+
+    return partial
+
+
+class RateImpactSimulator:
+    """Re-rate the book under two rate versions and compare."""
+
+    # Job registry is process-local, like the quote export jobs
+    _jobs: ClassVar[dict[UUID, ImpactSimulationJob]] = {}
+    _tasks: ClassVar[dict[UUID, asyncio.Task[None]]] = {}
+    # Running job of each (current, proposed) pair
+    _active: ClassVar[dict[tuple[UUID, UUID], UUID]] = {}
+
+    def __init__(
+        self,
+        db: Database,
+        cache: Cache,
+        executor: Executor | None = None,
+    ) -> None:
+        """Initialize with an optional executor for the rating chunks.
+
+        Without one, chunks run on the shared impact simulation pool.
+        """
+        self._db = db
+        self._cache = cache
+        self._executor = executor
+        self._settings = get_settings()
+
+    @staticmethod
+    def cache_key(current_version_id: UUID, proposed_version_id: UUID) -> str:
+        """Redis key of a simulation result."""
+        return f"{CACHE_PREFIX}{current_version_id}:{proposed_version_id}"
+
+    async def get_cached(
+        self, current_version_id: UUID, proposed_version_id: UUID
+    ) -> RateImpactSimulation | None:
+        """Return a previous simulation of this version pair, if still cached."""
+        cached = await self._cache.get(
+            self.cache_key(current_version_id, proposed_version_id)
+        )
+        if not cached:
+            return None
+        return RateImpactSimulation.model_validate(cached)
+
+    async def simulate(
+        self,
+        current: RateTableVersion,
+        proposed: RateTableVersion,
+        force_refresh: bool = False,
+    ) -> Result[RateImpactSimulation, str]:
+        """Simulate replacing the current version with the proposed one."""
+        if not force_refresh:
+            cached = await self.get_cached(current.id, proposed.id)
+            if cached is not None:
+                return Ok(cached)
+
+        try:
+            started = time.perf_counter()
+            plan = build_rating_plan(
+                current.rate_data,
+                proposed.rate_data,
+                await self._load_territories(),
+            )
+            state, product = table_scope(proposed.table_name)
+            totals = await self._run(plan, state, product)
+            simulation = self._summarize(
+                totals, current.id, proposed.id, time.perf_counter() - started
+            )
+        except Exception as e:
+            return Err(f"Rate impact simulation failed: {str(e)}")
+
+        await self._cache.set(
+            self.cache_key(current.id, proposed.id),
+            simulation.model_dump(mode="json"),
+            self._settings.rating_impact_cache_ttl_seconds,
+        )
+        return Ok(simulation)
+
+    @beartype
+    def start_job(
+        self,
+        current: RateTableVersion,
+        proposed: RateTableVersion,
+        requested_by: UUID,
+        force_refresh: bool = False,
+    ) -> ImpactSimulationJob:
+        """Start a background simulation and return its handle immediately.
+
+        While a simulation of the same pair is running its handle is
+        returned instead, even with ``force_refresh``.
+        """
+        self._purge_expired_jobs()
+        pair = (current.id, proposed.id)
+        running = self._active.get(pair)
+        if running is not None:
+            return self._jobs[running]
+
+        job = ImpactSimulationJob(
+            job_id=uuid4(),
+            current_version_id=current.id,
+            proposed_version_id=proposed.id,
+            requested_by=requested_by,
+        )
+        self._jobs[job.job_id] = job
+        self._active[pair] = job.job_id
+        self._tasks[job.job_id] = asyncio.create_task(
+            self._run_job(job, current, proposed, force_refresh),
+            name=f"rate-impact-{job.job_id}",
+        )
+        return job
+
+    @beartype
+    def get_job(self, job_id: UUID) -> Result[ImpactSimulationJob, str]:
+        """Look up a background simulation job."""
+        job = self._jobs.get(job_id)
+        if job is None:
+            return Err("Impact simulation job not found")
+        return Ok(job)
+
+    async def _run_job(
+        self,
+        job: ImpactSimulationJob,
+        current: RateTableVersion,
+        proposed: RateTableVersion,
+        force_refresh: bool,
+    ) -> None:
+        """Execute a background simulation, updating the registry."""
+        self._jobs[job.job_id] = job.model_copy(
+            update={"status": ImpactJobStatus.RUNNING}
+        )
+        try:
+            result = await self.simulate(current, proposed, force_refresh)
+        except Exception as e:  # noqa: BLE001 - surfaced through the job handle
+            result = Err(f"Rate impact simulation failed: {str(e)}")
+        finally:
+            self._tasks.pop(job.job_id, None)
+            self._active.pop((current.id, proposed.id), None)
+
+        if result.is_err():
+            logger.error("Rate impact job %s failed: %s", job.job_id, result.err_value)
+            update: dict[str, Any] = {
+                "status": ImpactJobStatus.FAILED,
+                "error": result.err_value,
+            }
+        else:
+            update = {"status": ImpactJobStatus.COMPLETED, "result": result.ok_value}
+        update["completed_at"] = datetime.now(timezone.utc)
+        self._jobs[job.job_id] = self._jobs[job.job_id].model_copy(update=update)
+
+    def _purge_expired_jobs(self) -> None:
+        """Drop finished jobs past the result cache lifetime.
+
+        A job whose task is gone has finished, even if it was cancelled
+        before recording a completion time.
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(
+            seconds=self._settings.rating_impact_cache_ttl_seconds
+        )
+        for job_id, job in list(self._jobs.items()):
+            if job_id in self._tasks:
+                continue
+            if (job.completed_at or job.created_at) < cutoff:
+                del self._jobs[job_id]
+
+    async def _load_territories(self) -> dict[tuple[str, str], str]:
+        rows = await self._db.fetch(
+            """
+            SELECT state, territory_id, zip_codes
+            FROM territory_definitions
+            WHERE active = true
+            """
+        )
+        territories: dict[tuple[str, str], str] = {}
+        for row in rows:
+            for zip_code in _json(row["zip_codes"]) or ():
+                territories[(row["state"], str(zip_code))] = row["territory_id"]
+        return territories
+
+    async def _run(
+        self, plan: RatingPlan, state: str | None, product: str | None
+    ) -> ImpactPartial:
+        chunk_rows = self._settings.rating_impact_chunk_rows
+        executor = self._executor or get_impact_executor()
+        workers = getattr(executor, "_max_workers", None) or os.cpu_count() or 1
+
+        loop = asyncio.get_running_loop()
+        totals = ImpactPartial()
+        pending: set[asyncio.Future[ImpactPartial]] = set()
+
+        async def drain(limit: int) -> None:
+            nonlocal pending
+            while len(pending) > limit:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    totals.merge(future.result())
+
+        try:
+            chunk: list[tuple[Any, ...]] = []
+            async for record in self._db.stream(
+                _BOOK_SQL, state, product, prefetch=min(chunk_rows, 5000)
+            ):
+                chunk.append(tuple(record))
+                if len(chunk) >= chunk_rows:
+                    pending.add(
+                        loop.run_in_executor(executor, simulate_chunk, chunk, plan)
+                    )
+                    chunk = []
+                    # Bound memory: keep about two chunks per worker in flight
+                    await drain(2 * workers)
+            if chunk:
+                pending.add(loop.run_in_executor(executor, simulate_chunk, chunk, plan))
+            await drain(0)
+        finally:
+            for future in pending:
+                future.cancel()
+        return totals
+
+    @staticmethod
+    def _summarize(
+        totals: ImpactPartial,
+        current_version_id: UUID,
+        proposed_version_id: UUID,
+        elapsed: float,
+    ) -> RateImpactSimulation:
+        def distributions(dimension: str) -> dict[str, PremiumChangeDistribution]:
+            return {
+                key: stats.to_distribution()
+                for key, stats in sorted(totals.groups[dimension].items())
+            }
+
+        overall = totals.groups["overall"].get("all", GroupStats())
+        return RateImpactSimulation(
+            current_version_id=current_version_id,
+            proposed_version_id=proposed_version_id,
+            simulated_at=datetime.now(timezone.utc),
+            elapsed_seconds=round(elapsed, 3),
+            rows_simulated=totals.rows - totals.skipped,
+            rows_skipped=totals.skipped,
+            bin_edges=BIN_EDGES.tolist(),
+            overall=overall.to_distribution(),
+            by_source=distributions("source"),
+            by_state=distributions("state"),
+            by_territory=distributions("territory"),
+            by_tier=distributions("tier"),
+            by_coverage=distributions("coverage"),
+        )
+
+
+# Shared impact simulation process pool
+_impact_executor: ProcessPoolExecutor | None = None
+
+
+@beartype
+def get_impact_executor() -> ProcessPoolExecutor:
+    """Get the process pool shared by every impact simulation."""
+    global _impact_executor
+    if _impact_executor is None:
+        settings = get_settings()
+        # Leave a core for the event loop by default
+        workers = settings.rating_impact_workers or max((os.cpu_count() or 2) - 1, 1)
+        # Spawned workers do not inherit the event loop or pool sockets
+        _impact_executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(settings.rating_pool_niceness,),
+        )
+    return _impact_executor
+
+
+@beartype
+def shutdown_impact_executor() -> None:
+    """Stop the shared pool's workers, if it was ever started."""
+    global _impact_executor
+    if _impact_executor is not None:
+        _impact_executor.shutdown(wait=False, cancel_futures=True)
+        _impact_executor = None
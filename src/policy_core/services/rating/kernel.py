@@ -0,0 +1,692 @@
+# PolicyCore - Policy Decision Management System
+# Copyright (C) 2025 Luiz Frias <luizf35@gmail.com>
+# Form F[x] Labs
+#
+# This software is dual-licensed under AGPL-3.0 and Commercial License.
+# For commercial licensing, contact: luizf35@gmail.com
+# See LICENSE file for full terms.
+
+"""Pure rating kernel.
+
+:func:`rate_quote` prices a quote from a fully loaded :class:`RatingContext`:
+no awaits, no I/O and no per-call instrumentation.  Everything that needs
+the database or cache (rates, territory, customer history, minimum
+premium) is resolved beforehand by the async shell in
+:class:`~policy_core.services.rating_engine.RatingEngine`, which also owns
+caching, A/B routing and AI scoring.
+
+Because the kernel only depends on its arguments it can run in worker
+processes, back batch re-rating and simulations, and be benchmarked on its
+own.  Given the :class:`RatingStages` of an earlier rating,
+:func:`rate_quote` recomputes only the stages whose inputs changed, and
+:func:`rate_variants` reprices coverage-term variations of a rated quote
+without re-running factors or rules.  Input validation
+happens at the shell boundary, so the functions here are deliberately not
+``@beartype``-wrapped.
+
+Money is fixed-point (see :mod:`.fixed_point`): amounts are integer
+micro-cents, rates and percentages are scaled by 1e6.  Rounding happens at
+these points only, all half away from zero:
+
+1. rates and coverage limits are read to the micro-unit;
+2. each coverage premium is rounded to the micro-cent;
+3. the composite factor is rounded to six decimals;
+4. the factored premium is rounded to the micro-cent;
+5. each discount is rounded to the cent, then scaled to the micro-cent
+   when the combined cap applies;
+6. the shell rounds premiums and totals to the cent for ``RatingResult``.
+"""
+
+import hashlib
+from collections.abc import Iterable, Mapping, Sequence
+from decimal import Decimal
+from typing import NamedTuple
+
+from pydantic import BaseModel
+
+from policy_core.core.result_types import Err, Ok, Result
+
+from ...models.quote import (
+    CoverageSelection,
+    DiscountType,
+    DriverInfo,
+    VehicleInfo,
+)
+from ...schemas.rating import CoverageRates, RatingFactors
+from .business_rules import BusinessRuleViolation, RatingBusinessRules
+from .fixed_point import (
+    MICRO,
+    MICROCENTS_PER_DOLLAR,
+    decimal_to_micro,
+    decimal_to_microcents,
+    div_half_up,
+    exact_decimal,
+    factor_to_micro,
+    round_to_cents,
+    scale_by_micro,
+)
+from .state_rules import CompiledStateRules
+
+_MAX_DISCOUNT_PCT = 50 * MICRO
+
+# Rates are per $1000 of limit
+_RATE_DIVISOR = 1000 * MICRO
+
+# Stateless; shared by every kernel call
+_business_rules = RatingBusinessRules()
+
+# Context fields each stage reads.  Combining the stages into a premium and
+# the business rules read everything and always run.
+STAGE_INPUTS: dict[str, tuple[str, ...]] = {
+    "coverage_premiums": ("state", "coverages", "rates"),
+    "factors": (
+        "vehicle",
+        "drivers",
+        "state_rules",
+        "rating_year",
+        "territory_factor",
+        "credit_factor",
+        "claims_factor",
+    ),
+    "discounts": ("drivers", "customer"),
+    "surcharges": ("drivers", "customer"),
+}
+
+# Part of every stage key; bump when a stage computes differently
+STAGES_VERSION = 1
+
+
+class CustomerFacts(NamedTuple):
+    """Customer history the kernel rates on."""
+
+    active_policies: int = 0
+    tenure_years: int = 0
+    coverage_lapse: bool = False
+
+
+class RatingContext(NamedTuple):
+    """Everything needed to price one quote, already loaded.
+
+    ``rates`` maps coverage to its rate per $1000 of limit scaled by 1e6
+    (see :func:`rate_table`); ``minimum_premium`` is in micro-cents.
+    ``state_rules`` is the state's compiled rule pack.
+    """
+
+    state: str
+    product_type: str
+    vehicle: VehicleInfo | None
+    drivers: tuple[DriverInfo, ...]
+    coverages: tuple[CoverageSelection, ...]
+    rates: Mapping[str, int]
+    state_rules: CompiledStateRules
+    minimum_premium: int
+    rating_year: int
+    territory_factor: float | None = None
+    credit_factor: float | None = None
+    claims_factor: float | None = None
+    customer: CustomerFacts | None = None
+
+
+class KernelDiscount(NamedTuple):
+    """Discount in micro-cents with its percentage scaled by 1e6."""
+
+    discount_type: DiscountType
+    description: str
+    amount: int
+    percentage: int
+
+
+class RuleDiscount(NamedTuple):
+    """Applied discount in exact Decimal dollars and percent, for the rules."""
+
+    discount_type: DiscountType
+    description: str
+    amount: Decimal
+    percentage: Decimal
+
+
+class DiscountRule(NamedTuple):
+    """Discount a quote qualifies for, percentage scaled by 1e6."""
+
+    discount_type: DiscountType
+    description: str
+    percentage: int
+
+
+class KernelSurcharge(NamedTuple):
+    """Flat surcharge in micro-cents."""
+
+    surcharge_type: str
+    description: str
+    amount: int
+
+
+class RatingStages(NamedTuple):
+    """Intermediate results of a rating, keyed by the inputs of each stage.
+
+    ``keys`` maps each stage of :data:`STAGE_INPUTS` to a digest of the
+    context fields it read (see :func:`stage_keys`).
+    """
+
+    keys: dict[str, str]
+    coverage_premiums: dict[str, int]
+    factors: RatingFactors
+    discount_schedule: tuple[DiscountRule, ...]
+    surcharges: tuple[KernelSurcharge, ...]
+
+
+class KernelRating(NamedTuple):
+    """Premium and its breakdown in micro-cents, before caching and metadata."""
+
+    coverage_premiums: dict[str, int]
+    base_premium: int
+    factors: RatingFactors
+    composite_factor: int
+    factored_premium: int
+    discounts: list[KernelDiscount]
+    total_discount: int
+    surcharges: list[KernelSurcharge]
+    total_surcharge: int
+    total_premium: int
+    tier: str
+    violations: list[BusinessRuleViolation]
+    stages: RatingStages | None = None
+
+
+class KernelVariant(NamedTuple):
+    """Premium of a coverage-term variation of a rated quote, in micro-cents."""
+
+    coverage_premiums: dict[str, int]
+    base_premium: int
+    total_discount: int
+    total_premium: int
+
+
+def rate_table(rates: CoverageRates) -> dict[str, int]:
+    """Fixed-point rate per $1000 of limit for each rated coverage."""
+    return {
+        name: decimal_to_micro(rate)
+        for name in CoverageRates.model_fields
+        if (rate := getattr(rates, name)) is not None
+    }
+
+
+def _rate_key(coverage: CoverageSelection) -> str:
+    # Legacy support: treat 'liability' as combined BI/PD -> use BI rate
+    key = coverage.coverage_type.value
+    return "bodily_injury" if key == "liability" else key
+
+
+def _coverage_premium(coverage: CoverageSelection, rate: int) -> int:
+    return div_half_up(decimal_to_microcents(coverage.limit) * rate, _RATE_DIVISOR)
+
+
+def coverage_premiums(
+    rates: Mapping[str, int], coverages: Sequence[CoverageSelection], state: str
+) -> Result[dict[str, int], str]:
+    """Premium per coverage at the rate per $1000 of limit."""
+    premiums: dict[str, int] = {}
+    for coverage in coverages:
+        key = _rate_key(coverage)
+        rate = rates.get(key, 0)
+        if rate <= 0:
+            available = [k for k, v in rates.items() if v > 0]
+            return Err(
+                f"No approved rate found for coverage '{coverage.coverage_type.value}' in {state}. "
+                f"Available coverages: {available}. "
+                f"Admin must approve rates for this coverage type before quotes can proceed."
+            )
+        premiums[key] = _coverage_premium(coverage, rate)
+    return Ok(premiums)
+
+
+def vehicle_factors(vehicle: VehicleInfo, rating_year: int) -> dict[str, float]:
+    """Vehicle age, equipment and usage factors."""
+    vehicle_age = rating_year - vehicle.year
+    if vehicle_age <= 1:
+        age_factor = 1.15  # New car surcharge
+    elif vehicle_age <= 3:
+        age_factor = 1.05
+    elif vehicle_age <= 7:
+        age_factor = 1.00
+    elif vehicle_age <= 12:
+        age_factor = 0.95
+    else:
+        age_factor = 0.90  # Older car discount
+
+    safety = 1.0
+    for feature in vehicle.safety_features:
+        feature = feature.lower()
+        if feature in ("abs", "airbags"):
+            safety *= 0.98
+        elif feature in ("blind_spot", "lane_assist"):
+            safety *= 0.97
+        elif feature in ("automatic_braking", "collision_warning"):
+            safety *= 0.95
+
+    return {
+        "vehicle_age": age_factor,
+        # Safety equipment and anti-theft are rated together as vehicle type
+        "vehicle_type": round(safety, 4) * (0.95 if vehicle.anti_theft else 1.0),
+        "low_mileage": 0.90 if vehicle.annual_mileage < 7500 else 1.0,
+        "high_mileage": 1.15 if vehicle.annual_mileage > 20000 else 1.0,
+    }
+
+
+def driver_factors(drivers: Sequence[DriverInfo]) -> dict[str, float]:
+    """Age and experience of the youngest driver, record of all drivers."""
+    primary = min(drivers, key=lambda d: d.age)
+
+    age = primary.age
+    if age < 25:
+        age_factor = 1.50 if age < 21 else 1.25
+    elif age < 30:
+        age_factor = 1.10
+    elif age < 65:
+        age_factor = 1.00
+    else:
+        age_factor = 1.05  # Senior driver
+
+    years_licensed = primary.years_licensed
+    if years_licensed < 3:
+        experience = 1.20
+    elif years_licensed < 5:
+        experience = 1.10
+    elif years_licensed < 10:
+        experience = 1.05
+    else:
+        experience = 1.00
+
+    total_violations = sum(d.violations_3_years for d in drivers)
+    if total_violations == 0:
+        violations = 0.95  # Clean record discount
+    elif total_violations <= 2:
+        violations = 1.10
+    else:
+        violations = min(1.25 + (total_violations * 0.10), 2.00)
+
+    total_accidents = sum(d.accidents_3_years for d in drivers)
+    if total_accidents == 0:
+        accidents = 1.00
+    elif total_accidents == 1:
+        accidents = 1.25
+    else:
+        accidents = min(1.50 + (total_accidents * 0.25), 3.00)
+
+    # DUIs are surcharged (SR-22), not rated as a factor
+    return {
+        "driver_age": age_factor,
+        "experience": experience,
+        "violations": violations,
+        "accidents": accidents,
+    }
+
+
+def rating_factors(context: RatingContext) -> RatingFactors:
+    """All rating factors of a quote after state rules."""
+    factors: dict[str, float] = {}
+    if context.vehicle is not None:
+        if context.territory_factor is not None:
+            factors["territory"] = context.territory_factor
+        factors.update(vehicle_factors(context.vehicle, context.rating_year))
+    factors.update(driver_factors(context.drivers))
+    if context.credit_factor is not None:
+        factors["credit"] = context.credit_factor
+    if context.claims_factor is not None:
+        factors["claims_history"] = context.claims_factor
+
+    validated = context.state_rules.apply(factors)
+    return RatingFactors(
+        violations=validated.get("violations", 1.0),
+        accidents=validated.get("accidents", 1.0),
+        experience=validated.get("experience", 1.0),
+        driver_age=validated.get("driver_age", 1.0),
+        low_mileage=validated.get("low_mileage", 1.0),
+        high_mileage=validated.get("high_mileage", 1.0),
+        territory=validated.get("territory", 1.0),
+        catastrophe_risk=validated.get("catastrophe_risk", 1.0),
+        vehicle_age=validated.get("vehicle_age", 1.0),
+        vehicle_type=validated.get("vehicle_type", 1.0),
+        credit=validated.get("credit"),
+        occupation=validated.get("occupation"),
+        education=validated.get("education"),
+        marital_status=validated.get("marital_status"),
+        gender=validated.get("gender"),
+    )
+
+
+def discount_schedule(
+    drivers: Sequence[DriverInfo], customer: CustomerFacts | None
+) -> list[DiscountRule]:
+    """Discounts a quote qualifies for, before they are priced."""
+    schedule: list[DiscountRule] = []
+
+    if customer is not None and customer.active_policies > 0:
+        schedule.append(
+            DiscountRule(DiscountType.MULTI_POLICY, "Multi-policy discount", 10 * MICRO)
+        )
+
+    if not any(d.violations_3_years > 0 or d.accidents_3_years > 0 for d in drivers):
+        schedule.append(
+            DiscountRule(DiscountType.SAFE_DRIVER, "Safe driver discount", 15 * MICRO)
+        )
+
+    # Only one good student discount per policy
+    for driver in drivers:
+        if driver.age < 25 and driver.good_student:
+            schedule.append(
+                DiscountRule(
+                    DiscountType.GOOD_STUDENT,
+                    f"Good student discount for {driver.first_name}",
+                    8 * MICRO,
+                )
+            )
+            break
+
+    if any(d.occupation and "military" in d.occupation.lower() for d in drivers):
+        schedule.append(
+            DiscountRule(DiscountType.MILITARY, "Military discount", 5 * MICRO)
+        )
+
+    if customer is not None and customer.tenure_years >= 5:
+        schedule.append(
+            DiscountRule(
+                DiscountType.LOYALTY,
+                f"Loyalty discount ({customer.tenure_years} years)",
+                min(customer.tenure_years * 2, 20) * MICRO,
+            )
+        )
+    return schedule
+
+
+def apply_discounts(
+    schedule: Sequence[DiscountRule], premium: int
+) -> list[KernelDiscount]:
+    """Price a discount schedule, scaled down to a 50% combined cap."""
+    applied = [
+        KernelDiscount(
+            discount_type=rule.discount_type,
+            description=rule.description,
+            amount=round_to_cents(div_half_up(premium * rule.percentage, 100 * MICRO)),
+            percentage=rule.percentage,
+        )
+        for rule in schedule
+    ]
+
+    total_pct = sum(d.percentage for d in applied)
+    if total_pct > _MAX_DISCOUNT_PCT:
+        applied = [
+            d._replace(
+                amount=div_half_up(d.amount * _MAX_DISCOUNT_PCT, total_pct),
+                percentage=div_half_up(d.percentage * _MAX_DISCOUNT_PCT, total_pct),
+            )
+            for d in applied
+        ]
+    return applied
+
+
+def discounts(
+    drivers: Sequence[DriverInfo],
+    customer: CustomerFacts | None,
+    premium: int,
+) -> list[KernelDiscount]:
+    """Applicable discounts, scaled down to a 50% combined cap."""
+    return apply_discounts(discount_schedule(drivers, customer), premium)
+
+
+def surcharges(
+    drivers: Sequence[DriverInfo], customer: CustomerFacts | None
+) -> list[KernelSurcharge]:
+    """Flat surcharges for filings, lapses and high-risk drivers."""
+    applied: list[KernelSurcharge] = []
+
+    if any(d.dui_convictions > 0 for d in drivers):
+        applied.append(
+            KernelSurcharge(
+                surcharge_type="sr22_filing",
+                description="SR-22 filing required",
+                amount=250 * MICROCENTS_PER_DOLLAR,
+            )
+        )
+
+    if customer is not None and customer.coverage_lapse:
+        applied.append(
+            KernelSurcharge(
+                surcharge_type="coverage_lapse",
+                description="Prior coverage lapse",
+                amount=100 * MICROCENTS_PER_DOLLAR,
+            )
+        )
+
+    high_risk = [
+        d for d in drivers if d.violations_3_years > 3 or d.accidents_3_years > 2
+    ]
+    if high_risk:
+        applied.append(
+            KernelSurcharge(
+                surcharge_type="high_risk",
+                description=f"High-risk driver surcharge ({len(high_risk)} drivers)",
+                amount=150 * MICROCENTS_PER_DOLLAR * len(high_risk),
+            )
+        )
+    return applied
+
+
+def determine_tier(factors: RatingFactors) -> str:
+    """Rating tier from the composite factor."""
+    risk_score = factors.calculate_composite_factor()
+    if risk_score < 0.8:
+        return "preferred_plus"
+    elif risk_score < 0.95:
+        return "preferred"
+    elif risk_score < 1.1:
+        return "standard"
+    elif risk_score < 1.3:
+        return "non_standard"
+    return "high_risk"
+
+
+def _canonical(value: object) -> str:
+    if isinstance(value, BaseModel):
+        return value.model_dump_json()
+    if isinstance(value, CompiledStateRules):
+        return value.state + value.pack.model_dump_json()
+    if isinstance(value, Mapping):
+        return repr(sorted(value.items()))
+    if isinstance(value, tuple):
+        return "(" + ",".join(_canonical(item) for item in value) + ")"
+    return repr(value)
+
+
+def stage_keys(context: RatingContext) -> dict[str, str]:
+    """Digest of the context fields each stage reads, per stage."""
+    fields: dict[str, str] = {}
+    keys: dict[str, str] = {}
+    for stage, inputs in STAGE_INPUTS.items():
+        digest = hashlib.blake2b(str(STAGES_VERSION).encode(), digest_size=16)
+        for name in inputs:
+            if name not in fields:
+                fields[name] = _canonical(getattr(context, name))
+            digest.update(b"\x1f" + fields[name].encode())
+        keys[stage] = digest.hexdigest()
+    return keys
+
+
+def rate_stages(
+    context: RatingContext, previous: RatingStages | None = None
+) -> Result[RatingStages, str]:
+    """Intermediate results of a quote, reusing unchanged ones of ``previous``.
+
+    A stage of ``previous`` is reused when its key matches, i.e. none of the
+    context fields it reads changed.  Every stage is a function of those
+    fields alone, so the result equals computing all stages afresh.
+    """
+    keys = stage_keys(context)
+
+    def unchanged(stage: str) -> bool:
+        return previous is not None and previous.keys.get(stage) == keys[stage]
+
+    if previous is not None and unchanged("coverage_premiums"):
+        premiums = previous.coverage_premiums
+    else:
+        computed = coverage_premiums(context.rates, context.coverages, context.state)
+        if isinstance(computed, Err):
+            return computed
+        premiums = computed.value
+
+    return Ok(
+        RatingStages(
+            keys=keys,
+            coverage_premiums=premiums,
+            factors=(
+                previous.factors
+                if previous is not None and unchanged("factors")
+                else rating_factors(context)
+            ),
+            discount_schedule=(
+                previous.discount_schedule
+                if previous is not None and unchanged("discounts")
+                else tuple(discount_schedule(context.drivers, context.customer))
+            ),
+            surcharges=(
+                previous.surcharges
+                if previous is not None and unchanged("surcharges")
+                else tuple(surcharges(context.drivers, context.customer))
+            ),
+        )
+    )
+
+
+def combine_stages(
+    context: RatingContext, stages: RatingStages
+) -> Result[KernelRating, str]:
+    """Premium of a quote from its stages, checked against the business rules."""
+    base_premium = sum(stages.coverage_premiums.values())
+
+    factors = stages.factors
+    composite = factor_to_micro(factors.calculate_composite_factor())
+    factored = scale_by_micro(base_premium, composite)
+
+    applied_discounts = apply_discounts(stages.discount_schedule, factored)
+    total_discount = sum(d.amount for d in applied_discounts)
+
+    applied_surcharges = list(stages.surcharges)
+    total_surcharge = sum(s.amount for s in applied_surcharges)
+
+    total_premium = max(
+        factored - total_discount + total_surcharge, context.minimum_premium
+    )
+
+    # The business rules work in Decimal dollars; convert without rounding
+    validation = _business_rules.validate_premium_calculation(
+        state=context.state,
+        product_type=context.product_type,
+        vehicle_info=context.vehicle,
+        drivers=list(context.drivers),
+        coverage_selections=list(context.coverages),
+        factors=factors,
+        base_premium=exact_decimal(base_premium),
+        total_premium=exact_decimal(total_premium),
+        discounts=[
+            RuleDiscount(
+                discount_type=d.discount_type,
+                description=d.description,
+                amount=exact_decimal(d.amount),
+                percentage=exact_decimal(d.percentage * 100),
+            )
+            for d in applied_discounts
+        ],
+        surcharges=[
+            {"type": s.surcharge_type, "amount": exact_decimal(s.amount)}
+            for s in applied_surcharges
+        ],
+    )
+    if isinstance(validation, Err):
+        return validation
+    critical = _business_rules.get_critical_violations(validation.value)
+    if critical:
+        return Err(
+            "Critical business rule violations prevent rating: "
+            + "; ".join(v.message for v in critical)
+        )
+
+    return Ok(
+        KernelRating(
+            coverage_premiums=dict(stages.coverage_premiums),
+            base_premium=base_premium,
+            factors=factors,
+            composite_factor=composite,
+            factored_premium=factored,
+            discounts=applied_discounts,
+            total_discount=total_discount,
+            surcharges=applied_surcharges,
+            total_surcharge=total_surcharge,
+            total_premium=total_premium,
+            tier=determine_tier(factors),
+            violations=validation.value,
+            stages=stages,
+        )
+    )
+
+
+def rate_quote(
+    context: RatingContext, previous: RatingStages | None = None
+) -> Result[KernelRating, str]:
+    """Price a quote from its loaded context.
+
+    With ``previous``, the stages of an earlier rating of the same quote,
+    only the stages whose inputs changed are recomputed.
+    """
+    stages = rate_stages(context, previous)
+    if isinstance(stages, Err):
+        return stages
+    return combine_stages(context, stages.value)
+
+
+def rate_variants(
+    context: RatingContext,
+    anchor: KernelRating,
+    variants: Iterable[Sequence[CoverageSelection]],
+) -> Result[list[KernelVariant], str]:
+    """Reprice ``anchor`` with some of its coverages replaced, per variant.
+
+    Each variant lists replacement coverages matched to the anchor's by
+    coverage type.  Only those coverage premiums are recomputed; the
+    factors, discount schedule and surcharges of ``anchor`` are reused, so
+    each variant costs a few integer operations and matches a full
+    :func:`rate_quote` of the changed coverages.  Variants are not run
+    through the business rules: none of the error-level rules depend on
+    coverage limits or deductibles, and the caller checks state minimums.
+    """
+    schedule = (
+        anchor.stages.discount_schedule
+        if anchor.stages is not None
+        else discount_schedule(context.drivers, context.customer)
+    )
+    priced: list[KernelVariant] = []
+    for changes in variants:
+        premiums = dict(anchor.coverage_premiums)
+        for coverage in changes:
+            key = _rate_key(coverage)
+            if key not in premiums:
+                return Err(
+                    f"Coverage '{coverage.coverage_type.value}' is not on the rated quote"
+                )
+            premiums[key] = _coverage_premium(coverage, context.rates[key])
+        base_premium = sum(premiums.values())
+
+        factored = scale_by_micro(base_premium, anchor.composite_factor)
+        total_discount = sum(d.amount for d in apply_discounts(schedule, factored))
+        total_premium = max(
+            factored - total_discount + anchor.total_surcharge,
+            context.minimum_premium,
+        )
+        priced.append(
+            KernelVariant(
+                coverage_premiums=premiums,
+                base_premium=base_premium,
+                total_discount=total_discount,
+                total_premium=total_premium,
+            )
+        )
+    return Ok(priced)
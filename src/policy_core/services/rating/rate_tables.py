@@ -24,10 +24,33 @@ from pydantic import Field
 from policy_core.core.cache import Cache
 from policy_core.core.database import Database
 from policy_core.core.result_types import Err, Ok, Result
+from policy_core.core.types import CacheLike
 from policy_core.models.base import BaseModelConfig
 
 from ...schemas.rating import RateTableData
 
+# Token replaced whenever rate or territory data the rating engine loads
+# changes; a persisted rating breakdown is only reused under the token it
+# was rated with
+RATING_GENERATION_KEY = "rating:generation"
+RATING_GENERATION_TTL = 30 * 86400
+
+
+@beartype
+async def bump_rating_generation(cache: CacheLike) -> None:
+    """Retire every persisted rating breakdown."""
+    await cache.set(RATING_GENERATION_KEY, uuid4().hex, RATING_GENERATION_TTL)
+
+
+@beartype
+def table_scope(table_name: str) -> tuple[str | None, str | None]:
+    """State and product of a "<STATE>_<product>_<table>" rate table name."""
+    parts = table_name.split("_")
+    if len(parts) >= 3 and len(parts[0]) == 2 and parts[0].isupper():
+        return parts[0], parts[1]
+    return None, None
+
+
 # Auto-generated models
 
 
@@ -531,6 +554,7 @@ class RateTableService:
         await self._cache.delete(f"{self._cache_prefix}active:*")
         await self._cache.delete(f"{self._cache_prefix}version:*")
         await self._cache.delete("rating:base_rates:*")
+        await bump_rating_generation(self._cache)
 
     @beartype
     def _row_to_rate_version(self, row: Any) -> RateTableVersion:
@@ -615,4 +639,6 @@ class RateTableService:
             "max_decrease": min(changes) if changes else 0,
             "coverages_affected": len(modified),
         }
+
+
 # SYSTEM_BOUNDARY: Rate table management requires flexible dict structures for dynamic pricing data and lookup optimization
@@ -462,7 +462,7 @@ class RatingEngine:
                     ai_risk_score = ai_result.unwrap()
 
             # Business rule validation
-            violations_result = await self._business_rules.validate_premium_calculation(
+            violations_result = self._business_rules.validate_premium_calculation(
                 state=state,
                 product_type="auto",
                 vehicle_info=vehicle_info,
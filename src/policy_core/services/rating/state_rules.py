@@ -8,30 +8,39 @@
 
 """State-specific rating rules and regulations.
 
-This module implements state-specific insurance rating rules including
-California Proposition 103 compliance and other state regulations.
+Each state is a declarative rule pack in a versioned JSON file
+(``data/state_rules.json`` unless ``rating_state_rules_path`` points
+elsewhere): required coverages, minimum limits, prohibited factors, factor
+caps, factors derived from other factors (Florida's coastal catastrophe
+loading) and primary-factor weighting (California Proposition 103).
+
+Packs are compiled once into :class:`CompiledStateRules`, whose ``apply``
+runs a fixed chain of closures built for that state only, so the per-quote
+cost does not depend on how many states or rules exist.  Supporting a new
+state means adding its pack to the data file.
 """
 
+import json
+import logging
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Mapping
 from decimal import Decimal
+from pathlib import Path
 from typing import Any
 
 from beartype import beartype
-from pydantic import Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
-from policy_core.models.base import BaseModelConfig
+from policy_core.core.config import get_settings
 
 from ...core.result_types import Err, Ok, Result
 from ..performance_monitor import performance_monitor
 
-# Auto-generated models
+logger = logging.getLogger(__name__)
 
+DEFAULT_RULES_PATH = Path(__file__).parent / "data" / "state_rules.json"
 
-@beartype
-class FactorsMetrics(BaseModelConfig):
-    """Structured model replacing dict[str, float] usage."""
-
-    average: float = Field(default=0.0, ge=0.0, description="Average value")
+FactorRule = Callable[[dict[str, float]], None]
 
 
 @beartype
@@ -40,7 +49,7 @@ class StateRatingRules(ABC):
 
     @abstractmethod
     @beartype
-    def validate_factors(self, factors: FactorsMetrics) -> FactorsMetrics:
+    def validate_factors(self, factors: Mapping[str, float]) -> dict[str, float]:
         """Validate and adjust factors per state regulations."""
         pass
 
@@ -69,380 +78,261 @@ class StateRatingRules(ABC):
         pass
 
 
-@beartype
-class CaliforniaRules(StateRatingRules):
-    """California Proposition 103 compliant rating rules."""
+class FactorCap(BaseModel):
+    """Bounds a factor is clamped to."""
 
-    @beartype
-    def get_state_code(self) -> str:
-        """Return state code."""
-        return "CA"
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
-    @beartype
-    @performance_monitor("california_validate_factors")
-    def validate_factors(self, factors: FactorsMetrics) -> FactorsMetrics:
-        """Apply California-specific factor limits per Prop 103."""
-        # Prop 103: Driving record, miles driven, years of experience
-        # are primary factors (must account for 80%+ of rating variation)
-
-        adjusted = factors.copy()
-
-        # Remove prohibited factors
-        prohibited = ["credit", "occupation", "education", "gender", "marital_status"]
-        for factor in prohibited:
-            adjusted.pop(factor, None)
-
-        # Identify primary and secondary factors
-        primary_factors = [
-            "violations",
-            "accidents",
-            "experience",
-            "low_mileage",
-            "high_mileage",
-            "driver_age",  # Age is allowed as it relates to experience
-        ]
-
-        # Calculate weights
-        primary_weight = 1.0
-        secondary_weight = 1.0
-
-        for factor_name, factor_value in adjusted.items():
-            if factor_name in primary_factors:
-                primary_weight *= factor_value
-            else:
-                secondary_weight *= factor_value
-
-        # Ensure primary factors dominate (80% rule)
-        # If secondary factors have too much impact, scale them down
-        total_deviation = abs(1.0 - primary_weight) + abs(1.0 - secondary_weight)
-        primary_deviation = abs(1.0 - primary_weight)
-
-        if total_deviation > 0 and primary_deviation / total_deviation < 0.8:
-            # Scale down secondary factors
-            scale_factor = 0.2  # Secondary factors can only account for 20%
-            for key in list(adjusted.keys()):
-                if key not in primary_factors:
-                    # Move factor closer to 1.0
-                    adjusted[key] = 1.0 + (adjusted[key] - 1.0) * scale_factor
+    min: float = Field(..., gt=0.0)
+    max: float = Field(..., gt=0.0)
 
-        return adjusted
+    @model_validator(mode="after")
+    def _ordered(self) -> "FactorCap":
+        if self.max < self.min:
+            raise ValueError(f"max {self.max} is below min {self.min}")
+        return self
 
-    @beartype
-    def get_required_coverages(self) -> list[str]:
-        """California required coverages."""
-        return [
-            "bodily_injury",  # 15/30
-            "property_damage",  # 5
-            "uninsured_motorist",  # 15/30 (UM BI is required)
-        ]
 
-    @beartype
-    def get_minimum_limits(self) -> dict[str, Decimal]:
-        """California minimum liability limits."""
-        return {
-            "bodily_injury_per_person": Decimal("15000"),
-            "bodily_injury_per_accident": Decimal("30000"),
-            "property_damage": Decimal("5000"),
-            "uninsured_motorist_per_person": Decimal("15000"),
-            "uninsured_motorist_per_accident": Decimal("30000"),
-        }
+class DerivedFactor(BaseModel):
+    """Set ``target`` to ``value`` when ``source`` exceeds ``above``.
 
-    @beartype
-    def is_factor_allowed(self, factor_name: str) -> bool:
-        """Check if factor is allowed under Prop 103."""
-        prohibited_factors = {
-            "credit",
-            "credit_score",
-            "occupation",
-            "education",
-            "education_level",
-            "gender",
-            "marital_status",
-            "zip_code",  # Can only use for determining territory, not as standalone
-        }
-        return factor_name.lower() not in prohibited_factors
+    For one source and target the highest matching threshold wins.
+    """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
-@beartype
-class TexasRules(StateRatingRules):
-    """Texas rating rules - more permissive than California."""
+    source: str = Field(..., min_length=1)
+    above: float
+    target: str = Field(..., min_length=1)
+    value: float = Field(..., gt=0.0)
 
-    @beartype
-    def get_state_code(self) -> str:
-        """Return state code."""
-        return "TX"
 
-    @beartype
-    def validate_factors(self, factors: FactorsMetrics) -> FactorsMetrics:
-        """Texas allows most rating factors with few restrictions."""
-        # Texas has fewer restrictions than California
-        # Credit scoring is allowed, occupation is allowed, etc.
-        return factors
+class PrimaryWeighting(BaseModel):
+    """Keep the combined secondary factors within a band around 1.0.
 
-    @beartype
-    def get_required_coverages(self) -> list[str]:
-        """Texas required coverages."""
-        return [
-            "bodily_injury",  # 30/60
-            "property_damage",  # 25
-        ]
+    When the product of all non-primary factors falls outside
+    ``[secondary_min, secondary_max]`` their deviations from 1.0 are scaled
+    down proportionally until it sits on the band edge.
+    """
 
-    @beartype
-    def get_minimum_limits(self) -> dict[str, Decimal]:
-        """Texas minimum liability limits."""
-        return {
-            "bodily_injury_per_person": Decimal("30000"),
-            "bodily_injury_per_accident": Decimal("60000"),
-            "property_damage": Decimal("25000"),
-        }
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
-    @beartype
-    def is_factor_allowed(self, factor_name: str) -> bool:
-        """Texas allows most factors."""
-        # Very few prohibited factors in Texas
-        prohibited_factors = {
-            "race",
-            "religion",
-            "national_origin",
-        }
-        return factor_name.lower() not in prohibited_factors
+    primary_factors: list[str] = Field(..., min_length=1)
+    secondary_min: float = Field(..., gt=0.0, le=1.0)
+    secondary_max: float = Field(..., ge=1.0)
 
 
-@beartype
-class NewYorkRules(StateRatingRules):
-    """New York rating rules."""
+class StateRulePack(BaseModel):
+    """Declarative rating rules of one state."""
 
-    @beartype
-    def get_state_code(self) -> str:
-        """Return state code."""
-        return "NY"
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
-    @beartype
-    def validate_factors(self, factors: FactorsMetrics) -> FactorsMetrics:
-        """Apply New York-specific factor limits."""
-        adjusted = factors.copy()
-
-        # New York has restrictions on credit scoring
-        # Must be actuarially justified
-        if "credit" in adjusted:
-            # Cap credit factor impact
-            credit_factor = adjusted["credit"]
-            if credit_factor > 1.25:
-                adjusted["credit"] = 1.25
-            elif credit_factor < 0.80:
-                adjusted["credit"] = 0.80
+    required_coverages: list[str] = Field(default_factory=list)
+    minimum_limits: dict[str, Decimal] = Field(default_factory=dict)
+    prohibited_factors: list[str] = Field(default_factory=list)
+    factor_caps: dict[str, FactorCap] = Field(default_factory=dict)
+    derived_factors: list[DerivedFactor] = Field(default_factory=list)
+    primary_weighting: PrimaryWeighting | None = None
 
-        return adjusted
 
-    @beartype
-    def get_required_coverages(self) -> list[str]:
-        """New York required coverages."""
-        return [
-            "bodily_injury",  # 25/50
-            "property_damage",  # 10
-            "personal_injury_protection",  # No-fault state
-            "uninsured_motorist",  # 25/50
-        ]
+class StateRulesFile(BaseModel):
+    """Schema of a state rules data file."""
 
-    @beartype
-    def get_minimum_limits(self) -> dict[str, Decimal]:
-        """New York minimum liability limits."""
-        return {
-            "bodily_injury_per_person": Decimal("25000"),
-            "bodily_injury_per_accident": Decimal("50000"),
-            "property_damage": Decimal("10000"),
-            "personal_injury_protection": Decimal("50000"),
-            "uninsured_motorist_per_person": Decimal("25000"),
-            "uninsured_motorist_per_accident": Decimal("50000"),
-        }
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
-    @beartype
-    def is_factor_allowed(self, factor_name: str) -> bool:
-        """Check if factor is allowed in New York."""
-        prohibited_factors = {
-            "race",
-            "religion",
-            "national_origin",
-            "sexual_orientation",
-        }
-        return factor_name.lower() not in prohibited_factors
+    version: str = Field(..., min_length=1)
+    states: dict[str, StateRulePack]
 
+    @field_validator("states")
+    @classmethod
+    def _state_codes(cls, states: dict[str, StateRulePack]) -> dict[str, StateRulePack]:
+        for code in states:
+            if len(code) != 2 or not code.isalpha() or not code.isupper():
+                raise ValueError(f"Invalid state code: {code!r}")
+        return states
 
-@beartype
-class FloridaRules(StateRatingRules):
-    """Florida rating rules with hurricane/catastrophe considerations."""
 
-    @beartype
-    def get_state_code(self) -> str:
-        """Return state code."""
-        return "FL"
+def _derive(source: str, target: str, steps: list[tuple[float, float]]) -> FactorRule:
+    steps = sorted(steps, reverse=True)
 
-    @beartype
-    @performance_monitor("florida_validate_factors")
-    def validate_factors(self, factors: FactorsMetrics) -> FactorsMetrics:
-        """Apply Florida-specific factor limits."""
-        adjusted = factors.copy()
-
-        # Florida allows credit but has specific requirements
-        # Cap extreme credit factors
-        if "credit" in adjusted:
-            credit_factor = adjusted["credit"]
-            if credit_factor > 1.40:
-                adjusted["credit"] = 1.40
-            elif credit_factor < 0.60:
-                adjusted["credit"] = 0.60
-
-        # Hurricane zone considerations
-        if "territory" in adjusted:
-            territory_factor = adjusted["territory"]
-            # Coastal areas have higher wind/flood risk
-            if territory_factor > 1.50:  # High-risk coastal zones
-                # Apply additional catastrophe factor
-                adjusted["catastrophe_risk"] = 1.10
-            elif territory_factor > 1.25:  # Moderate coastal risk
-                adjusted["catastrophe_risk"] = 1.05
+    def rule(factors: dict[str, float]) -> None:
+        value = factors.get(source)
+        if value is None:
+            return
+        for above, derived in steps:
+            if value > above:
+                factors[target] = derived
+                return
 
-        return adjusted
+    return rule
 
-    @beartype
-    def get_required_coverages(self) -> list[str]:
-        """Florida required coverages."""
-        return [
-            "property_damage",  # 10k minimum
-            "personal_injury_protection",  # No-fault state, 10k PIP
-        ]
 
-    @beartype
-    def get_minimum_limits(self) -> dict[str, Decimal]:
-        """Florida minimum liability limits."""
-        return {
-            "property_damage": Decimal("10000"),
-            "personal_injury_protection": Decimal("10000"),
-            # Note: BI is not required unless DUI conviction or other violations
-        }
+def _drop(prohibited: frozenset[str]) -> FactorRule:
+    def rule(factors: dict[str, float]) -> None:
+        for name in prohibited.intersection(factors):
+            del factors[name]
 
-    @beartype
-    def is_factor_allowed(self, factor_name: str) -> bool:
-        """Check if factor is allowed in Florida."""
-        prohibited_factors = {
-            "race",
-            "religion",
-            "national_origin",
-        }
-        return factor_name.lower() not in prohibited_factors
+    return rule
 
 
-@beartype
-class MichiganRules(StateRatingRules):
-    """Michigan rating rules with no-fault PIP requirements."""
+def _clamp(caps: dict[str, tuple[float, float]]) -> FactorRule:
+    def rule(factors: dict[str, float]) -> None:
+        for name, (low, high) in caps.items():
+            value = factors.get(name)
+            if value is not None:
+                factors[name] = min(max(value, low), high)
 
-    @beartype
-    def get_state_code(self) -> str:
-        """Return state code."""
-        return "MI"
+    return rule
 
-    @beartype
-    def validate_factors(self, factors: FactorsMetrics) -> FactorsMetrics:
-        """Apply Michigan-specific factor limits."""
-        adjusted = factors.copy()
 
-        # Michigan restricts credit scoring
-        adjusted.pop("credit", None)  # Credit scoring prohibited
+def _weight_primary(weighting: PrimaryWeighting) -> FactorRule:
+    primary = frozenset(weighting.primary_factors)
+    low, high = weighting.secondary_min, weighting.secondary_max
 
-        # Michigan has strict gender equality requirements
-        adjusted.pop("gender", None)
+    def rule(factors: dict[str, float]) -> None:
+        secondary = 1.0
+        for name, value in factors.items():
+            if name not in primary:
+                secondary *= value
+        if secondary < low:
+            scale = (1.0 - low) / (1.0 - secondary)
+        elif secondary > high:
+            scale = (high - 1.0) / (secondary - 1.0)
+        else:
+            return
+        for name in factors:
+            if name not in primary:
+                factors[name] = 1.0 + (factors[name] - 1.0) * scale
 
+    return rule
+
+
+class CompiledStateRules(StateRatingRules):
+    """A state rule pack compiled into a single-pass factor adjustment."""
+
+    def __init__(self, state: str, pack: StateRulePack) -> None:
+        """Compile ``pack`` for ``state``."""
+        self.state = state
+        self.pack = pack
+        self.required_coverages = tuple(pack.required_coverages)
+        self.minimum_limits = dict(pack.minimum_limits)
+        self.prohibited = frozenset(name.lower() for name in pack.prohibited_factors)
+
+        # Derived factors read raw values, so they run before anything else
+        rules: list[FactorRule] = []
+        derived: dict[tuple[str, str], list[tuple[float, float]]] = {}
+        for spec in pack.derived_factors:
+            derived.setdefault((spec.source, spec.target), []).append(
+                (spec.above, spec.value)
+            )
+        rules.extend(_derive(src, tgt, steps) for (src, tgt), steps in derived.items())
+        if self.prohibited:
+            rules.append(_drop(self.prohibited))
+        if pack.factor_caps:
+            rules.append(
+                _clamp({n: (c.min, c.max) for n, c in pack.factor_caps.items()})
+            )
+        if pack.primary_weighting is not None:
+            rules.append(_weight_primary(pack.primary_weighting))
+        self._rules = tuple(rules)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Closures do not pickle; recompile from the pack instead
+        return (CompiledStateRules, (self.state, self.pack))
+
+    def apply(self, factors: Mapping[str, float]) -> dict[str, float]:
+        """Factors after this state's rules, in one pass."""
+        adjusted = dict(factors)
+        for rule in self._rules:
+            rule(adjusted)
         return adjusted
 
+    @beartype
+    def validate_factors(self, factors: Mapping[str, float]) -> dict[str, float]:
+        """Validate and adjust factors per state regulations."""
+        return self.apply(factors)
+
     @beartype
     def get_required_coverages(self) -> list[str]:
-        """Michigan required coverages."""
-        return [
-            "bodily_injury",  # 20/40 minimum
-            "property_damage",  # 10k minimum
-            "personal_injury_protection",  # Unlimited PIP required
-            "property_protection",  # $1M mini-tort coverage
-        ]
+        """Get state-mandated coverages."""
+        return list(self.required_coverages)
 
     @beartype
     def get_minimum_limits(self) -> dict[str, Decimal]:
-        """Michigan minimum liability limits."""
-        return {
-            "bodily_injury_per_person": Decimal("20000"),
-            "bodily_injury_per_accident": Decimal("40000"),
-            "property_damage": Decimal("10000"),
-            "personal_injury_protection": Decimal("0"),  # Unlimited required
-            "property_protection": Decimal("1000000"),  # $1M mini-tort
-        }
+        """Get state minimum coverage limits."""
+        return dict(self.minimum_limits)
 
     @beartype
     def is_factor_allowed(self, factor_name: str) -> bool:
-        """Check if factor is allowed in Michigan."""
-        prohibited_factors = {
-            "race",
-            "religion",
-            "national_origin",
-            "credit",
-            "credit_score",
-            "gender",
-            "marital_status",
+        """Check if a rating factor is allowed in this state."""
+        return factor_name.lower() not in self.prohibited
+
+    @beartype
+    def get_state_code(self) -> str:
+        """Get the state code."""
+        return self.state
+
+
+class StateRuleBook:
+    """Compiled rule packs of every supported state."""
+
+    def __init__(self, spec: StateRulesFile) -> None:
+        """Compile a validated rules file."""
+        self.version = spec.version
+        self._rules = {
+            state: CompiledStateRules(state, pack)
+            for state, pack in spec.states.items()
         }
-        return factor_name.lower() not in prohibited_factors
 
+    @classmethod
+    def load(cls, path: Path) -> "StateRuleBook":
+        """Load and compile a rules file."""
+        spec = StateRulesFile.model_validate(json.loads(path.read_text()))
+        return cls(spec)
 
-@beartype
-class PennsylvaniaRules(StateRatingRules):
-    """Pennsylvania rating rules with choice no-fault options."""
+    @property
+    def states(self) -> tuple[str, ...]:
+        """Supported state codes."""
+        return tuple(self._rules)
 
-    @beartype
-    def get_state_code(self) -> str:
-        """Return state code."""
-        return "PA"
+    def rules(self, state: str) -> CompiledStateRules:
+        """Compiled rules of ``state``; ``KeyError`` if unsupported."""
+        return self._rules[state]
 
-    @beartype
-    @performance_monitor("pennsylvania_validate_factors")
-    def validate_factors(self, factors: FactorsMetrics) -> FactorsMetrics:
-        """Apply Pennsylvania-specific factor limits."""
-        adjusted = factors.copy()
-
-        # Pennsylvania allows most factors but has caps
-        if "credit" in adjusted:
-            credit_factor = adjusted["credit"]
-            # Credit factor cannot exceed 1.35 or be below 0.75
-            if credit_factor > 1.35:
-                adjusted["credit"] = 1.35
-            elif credit_factor < 0.75:
-                adjusted["credit"] = 0.75
+    def compiled(self) -> dict[str, CompiledStateRules]:
+        """Compiled rules keyed by state."""
+        return dict(self._rules)
 
-        return adjusted
 
-    @beartype
-    def get_required_coverages(self) -> list[str]:
-        """Pennsylvania required coverages."""
-        return [
-            "bodily_injury",  # 15/30 minimum
-            "property_damage",  # 5k minimum
-            # Note: PIP is optional but must be offered
-        ]
+# Global state rule book instance
+_state_rule_book: StateRuleBook | None = None
 
-    @beartype
-    def get_minimum_limits(self) -> dict[str, Decimal]:
-        """Pennsylvania minimum liability limits."""
-        return {
-            "bodily_injury_per_person": Decimal("15000"),
-            "bodily_injury_per_accident": Decimal("30000"),
-            "property_damage": Decimal("5000"),
-        }
 
-    @beartype
-    def is_factor_allowed(self, factor_name: str) -> bool:
-        """Check if factor is allowed in Pennsylvania."""
-        prohibited_factors = {
-            "race",
-            "religion",
-            "national_origin",
-        }
-        return factor_name.lower() not in prohibited_factors
+@beartype
+def get_state_rule_book() -> StateRuleBook:
+    """Get global state rule book, loading it on first use."""
+    global _state_rule_book
+    if _state_rule_book is None:
+        _state_rule_book = _load_configured()
+    return _state_rule_book
+
+
+@beartype
+def reload_state_rule_book(path: Path | None = None) -> StateRuleBook:
+    """Swap in rules from ``path`` or the configured file.
+
+    The current rules stay in place if the new file does not validate.
+    """
+    global _state_rule_book
+    book = StateRuleBook.load(path) if path is not None else _load_configured()
+    _state_rule_book = book
+    logger.info("Loaded state rules version %s", book.version)
+    return book
+
+
+def _load_configured() -> StateRuleBook:
+    configured = get_settings().rating_state_rules_path
+    return StateRuleBook.load(Path(configured) if configured else DEFAULT_RULES_PATH)
 
 
 # Factory function
@@ -450,38 +340,36 @@ class PennsylvaniaRules(StateRatingRules):
 @performance_monitor("get_state_rules")
 def get_state_rules(state: str) -> Result[StateRatingRules, str]:
     """Get rules for a specific state - FAIL FAST if unsupported."""
-    rules_map = {
-        "CA": CaliforniaRules(),
-        "TX": TexasRules(),
-        "NY": NewYorkRules(),
-        "FL": FloridaRules(),
-        "MI": MichiganRules(),
-        "PA": PennsylvaniaRules(),
-        # DO NOT add defaults - explicit state support required
-    }
-
-    if state not in rules_map:
+    book = get_state_rule_book()
+    # DO NOT add defaults - explicit state support required
+    if state not in book.states:
         return Err(
             f"State '{state}' is not supported for rating. "
-            f"Supported states: {list(rules_map.keys())}. "
+            f"Supported states: {list(book.states)}. "
             f"Admin must add state support before quotes can proceed. "
-            f"Required action: Implement state rules in rating engine configuration."
+            f"Required action: Add the state's rule pack to the state rules data file."
         )
 
-    return Ok(rules_map[state])
+    return Ok(book.rules(state))
 
 
 @beartype
 @performance_monitor("validate_coverage_limits")
 def validate_coverage_limits(
-    state: str, coverage_selections: list[Any]
+    state: str,
+    coverage_selections: list[Any],
+    state_rules: StateRatingRules | None = None,
 ) -> Result[bool, str]:
-    """Validate that coverage selections meet state minimums."""
-    state_rules_result = get_state_rules(state)
-    if isinstance(state_rules_result, Err):
-        return state_rules_result
-
-    state_rules = state_rules_result.value
+    """Validate that coverage selections meet state minimums.
+
+    ``state_rules`` overrides the rule book's rules for ``state``, e.g. with
+    the database-merged rules a rating engine holds.
+    """
+    if state_rules is None:
+        state_rules_result = get_state_rules(state)
+        if isinstance(state_rules_result, Err):
+            return state_rules_result
+        state_rules = state_rules_result.value
     minimums = state_rules.get_minimum_limits()
 
     # Build coverage map from selections
@@ -525,4 +413,6 @@ def validate_coverage_limits(
             )
 
     return Ok(True)
+
+
 # SYSTEM_BOUNDARY: State rating rules require flexible dict structures for jurisdiction-specific regulations and compliance factors
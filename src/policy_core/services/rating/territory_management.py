@@ -23,6 +23,7 @@ from policy_core.core.types import CacheLike, DatabaseLike
 from policy_core.models.base import BaseModelConfig
 
 from ...schemas.rating import TerritoryRiskFactors
+from .rate_tables import bump_rating_generation
 
 # Auto-generated models
 
@@ -629,6 +630,7 @@ class TerritoryManager:
         for zip_code in zip_codes:
             cache_key = f"{self._cache_prefix}{state}:{zip_code}"
             await self._cache.delete(cache_key)
+        await bump_rating_generation(self._cache)
 
     @beartype
     def _assess_overall_risk(self, territory: TerritoryDefinition) -> str:
@@ -702,4 +704,6 @@ class TerritoryManager:
         }
 
         return descriptions.get(factor_name, f"{level.title()} risk factor")
+
+
 # SYSTEM_BOUNDARY: Territory management requires flexible dict structures for geographic rating factors and postal code mapping
@@ -0,0 +1,169 @@
+# PolicyCore - Policy Decision Management System
+# Copyright (C) 2025 Luiz Frias <luizf35@gmail.com>
+# Form F[x] Labs
+#
+# This software is dual-licensed under AGPL-3.0 and Commercial License.
+# For commercial licensing, contact: luizf35@gmail.com
+# See LICENSE file for full terms.
+
+"""Process pool for batch rating.
+
+Bulk re-rating prices thousands of loaded contexts back to back.  Run on
+the event loop, that CPU work stalls every quote request served by the same
+worker.  :class:`RatingWorkerPool` ships batch work to a small pool of
+spawned processes instead:
+
+* Contexts are pickled in chunks of ``rating_pool_chunk_size`` and priced
+  with :func:`~.kernel.rate_quote` in the worker; results come back in
+  input order.
+* At most ``rating_pool_max_chunks`` chunks are queued or running across
+  all batch callers.  Further callers wait on the event loop for a slot, so
+  a large job never grows an unbounded backlog of pickled contexts.
+* Workers lower their own scheduling priority by ``rating_pool_niceness``,
+  so when batch and interactive work contend for a core the API process
+  wins.
+
+Interactive quotes deliberately do not use the pool: a kernel rating is
+cheaper than a round trip to another process, so they are priced inline
+and never queue behind batch work.
+"""
+
+import asyncio
+import multiprocessing
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import islice
+from typing import NamedTuple
+
+from beartype import beartype
+
+from policy_core.core.config import get_settings
+from policy_core.core.result_types import Err, Result
+
+from .kernel import KernelRating, RatingContext, RatingStages, rate_quote
+
+
+class RatingJob(NamedTuple):
+    """One loaded quote to price, with the stages of its previous rating."""
+
+    context: RatingContext
+    previous: RatingStages | None = None
+
+
+def _init_worker(niceness: int) -> None:
+    if niceness and hasattr(os, "nice"):
+        os.nice(niceness)
+
+
+def rate_chunk(jobs: list[RatingJob]) -> list[Result[KernelRating, str]]:
+    """Price a chunk of jobs; one failing quote does not fail the chunk."""
+    results: list[Result[KernelRating, str]] = []
+    for context, previous in jobs:
+        try:
+            results.append(rate_quote(context, previous))
+        except Exception as e:
+            results.append(Err(f"Rating calculation error: {str(e)}"))
+    return results
+
+
+def _chunks(jobs: Iterable[RatingJob], size: int) -> Iterator[list[RatingJob]]:
+    iterator = iter(jobs)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class RatingWorkerPool:
+    """Bounded process pool for CPU-bound batch rating."""
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        chunk_size: int | None = None,
+        max_chunks: int | None = None,
+        executor: Executor | None = None,
+    ) -> None:
+        """Configure from settings unless overridden.
+
+        Without an executor the process pool is started on first use.
+        """
+        settings = get_settings()
+        # Leave a core for the event loop by default
+        self._workers = (
+            workers or settings.rating_pool_workers or max((os.cpu_count() or 2) - 1, 1)
+        )
+        self._chunk_size = chunk_size or settings.rating_pool_chunk_size
+        self._max_chunks = max_chunks or settings.rating_pool_max_chunks
+        self._niceness = settings.rating_pool_niceness
+        self._executor = executor
+        self._owned = executor is None
+        self._slots = asyncio.Semaphore(self._max_chunks)
+
+    @property
+    def workers(self) -> int:
+        """Worker processes used for batch rating."""
+        return self._workers
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            # Spawned workers do not inherit the event loop or pool sockets
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self._niceness,),
+            )
+        return self._executor
+
+    async def rate(self, jobs: Iterable[RatingJob]) -> list[Result[KernelRating, str]]:
+        """Price ``jobs`` on the pool, returning results in input order."""
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        futures: list[asyncio.Future[list[Result[KernelRating, str]]]] = []
+
+        def release(_: asyncio.Future[list[Result[KernelRating, str]]]) -> None:
+            self._slots.release()
+
+        try:
+            for chunk in _chunks(jobs, self._chunk_size):
+                # Backpressure: wait for a free slot before pickling more work
+                await self._slots.acquire()
+                future = loop.run_in_executor(executor, rate_chunk, chunk)
+                future.add_done_callback(release)
+                futures.append(future)
+
+            results: list[Result[KernelRating, str]] = []
+            for chunk_results in await asyncio.gather(*futures):
+                results.extend(chunk_results)
+            return results
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def shutdown(self) -> None:
+        """Stop the worker processes of an owned pool."""
+        if self._owned and self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# Global rating worker pool instance
+_rating_worker_pool: RatingWorkerPool | None = None
+
+
+@beartype
+def get_rating_worker_pool() -> RatingWorkerPool:
+    """Get global rating worker pool instance."""
+    global _rating_worker_pool
+    if _rating_worker_pool is None:
+        _rating_worker_pool = RatingWorkerPool()
+    return _rating_worker_pool
+
+
+@beartype
+def shutdown_rating_worker_pool() -> None:
+    """Stop the global pool's workers, if it was ever started."""
+    global _rating_worker_pool
+    if _rating_worker_pool is not None:
+        _rating_worker_pool.shutdown()
+        _rating_worker_pool = None
@@ -10,13 +10,20 @@
 
 This module implements the core rating engine with state-specific rules,
 discount calculations, and sub-50ms performance requirements.
+
+:class:`RatingEngine` is the async shell: it loads rates, territory and
+customer history into a :class:`~policy_core.services.rating.kernel.RatingContext`
+and prices it with the synchronous kernel in ``rating.kernel``.
 """
 
+import asyncio
 import hashlib
 import json
-from datetime import date, datetime
-from decimal import ROUND_HALF_UP, Decimal
-from typing import Any
+import logging
+import time
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Any, NamedTuple
 from uuid import UUID
 
 from policy_core.core.types import CacheLike, DatabaseLike
@@ -32,6 +39,7 @@ except ImportError:
 from beartype import beartype
 from pydantic import Field
 
+from policy_core.core.config import get_settings
 from policy_core.core.result_types import Err, Ok, Result
 from policy_core.models.base import BaseModelConfig
 
@@ -39,9 +47,7 @@ from ..models.quote import (
     CoverageSelection,
     CoverageType,
     Discount,
-    DiscountType,
     DriverInfo,
-    Surcharge,
     VehicleInfo,
 )
 from ..schemas.rating import (
@@ -51,9 +57,40 @@ from ..schemas.rating import (
     TerritoryRates,
 )
 from .performance_monitor import performance_monitor
-from .rating.business_rules import RatingBusinessRules
+from .rating.ab_routing import RateAssignment, get_ab_test_router
+from .rating.fixed_point import (
+    decimal_to_microcents,
+    micro_to_decimal,
+    microcents_to_decimal,
+)
+from .rating.kernel import (
+    STAGES_VERSION,
+    CustomerFacts,
+    DiscountRule,
+    KernelDiscount,
+    KernelRating,
+    KernelSurcharge,
+    RatingContext,
+    RatingStages,
+    rate_quote,
+    rate_table,
+    rate_variants,
+)
 from .rating.performance_optimizer import RatingPerformanceOptimizer
+from .rating.rate_tables import RATING_GENERATION_KEY
+from .rating.state_rules import (
+    CompiledStateRules,
+    StateRulePack,
+    get_state_rule_book,
+    validate_coverage_limits,
+)
 from .rating.territory_management import TerritoryManager
+from .rating.worker_pool import RatingJob, RatingWorkerPool, get_rating_worker_pool
+
+logger = logging.getLogger(__name__)
+
+# Rate version reported when no A/B test routes the quote
+DEFAULT_RATE_VERSION = "2024.1"
 
 # Auto-generated models
 
@@ -202,6 +239,70 @@ class SurchargeList(BaseModelConfig):
 
 
 @beartype
+class RatingBreakdown(BaseModelConfig):
+    """Intermediate results of a rating, persisted with the quote.
+
+    Holds the facts the engine loaded for the quote and every kernel stage,
+    in fixed-point units.  Re-rating the quote within
+    ``rating_breakdown_ttl_seconds``, while rate and territory data are
+    unchanged, reuses the loaded facts without I/O and recomputes only the
+    stages whose inputs changed.
+    """
+
+    version: int = Field(..., ge=1)
+    context_key: str = Field(..., min_length=1)
+    rated_at: datetime = Field(...)
+
+    # Loaded context
+    rates: dict[str, int] = Field(default_factory=dict)
+    minimum_premium: int = Field(..., ge=0)
+    rating_year: int = Field(...)
+    territory_factor: float | None = Field(None)
+    credit_factor: float | None = Field(None)
+    claims_factor: float | None = Field(None)
+    customer: CustomerFacts | None = Field(None)
+
+    # Kernel stages
+    stage_keys: dict[str, str] = Field(default_factory=dict)
+    coverage_premiums: dict[str, int] = Field(default_factory=dict)
+    factors: RatingFactors = Field(...)
+    discount_schedule: tuple[DiscountRule, ...] = Field(default=())
+    surcharges: tuple[KernelSurcharge, ...] = Field(default=())
+
+    @classmethod
+    def from_rating(
+        cls, context: RatingContext, stages: RatingStages, context_key: str
+    ) -> "RatingBreakdown":
+        """Breakdown of a kernel rating of ``context``."""
+        return cls(
+            version=STAGES_VERSION,
+            context_key=context_key,
+            rated_at=datetime.now(timezone.utc),
+            rates=dict(context.rates),
+            minimum_premium=context.minimum_premium,
+            rating_year=context.rating_year,
+            territory_factor=context.territory_factor,
+            credit_factor=context.credit_factor,
+            claims_factor=context.claims_factor,
+            customer=context.customer,
+            stage_keys=stages.keys,
+            coverage_premiums=stages.coverage_premiums,
+            factors=stages.factors,
+            discount_schedule=stages.discount_schedule,
+            surcharges=stages.surcharges,
+        )
+
+    def stages(self) -> RatingStages:
+        """Kernel stages to re-rate from."""
+        return RatingStages(
+            keys=dict(self.stage_keys),
+            coverage_premiums=dict(self.coverage_premiums),
+            factors=self.factors,
+            discount_schedule=self.discount_schedule,
+            surcharges=self.surcharges,
+        )
+
+
 class RatingResult(BaseModelConfig):
     """Rating calculation result with all details."""
 
@@ -229,6 +330,109 @@ class RatingResult(BaseModelConfig):
     calculation_time_ms: int = Field(..., ge=0)
     rate_version: str = Field(...)
     effective_date: date = Field(...)
+    ab_test_id: UUID | None = Field(None)
+    ab_test_group: str | None = Field(None, pattern="^(control|test)$")
+
+    # Loaded facts and kernel stages to re-rate the quote from
+    breakdown: RatingBreakdown | None = Field(None)
+
+
+class VariantPremium(BaseModelConfig):
+    """Premium of one coverage-term variation of a quote."""
+
+    base_premium: Decimal | None = Field(None, ge=0, decimal_places=2)
+    total_premium: Decimal | None = Field(None, ge=0, decimal_places=2)
+    error: str | None = Field(None, description="Why the variation was not priced")
+
+
+class VariationPricing(BaseModelConfig):
+    """Premiums of coverage-term variations of one quote."""
+
+    base_premium: Decimal = Field(..., ge=0, decimal_places=2)
+    total_premium: Decimal = Field(..., ge=0, decimal_places=2)
+    rate_version: str = Field(...)
+    variants: list[VariantPremium] = Field(default_factory=list)
+
+
+class PremiumRequest(BaseModelConfig):
+    """Inputs of one rating in a batch."""
+
+    state: str = Field(...)
+    product_type: str = Field(...)
+    vehicle_info: VehicleInfo | None = Field(None)
+    drivers: list[DriverInfo] = Field(default_factory=list)
+    coverage_selections: list[CoverageSelection] = Field(default_factory=list)
+    customer_id: UUID | None = Field(None)
+    previous: RatingBreakdown | None = Field(
+        None, description="Breakdown of an earlier rating of the same quote"
+    )
+
+
+class _PendingRating(NamedTuple):
+    """A validated, loaded rating waiting to be priced by the kernel."""
+
+    request: PremiumRequest
+    cache_key: str
+    assignment: RateAssignment | None
+    rate_version: str
+    context_key: str
+    context: RatingContext
+    stages: RatingStages | None
+
+
+def _context_key(
+    state: str,
+    product_type: str,
+    vehicle_info: VehicleInfo | None,
+    customer_id: UUID | None,
+    rate_version: str,
+    generation: str,
+) -> str:
+    """Inputs the loaded context facts depend on.
+
+    ``generation`` is the rating generation token, which changes whenever
+    rate or territory data is changed, so breakdowns loaded before the
+    change are never reused.
+    """
+    garage_zip = vehicle_info.garage_zip if vehicle_info else ""
+    return (
+        f"{state}:{product_type}:{customer_id or ''}:{garage_zip}"
+        f":{rate_version}:{generation}"
+    )
+
+
+def _comparable(rating: KernelRating) -> KernelRating:
+    """Rating with its violations as plain data, for equality checks."""
+    return rating._replace(violations=[v.to_dict() for v in rating.violations])
+
+
+def _discount(discount: KernelDiscount) -> Discount:
+    """Kernel discount as the API model, rounded to the cent."""
+    return Discount(
+        discount_type=discount.discount_type,
+        description=discount.description,
+        amount=microcents_to_decimal(discount.amount),
+        percentage=micro_to_decimal(discount.percentage),
+    )
+
+
+def _surcharge(surcharge: KernelSurcharge) -> SurchargeCalculation:
+    """Kernel surcharge as the API model, rounded to the cent."""
+    amount = microcents_to_decimal(surcharge.amount)
+    return SurchargeCalculation(
+        surcharge_type=surcharge.surcharge_type,
+        # Policy-level surcharge; the schema requires a non-empty name
+        driver_id=None,
+        driver_name="Policy",
+        reason=surcharge.description,
+        rate=0.0,
+        amount=amount,
+        severity="medium",
+        is_flat_fee=True,
+        risk_score=None,
+        capped=False,
+        original_amount=amount,
+    )
 
 
 @beartype
@@ -246,10 +450,9 @@ class RatingEngine:
         self._base_rates: dict[str, CoverageRates] = {}
         self._discount_rules: dict[str, DiscountRules] = {}
         self._territory_factors: dict[str, TerritoryRates] = {}
-        self._state_rules: dict[str, StateRules] = {}
+        self._state_rules: dict[str, CompiledStateRules] = {}
 
-        # Business rule validation and territory management
-        self._business_rules = RatingBusinessRules()
+        # Territory management
         self._territory_manager = TerritoryManager(db, cache)
 
         # Performance optimizer for sub-50ms calculations
@@ -304,240 +507,432 @@ class RatingEngine:
         drivers: list[DriverInfo],
         coverage_selections: list[CoverageSelection],
         customer_id: UUID | None = None,
+        previous: RatingBreakdown | None = None,
     ) -> Result[RatingResult, str]:
-        """Calculate premium with all factors - MUST complete in <50ms."""
+        """Calculate premium with all factors - MUST complete in <50ms.
+
+        ``previous`` is the breakdown of an earlier rating of the same quote.
+        While it is fresh its loaded facts are reused and only the kernel
+        stages whose inputs changed are recomputed; the result is identical
+        to a full rating from the same facts.
+        """
         # Start performance monitoring
         perf_token = self._performance_optimizer.start_performance_monitoring()
 
         try:
-            # Validate inputs - FAIL FAST
-            validation = self._validate_rating_inputs(
-                state, product_type, drivers, coverage_selections
+            prepared = await self._prepare_rating(
+                PremiumRequest(
+                    state=state,
+                    product_type=product_type,
+                    vehicle_info=vehicle_info,
+                    drivers=drivers,
+                    coverage_selections=coverage_selections,
+                    customer_id=customer_id,
+                    previous=previous,
+                )
             )
-            if isinstance(validation, Err):
-                return validation
+            if isinstance(prepared, Err):
+                return prepared
+            if isinstance(prepared.value, RatingResult):
+                return Ok(prepared.value)
+            pending = prepared.value
 
-            # Check cache for recent calculation
-            cache_key = self._generate_cache_key(
-                state, product_type, vehicle_info, drivers, coverage_selections
-            )
-            cached_raw = await self._cache.get(f"{self._cache_prefix}{cache_key}")
-            if cached_raw:
-                return Ok(RatingResult(**json.loads(str(cached_raw))))
+            # Interactive ratings are priced inline: the kernel is cheaper
+            # than a round trip to the batch worker pool
+            rating = rate_quote(pending.context, pending.stages)
+            if isinstance(rating, Err):
+                return rating
 
-            # Get base rates - NO FALLBACKS
-            base_rates = await self._get_base_rates(state, product_type)
-            if isinstance(base_rates, Err):
-                return base_rates
+            return await self._finish_rating(pending, rating.value, perf_token)
 
-            # Calculate base premium for each coverage
-            coverage_premiums = {}
-            total_base = Decimal("0")
-
-            for coverage in coverage_selections:
-                # EXPLICIT rate lookup using structured model
-                cov_key = coverage.coverage_type.value
-
-                # Legacy support: treat 'liability' as combined BI/PD → use BI rate
-                if cov_key == "liability":
-                    cov_key = "bodily_injury"
-
-                base_rate_value = getattr(base_rates.value, cov_key, None)
-                if base_rate_value is None or base_rate_value == Decimal("0"):
-                    available_coverage_types = [
-                        k
-                        for k, v in base_rates.value.model_dump().items()
-                        if v is not None and v > 0
-                    ]
-                    return Err(
-                        f"No approved rate found for coverage '{coverage.coverage_type.value}' in {state}. "
-                        f"Available coverages: {available_coverage_types}. "
-                        f"Admin must approve rates for this coverage type before quotes can proceed."
-                    )
+        except Exception as e:
+            return Err(f"Rating calculation error: {str(e)}")
 
-                base_rate = base_rate_value
-                coverage_premium = (
-                    coverage.limit * Decimal(str(base_rate)) / Decimal("1000")
-                )  # Rate per $1000
-                coverage_premiums[coverage.coverage_type] = coverage_premium.quantize(
-                    Decimal("0.01"), rounding=ROUND_HALF_UP
+    @beartype
+    @performance_monitor("calculate_premium_batch")
+    async def calculate_premium_batch(
+        self,
+        requests: list[PremiumRequest],
+        pool: RatingWorkerPool | None = None,
+    ) -> list[Result[RatingResult, str]]:
+        """Calculate premiums for many quotes, in request order.
+
+        Contexts are loaded here on the event loop and priced on the batch
+        worker pool, so bulk jobs do not hold the loop for their CPU work.
+        Each result is what :meth:`calculate_premium` returns for the same
+        request.
+        """
+        results: list[Result[Any, str]] = []
+        pending: dict[int, _PendingRating] = {}
+        for index, request in enumerate(requests):
+            try:
+                prepared = await self._prepare_rating(request)
+            except Exception as e:
+                prepared = Err(f"Rating calculation error: {str(e)}")
+            # Cached results and errors are final; the rest go to the pool
+            if isinstance(prepared, Ok) and isinstance(prepared.value, _PendingRating):
+                pending[index] = prepared.value
+            results.append(prepared)
+
+        if not pending:
+            return results
+
+        started = time.perf_counter()
+        rated = await (pool or get_rating_worker_pool()).rate(
+            RatingJob(p.context, p.stages) for p in pending.values()
+        )
+        # Batch ratings report their share of the batch and stay out of the
+        # interactive latency statistics
+        share_ms = int((time.perf_counter() - started) * 1000 / len(pending))
+
+        for (index, prepared_rating), rating in zip(
+            pending.items(), rated, strict=True
+        ):
+            if rating.is_err():
+                results[index] = Err(rating.unwrap_err())
+                continue
+            try:
+                results[index] = await self._finish_rating(
+                    prepared_rating, rating.unwrap(), calculation_time_ms=share_ms
                 )
-                total_base += coverage_premium
+            except Exception as e:
+                results[index] = Err(f"Rating calculation error: {str(e)}")
+        return results
+
+    async def _prepare_rating(
+        self, request: PremiumRequest
+    ) -> Result[RatingResult | _PendingRating, str]:
+        """Validate a request and load its context, or return a cached result."""
+        state = request.state
+        product_type = request.product_type
+        vehicle_info = request.vehicle_info
+        drivers = request.drivers
+        coverage_selections = request.coverage_selections
+        customer_id = request.customer_id
+        previous = request.previous
+
+        # Validate inputs - FAIL FAST
+        validation = self._validate_rating_inputs(
+            state, product_type, drivers, coverage_selections
+        )
+        if isinstance(validation, Err):
+            return validation
 
-            # ------------------------------------------------------------------
-            # Apply rating factors – returns a ``RatingFactors`` model
-            # ------------------------------------------------------------------
+        # Check cache for recent calculation
+        cache_key = self._generate_cache_key(
+            state, product_type, vehicle_info, drivers, coverage_selections
+        )
 
-            factors = await self._calculate_factors(
-                state, vehicle_info, drivers, customer_id
-            )
-            if isinstance(factors, Err):
-                return factors
+        # A/B routing is an in-process lookup; anonymous quotes are
+        # routed by their fingerprint
+        assignment = get_ab_test_router().assign(
+            state, product_type, str(customer_id) if customer_id else cache_key
+        )
+        if assignment is not None:
+            cache_key = f"{cache_key}:{assignment.snapshot.label}"
 
-            # Apply factors to base premium using composite calculation
-            factored_premium = total_base * Decimal(
-                str(factors.value.calculate_composite_factor())
-            )
+        cached_raw = await self._cache.get(f"{self._cache_prefix}{cache_key}")
+        if cached_raw:
+            return Ok(RatingResult(**json.loads(str(cached_raw))))
+
+        # Read before loading, so a change made while loading leaves the
+        # breakdown stamped with the old generation
+        generation = await self._cache.get(RATING_GENERATION_KEY)
+        rate_version = assignment.snapshot.label if assignment else DEFAULT_RATE_VERSION
+        context_key = _context_key(
+            state,
+            product_type,
+            vehicle_info,
+            customer_id,
+            rate_version,
+            str(generation or ""),
+        )
 
-            # Calculate discounts
-            discounts = await self._calculate_discounts(
+        # Resolve everything the kernel needs, then price without I/O
+        stages: RatingStages | None = None
+        if previous is not None and self._is_reusable(previous, context_key):
+            context: Result[RatingContext, str] = Ok(
+                RatingContext(
+                    state=state,
+                    product_type=product_type,
+                    vehicle=vehicle_info,
+                    drivers=tuple(drivers),
+                    coverages=tuple(coverage_selections),
+                    rates=previous.rates,
+                    state_rules=self._state_rules[state],
+                    minimum_premium=previous.minimum_premium,
+                    rating_year=previous.rating_year,
+                    territory_factor=previous.territory_factor,
+                    credit_factor=previous.credit_factor,
+                    claims_factor=previous.claims_factor,
+                    customer=previous.customer,
+                )
+            )
+            stages = previous.stages()
+        else:
+            context = await self._load_context(
                 state,
                 product_type,
                 vehicle_info,
                 drivers,
+                coverage_selections,
                 customer_id,
-                factored_premium,
+                assignment.snapshot.rates if assignment is not None else None,
             )
-            if isinstance(discounts, Err):
-                return discounts
-
-            total_discount = sum(d.amount for d in discounts.value)
-
-            # ------------------------------------------------------------------
-            # Calculate surcharges (raw list[Surcharge]) and convert to
-            # structured ``SurchargeCalculation`` model list for downstream
-            # validation + result payload.
-            # ------------------------------------------------------------------
-
-            surcharges = await self._calculate_surcharges(state, drivers, customer_id)
-            if isinstance(surcharges, Err):
-                return surcharges
-
-            # Transform to structured schema objects
-            surcharge_items = [
-                SurchargeCalculation(
-                    surcharge_type=s.surcharge_type,
-                    driver_id=None,
-                    driver_name="",
-                    reason=s.description,
-                    rate=float(s.percentage / Decimal("100")) if s.percentage else 0.0,
-                    amount=s.amount,
-                    severity="medium",
-                    is_flat_fee=s.percentage is None,
-                    risk_score=None,
-                    capped=False,
-                    original_amount=s.amount,
-                )
-                for s in surcharges.value
-            ]
-
-            surcharge_list = SurchargeList(items=surcharge_items)
+        if isinstance(context, Err):
+            return context
+
+        return Ok(
+            _PendingRating(
+                request=request,
+                cache_key=cache_key,
+                assignment=assignment,
+                rate_version=rate_version,
+                context_key=context_key,
+                context=context.value,
+                stages=stages,
+            )
+        )
 
-            total_surcharge = sum(item.amount for item in surcharge_items)
+    async def _finish_rating(
+        self,
+        pending: _PendingRating,
+        priced: KernelRating,
+        perf_token: str | None = None,
+        calculation_time_ms: int = 0,
+    ) -> Result[RatingResult, str]:
+        """Build, cache and return the result of a priced rating."""
+        request = pending.request
+        assignment = pending.assignment
+        context = pending.context
+
+        if pending.stages is not None and get_settings().rating_verify_incremental:
+            verified = await self._verify_incremental(
+                priced,
+                request.state,
+                request.product_type,
+                request.vehicle_info,
+                request.drivers,
+                request.coverage_selections,
+                request.customer_id,
+                assignment.snapshot.rates if assignment is not None else None,
+            )
+            if isinstance(verified, Err):
+                return verified
+            priced, context = verified.value
+
+        # AI risk assessment (if enabled and customer exists)
+        ai_risk_score = None
+        ai_risk_factors = []
+        if request.customer_id:
+            ai_assessment = await self._get_ai_risk_assessment(
+                request.customer_id, request.vehicle_info, request.drivers
+            )
+            if isinstance(ai_assessment, Ok):
+                ai_risk_score = ai_assessment.value.get("score")
+                ai_risk_factors = ai_assessment.value.get("factors", [])
 
-            # Final premium calculation
-            total_premium = factored_premium - total_discount + total_surcharge
+        # Build result and get calculation time
+        calc_time = calculation_time_ms
+        if perf_token is not None:
+            calc_time = self._performance_optimizer.end_performance_monitoring(
+                perf_token
+            )
 
-            # Ensure minimum premium
-            min_premium = await self._get_minimum_premium(state, product_type)
-            if isinstance(min_premium, Err):
-                return min_premium
+        result = RatingResult(
+            base_premium=microcents_to_decimal(priced.base_premium),
+            total_premium=microcents_to_decimal(priced.total_premium),
+            coverage_premiums=CoveragePremiums(
+                **{
+                    name: microcents_to_decimal(premium)
+                    for name, premium in priced.coverage_premiums.items()
+                }
+            ),
+            discounts=[_discount(d) for d in priced.discounts],
+            total_discount_amount=microcents_to_decimal(priced.total_discount),
+            surcharges=SurchargeList(
+                surcharge_items=[_surcharge(s) for s in priced.surcharges]
+            ),
+            total_surcharge_amount=microcents_to_decimal(priced.total_surcharge),
+            rating_factors=priced.factors,
+            tier=priced.tier,
+            ai_risk_score=ai_risk_score,
+            ai_risk_factors=ai_risk_factors,
+            calculation_time_ms=calc_time,
+            rate_version=pending.rate_version,
+            effective_date=date.today(),
+            ab_test_id=assignment.test_id if assignment else None,
+            ab_test_group=assignment.group if assignment else None,
+            breakdown=(
+                RatingBreakdown.from_rating(context, priced.stages, pending.context_key)
+                if priced.stages is not None
+                else None
+            ),
+        )
 
-            if total_premium < min_premium.value:
-                total_premium = min_premium.value
+        # Cache result for 5 minutes
+        await self._cache.set(
+            f"{self._cache_prefix}{pending.cache_key}",
+            result.model_dump_json(),
+            300,
+        )
 
-            # Determine tier
-            tier = self._determine_tier(factors.value, total_premium)
+        # Log if slow (>50ms requirement)
+        if perf_token is not None and calc_time > 50:
+            await self._log_slow_calculation(calc_time, priced.factors)
+
+        return Ok(result)
+
+    def _is_reusable(self, previous: RatingBreakdown, context_key: str) -> bool:
+        """Whether the facts loaded for ``previous`` still apply."""
+        ttl = get_settings().rating_breakdown_ttl_seconds
+        age = (datetime.now(timezone.utc) - previous.rated_at).total_seconds()
+        return (
+            previous.version == STAGES_VERSION
+            and previous.context_key == context_key
+            and previous.rating_year == date.today().year
+            and 0 <= age < ttl
+        )
 
-            # AI risk assessment (if enabled and customer exists)
-            ai_risk_score = None
-            ai_risk_factors = []
-            if customer_id:
-                ai_assessment = await self._get_ai_risk_assessment(
-                    customer_id, vehicle_info, drivers
-                )
-                if isinstance(ai_assessment, Ok):
-                    ai_risk_score = ai_assessment.value.get("score")
-                    ai_risk_factors = ai_assessment.value.get("factors", [])
-
-            # Validate business rules before finalizing result – pass structured
-            # ``RatingFactors`` model directly (it now behaves like a mapping)
-            business_validation = (
-                await self._business_rules.validate_premium_calculation(
-                    state=state,
-                    product_type=product_type,
-                    vehicle_info=vehicle_info,
-                    drivers=drivers,
-                    coverage_selections=coverage_selections,
-                    factors=factors.value,
-                    base_premium=total_base,
-                    total_premium=total_premium,
-                    discounts=discounts.value,
-                    surcharges=[item.model_dump() for item in surcharge_items],
-                )
+    async def _verify_incremental(
+        self,
+        incremental: KernelRating,
+        state: str,
+        product_type: str,
+        vehicle_info: VehicleInfo | None,
+        drivers: list[DriverInfo],
+        coverage_selections: list[CoverageSelection],
+        customer_id: UUID | None,
+        routed_rates: CoverageRates | None,
+    ) -> Result[tuple[KernelRating, RatingContext], str]:
+        """Rate again from freshly loaded facts; the full rating wins."""
+        context = await self._load_context(
+            state,
+            product_type,
+            vehicle_info,
+            drivers,
+            coverage_selections,
+            customer_id,
+            routed_rates,
+        )
+        if isinstance(context, Err):
+            return context
+        full = rate_quote(context.value)
+        if isinstance(full, Err):
+            return full
+        if _comparable(full.value) != _comparable(incremental):
+            logger.error(
+                "Incremental re-rating of %s %s differs from a full rating: "
+                "%s != %s",
+                state,
+                product_type,
+                incremental.total_premium,
+                full.value.total_premium,
             )
+        return Ok((full.value, context.value))
 
-            if isinstance(business_validation, Err):
-                return business_validation
+    @beartype
+    @performance_monitor("price_variations", max_duration_ms=100)
+    async def price_variations(
+        self,
+        state: str,
+        product_type: str,
+        vehicle_info: VehicleInfo | None,
+        drivers: list[DriverInfo],
+        coverage_selections: list[CoverageSelection],
+        variants: list[list[CoverageSelection]],
+        customer_id: UUID | None = None,
+    ) -> Result[VariationPricing, str]:
+        """Price coverage-term variations of a quote in one call.
 
-            violations = business_validation.value
-            critical_violations = self._business_rules.get_critical_violations(
-                violations
+        Each variant lists coverages that replace the quote's coverage of the
+        same type.  The context is loaded and the quote rated once; every
+        variant then only recomputes the coverages it replaces.  Variants
+        below the state's minimum limits get an error instead of a premium.
+        """
+        try:
+            validation = self._validate_rating_inputs(
+                state, product_type, drivers, coverage_selections
             )
+            if isinstance(validation, Err):
+                return validation
 
-            # Fail if critical business rule violations exist
-            if critical_violations:
-                violation_messages = [v.message for v in critical_violations]
-                return Err(
-                    f"Critical business rule violations prevent rating: {'; '.join(violation_messages)}"
+            # Same routing key as calculate_premium, so both see one rate set
+            routing_key = (
+                str(customer_id)
+                if customer_id
+                else self._generate_cache_key(
+                    state, product_type, vehicle_info, drivers, coverage_selections
                 )
-
-            # Build result and get calculation time
-            calc_time = self._performance_optimizer.end_performance_monitoring(
-                perf_token
+            )
+            # What-if pricing is not an assignment; leave the counts alone
+            assignment = get_ab_test_router().assign(
+                state, product_type, routing_key, record=False
             )
 
-            # ------------------------------------------------------------------
-            # Build ``CoveragePremiums`` model from calculated premiums.
-            # ------------------------------------------------------------------
-
-            premiums_kwargs: dict[str, Decimal] = {}
-            for cov_type, prem in coverage_premiums.items():
-                attr_name = (
-                    cov_type.value if hasattr(cov_type, "value") else str(cov_type)
+            context = await self._load_context(
+                state,
+                product_type,
+                vehicle_info,
+                drivers,
+                coverage_selections,
+                customer_id,
+                assignment.snapshot.rates if assignment is not None else None,
+            )
+            if isinstance(context, Err):
+                return context
+
+            anchor = rate_quote(context.value)
+            if isinstance(anchor, Err):
+                return anchor
+
+            errors: dict[int, str] = {}
+            for index, changes in enumerate(variants):
+                replaced = {c.coverage_type: c for c in changes}
+                limits = validate_coverage_limits(
+                    state,
+                    [replaced.get(c.coverage_type, c) for c in coverage_selections],
+                    self._state_rules[state],
                 )
-                if attr_name == "liability":
-                    attr_name = "bodily_injury"  # legacy mapping
-                premiums_kwargs[attr_name] = prem
-
-            coverage_premiums_model = CoveragePremiums(**premiums_kwargs)
-
-            result = RatingResult(
-                base_premium=total_base.quantize(
-                    Decimal("0.01"), rounding=ROUND_HALF_UP
-                ),
-                total_premium=total_premium.quantize(
-                    Decimal("0.01"), rounding=ROUND_HALF_UP
-                ),
-                coverage_premiums=coverage_premiums_model,
-                discounts=discounts.value,
-                total_discount_amount=Decimal(str(total_discount)),
-                surcharges=surcharge_list,
-                total_surcharge_amount=Decimal(str(total_surcharge)),
-                rating_factors=factors.value,
-                tier=tier,
-                ai_risk_score=ai_risk_score,
-                ai_risk_factors=ai_risk_factors,
-                calculation_time_ms=calc_time,
-                rate_version="2024.1",
-                effective_date=date.today(),
+                if limits.is_err():
+                    errors[index] = limits.unwrap_err()
+            priced = rate_variants(
+                context.value,
+                anchor.value,
+                [changes for i, changes in enumerate(variants) if i not in errors],
             )
+            if isinstance(priced, Err):
+                return priced
+
+            results = iter(priced.value)
+            premiums = []
+            for index in range(len(variants)):
+                if index in errors:
+                    premiums.append(VariantPremium(error=errors[index]))
+                    continue
+                variant = next(results)
+                premiums.append(
+                    VariantPremium(
+                        base_premium=microcents_to_decimal(variant.base_premium),
+                        total_premium=microcents_to_decimal(variant.total_premium),
+                    )
+                )
 
-            # Cache result for 5 minutes
-            await self._cache.set(
-                f"{self._cache_prefix}{cache_key}",
-                result.model_dump_json(),
-                300,
+            return Ok(
+                VariationPricing(
+                    base_premium=microcents_to_decimal(anchor.value.base_premium),
+                    total_premium=microcents_to_decimal(anchor.value.total_premium),
+                    rate_version=(
+                        assignment.snapshot.label
+                        if assignment
+                        else DEFAULT_RATE_VERSION
+                    ),
+                    variants=premiums,
+                )
             )
 
-            # Log if slow (>50ms requirement)
-            if calc_time > 50:
-                await self._log_slow_calculation(calc_time, factors.value)
-
-            return Ok(result)
-
         except Exception as e:
-            return Err(f"Rating calculation error: {str(e)}")
+            return Err(f"Variation pricing error: {str(e)}")
 
     @beartype
     @performance_monitor("validate_rating_inputs")
@@ -577,7 +972,7 @@ class RatingEngine:
             return Err("At least one coverage selection is required")
 
         # Check for required coverages based on state
-        required_coverages = self._state_rules[state].get("required_coverages", [])
+        required_coverages = self._state_rules[state].required_coverages
         selected_types = {c.coverage_type.value for c in coverage_selections}
 
         # Legacy/support: selecting 'liability' should satisfy BI + PD minimums
@@ -593,6 +988,77 @@ class RatingEngine:
 
         return Ok(True)
 
+    async def _load_context(
+        self,
+        state: str,
+        product_type: str,
+        vehicle_info: VehicleInfo | None,
+        drivers: list[DriverInfo],
+        coverage_selections: list[CoverageSelection],
+        customer_id: UUID | None,
+        routed_rates: CoverageRates | None,
+    ) -> Result[RatingContext, str]:
+        """Load rates, territory and customer history for the rating kernel."""
+        if routed_rates is not None:
+            rates = routed_rates
+        else:
+            base_rates = await self._get_base_rates(state, product_type)
+            if isinstance(base_rates, Err):
+                return base_rates
+            rates = base_rates.value
+
+        territory_factor: float | None = None
+        if vehicle_info:
+            territory = await self._get_territory_factor(state, vehicle_info.garage_zip)
+            if isinstance(territory, Err):
+                return territory
+            territory_factor = territory.value
+
+        credit_factor: float | None = None
+        claims_factor: float | None = None
+        customer: CustomerFacts | None = None
+        if customer_id:
+            # Independent lookups; a failed one just leaves its fact unset
+            claims, policies, tenure, lapse = await asyncio.gather(
+                self._get_claims_factor(customer_id),
+                self._get_customer_policy_count(customer_id),
+                self._get_customer_tenure_years(customer_id),
+                self._check_coverage_lapse(customer_id),
+            )
+            if self._state_rules[state].is_factor_allowed("credit"):
+                credit = await self._get_credit_factor(customer_id)
+                if isinstance(credit, Ok):
+                    credit_factor = credit.value
+            if isinstance(claims, Ok):
+                claims_factor = claims.value
+            customer = CustomerFacts(
+                active_policies=policies.value if isinstance(policies, Ok) else 0,
+                tenure_years=tenure.value if isinstance(tenure, Ok) else 0,
+                coverage_lapse=lapse.value if isinstance(lapse, Ok) else False,
+            )
+
+        min_premium = await self._get_minimum_premium(state, product_type)
+        if isinstance(min_premium, Err):
+            return min_premium
+
+        return Ok(
+            RatingContext(
+                state=state,
+                product_type=product_type,
+                vehicle=vehicle_info,
+                drivers=tuple(drivers),
+                coverages=tuple(coverage_selections),
+                rates=rate_table(rates),
+                state_rules=self._state_rules[state],
+                minimum_premium=decimal_to_microcents(min_premium.value),
+                rating_year=date.today().year,
+                territory_factor=territory_factor,
+                credit_factor=credit_factor,
+                claims_factor=claims_factor,
+                customer=customer,
+            )
+        )
+
     @beartype
     @performance_monitor("get_base_rates")
     async def _get_base_rates(
@@ -675,399 +1141,6 @@ class RatingEngine:
 
         return Ok(coverage_rates)
 
-    @beartype
-    @performance_monitor("calculate_factors")
-    async def _calculate_factors(
-        self,
-        state: str,
-        vehicle_info: VehicleInfo | None,
-        drivers: list[DriverInfo],
-        customer_id: UUID | None,
-    ) -> Result[RatingFactors, str]:
-        """Calculate all rating factors."""
-        factors = {}
-
-        # Territory factor (ZIP-based)
-        if vehicle_info:
-            territory_result = await self._get_territory_factor(
-                state, vehicle_info.garage_zip
-            )
-            if isinstance(territory_result, Err):
-                return territory_result
-            factors["territory"] = territory_result.value
-
-        # Vehicle factors
-        if vehicle_info:
-            vehicle_factors = await self._calculate_vehicle_factors(vehicle_info)
-            if isinstance(vehicle_factors, Err):
-                return vehicle_factors
-            # Extract individual factors from RatingFactors model
-            vf = vehicle_factors.value
-            factors["vehicle_age"] = vf.vehicle_age
-            factors["vehicle_type"] = vf.vehicle_type
-            factors["low_mileage"] = vf.low_mileage
-            factors["high_mileage"] = vf.high_mileage
-
-        # Driver factors
-        driver_factors = await self._calculate_driver_factors(drivers)
-        if isinstance(driver_factors, Err):
-            return driver_factors
-        # Extract individual factors from RatingFactors model
-        df = driver_factors.value
-        factors["driver_age"] = df.driver_age
-        factors["experience"] = df.experience
-        factors["violations"] = df.violations
-        factors["accidents"] = df.accidents
-
-        # Credit factor (if allowed in state)
-        if customer_id and state not in ["CA", "MA", "MI"]:
-            credit_factor = await self._get_credit_factor(customer_id)
-            if isinstance(credit_factor, Ok):
-                factors["credit"] = credit_factor.value
-
-        # Claims history factor
-        if customer_id:
-            claims_factor = await self._get_claims_factor(customer_id)
-            if isinstance(claims_factor, Ok):
-                factors["claims_history"] = claims_factor.value
-
-        # Apply state-specific factor validation
-        validated_factors = self._apply_state_factor_rules(state, factors)
-        if isinstance(validated_factors, Err):
-            return validated_factors
-
-        validated_dict = validated_factors.value
-
-        # Convert to RatingFactors model
-        rating_factors = RatingFactors(
-            violations=validated_dict.get("violations", 1.0),
-            accidents=validated_dict.get("accidents", 1.0),
-            experience=validated_dict.get("experience", 1.0),
-            driver_age=validated_dict.get("driver_age", 1.0),
-            low_mileage=validated_dict.get("low_mileage", 1.0),
-            high_mileage=validated_dict.get("high_mileage", 1.0),
-            territory=validated_dict.get("territory", 1.0),
-            catastrophe_risk=validated_dict.get("catastrophe_risk", 1.0),
-            vehicle_age=validated_dict.get("vehicle_age", 1.0),
-            vehicle_type=validated_dict.get("vehicle_type", 1.0),
-            credit=validated_dict.get("credit"),
-            occupation=validated_dict.get("occupation"),
-            education=validated_dict.get("education"),
-            marital_status=validated_dict.get("marital_status"),
-            gender=validated_dict.get("gender"),
-        )
-
-        return Ok(rating_factors)
-
-    @beartype
-    @performance_monitor("calculate_vehicle_factors")
-    async def _calculate_vehicle_factors(
-        self, vehicle: VehicleInfo
-    ) -> Result[RatingFactors, str]:
-        """Calculate vehicle-specific factors."""
-        factors = {}
-
-        # Age factor
-        vehicle_age = datetime.now().year - vehicle.year
-        if vehicle_age <= 1:
-            factors["vehicle_age"] = 1.15  # New car surcharge
-        elif vehicle_age <= 3:
-            factors["vehicle_age"] = 1.05
-        elif vehicle_age <= 7:
-            factors["vehicle_age"] = 1.00
-        elif vehicle_age <= 12:
-            factors["vehicle_age"] = 0.95
-        else:
-            factors["vehicle_age"] = 0.90  # Older car discount
-
-        # Safety features factor
-        safety_discount = 1.0
-        for feature in vehicle.safety_features:
-            if feature.lower() in ["abs", "airbags"]:
-                safety_discount *= 0.98
-            elif feature.lower() in ["blind_spot", "lane_assist"]:
-                safety_discount *= 0.97
-            elif feature.lower() in ["automatic_braking", "collision_warning"]:
-                safety_discount *= 0.95
-
-        factors["safety_features"] = round(safety_discount, 4)
-
-        # Anti-theft factor
-        if vehicle.anti_theft:
-            factors["anti_theft"] = 0.95
-
-        # Usage factor
-        if vehicle.annual_mileage < 7500:
-            factors["low_mileage"] = 0.90
-        elif vehicle.annual_mileage > 20000:
-            factors["high_mileage"] = 1.15
-
-        # Create RatingFactors model from factors dictionary
-        rating_factors = RatingFactors(
-            vehicle_age=factors.get("vehicle_age", 1.0),
-            low_mileage=factors.get("low_mileage", 1.0),
-            high_mileage=factors.get("high_mileage", 1.0),
-            # Set safety features and anti-theft as vehicle_type factor
-            vehicle_type=factors.get("safety_features", 1.0)
-            * factors.get("anti_theft", 1.0),
-        )
-
-        return Ok(rating_factors)
-
-    @beartype
-    @performance_monitor("calculate_driver_factors")
-    async def _calculate_driver_factors(
-        self, drivers: list[DriverInfo]
-    ) -> Result[RatingFactors, str]:
-        """Calculate driver-specific factors."""
-        # Find primary driver (youngest regular driver typically has highest impact)
-        primary_driver = min(drivers, key=lambda d: d.age)
-
-        factors = {}
-
-        # Age factor
-        age = primary_driver.age
-        if age < 25:
-            factors["driver_age"] = 1.50 if age < 21 else 1.25
-        elif age < 30:
-            factors["driver_age"] = 1.10
-        elif age < 65:
-            factors["driver_age"] = 1.00
-        else:
-            factors["driver_age"] = 1.05  # Senior driver
-
-        # Experience factor
-        years_licensed = primary_driver.years_licensed
-        if years_licensed < 3:
-            factors["experience"] = 1.20
-        elif years_licensed < 5:
-            factors["experience"] = 1.10
-        elif years_licensed < 10:
-            factors["experience"] = 1.05
-        else:
-            factors["experience"] = 1.00
-
-        # Violations factor
-        total_violations = sum(d.violations_3_years for d in drivers)
-        if total_violations == 0:
-            factors["violations"] = 0.95  # Clean record discount
-        elif total_violations <= 2:
-            factors["violations"] = 1.10
-        else:
-            factors["violations"] = min(1.25 + (total_violations * 0.10), 2.00)
-
-        # Accidents factor
-        total_accidents = sum(d.accidents_3_years for d in drivers)
-        if total_accidents == 0:
-            factors["accidents"] = 1.00
-        elif total_accidents == 1:
-            factors["accidents"] = 1.25
-        else:
-            factors["accidents"] = min(1.50 + (total_accidents * 0.25), 3.00)
-
-        # DUI factor
-        total_duis = sum(d.dui_convictions for d in drivers)
-        if total_duis > 0:
-            factors["dui"] = min(2.00 + (total_duis * 0.50), 4.00)
-
-        # Create RatingFactors model from factors dictionary
-        rating_factors = RatingFactors(
-            driver_age=factors.get("driver_age", 1.0),
-            experience=factors.get("experience", 1.0),
-            violations=factors.get("violations", 1.0),
-            accidents=factors.get("accidents", 1.0),
-            # Note: DUI is handled separately and not part of RatingFactors model
-        )
-
-        return Ok(rating_factors)
-
-    @beartype
-    @performance_monitor("calculate_discounts")
-    async def _calculate_discounts(
-        self,
-        state: str,
-        product_type: str,
-        vehicle_info: VehicleInfo | None,
-        drivers: list[DriverInfo],
-        customer_id: UUID | None,
-        base_premium: Decimal,
-    ) -> Result[list[Discount], str]:
-        """Calculate applicable discounts."""
-        discounts = []
-
-        # Multi-policy discount
-        if customer_id:
-            policy_count = await self._get_customer_policy_count(customer_id)
-            if isinstance(policy_count, Ok) and policy_count.value > 0:
-                discounts.append(
-                    Discount(
-                        discount_type=DiscountType.MULTI_POLICY,
-                        description="Multi-policy discount",
-                        amount=(base_premium * Decimal("0.10")).quantize(
-                            Decimal("0.01"), rounding=ROUND_HALF_UP
-                        ),
-                        percentage=Decimal("10"),
-                    )
-                )
-
-        # Safe driver discount
-        has_violations = any(d.violations_3_years > 0 for d in drivers)
-        has_accidents = any(d.accidents_3_years > 0 for d in drivers)
-
-        if not has_violations and not has_accidents:
-            discounts.append(
-                Discount(
-                    discount_type=DiscountType.SAFE_DRIVER,
-                    description="Safe driver discount",
-                    amount=(base_premium * Decimal("0.15")).quantize(
-                        Decimal("0.01"), rounding=ROUND_HALF_UP
-                    ),
-                    percentage=Decimal("15"),
-                )
-            )
-
-        # Good student discount
-        for driver in drivers:
-            if driver.age < 25 and driver.good_student:
-                discounts.append(
-                    Discount(
-                        discount_type=DiscountType.GOOD_STUDENT,
-                        description=f"Good student discount for {driver.first_name}",
-                        amount=(base_premium * Decimal("0.08")).quantize(
-                            Decimal("0.01"), rounding=ROUND_HALF_UP
-                        ),
-                        percentage=Decimal("8"),
-                    )
-                )
-                break  # Only one good student discount
-
-        # Military/veteran discount
-        if any(d.occupation and "military" in d.occupation.lower() for d in drivers):
-            discounts.append(
-                Discount(
-                    discount_type=DiscountType.MILITARY,
-                    description="Military discount",
-                    amount=(base_premium * Decimal("0.05")).quantize(
-                        Decimal("0.01"), rounding=ROUND_HALF_UP
-                    ),
-                    percentage=Decimal("5"),
-                )
-            )
-
-        # Loyalty discount
-        if customer_id:
-            tenure = await self._get_customer_tenure_years(customer_id)
-            if isinstance(tenure, Ok) and tenure.value >= 5:
-                discount_pct = min(tenure.value * 2, 20)  # Max 20%
-                discounts.append(
-                    Discount(
-                        discount_type=DiscountType.LOYALTY,
-                        description=f"Loyalty discount ({tenure.value} years)",
-                        amount=(
-                            base_premium * Decimal(str(discount_pct / 100))
-                        ).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP),
-                        percentage=Decimal(str(discount_pct)),
-                    )
-                )
-
-        # Validate discount stacking limits
-        total_discount_pct = sum(
-            d.percentage for d in discounts if d.percentage is not None
-        )
-        if total_discount_pct > Decimal("50"):
-            # Cap total discounts at 50%
-            scale_factor = Decimal("50") / total_discount_pct
-            scaled_discounts = []
-            for discount in discounts:
-                # Create new discount instance with scaled values
-                scaled_discount = discount.model_copy(
-                    update={
-                        "amount": discount.amount * scale_factor,
-                        "percentage": (
-                            discount.percentage * scale_factor
-                            if discount.percentage
-                            else None
-                        ),
-                    }
-                )
-                scaled_discounts.append(scaled_discount)
-            discounts = scaled_discounts
-
-        return Ok(discounts)
-
-    @beartype
-    @performance_monitor("calculate_surcharges")
-    async def _calculate_surcharges(
-        self, state: str, drivers: list[DriverInfo], customer_id: UUID | None
-    ) -> Result[list[Surcharge], str]:
-        """Calculate applicable surcharges."""
-        surcharges = []
-
-        # SR-22 surcharge (if any driver has DUI)
-        if any(d.dui_convictions > 0 for d in drivers):
-            surcharges.append(
-                Surcharge(
-                    surcharge_type="sr22_filing",
-                    description="SR-22 filing required",
-                    amount=Decimal("250.00"),
-                    percentage=None,
-                    eligible=True,
-                    validation_notes=None,
-                )
-            )
-
-        # Lapse in coverage surcharge
-        if customer_id:
-            lapse = await self._check_coverage_lapse(customer_id)
-            if isinstance(lapse, Ok) and lapse.value:
-                surcharges.append(
-                    Surcharge(
-                        surcharge_type="coverage_lapse",
-                        description="Prior coverage lapse",
-                        amount=Decimal("100.00"),
-                        percentage=None,
-                        eligible=True,
-                        validation_notes=None,
-                    )
-                )
-
-        # High-risk driver surcharge
-        high_risk_drivers = [
-            d for d in drivers if d.violations_3_years > 3 or d.accidents_3_years > 2
-        ]
-        if high_risk_drivers:
-            surcharges.append(
-                Surcharge(
-                    surcharge_type="high_risk",
-                    description=f"High-risk driver surcharge ({len(high_risk_drivers)} drivers)",
-                    amount=Decimal("150.00") * len(high_risk_drivers),
-                    percentage=None,
-                    eligible=True,
-                    validation_notes=None,
-                )
-            )
-
-        return Ok(surcharges)
-
-    @beartype
-    @performance_monitor("determine_tier")
-    def _determine_tier(self, factors: RatingFactors, premium: Decimal) -> str:
-        """Determine rating tier based on factors and premium."""
-        # Calculate composite risk score using the structured model
-        risk_score = factors.calculate_composite_factor()
-
-        # Assign tier based on risk score
-        if risk_score < 0.8:
-            return "preferred_plus"
-        elif risk_score < 0.95:
-            return "preferred"
-        elif risk_score < 1.1:
-            return "standard"
-        elif risk_score < 1.3:
-            return "non_standard"
-        else:
-            return "high_risk"
-
     @beartype
     @performance_monitor("generate_cache_key")
     def _generate_cache_key(
@@ -1491,93 +1564,18 @@ class RatingEngine:
 
         rows = await self._db.fetch(query)
 
+        # Bundled rule packs, with database packs taking precedence
+        compiled = get_state_rule_book().compiled()
         for row in rows:
-            self._state_rules[row["state"]] = json.loads(row["rules_data"])
-
-        # Hardcode some essential states if not in DB
-        if "CA" not in self._state_rules:
-            self._state_rules["CA"] = {
-                "required_coverages": ["bodily_injury", "property_damage"],
-                "prohibited_factors": ["credit", "occupation", "education"],
-                "minimum_limits": {
-                    "bodily_injury_per_person": 15000,
-                    "bodily_injury_per_accident": 30000,
-                    "property_damage": 5000,
-                },
-            }
-
-        if "TX" not in self._state_rules:
-            self._state_rules["TX"] = {
-                "required_coverages": ["bodily_injury", "property_damage"],
-                "prohibited_factors": [],
-                "minimum_limits": {
-                    "bodily_injury_per_person": 30000,
-                    "bodily_injury_per_accident": 60000,
-                    "property_damage": 25000,
-                },
-            }
+            try:
+                pack = StateRulePack.model_validate(json.loads(row["rules_data"]))
+            except ValueError as e:
+                return Err(f"Invalid state rules for {row['state']}: {e}")
+            compiled[row["state"]] = CompiledStateRules(row["state"], pack)
+        self._state_rules = compiled
 
         return Ok(True)
 
-    @beartype
-    @performance_monitor("apply_state_factor_rules")
-    def _apply_state_factor_rules(
-        self, state: str, factors: dict[str, float]
-    ) -> Result[dict[str, float], str]:
-        """Apply state-specific factor validation rules."""
-        if state not in self._state_rules:
-            return Err(f"No rules configured for state {state}")
-
-        rules_obj = self._state_rules[state]
-
-        # Normalize to a plain ``dict`` for easier processing.
-        if hasattr(rules_obj, "model_dump"):
-            rules_dict: dict[str, Any] = rules_obj.model_dump()
-        else:
-            rules_dict = rules_obj  # type: ignore[assignment]
-
-        adjusted_factors = factors.copy()
-
-        # Remove prohibited factors
-        for prohibited in rules_dict.get("prohibited_factors", []):
-            adjusted_factors.pop(prohibited, None)
-
-        # Apply California Prop 103 rules
-        if state == "CA":
-            # Ensure primary factors (driving record, miles, experience)
-            # account for at least 80% of rating
-            primary_factors = [
-                "violations",
-                "accidents",
-                "experience",
-                "low_mileage",
-                "high_mileage",
-            ]
-            primary_weight = 1.0
-            secondary_weight = 1.0
-
-            for factor_name, factor_value in adjusted_factors.items():
-                if factor_name in primary_factors:
-                    primary_weight *= factor_value
-                else:
-                    secondary_weight *= factor_value
-
-            # If secondary factors have too much impact, scale them down
-            if secondary_weight < 0.8 or secondary_weight > 1.2:
-                scale = (
-                    0.2 / abs(1.0 - secondary_weight)
-                    if secondary_weight != 1.0
-                    else 1.0
-                )
-                for factor_name in adjusted_factors:
-                    if factor_name not in primary_factors:
-                        # Move factor closer to 1.0
-                        adjusted_factors[factor_name] = (
-                            1.0 + (adjusted_factors[factor_name] - 1.0) * scale
-                        )
-
-        return Ok(adjusted_factors)
-
     @beartype
     def get_performance_metrics(self) -> dict[str, Any]:
         """Get current performance metrics for monitoring."""
@@ -1598,4 +1596,5 @@ class RatingEngine:
         """Warm caches for better performance."""
         return await self._performance_optimizer.warm_cache_for_common_scenarios()
 
+
 # SYSTEM_BOUNDARY: Rating engine requires flexible dict structures for dynamic rate calculation and state-specific configurations
@@ -6,8 +6,17 @@
 # For commercial licensing, contact: luizf35@gmail.com
 # See LICENSE file for full terms.
 
-"""User auto-provisioning service for SSO integration."""
+"""User auto-provisioning service for SSO integration.
 
+Rules are compiled once into predicate closures (sets built, regexes
+compiled, disabled rules dropped, priority order fixed) and cached per
+provider in-process.  Every rule change bumps a per-provider version
+counter in Redis; an SSO login costs one ``GET`` of that counter and a
+walk over the compiled closures, recompiling only when the version moved.
+"""
+
+import re
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any
 from uuid import UUID, uuid4
@@ -161,6 +170,114 @@ class ProvisioningResult(BaseModelConfig):
     warnings: list[str]
 
 
+RulePredicate = Callable[[SSOUserInfo, str], bool]
+
+
+def _never(sso_info: SSOUserInfo, provider_name: str) -> bool:
+    return False
+
+
+@beartype
+def compile_conditions(conditions: ProvisioningConditions) -> RulePredicate:
+    """Compile rule conditions into a predicate over (user, provider name).
+
+    Unset conditions are left out entirely; a condition that cannot be
+    compiled (such as an invalid regex) makes the rule never match.
+    """
+    checks: list[RulePredicate] = []
+
+    if conditions.email_domains:
+        domains = frozenset(conditions.email_domains)
+        checks.append(
+            lambda info, _: (info.email.split("@")[-1] if "@" in info.email else "")
+            in domains
+        )
+
+    if conditions.email_patterns:
+        try:
+            patterns = [re.compile(pattern) for pattern in conditions.email_patterns]
+        except re.error:
+            return _never
+        checks.append(
+            lambda info, _: any(pattern.match(info.email) for pattern in patterns)
+        )
+
+    if conditions.required_groups:
+        required = frozenset(conditions.required_groups)
+        checks.append(lambda info, _: required.issubset(info.groups))
+
+    if conditions.excluded_groups:
+        excluded = frozenset(conditions.excluded_groups)
+        checks.append(lambda info, _: excluded.isdisjoint(info.groups))
+
+    if conditions.providers:
+        providers = frozenset(conditions.providers)
+        checks.append(lambda _, provider_name: provider_name in providers)
+
+    if conditions.email_verified is not None:
+        verified = conditions.email_verified
+        checks.append(lambda info, _: info.email_verified == verified)
+
+    if conditions.custom_fields:
+        expected_claims: list[tuple[str, Any]] = []
+        custom_fields_data = conditions.custom_fields.model_dump(exclude_unset=True)
+        for field, expected_value in custom_fields_data.items():
+            if field == "additional_attributes":
+                # Only non-None additional attributes are checked
+                if isinstance(expected_value, dict):
+                    expected_claims.extend(
+                        (key, value)
+                        for key, value in expected_value.items()
+                        if value is not None
+                    )
+            else:
+                expected_claims.append((field, expected_value))
+        if expected_claims:
+            checks.append(
+                lambda info, _: all(
+                    info.raw_claims.get(key) == value for key, value in expected_claims
+                )
+            )
+
+    def matches(sso_info: SSOUserInfo, provider_name: str) -> bool:
+        try:
+            return all(check(sso_info, provider_name) for check in checks)
+        except Exception:
+            # If condition evaluation fails, err on the side of caution
+            return False
+
+    return matches
+
+
+class CompiledRule:
+    """An enabled provisioning rule with its conditions compiled."""
+
+    __slots__ = ("name", "matches", "actions")
+
+    def __init__(self, rule: ProvisioningRule) -> None:
+        self.name = rule.rule_name
+        self.matches = compile_conditions(rule.conditions)
+        self.actions = rule.actions
+
+
+class CompiledRuleSet:
+    """A provider's enabled rules in evaluation order, tagged by version."""
+
+    __slots__ = ("version", "rules")
+
+    def __init__(self, version: str, rules: list[ProvisioningRule]) -> None:
+        self.version = version
+        self.rules = [
+            CompiledRule(rule)
+            for rule in sorted(rules, key=lambda r: r.priority, reverse=True)
+            if rule.is_enabled
+        ]
+
+
+# Compiled rule sets by provider ID, shared by every service instance
+_compiled_rule_sets: dict[UUID, CompiledRuleSet] = {}
+
+
 class UserProvisioningService:
     """Service for automatic user provisioning via SSO."""
 
@@ -174,6 +291,7 @@ class UserProvisioningService:
         self._db = db
         self._cache = cache
         self._rules_cache_prefix = "provisioning_rules:"
+        self._rules_version_prefix = "provisioning_rules_version:"
 
     @beartype
     async def evaluate_provisioning(
@@ -194,11 +312,10 @@ class UserProvisioningService:
         """
         try:
             # Get applicable rules for this provider
-            rules_result = await self._get_provisioning_rules(provider_id)
+            rules_result = await self._get_compiled_rules(provider_id)
             if isinstance(rules_result, Err):
                 return rules_result
 
-            rules = rules_result.unwrap()
             applied_rules = []
             warnings = []
 
@@ -207,16 +324,10 @@ class UserProvisioningService:
             assigned_groups = []
             auto_create = True
 
-            # Process rules in priority order
-            for rule in sorted(rules, key=lambda r: r.priority, reverse=True):
-                if not rule.is_enabled:
-                    continue
-
-                # Evaluate rule conditions
-                if await self._evaluate_conditions(
-                    rule.conditions, sso_info, provider_name
-                ):
-                    applied_rules.append(rule.rule_name)
+            # Compiled rules are already enabled-only and in priority order
+            for rule in rules_result.unwrap().rules:
+                if rule.matches(sso_info, provider_name):
+                    applied_rules.append(rule.name)
 
                     # Apply rule actions
                     actions = rule.actions
@@ -335,7 +446,7 @@ class UserProvisioningService:
             )
 
             # Clear rules cache
-            await self._cache.delete(f"{self._rules_cache_prefix}{provider_id}")
+            await self._invalidate_rules(provider_id)
 
             return Ok(rule_id)
 
@@ -433,9 +544,7 @@ class UserProvisioningService:
             await self._db.execute(query, rule_id, *update_values)
 
             # Clear rules cache
-            await self._cache.delete(
-                f"{self._rules_cache_prefix}{existing['provider_id']}"
-            )
+            await self._invalidate_rules(existing["provider_id"])
 
             return Ok(True)
 
@@ -475,7 +584,7 @@ class UserProvisioningService:
                 return Err("Rule not found or already deleted")
 
             # Clear rules cache
-            await self._cache.delete(f"{self._rules_cache_prefix}{rule['provider_id']}")
+            await self._invalidate_rules(rule["provider_id"])
 
             return Ok(True)
 
@@ -543,6 +652,39 @@ class UserProvisioningService:
         except Exception as e:
             return Err(f"Failed to test provisioning rule: {str(e)}")
 
+    async def _invalidate_rules(self, provider_id: UUID) -> None:
+        """Drop cached rules and bump the version compiled rules are keyed by."""
+        await self._cache.delete(f"{self._rules_cache_prefix}{provider_id}")
+        await self._cache.incr(f"{self._rules_version_prefix}{provider_id}")
+
+    @beartype
+    async def _get_compiled_rules(
+        self,
+        provider_id: UUID,
+    ) -> Result[CompiledRuleSet, str]:
+        """Get a provider's compiled rules, recompiling if the version moved.
+
+        Args:
+            provider_id: Provider ID
+
+        Returns:
+            Result containing the compiled rule set or error
+        """
+        version = str(
+            await self._cache.get(f"{self._rules_version_prefix}{provider_id}") or 0
+        )
+        compiled = _compiled_rule_sets.get(provider_id)
+        if compiled is not None and compiled.version == version:
+            return Ok(compiled)
+
+        rules_result = await self._get_provisioning_rules(provider_id)
+        if isinstance(rules_result, Err):
+            return rules_result
+
+        compiled = CompiledRuleSet(version, rules_result.unwrap())
+        _compiled_rule_sets[provider_id] = compiled
+        return Ok(compiled)
+
     @beartype
     async def _get_provisioning_rules(
         self,
@@ -627,73 +769,7 @@ class UserProvisioningService:
         Returns:
             True if conditions are met, False otherwise
         """
-        try:
-            # Email domain conditions
-            if conditions.email_domains:
-                allowed_domains = conditions.email_domains
-                user_domain = (
-                    sso_info.email.split("@")[-1] if "@" in sso_info.email else ""
-                )
-                if user_domain not in allowed_domains:
-                    return False
-
-            # Email pattern conditions
-            if conditions.email_patterns:
-                import re
-
-                patterns = conditions.email_patterns
-                if not any(re.match(pattern, sso_info.email) for pattern in patterns):
-                    return False
-
-            # Group membership conditions
-            if conditions.required_groups:
-                required = set(conditions.required_groups)
-                user_groups = set(sso_info.groups)
-                if not required.issubset(user_groups):
-                    return False
-
-            # Group exclusion conditions
-            if conditions.excluded_groups:
-                excluded = set(conditions.excluded_groups)
-                user_groups = set(sso_info.groups)
-                if excluded.intersection(user_groups):
-                    return False
-
-            # Provider conditions
-            if conditions.providers:
-                allowed_providers = conditions.providers
-                if provider_name not in allowed_providers:
-                    return False
-
-            # Email verification condition
-            if conditions.email_verified is not None:
-                if sso_info.email_verified != conditions.email_verified:
-                    return False
-
-            # Custom field conditions
-            if conditions.custom_fields:
-                custom_fields_data = conditions.custom_fields.model_dump(
-                    exclude_unset=True
-                )
-                for field, expected_value in custom_fields_data.items():
-                    if field == "additional_attributes":
-                        # Handle additional attributes structured model
-                        if isinstance(expected_value, dict):
-                            for attr_key, attr_value in expected_value.items():
-                                if attr_value is not None:  # Only check non-None values
-                                    actual_value = sso_info.raw_claims.get(attr_key)
-                                    if actual_value != attr_value:
-                                        return False
-                    else:
-                        actual_value = sso_info.raw_claims.get(field)
-                        if actual_value != expected_value:
-                            return False
-
-            return True
-
-        except Exception:
-            # If condition evaluation fails, err on the side of caution
-            return False
+        return compile_conditions(conditions)(sso_info, provider_name)
 
     @beartype
     async def _validate_rule(
@@ -720,4 +796,6 @@ class UserProvisioningService:
         # Type checking ensures groups is a list when not None
 
         return Ok(True)
+
+
 # SYSTEM_BOUNDARY: User provisioning requires flexible dict structures for account creation workflows and permission mapping
@@ -0,0 +1,213 @@
+"""Unit tests for deterministic rate version A/B routing."""
+
+import json
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.policy_core.core.result_types import Err, Ok
+from src.policy_core.models.quote import CoverageSelection, CoverageType, DriverInfo
+from src.policy_core.services import rating_engine as rating_engine_module
+from src.policy_core.services.rating.ab_routing import (
+    ABTestRouter,
+    routing_bucket,
+)
+from src.policy_core.services.rating.state_rules import get_state_rule_book
+from src.policy_core.services.rating_engine import RatingEngine
+
+TEST_ID = uuid4()
+
+
+def _test_row(
+    test_id: UUID = TEST_ID,
+    split: str = "0.25",
+    table_name: str = "CA_auto_base_rates",
+    control_rates: dict | None = None,
+    start: date | None = None,
+) -> dict:
+    today = date.today()
+    control = control_rates or {"bodily_injury": "5", "property_damage": "3"}
+    return {
+        "id": test_id,
+        "traffic_split": Decimal(split),
+        "start_date": start or today - timedelta(days=1),
+        "end_date": today + timedelta(days=30),
+        "control_version_id": uuid4(),
+        "control_table_name": table_name,
+        "control_version_number": 3,
+        "control_rate_data": json.dumps({"coverages": control, "base_rates": {}}),
+        "test_version_id": uuid4(),
+        "test_table_name": table_name,
+        "test_version_number": 4,
+        "test_rate_data": {
+            "coverages": {"bodily_injury": "6", "property_damage": "3"},
+            "base_rates": {},
+        },
+    }
+
+
+def _database(rows: list[dict]) -> MagicMock:
+    db = MagicMock()
+    db.fetch = AsyncMock(return_value=rows)
+    db.execute = AsyncMock(return_value="INSERT 0 2")
+    return db
+
+
+class TestAssignment:
+    """Test group assignment is deterministic and honours the split."""
+
+    @pytest.mark.asyncio
+    async def test_same_key_same_group(self) -> None:
+        """Test a routing key always lands in the same group."""
+        router = ABTestRouter(sync_interval_seconds=60)
+        assert (await router.refresh(_database([_test_row()]))).unwrap() == 1
+
+        first = router.assign("CA", "auto", "customer-1")
+        assert first is not None
+        for _ in range(10):
+            assert router.assign("CA", "auto", "customer-1") == first
+        assert router.assign("TX", "auto", "customer-1") is None
+
+    @pytest.mark.asyncio
+    async def test_split_and_snapshots(self) -> None:
+        """Test the test share tracks traffic_split and each arm has its rates."""
+        router = ABTestRouter(sync_interval_seconds=60)
+        await router.refresh(_database([_test_row(split="0.25")]))
+
+        groups = [router.assign("CA", "auto", f"quote-{i}") for i in range(20000)]
+        tests = [a for a in groups if a is not None and a.group == "test"]
+
+        assert len(tests) / len(groups) == pytest.approx(0.25, abs=0.02)
+        assert tests[0].snapshot.label == "CA_auto_base_rates_v4"
+        assert tests[0].snapshot.rates.bodily_injury == Decimal("6")
+        assert sum(router.pending_counts.values()) == 20000
+
+    @pytest.mark.asyncio
+    async def test_unrecorded_lookup(self) -> None:
+        """Test a lookup with ``record=False`` routes alike but is not counted."""
+        router = ABTestRouter(sync_interval_seconds=60)
+        await router.refresh(_database([_test_row()]))
+
+        looked_up = router.assign("CA", "auto", "customer-1", record=False)
+
+        assert looked_up == router.assign("CA", "auto", "customer-1")
+        assert sum(router.pending_counts.values()) == 1
+
+    def test_buckets_independent_across_tests(self) -> None:
+        """Test the bucket depends on the test as well as the key."""
+        assert routing_bucket(uuid4(), "customer-1") != routing_bucket(
+            uuid4(), "customer-1"
+        )
+
+    @pytest.mark.asyncio
+    async def test_unusable_tests_are_not_routed(self) -> None:
+        """Test tests that have not started or cannot be priced are skipped."""
+        router = ABTestRouter(sync_interval_seconds=60)
+        loaded = await router.refresh(
+            _database(
+                [
+                    _test_row(start=date.today() + timedelta(days=5)),
+                    _test_row(test_id=uuid4(), table_name="legacy"),
+                    _test_row(
+                        test_id=uuid4(),
+                        table_name="TX_auto_base_rates",
+                        control_rates={"collision": "2"},
+                    ),
+                ]
+            )
+        )
+
+        assert loaded.unwrap() == 1
+        assert router.assign("CA", "auto", "customer-1") is None
+        assert router.assign("TX", "auto", "customer-1") is None
+
+
+class TestFlush:
+    """Test assignment counts are written in batches."""
+
+    @pytest.mark.asyncio
+    async def test_counts_flushed_in_one_statement(self) -> None:
+        """Test buffered counts go out as one upsert and then reset."""
+        router = ABTestRouter(sync_interval_seconds=60)
+        db = _database([_test_row()])
+        await router.refresh(db)
+        for i in range(100):
+            router.assign("CA", "auto", f"quote-{i}")
+
+        assert (await router.flush(db)).unwrap() == 100
+        test_ids, groups, counts = db.execute.await_args.args[1:]
+        assert set(test_ids) == {TEST_ID}
+        assert sorted(groups) == ["control", "test"]
+        assert sum(counts) == 100
+        assert router.pending_counts == {}
+        assert (await router.flush(db)).unwrap() == 0
+        assert db.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_counts(self) -> None:
+        """Test counts survive a failed write for the next flush."""
+        router = ABTestRouter(sync_interval_seconds=60)
+        db = _database([_test_row()])
+        await router.refresh(db)
+        router.assign("CA", "auto", "quote-1")
+        db.execute = AsyncMock(side_effect=RuntimeError("connection lost"))
+
+        assert (await router.flush(db)).is_err()
+        assert sum(router.pending_counts.values()) == 1
+
+
+class TestRatingEngineRouting:
+    """Test RatingEngine prices routed quotes from the assigned snapshot."""
+
+    @pytest.mark.asyncio
+    async def test_assigned_version_rates_and_labels_quote(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a routed quote uses its arm's rates without a rate lookup."""
+        router = ABTestRouter(sync_interval_seconds=60)
+        await router.refresh(_database([_test_row(split="0.999")]))
+        monkeypatch.setattr(rating_engine_module, "get_ab_test_router", lambda: router)
+
+        cache = MagicMock()
+        cache.get = AsyncMock(return_value=None)
+        cache.set = AsyncMock(return_value=True)
+        db = MagicMock()
+        db.fetchrow = AsyncMock(return_value=None)
+        engine = RatingEngine(db, cache)
+        engine._state_rules = {"CA": get_state_rule_book().rules("CA")}
+        engine._get_base_rates = AsyncMock(side_effect=AssertionError("rate lookup"))
+        engine._get_minimum_premium = AsyncMock(return_value=Ok(Decimal("0")))
+        engine._get_ai_risk_assessment = AsyncMock(return_value=Err("disabled"))
+
+        result = await engine.calculate_premium(
+            state="CA",
+            product_type="auto",
+            vehicle_info=None,
+            drivers=[
+                DriverInfo(
+                    first_name="Jane", last_name="Doe", age=40, years_licensed=20
+                )
+            ],
+            coverage_selections=[
+                CoverageSelection(
+                    coverage_type=CoverageType.BODILY_INJURY,
+                    limit=Decimal("100000.00"),
+                    deductible=Decimal("0.00"),
+                ),
+                CoverageSelection(
+                    coverage_type=CoverageType.PROPERTY_DAMAGE,
+                    limit=Decimal("50000.00"),
+                    deductible=Decimal("0.00"),
+                ),
+            ],
+            customer_id=uuid4(),
+        )
+
+        rating = result.unwrap()
+        assert rating.ab_test_id == TEST_ID and rating.ab_test_group == "test"
+        assert rating.rate_version == "CA_auto_base_rates_v4"
+        # 100k BI at the test arm's $6 and 50k PD at $3 per $1000
+        assert rating.base_premium == Decimal("750.00")
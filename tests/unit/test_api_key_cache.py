@@ -0,0 +1,202 @@
+"""Unit tests for the in-process API key cache and usage tracker."""
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from redis.asyncio import Redis
+
+from src.policy_core.core.auth.oauth2 import api_key_cache, api_keys
+from src.policy_core.core.auth.oauth2.api_key_cache import (
+    INVALIDATION_CHANNEL,
+    APIKeyCache,
+    APIKeyUsageTracker,
+)
+from src.policy_core.core.auth.oauth2.api_keys import APIKeyManager
+from src.policy_core.core.cache import Cache
+from src.policy_core.core.database import Database
+from src.policy_core.core.result_types import Err, Ok
+
+
+@pytest.fixture
+def fresh_state(
+    monkeypatch: pytest.MonkeyPatch,
+) -> tuple[APIKeyCache, APIKeyUsageTracker]:
+    """Give each test its own cache and tracker singletons."""
+    cache = APIKeyCache(ttl_seconds=60, negative_ttl_seconds=10)
+    tracker = APIKeyUsageTracker(flush_interval_seconds=10)
+    monkeypatch.setattr(api_key_cache, "_api_key_cache", cache)
+    monkeypatch.setattr(api_key_cache, "_api_key_usage_tracker", tracker)
+    return cache, tracker
+
+
+def _manager(row: dict | None) -> tuple[APIKeyManager, MagicMock, MagicMock]:
+    db = MagicMock(spec=Database)
+    db.fetchrow = AsyncMock(return_value=row)
+    db.execute = AsyncMock()
+    cache = MagicMock(spec=Cache)
+    cache.get = AsyncMock(return_value=None)
+    cache.set = AsyncMock()
+    cache.incr = AsyncMock(return_value=2)
+    cache.expire = AsyncMock()
+    return APIKeyManager(db, cache), db, cache
+
+
+class TestAPIKeyCache:
+    """Test validation is served from the in-process cache."""
+
+    @pytest.mark.asyncio
+    async def test_valid_key_loaded_once_and_usage_not_written(
+        self, fresh_state: tuple[APIKeyCache, APIKeyUsageTracker]
+    ) -> None:
+        """Test repeat calls skip Redis/DB lookups and per-call writes."""
+        _, tracker = fresh_state
+        key_id = uuid4()
+        manager, db, cache = _manager(
+            {
+                "id": key_id,
+                "client_id": "client-1",
+                "scopes": ["quote:read"],
+                "rate_limit_per_minute": 100,
+                "allowed_ips": None,
+                "expires_at": None,
+                "active": True,
+            }
+        )
+
+        for _ in range(5):
+            result = await manager.validate_api_key("pd_secret", "quote:read")
+            assert result.is_ok()
+
+        assert db.fetchrow.await_count == 1
+        assert cache.get.await_count == 1
+        db.execute.assert_not_awaited()
+        assert tracker.pending(str(key_id)).uses == 5
+
+    @pytest.mark.asyncio
+    async def test_invalid_key_is_negatively_cached(
+        self, fresh_state: tuple[APIKeyCache, APIKeyUsageTracker]
+    ) -> None:
+        """Test unknown keys are rejected without repeated lookups."""
+        manager, db, _ = _manager(None)
+
+        for _ in range(3):
+            result = await manager.validate_api_key("pd_unknown")
+            assert result.unwrap_err() == "Invalid API key"
+
+        assert db.fetchrow.await_count == 1
+
+    def test_entry_capped_at_key_expiry(self) -> None:
+        """Test a key expiring sooner than the TTL is not served after expiry."""
+        cache = APIKeyCache(ttl_seconds=60, negative_ttl_seconds=10)
+        cache.put(
+            "hash", Ok({"id": "k"}), datetime.now(timezone.utc) - timedelta(seconds=1)
+        )
+
+        assert cache.get("hash") is None
+
+    @pytest.mark.asyncio
+    async def test_invalidation_is_published(self) -> None:
+        """Test evictions reach other workers over pub/sub."""
+        cache = APIKeyCache(ttl_seconds=60, negative_ttl_seconds=10)
+        cache.put("a", Ok({"id": "1"}))
+        cache.put("b", Err("API key is disabled"))
+        redis = MagicMock(spec=Redis)
+        redis.publish = AsyncMock()
+
+        await cache.publish_invalidation(redis, "a", "b")
+
+        assert cache.get("a") is None and cache.get("b") is None
+        redis.publish.assert_awaited_once_with(INVALIDATION_CHANNEL, "a b")
+
+    @pytest.mark.asyncio
+    async def test_bulk_revoke_writes_on_the_primary(
+        self,
+        fresh_state: tuple[APIKeyCache, APIKeyUsageTracker],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test the revoking UPDATE runs in a transaction, not on the replica."""
+        cache, _ = fresh_state
+        cache.put("h1", Ok({"id": "1"}))
+        manager, db, _ = _manager(None)
+        db.fetch = AsyncMock(side_effect=AssertionError("replica read"))
+        conn = MagicMock()
+        conn.fetch = AsyncMock(return_value=[{"key_hash": "h1"}, {"key_hash": "h2"}])
+
+        @asynccontextmanager
+        async def transaction() -> AsyncIterator[MagicMock]:
+            yield conn
+
+        db.transaction = transaction
+        redis = MagicMock(spec=Redis)
+        redis.publish = AsyncMock()
+        monkeypatch.setattr(api_keys, "get_redis_client", lambda: redis)
+
+        assert (await manager.bulk_revoke_keys("client-1", "rotated")).unwrap() == 2
+        assert "UPDATE api_keys" in conn.fetch.await_args.args[0]
+        assert cache.get("h1") is None
+        redis.publish.assert_awaited_once_with(INVALIDATION_CHANNEL, "h1 h2")
+
+
+class TestAPIKeyUsageTracker:
+    """Test usage counters are flushed in bulk."""
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_one_statement(self) -> None:
+        """Test all keys go out in a single unnest() update."""
+        tracker = APIKeyUsageTracker(flush_interval_seconds=10)
+        first, second = str(uuid4()), str(uuid4())
+        for key_id in (first, first, second):
+            tracker.record(key_id)
+        db = MagicMock(spec=Database)
+        db.execute = AsyncMock()
+
+        assert (await tracker.flush(db)).unwrap() == 2
+
+        db.execute.assert_awaited_once()
+        args = db.execute.await_args.args
+        assert "unnest" in args[0]
+        assert args[3] == [2, 1]
+        assert tracker.pending(first).uses == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_counts(self) -> None:
+        """Test usage survives a failed write and merges with new usage."""
+        tracker = APIKeyUsageTracker(flush_interval_seconds=10)
+        key_id = str(uuid4())
+        tracker.record(key_id)
+        db = MagicMock(spec=Database)
+        db.execute = AsyncMock(side_effect=RuntimeError("primary unavailable"))
+
+        result = await tracker.flush(db)
+        tracker.record(key_id)
+
+        assert result.is_err()
+        assert tracker.pending(key_id).uses == 2
+
+    @pytest.mark.asyncio
+    async def test_statistics_include_unflushed_usage(
+        self, fresh_state: tuple[APIKeyCache, APIKeyUsageTracker]
+    ) -> None:
+        """Test get_usage_statistics adds pending counters to stored totals."""
+        _, tracker = fresh_state
+        key_id = uuid4()
+        manager, db, _ = _manager(
+            {
+                "name": "partner",
+                "client_id": "client-1",
+                "created_at": datetime(2025, 1, 1, tzinfo=timezone.utc),
+                "last_used_at": datetime(2025, 1, 2, tzinfo=timezone.utc),
+                "use_count": 10,
+            }
+        )
+        tracker.record(str(key_id))
+        tracker.record(str(key_id))
+
+        stats = (await manager.get_usage_statistics(key_id)).unwrap()
+
+        assert stats["total_requests"] == 12
+        assert stats["last_used_at"] == tracker.pending(str(key_id)).last_used_at
@@ -0,0 +1,218 @@
+"""Unit tests for the audit Merkle chain."""
+
+import hashlib
+from datetime import datetime, timezone
+from decimal import Decimal
+from ipaddress import IPv4Address
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.policy_core.compliance.audit_chain import (
+    AUDIT_LOG_COLUMNS,
+    AuditChain,
+    MerkleFrontier,
+    leaf_hash,
+    node_hash,
+    partition_key,
+    peak_positions,
+    root_from_proof,
+)
+from src.policy_core.compliance.audit_logger import (
+    AuditEventType,
+    ComplianceEvent,
+)
+from src.policy_core.compliance.audit_pipeline import event_to_copy_record
+from src.policy_core.compliance.processing_integrity import (
+    ProcessingIntegrityManager,
+)
+from src.policy_core.core.result_types import Ok
+
+
+def _rfc6962_root(leaves: list[bytes]) -> bytes:
+    """Reference tree head computed recursively from all leaves."""
+    if len(leaves) == 1:
+        return leaves[0]
+    split = 1 << ((len(leaves) - 1).bit_length() - 1)
+    return node_hash(_rfc6962_root(leaves[:split]), _rfc6962_root(leaves[split:]))
+
+
+def _leaves(count: int) -> list[bytes]:
+    return [hashlib.sha256(b"\x00" + str(i).encode()).digest() for i in range(count)]
+
+
+def _build(count: int) -> tuple[MerkleFrontier, dict[tuple[int, int], bytes]]:
+    frontier = MerkleFrontier(0, [])
+    stored: dict[tuple[int, int], bytes] = {}
+    for leaf in _leaves(count):
+        for level, index, digest in frontier.append(leaf):
+            stored[(level, index)] = digest
+    return frontier, stored
+
+
+class _NodeStore:
+    """Minimal connection answering the node lookup query from a dict."""
+
+    def __init__(self, stored: dict[tuple[int, int], bytes]) -> None:
+        self.stored = stored
+
+    async def fetch(
+        self, _query: str, _partition: str, levels: list[int], indexes: list[int]
+    ) -> list[dict[str, Any]]:
+        return [
+            {"level": level, "node_index": index, "hash": self.stored[(level, index)]}
+            for level, index in zip(levels, indexes, strict=True)
+            if (level, index) in self.stored
+        ]
+
+
+class TestMerkleFrontier:
+    """Test incremental appends match a full recomputation."""
+
+    @pytest.mark.parametrize("count", [1, 2, 3, 7, 8, 13, 64, 100])
+    def test_incremental_root_matches_reference(self, count: int) -> None:
+        """Test the frontier root equals the RFC 6962 tree head."""
+        frontier, _ = _build(count)
+
+        assert frontier.root() == _rfc6962_root(_leaves(count))
+
+    def test_stores_about_two_nodes_per_leaf(self) -> None:
+        """Test only perfect subtrees are persisted."""
+        _, stored = _build(1024)
+
+        assert len(stored) == 2047
+
+    def test_peaks_follow_binary_decomposition(self) -> None:
+        """Test 13 = 8 + 4 + 1 leaves give three peaks."""
+        assert peak_positions(13) == [(3, 0), (2, 2), (0, 12)]
+        assert peak_positions(0) == []
+
+
+class TestInclusionProofs:
+    """Test O(log n) proofs against stored nodes."""
+
+    @pytest.mark.asyncio
+    async def test_every_leaf_proves_against_historic_sizes(self) -> None:
+        """Test proofs for every leaf at several checkpoint sizes."""
+        _, stored = _build(37)
+        leaves = _leaves(37)
+        chain = AuditChain(MagicMock(), signing_key="k" * 32)
+        conn = _NodeStore(stored)
+
+        for tree_size in (1, 5, 16, 37):
+            root = _rfc6962_root(leaves[:tree_size])
+            for index in range(tree_size):
+                path = await chain._proof(conn, "2025_07", index, tree_size)
+                assert root_from_proof(leaves[index], path) == root
+                assert len(path) <= 2 * tree_size.bit_length()
+
+    @pytest.mark.asyncio
+    async def test_tampered_leaf_fails(self) -> None:
+        """Test a modified record no longer reaches the checkpoint root."""
+        _, stored = _build(10)
+        leaves = _leaves(10)
+        chain = AuditChain(MagicMock(), signing_key="k" * 32)
+
+        path = await chain._proof(_NodeStore(stored), "2025_07", 4, 10)
+
+        assert root_from_proof(leaves[5], path) != _rfc6962_root(leaves)
+
+
+class TestLeafHashing:
+    """Test leaf hashes survive the database round trip."""
+
+    def test_copy_record_and_fetched_row_hash_alike(self) -> None:
+        """Test type differences between COPY input and asyncpg output."""
+        event = ComplianceEvent(
+            event_type=AuditEventType.AUTHENTICATION,
+            action="login",
+            ip_address="10.1.2.3",
+            risk_score=0.1,
+        )
+        record = dict(zip(AUDIT_LOG_COLUMNS, event_to_copy_record(event), strict=True))
+        fetched = {
+            **record,
+            "ip_address": IPv4Address("10.1.2.3"),
+            "risk_score": Decimal("0.10"),
+            "created_at": record["created_at"].astimezone(timezone.utc),
+        }
+
+        assert leaf_hash(record) == leaf_hash(fetched)
+        assert leaf_hash(record) != leaf_hash({**fetched, "action": "logout"})
+
+    def test_partition_key_uses_utc_month(self) -> None:
+        """Test keys line up with audit_logs partition names."""
+        assert partition_key(datetime(2025, 7, 31, 23, tzinfo=timezone.utc)) == (
+            "2025_07"
+        )
+
+
+class TestCheckpoints:
+    """Test signed checkpoints."""
+
+    @pytest.mark.asyncio
+    async def test_append_writes_nodes_and_chained_checkpoint(self) -> None:
+        """Test a batch stores its nodes and a signed tree head."""
+        conn = MagicMock()
+        conn.execute = AsyncMock()
+        conn.fetchval = AsyncMock(side_effect=[0, b"\x01" * 32])
+        conn.fetch = AsyncMock(return_value=[])
+        conn.copy_records_to_table = AsyncMock()
+        chain = AuditChain(MagicMock(), checkpoint_interval=60, signing_key="k" * 32)
+        created_at = datetime(2025, 7, 1, tzinfo=timezone.utc)
+        rows = [
+            {"id": f"id-{i}", "action": "a", "created_at": created_at} for i in range(3)
+        ]
+
+        await chain.append(conn, rows)
+
+        nodes = conn.copy_records_to_table.await_args.kwargs["records"]
+        assert [(node[1], node[2]) for node in nodes] == [
+            (0, 0),
+            (0, 1),
+            (1, 0),
+            (0, 2),
+        ]
+        insert = conn.execute.await_args_list[-1].args
+        assert "INSERT INTO audit_checkpoints" in insert[0]
+        assert insert[2] == 3
+        assert insert[4] == b"\x01" * 32
+        expected_root = node_hash(
+            node_hash(leaf_hash(rows[0]), leaf_hash(rows[1])), leaf_hash(rows[2])
+        )
+        assert insert[3] == expected_root
+        assert insert[5].hex() == chain.sign(
+            "2025_07", 3, expected_root.hex(), (b"\x01" * 32).hex()
+        )
+
+
+class TestSampling:
+    """Test continuous spot checks of the chain."""
+
+    @pytest.mark.asyncio
+    async def test_short_block_sample_falls_back_to_random_rows(self) -> None:
+        """Test a small trail is still sampled when no block is picked."""
+        ids = [uuid4() for _ in range(3)]
+        database = MagicMock()
+        database.fetch = AsyncMock(
+            side_effect=[[], [{"audit_log_id": audit_id} for audit_id in ids]]
+        )
+        chain = AuditChain(database, checkpoint_interval=60, signing_key="k" * 32)
+
+        assert (await chain.sample_leaves(20)).unwrap() == ids
+        assert "ORDER BY random()" in database.fetch.await_args.args[0]
+
+    @pytest.mark.asyncio
+    async def test_nothing_verified_is_inconclusive(self) -> None:
+        """Test an empty sample is not reported as full integrity."""
+        chain = MagicMock()
+        chain.sample_leaves = AsyncMock(return_value=Ok([]))
+        manager = ProcessingIntegrityManager(audit_logger=MagicMock(chain=chain))
+
+        result = await manager._verify_change_integrity()
+
+        assert result.total_changes_checked == 0
+        assert result.inconclusive
+        assert result.integrity_percentage == 0.0
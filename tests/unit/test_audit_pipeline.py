@@ -0,0 +1,281 @@
+"""Unit tests for the asynchronous audit-log pipeline."""
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import asyncpg
+import pytest
+
+from src.policy_core.compliance.audit_logger import (
+    AuditEventType,
+    ComplianceEvent,
+    RiskLevel,
+)
+from src.policy_core.compliance.audit_pipeline import (
+    AUDIT_LOG_COLUMNS,
+    DEAD_LETTER_FILE,
+    INSERT_AUDIT_LOGS,
+    INSERT_AUDIT_LOGS_IDEMPOTENT,
+    AuditPipeline,
+    AuditSpool,
+    event_to_copy_record,
+    insert_parameters,
+)
+from src.policy_core.core.database import Database
+
+
+def _event(risk: RiskLevel = RiskLevel.INFO, **kwargs: Any) -> ComplianceEvent:
+    return ComplianceEvent(
+        event_type=AuditEventType.DATA_ACCESS,
+        action="read_quote",
+        risk_level=risk,
+        **kwargs,
+    )
+
+
+def _database() -> tuple[MagicMock, MagicMock]:
+    conn = MagicMock()
+    conn.copy_records_to_table = AsyncMock()
+    conn.execute = AsyncMock()
+    conn.fetch = AsyncMock(return_value=[])
+    conn.fetchval = AsyncMock(return_value=0)
+    db = MagicMock()
+
+    @asynccontextmanager
+    async def transaction() -> Any:
+        yield conn
+
+    db.transaction = transaction
+    return db, conn
+
+
+class TestCopyRecord:
+    """Test event to COPY row conversion."""
+
+    def test_coerces_column_types(self) -> None:
+        """Test inet/uuid coercion and non-UUID resource ids."""
+        record = event_to_copy_record(
+            _event(ip_address="10.0.0.1", resource_id="CTRL-001", risk_score=0.333)
+        )
+        row = dict(zip(AUDIT_LOG_COLUMNS, record, strict=True))
+
+        assert str(row["ip_address"]) == "10.0.0.1"
+        assert row["resource_id"] is None
+        assert row["security_alerts"]["resource_ref"] == "CTRL-001"
+        assert str(row["risk_score"]) == "0.33"
+        assert row["resource_type"] == "system"
+
+
+class TestInsertParameters:
+    """Test the unnest() insert works with the pool's connection setup."""
+
+    @pytest.mark.asyncio
+    async def test_json_columns_bypass_registered_codec(self) -> None:
+        """Test no parameter is jsonb, so the text jsonb codec is never used."""
+        conn = MagicMock()
+        conn.set_type_codec = AsyncMock()
+        conn.execute = AsyncMock()
+        # The pool's own connection setup, minus the connection type check
+        init_connection = Database._init_connection.__wrapped__
+        await init_connection(Database.__new__(Database), conn)
+        codec = conn.set_type_codec.await_args
+        assert codec.args[0] == "jsonb"
+        # Text-format codecs cannot encode binary COPY or jsonb[] parameters
+        assert codec.kwargs.get("format", "text") == "text"
+        assert "jsonb[]" not in INSERT_AUDIT_LOGS
+
+        event = _event(resource_id="CTRL-001", error_details="timeout")
+        record = event_to_copy_record(event)
+        parameters = insert_parameters([record])
+        for column, values in zip(AUDIT_LOG_COLUMNS, parameters, strict=True):
+            if column in ("request_body", "security_alerts"):
+                original = record[AUDIT_LOG_COLUMNS.index(column)]
+                assert values == [
+                    None if original is None else json.dumps(original, default=str)
+                ]
+                if original is not None:
+                    assert codec.kwargs["decoder"](values[0]) == original
+            else:
+                assert values == [record[AUDIT_LOG_COLUMNS.index(column)]]
+
+
+class TestAuditSpool:
+    """Test the durable local spool."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_appends_share_fsync(self, tmp_path: Path) -> None:
+        """Test a burst of appends is group-committed."""
+        spool = AuditSpool(tmp_path, fsync_delay=0.01)
+        spool.open()
+
+        seqs = await asyncio.gather(*(spool.append(f'{{"n": {i}}}') for i in range(20)))
+
+        assert sorted(seqs) == list(range(1, 21))
+        assert spool.fsyncs < 20
+        spool.close()
+
+    @pytest.mark.asyncio
+    async def test_unwritten_events_survive_restart(self, tmp_path: Path) -> None:
+        """Test pending lines are recovered and written ones reclaimed."""
+        spool = AuditSpool(tmp_path, fsync_delay=0)
+        spool.open()
+        first = await spool.append("a")
+        await spool.append("b")
+        spool.mark_written([first])
+        spool.close()
+
+        lines, paths = AuditSpool(tmp_path).recover()
+
+        assert lines == ["a", "b"]
+        assert len(paths) == 1
+
+    @pytest.mark.asyncio
+    async def test_segment_truncated_when_fully_written(self, tmp_path: Path) -> None:
+        """Test nothing is left to replay once every event is in the database."""
+        spool = AuditSpool(tmp_path, fsync_delay=0)
+        spool.open()
+        seq = await spool.append("a")
+        spool.mark_written([seq])
+        spool.close()
+
+        assert AuditSpool(tmp_path).recover() == ([], [])
+
+    @pytest.mark.asyncio
+    async def test_live_segments_are_not_recovered(self, tmp_path: Path) -> None:
+        """Test a starting worker leaves a running sibling's segment alone."""
+        sibling = AuditSpool(tmp_path, fsync_delay=0)
+        sibling.open()
+        await sibling.append("live")
+
+        starting = AuditSpool(tmp_path)
+        assert starting.recover() == ([], [])
+        starting.release_recovered(replayed=True)
+        assert await sibling.append("still here") == 2
+
+        # Once the sibling exits its pending lines are fair game
+        sibling.close()
+        lines, paths = starting.recover()
+        assert lines == ["live", "still here"]
+        assert AuditSpool(tmp_path).recover() == ([], [])
+        starting.release_recovered(replayed=True)
+        assert not paths[0].exists()
+
+
+class TestAuditPipeline:
+    """Test buffering, backpressure and batch writes."""
+
+    @pytest.mark.asyncio
+    async def test_low_risk_events_shed_when_full(self, tmp_path: Path) -> None:
+        """Test the buffer bound drops low-risk events and counts them."""
+        db, _ = _database()
+        pipeline = AuditPipeline(
+            db, AuditSpool(tmp_path), batch_size=100, flush_interval=60, capacity=2
+        )
+
+        accepted = [pipeline.submit(_event()) for _ in range(3)]
+        metrics = pipeline.metrics()
+
+        assert accepted == [True, True, False]
+        assert metrics.dropped_total == 1
+        assert metrics.queue_depth == 2
+        await pipeline.close()
+
+    @pytest.mark.asyncio
+    async def test_flush_inserts_batch_and_clears_spool(self, tmp_path: Path) -> None:
+        """Test a flush inserts the batch at once and reclaims spooled events."""
+        db, conn = _database()
+        spool = AuditSpool(tmp_path, fsync_delay=0)
+        pipeline = AuditPipeline(db, spool, batch_size=10, flush_interval=60)
+
+        await pipeline.submit_durable(_event(RiskLevel.CRITICAL))
+        pipeline.submit(_event())
+        written = await pipeline.flush()
+
+        assert written == 2
+        inserts = [
+            call.args
+            for call in conn.execute.await_args_list
+            if call.args[0] == INSERT_AUDIT_LOGS
+        ]
+        assert len(inserts) == 1
+        assert all(len(values) == 2 for values in inserts[0][1:])
+        tables = [call.args[0] for call in conn.copy_records_to_table.await_args_list]
+        assert tables == ["audit_merkle_nodes"]
+        assert AuditSpool(tmp_path).recover()[0] == []
+        await pipeline.close()
+        assert AuditSpool(tmp_path).recover() == ([], [])
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_retried_idempotently(self, tmp_path: Path) -> None:
+        """Test a failed insert requeues the batch and retries via ON CONFLICT."""
+        db, conn = _database()
+        conn.execute.side_effect = [ConnectionError("down"), None, None]
+        pipeline = AuditPipeline(
+            db, AuditSpool(tmp_path), batch_size=10, flush_interval=60
+        )
+        pipeline.submit(_event())
+
+        with pytest.raises(ConnectionError):
+            await pipeline.flush()
+        assert pipeline.metrics().queue_depth == 1
+
+        assert await pipeline.flush() == 1
+        assert conn.fetch.await_args_list[0].args[0] == INSERT_AUDIT_LOGS_IDEMPOTENT
+        assert pipeline.metrics().flush_failures == 1
+        await pipeline.close()
+
+    @pytest.mark.asyncio
+    async def test_start_replays_spool(self, tmp_path: Path) -> None:
+        """Test events left in the spool are inserted on startup."""
+        spool = AuditSpool(tmp_path, fsync_delay=0)
+        spool.open()
+        await spool.append(_event(RiskLevel.HIGH).model_dump_json())
+        spool.close()
+
+        db, conn = _database()
+        pipeline = AuditPipeline(
+            db, AuditSpool(tmp_path), batch_size=10, flush_interval=60
+        )
+        await pipeline.start()
+
+        assert pipeline.metrics().replayed_total == 1
+        assert conn.fetch.await_args_list[0].args[0] == INSERT_AUDIT_LOGS_IDEMPOTENT
+        await pipeline.close()
+        assert AuditSpool(tmp_path).recover() == ([], [])
+
+    @pytest.mark.asyncio
+    async def test_rejected_rows_are_dead_lettered(self, tmp_path: Path) -> None:
+        """Test a row the database rejects does not hold up the rest."""
+        db, conn = _database()
+        bad_user = uuid4()
+
+        async def execute(query: str, *args: Any) -> None:
+            if query == INSERT_AUDIT_LOGS and bad_user in args[1]:
+                raise asyncpg.exceptions.ForeignKeyViolationError("user_id")
+
+        conn.execute.side_effect = execute
+        spool = AuditSpool(tmp_path, fsync_delay=0)
+        pipeline = AuditPipeline(db, spool, batch_size=10, flush_interval=60)
+        rejected = _event(RiskLevel.CRITICAL, user_id=bad_user)
+        await pipeline.submit_durable(rejected)
+        for _ in range(4):
+            pipeline.submit(_event())
+
+        assert await pipeline.flush() == 4
+        assert await pipeline.flush() == 0
+
+        metrics = pipeline.metrics()
+        assert metrics.dead_lettered_total == 1
+        assert metrics.flush_failures == 0
+        dead = (tmp_path / DEAD_LETTER_FILE).read_text().splitlines()
+        assert [ComplianceEvent.model_validate_json(line) for line in dead] == [
+            rejected
+        ]
+        await pipeline.close()
+        # The rejected event is not replayed from the spool
+        assert AuditSpool(tmp_path).recover() == ([], [])
@@ -0,0 +1,97 @@
+"""Unit tests for partition-pruned audit trail queries and maintenance."""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.policy_core.compliance.audit_logger import AuditLogger
+from src.policy_core.compliance.audit_partitions import AuditPartitionMaintenance
+from src.policy_core.core.pagination import KeysetCursor
+
+
+def _row(**overrides: object) -> dict[str, object]:
+    row: dict[str, object] = {
+        "id": uuid4(),
+        "created_at": datetime(2025, 7, 1, tzinfo=timezone.utc),
+        "user_id": None,
+        "ip_address": None,
+        "user_agent": None,
+        "action": "control_executed_SEC-001",
+        "resource_type": "compliance_control",
+        "resource_id": None,
+        "request_method": None,
+        "request_path": None,
+        "request_body": None,
+        "response_status": None,
+        "risk_score": Decimal("0.10"),
+        "security_alerts": {
+            "event_type": "control_execution",
+            "risk_level": "info",
+            "control_references": ["SEC-001"],
+            "resource_ref": "SEC-001",
+        },
+    }
+    row.update(overrides)
+    return row
+
+
+class TestAuditTrailQuery:
+    """Test the audit trail query is bounded and keyset-paged."""
+
+    @pytest.mark.asyncio
+    async def test_query_always_bounds_created_at(self) -> None:
+        """Test a missing start date falls back to the default window."""
+        db = MagicMock()
+        db.fetch = AsyncMock(return_value=[_row()])
+        end = datetime(2025, 7, 31, tzinfo=timezone.utc)
+
+        result = await AuditLogger(db).get_audit_trail(end_date=end, limit=10)
+
+        assert result.is_ok()
+        entry = result.ok_value[0]
+        assert entry.event_type == "control_execution"
+        assert entry.resource_id == "SEC-001"
+        assert entry.control_references == ["SEC-001"]
+
+        query, *params = db.fetch.await_args.args
+        assert "created_at >= $1" in query and "created_at <= $2" in query
+        assert "OFFSET" not in query
+        assert params[:2] == [end - timedelta(days=30), end]
+        assert params[-1] == 10
+
+    @pytest.mark.asyncio
+    async def test_cursor_narrows_upper_bound(self) -> None:
+        """Test the cursor both seeks and prunes newer partitions."""
+        db = MagicMock()
+        db.fetch = AsyncMock(return_value=[])
+        after = KeysetCursor(
+            created_at=datetime(2025, 6, 15, tzinfo=timezone.utc), id=uuid4()
+        )
+
+        await AuditLogger(db).get_audit_trail(control_id="SEC-001", after=after)
+
+        query, *params = db.fetch.await_args.args
+        assert "(created_at, id) < ($3, $4)" in query
+        assert params[1] == after.created_at
+        assert params[4] == {"control_references": ["SEC-001"]}
+
+
+class TestPartitionMaintenance:
+    """Test the partition maintenance job."""
+
+    @pytest.mark.asyncio
+    async def test_run_reports_created_and_archived(self) -> None:
+        """Test both SQL maintenance functions are invoked."""
+        db = MagicMock()
+        db.fetchval = AsyncMock(return_value=2)
+        db.fetch = AsyncMock(return_value=[{"name": "audit_logs_2018_01"}])
+
+        result = await AuditPartitionMaintenance(db).run()
+
+        assert result.is_ok()
+        assert result.ok_value.partitions_created == 2
+        assert result.ok_value.partitions_detached == ["audit_logs_2018_01"]
+        assert "ensure_audit_log_partitions" in db.fetchval.await_args.args[0]
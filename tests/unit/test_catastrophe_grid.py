@@ -0,0 +1,121 @@
+"""Unit tests for the catastrophe loading grid."""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from src.policy_core.services.rating import catastrophe
+from src.policy_core.services.rating.calculators import (
+    DwellingCharacteristics,
+    StatisticalRatingModels,
+)
+from src.policy_core.services.rating.catastrophe import (
+    CatastropheGrid,
+    CatGridFile,
+    get_catastrophe_grid,
+    reload_catastrophe_grid,
+    zip_index,
+)
+
+GRID = {
+    "version": "test.1",
+    "perils": {
+        "hurricane": {
+            "coverages": ["comprehensive", "collision"],
+            "zones": [
+                {"zip_from": "30000", "zip_to": "34999", "loading": 1.10},
+                # Carve-out: the later zone wins
+                {"zip_from": "33100", "zip_to": "33199", "loading": 1.30},
+            ],
+        },
+        "hail": {
+            "coverages": ["comprehensive"],
+            "zones": [{"zip_from": "33000", "zip_to": "33999", "loading": 1.05}],
+        },
+    },
+    "dwelling_modifiers": {"construction_type": {"masonry": 0.9}},
+}
+
+
+@pytest.fixture
+def grid() -> CatastropheGrid:
+    """Grid compiled from the test spec."""
+    return CatastropheGrid(CatGridFile.model_validate(GRID))
+
+
+class TestCatastropheGrid:
+    """Test compilation and lookups."""
+
+    def test_perils_stack_per_coverage(self, grid: CatastropheGrid) -> None:
+        """Test applicable perils multiply and overlapping zones override."""
+        assert grid.loading("33101", ["comprehensive"]) == pytest.approx(1.30 * 1.05)
+        assert grid.loading("33101-4321", ["collision"]) == pytest.approx(1.30)
+        assert grid.loading("33201", ["comprehensive"]) == pytest.approx(1.10 * 1.05)
+        assert grid.loading("34000", ["liability"]) == 1.0
+        assert grid.peril_loadings("90210") == {"hurricane": 1.0, "hail": 1.0}
+
+    def test_dwelling_modifiers(self, grid: CatastropheGrid) -> None:
+        """Test modifiers apply from models and dicts alike."""
+        masonry = DwellingCharacteristics(construction_type="masonry")
+        assert grid.loading("31000", ["collision"], masonry) == pytest.approx(0.99)
+        assert grid.dwelling_factor({"construction_type": "log_cabin"}) == 1.0
+
+    def test_vectorized_matches_scalar(self, grid: CatastropheGrid) -> None:
+        """Test batch lookups agree with one-at-a-time lookups."""
+        rng = np.random.default_rng(11)
+        zips = rng.integers(29000, 35000, 2000)
+        coverages = [["comprehensive"], ["collision"], ["liability"]]
+        picks = rng.integers(0, 3, 2000)
+        masks = np.stack([grid.peril_mask(coverages[i]) for i in picks])
+
+        batch = grid.loadings(zips, masks)
+        for zip5, pick, value in zip(zips[:200], picks[:200], batch[:200]):
+            assert value == pytest.approx(grid.loading(f"{zip5:05d}", coverages[pick]))
+
+    def test_invalid_inputs(self) -> None:
+        """Test bad ZIPs and inverted zones are rejected."""
+        with pytest.raises(ValueError):
+            zip_index("9021")
+        bad = json.loads(json.dumps(GRID))
+        bad["perils"]["hail"]["zones"][0]["zip_to"] = "32000"
+        with pytest.raises(ValidationError):
+            CatGridFile.model_validate(bad)
+
+
+class TestGridLoading:
+    """Test the global grid comes from the versioned data file."""
+
+    def test_reload_swaps_grid(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a new file takes effect without code changes."""
+        monkeypatch.setattr(catastrophe, "_catastrophe_grid", None)
+        assert get_catastrophe_grid().version == "2024.1"
+
+        path = tmp_path / "grid.json"
+        path.write_text(json.dumps(GRID))
+        reload_catastrophe_grid(path)
+
+        result = StatisticalRatingModels.calculate_catastrophe_loading(
+            zip_code="33101", coverage_types=["collision"]
+        )
+        assert result.unwrap() == pytest.approx(1.30)
+        assert StatisticalRatingModels.calculate_catastrophe_loading(
+            zip_code="ABCDE", coverage_types=["collision"]
+        ).is_err()
+
+    def test_bundled_grid_stacks_overlapping_zones(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test prefixes in two peril zones now get both loadings."""
+        monkeypatch.setattr(catastrophe, "_catastrophe_grid", None)
+        # Texas: hurricane and hail; Colorado: earthquake and wildfire
+        assert StatisticalRatingModels.calculate_catastrophe_loading(
+            "77001", ["comprehensive"]
+        ).unwrap() == pytest.approx(1.15 * 1.05)
+        assert StatisticalRatingModels.calculate_catastrophe_loading(
+            "80202", ["comprehensive"]
+        ).unwrap() == pytest.approx(1.08 * 1.06)
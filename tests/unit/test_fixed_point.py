@@ -0,0 +1,248 @@
+"""Unit tests for fixed-point premium arithmetic."""
+
+import random
+from decimal import ROUND_HALF_UP, Decimal, localcontext
+
+import numpy as np
+import pytest
+
+from src.policy_core.models.quote import (
+    CoverageSelection,
+    CoverageType,
+    DriverInfo,
+    VehicleInfo,
+)
+from src.policy_core.schemas.rating import CoverageRates
+from src.policy_core.services.rating.fixed_point import (
+    MICROCENTS_PER_DOLLAR,
+    decimal_to_microcents,
+    div_half_up,
+    factor_to_micro,
+    microcents_to_decimal,
+    round_to_cents,
+    round_to_cents_array,
+    scale_by_micro,
+    scale_by_micro_array,
+)
+from src.policy_core.services.rating.kernel import (
+    CustomerFacts,
+    RatingContext,
+    rate_quote,
+    rate_table,
+    rating_factors,
+)
+from src.policy_core.services.rating.state_rules import get_state_rule_book
+
+_CENT = Decimal("0.01")
+_MICRO = Decimal("0.000001")
+
+
+def _cents(value: Decimal) -> Decimal:
+    return value.quantize(_CENT, rounding=ROUND_HALF_UP)
+
+
+def _random_context(rng: random.Random) -> tuple[RatingContext, CoverageRates]:
+    rates = CoverageRates(
+        bodily_injury=Decimal(rng.randint(1, 99999)) / 10 ** rng.randint(1, 4),
+        property_damage=Decimal(rng.randint(1, 9999)) / 10 ** rng.randint(1, 3),
+        collision=Decimal(rng.randint(1, 9999)) / 10 ** rng.randint(1, 3),
+        comprehensive=Decimal(rng.randint(1, 9999)) / 10 ** rng.randint(1, 3),
+    )
+    coverages = [
+        CoverageSelection(
+            coverage_type=CoverageType.BODILY_INJURY,
+            limit=Decimal(rng.randint(25_000_00, 500_000_00)) / 100,
+            deductible=Decimal("0.00"),
+        )
+    ]
+    for coverage_type in (
+        CoverageType.PROPERTY_DAMAGE,
+        CoverageType.COLLISION,
+        CoverageType.COMPREHENSIVE,
+    ):
+        if rng.random() < 0.6:
+            coverages.append(
+                CoverageSelection(
+                    coverage_type=coverage_type,
+                    limit=Decimal(rng.randint(5_000_00, 100_000_00)) / 100,
+                    deductible=Decimal("500.00"),
+                )
+            )
+
+    drivers = []
+    for _ in range(rng.randint(1, 3)):
+        age = rng.randint(17, 85)
+        drivers.append(
+            DriverInfo(
+                first_name=rng.choice(["Ana", "Ben", "Cleo"]),
+                last_name="Test",
+                age=age,
+                years_licensed=rng.randint(1, age - 16),
+                violations_3_years=rng.choice([0, 0, 0, 1, 2]),
+                accidents_3_years=rng.choice([0, 0, 0, 1]),
+                good_student=age <= 25 and rng.random() < 0.5,
+                occupation=rng.choice([None, "military", "engineer"]),
+            )
+        )
+
+    state = rng.choice(["TX", "CA", "NY"])
+    return (
+        RatingContext(
+            state=state,
+            product_type="auto",
+            vehicle=VehicleInfo(
+                vin="1HGBH41JXMN109186",
+                year=rng.randint(2005, 2025),
+                make="Honda",
+                model="Accord",
+                usage="commute",
+                annual_mileage=rng.randint(1000, 30000),
+                garage_zip="75001",
+                anti_theft=rng.random() < 0.5,
+                safety_features=rng.sample(["abs", "airbags", "lane_assist"], 2),
+            ),
+            drivers=tuple(drivers),
+            coverages=tuple(coverages),
+            rates=rate_table(rates),
+            state_rules=get_state_rule_book().rules(state),
+            minimum_premium=rng.choice([0, 100, 500]) * MICROCENTS_PER_DOLLAR,
+            rating_year=2025,
+            territory_factor=rng.randint(700, 1500) / 1000,
+            credit_factor=rng.randint(700, 1300) / 1000,
+            claims_factor=rng.randint(800, 1300) / 1000,
+            customer=CustomerFacts(
+                active_policies=rng.randint(0, 2),
+                tenure_years=rng.randint(0, 12),
+                coverage_lapse=rng.random() < 0.2,
+            ),
+        ),
+        rates,
+    )
+
+
+def _decimal_reference(context: RatingContext, rates: CoverageRates) -> dict:
+    """The rating pipeline in Decimal with the composite at six decimals."""
+    # calculators.py lowers the process-wide precision to 10 digits
+    with localcontext() as ctx:
+        ctx.prec = 28
+        return _decimal_pipeline(context, rates)
+
+
+def _decimal_pipeline(context: RatingContext, rates: CoverageRates) -> dict:
+    premiums = {
+        c.coverage_type.value: c.limit * getattr(rates, c.coverage_type.value) / 1000
+        for c in context.coverages
+    }
+    base = sum(premiums.values(), Decimal("0"))
+    composite = Decimal(str(rating_factors(context).calculate_composite_factor()))
+    factored = base * composite.quantize(_MICRO, rounding=ROUND_HALF_UP)
+
+    # Same eligibility as the kernel; only the arithmetic is under test
+    rated = rate_quote(context).unwrap()
+    amounts = []
+    uncapped = []
+    for discount in rated.discounts:
+        pct = {
+            "multi_policy": Decimal(10),
+            "safe_driver": Decimal(15),
+            "good_student": Decimal(8),
+            "military": Decimal(5),
+        }.get(discount.discount_type.value)
+        if pct is None:
+            pct = Decimal(min(context.customer.tenure_years * 2, 20))
+        uncapped.append(pct)
+        amounts.append(_cents(factored * pct / 100))
+    total_pct = sum(uncapped, Decimal("0"))
+    if total_pct > 50:
+        amounts = [a * (Decimal(50) / total_pct) for a in amounts]
+    total_discount = sum(amounts, Decimal("0"))
+    surcharge = Decimal(sum(s.amount for s in rated.surcharges)) / MICROCENTS_PER_DOLLAR
+    minimum = Decimal(context.minimum_premium) / MICROCENTS_PER_DOLLAR
+
+    return {
+        "coverages": {name: _cents(p) for name, p in premiums.items()},
+        "base": _cents(base),
+        "discounts": [_cents(a) for a in amounts],
+        "total_discount": _cents(total_discount),
+        "total": _cents(max(factored - total_discount + surcharge, minimum)),
+    }
+
+
+class TestFixedPointHelpers:
+    """Test conversions and rounding points."""
+
+    def test_half_away_from_zero(self) -> None:
+        """Test integer rounding agrees with Decimal ROUND_HALF_UP."""
+        assert div_half_up(5, 2) == 3 and div_half_up(-5, 2) == -3
+        assert div_half_up(4, 3) == 1 and div_half_up(-4, 3) == -1
+        assert round_to_cents(1_500_000) == 2_000_000
+        assert round_to_cents(1_499_999) == 1_000_000
+        assert microcents_to_decimal(decimal_to_microcents(Decimal("12.345"))) == (
+            Decimal("12.35")
+        )
+        assert microcents_to_decimal(-1_500_000) == Decimal("-0.02")
+
+    def test_factor_float_drift_is_removed(self) -> None:
+        """Test a factor whose float sits just below a tie no longer loses a cent."""
+        composite = 0.95 * 1.05
+        assert repr(composite) == "0.9974999999999999"
+        assert factor_to_micro(composite) == 997_500
+
+        # 15% of $1000 at 0.9975 is exactly $149.625
+        factored = scale_by_micro(1000 * MICROCENTS_PER_DOLLAR, 997_500)
+        discount = round_to_cents(div_half_up(factored * 15, 100))
+        assert microcents_to_decimal(discount) == Decimal("149.63")
+
+        with localcontext() as ctx:
+            ctx.prec = 28
+            drifted = Decimal("1000") * Decimal(repr(composite)) * 15 / 100
+        assert _cents(drifted) == Decimal("149.62")
+
+    def test_arrays_match_scalars(self) -> None:
+        """Test the int64 batch path agrees with the scalar path."""
+        rng = np.random.default_rng(46)
+        # Premiums up to $10M and factors up to 10.0
+        amounts = rng.integers(0, 10**15, 5000, dtype=np.int64)
+        factors = rng.integers(0, 10**7, 5000, dtype=np.int64)
+
+        scaled = scale_by_micro_array(amounts, factors)
+        expected = [scale_by_micro(int(a), int(f)) for a, f in zip(amounts, factors)]
+        assert scaled.tolist() == expected
+        assert round_to_cents_array(scaled).tolist() == [
+            round_to_cents(v) for v in expected
+        ]
+
+
+class TestCentIdenticalCorpus:
+    """Test the fixed-point kernel prices to the cent like Decimal does."""
+
+    @pytest.mark.parametrize("seed", range(4))
+    def test_corpus(self, seed: int) -> None:
+        """Test premiums, discounts and totals agree across a random corpus."""
+        rng = random.Random(seed)
+        rated_quotes = 0
+        for _ in range(250):
+            context, rates = _random_context(rng)
+            rating = rate_quote(context)
+            if rating.is_err():
+                continue
+            rated_quotes += 1
+            rated = rating.unwrap()
+            reference = _decimal_reference(context, rates)
+
+            assert {
+                name: microcents_to_decimal(p)
+                for name, p in rated.coverage_premiums.items()
+            } == reference["coverages"]
+            assert microcents_to_decimal(rated.base_premium) == reference["base"]
+            assert [
+                microcents_to_decimal(d.amount) for d in rated.discounts
+            ] == reference["discounts"]
+            assert (
+                microcents_to_decimal(rated.total_discount)
+                == reference["total_discount"]
+            )
+            assert microcents_to_decimal(rated.total_premium) == reference["total"]
+
+        # The rest are refused by the discount business rule, as before
+        assert rated_quotes > 150
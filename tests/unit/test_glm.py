@@ -0,0 +1,155 @@
+"""Unit tests for compiled GLM scoring."""
+
+import math
+import time
+
+import numpy as np
+import pytest
+
+from src.policy_core.services.rating.calculators import (
+    FeaturesMetrics,
+    StatisticalRatingModels,
+)
+from src.policy_core.services.rating.glm import (
+    DEFAULT_MODEL_VERSION,
+    CompiledGLM,
+    GLMModelRegistry,
+    GLMModelSet,
+    build_feature_matrix,
+    get_glm_registry,
+)
+
+COEFFICIENTS = {
+    "intercept": -1.0,
+    "driver_age": 0.01,
+    "prior_claims": 0.3,
+    "credit_tier": 0.2,
+}
+
+
+class TestCompiledGLM:
+    """Test compilation and vectorized scoring."""
+
+    def test_feature_order_and_defaults(self) -> None:
+        """Test standard features come first and missing features default."""
+        model = CompiledGLM.compile("frequency", "v1", COEFFICIENTS)
+        assert model.feature_names == ("driver_age", "prior_claims", "credit_tier")
+
+        matrix = model.feature_matrix([{"prior_claims": 2}, FeaturesMetrics()])
+        # driver_age defaults to 30, unknown features to 0
+        assert matrix.tolist() == [[30.0, 2.0, 0.0], [30.0, 0.0, 0.0]]
+
+    def test_score_matches_scalar_formula(self) -> None:
+        """Test each row equals the textbook linear predictor and link."""
+        model = CompiledGLM.compile("frequency", "v1", COEFFICIENTS, link="logit")
+        rng = np.random.default_rng(3)
+        matrix = np.column_stack(
+            [
+                rng.uniform(16, 90, 1000),
+                rng.integers(0, 4, 1000),
+                rng.integers(0, 3, 1000),
+            ]
+        ).astype(np.float64)
+
+        scores = model.score(matrix)
+        for row, score in zip(matrix[:20], scores[:20]):
+            eta = -1.0 + 0.01 * row[0] + 0.3 * row[1] + 0.2 * row[2]
+            assert score == pytest.approx(max(0.1, 1 / (1 + math.exp(-eta))))
+
+    def test_bounds_and_invalid_link(self) -> None:
+        """Test factors are clipped and unknown links rejected at compile."""
+        model = CompiledGLM.compile("frequency", "v1", {"intercept": 5.0})
+        assert model.score(np.zeros((2, 0))).tolist() == [10.0, 10.0]
+        with pytest.raises(ValueError):
+            CompiledGLM.compile("frequency", "v1", COEFFICIENTS, link="probit")
+
+    @pytest.mark.slow
+    def test_batch_throughput(self) -> None:
+        """Test ten thousand risks score well within a rating budget."""
+        model_set = get_glm_registry().get()
+        risks = [
+            {"driver_age": 20 + i % 60, "prior_claims": i % 3} for i in range(10000)
+        ]
+        matrix = model_set.feature_matrix(risks)
+
+        start = time.perf_counter()
+        scores = model_set.score(matrix)
+        elapsed = time.perf_counter() - start
+
+        assert scores["pure_premium"].shape == (10000,)
+        assert elapsed < 0.05
+
+
+class TestGLMModelRegistry:
+    """Test versioned model sets."""
+
+    def test_default_set_and_versions(self) -> None:
+        """Test the default set is current and new versions take over."""
+        registry = GLMModelRegistry()
+        default = get_glm_registry().get(DEFAULT_MODEL_VERSION)
+        registry.register(default)
+        pure = CompiledGLM.compile("pure_premium", "v2", {"intercept": 0.0})
+        registry.register(GLMModelSet("v2", default.frequency, default.severity, pure))
+
+        assert registry.versions == [DEFAULT_MODEL_VERSION, "v2"]
+        assert registry.get().version == "v2"
+        matrix = registry.get().feature_matrix([{}])
+        assert registry.get().score(matrix)["pure_premium"].tolist() == [1.0]
+        with pytest.raises(KeyError):
+            registry.get("missing")
+
+    def test_set_scores_share_one_matrix(self) -> None:
+        """Test models with different features score from a shared matrix."""
+        frequency = CompiledGLM.compile(
+            "frequency", "v1", {"intercept": 0.0, "prior_claims": 0.5}
+        )
+        severity = CompiledGLM.compile(
+            "severity", "v1", {"intercept": 1.0, "vehicle_age": 0.1}, link="identity"
+        )
+        model_set = GLMModelSet("v1", frequency, severity)
+        matrix = model_set.feature_matrix([{"prior_claims": 2, "vehicle_age": 10}])
+
+        scores = model_set.score(matrix)
+        assert scores["frequency"][0] == pytest.approx(math.e)
+        assert scores["severity"][0] == pytest.approx(2.0)
+        assert scores["pure_premium"][0] == pytest.approx(2 * math.e)
+
+
+class TestStatisticalModelsUseCompiledGLM:
+    """Test the calculator entry points keep their results."""
+
+    def test_single_factor_matches_legacy_formula(self) -> None:
+        """Test the scalar API still ignores non-standard coefficients."""
+        result = StatisticalRatingModels.calculate_generalized_linear_model_factor(
+            {"driver_age": 40, "prior_claims": 1, "credit_tier": 3},
+            COEFFICIENTS,
+        )
+        assert result.unwrap() == pytest.approx(math.exp(-1.0 + 0.4 + 0.3))
+        assert StatisticalRatingModels.calculate_generalized_linear_model_factor(
+            {"driver_age": 40}, COEFFICIENTS, link_function="probit"
+        ).is_err()
+
+    def test_frequency_severity_uses_registry(self) -> None:
+        """Test the frequency/severity model scores the default set."""
+        result = StatisticalRatingModels.calculate_frequency_severity_model(
+            {"age": 40, "prior_claims": 1},
+            {"age": 3, "value": 20000, "annual_mileage": 10000},
+            {"urban": True},
+        ).unwrap()
+
+        risk = {
+            "driver_age": 40,
+            "vehicle_age": 3,
+            "annual_mileage": 10000,
+            "urban_indicator": 1.0,
+            "prior_claims": 1,
+            "vehicle_value": 20000,
+            "vehicle_safety_score": 0.0,
+        }
+        model_set = get_glm_registry().get()
+        matrix = build_feature_matrix([risk], model_set.feature_names)
+        scores = model_set.score(matrix)
+        assert result.frequency_factor == pytest.approx(scores["frequency"][0])
+        assert result.pure_premium_factor == pytest.approx(
+            result.frequency_factor * result.severity_factor
+        )
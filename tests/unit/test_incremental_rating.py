@@ -0,0 +1,259 @@
+"""Unit tests for incremental re-rating from a persisted breakdown."""
+
+from datetime import date
+from decimal import Decimal
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from policy_core.core.cache import Cache
+from policy_core.core.database import Database
+from src.policy_core.core.result_types import Err, Ok
+from src.policy_core.models.quote import (
+    CoverageSelection,
+    CoverageType,
+    DriverInfo,
+    VehicleInfo,
+)
+from src.policy_core.schemas.rating import CoverageRates
+from src.policy_core.services import rating_engine as rating_engine_module
+from src.policy_core.services.rating import kernel
+from src.policy_core.services.rating.fixed_point import (
+    MICROCENTS_PER_DOLLAR,
+    microcents_to_decimal,
+)
+from src.policy_core.services.rating.kernel import (
+    CustomerFacts,
+    KernelRating,
+    RatingContext,
+    rate_quote,
+    rate_table,
+    stage_keys,
+)
+from src.policy_core.services.rating.rate_tables import RateTableService
+from src.policy_core.services.rating.state_rules import get_state_rule_book
+from src.policy_core.services.rating_engine import RatingBreakdown, RatingEngine
+
+
+def _coverage(coverage_type: CoverageType, limit: str) -> CoverageSelection:
+    return CoverageSelection(
+        coverage_type=coverage_type,
+        limit=Decimal(limit),
+        deductible=Decimal("500"),
+    )
+
+
+def _driver(first_name: str, age: int, **fields: Any) -> DriverInfo:
+    return DriverInfo(
+        first_name=first_name,
+        last_name="Doe",
+        age=age,
+        years_licensed=min(age - 16, 20),
+        **fields,
+    )
+
+
+def _context(**overrides: Any) -> RatingContext:
+    values: dict[str, Any] = {
+        "state": "TX",
+        "product_type": "auto",
+        "vehicle": VehicleInfo(
+            vin="1HGBH41JXMN109186",
+            year=2020,
+            make="Honda",
+            model="Accord",
+            usage="commute",
+            annual_mileage=12000,
+            garage_zip="75001",
+        ),
+        "drivers": (_driver("Jane", 40),),
+        "coverages": (
+            _coverage(CoverageType.BODILY_INJURY, "100000"),
+            _coverage(CoverageType.PROPERTY_DAMAGE, "50000"),
+        ),
+        "rates": rate_table(
+            CoverageRates(
+                bodily_injury=Decimal("5.1234"), property_damage=Decimal("3.3")
+            )
+        ),
+        "state_rules": get_state_rule_book().rules("TX"),
+        "minimum_premium": 100 * MICROCENTS_PER_DOLLAR,
+        "rating_year": date.today().year,
+        "territory_factor": 1.17,
+        "credit_factor": 0.93,
+        "customer": CustomerFacts(active_policies=1, tenure_years=3),
+    }
+    values.update(overrides)
+    return RatingContext(**values)
+
+
+def _plain(rating: KernelRating) -> KernelRating:
+    return rating._replace(violations=[v.to_dict() for v in rating.violations])
+
+
+EDITS: dict[str, dict[str, Any]] = {
+    "limit": {
+        "coverages": (
+            _coverage(CoverageType.BODILY_INJURY, "250000"),
+            _coverage(CoverageType.PROPERTY_DAMAGE, "50000"),
+        )
+    },
+    "driver": {
+        "drivers": (
+            _driver("Jane", 40),
+            _driver("Sam", 19, good_student=True, violations_3_years=1),
+        )
+    },
+    "customer": {"customer": CustomerFacts(active_policies=0, coverage_lapse=True)},
+    "territory": {"territory_factor": 1.4},
+}
+
+
+class TestStagedRating:
+    """Test re-rating from stages equals a full rating."""
+
+    @pytest.mark.parametrize("edit", sorted(EDITS))
+    def test_identical_to_full_rating(self, edit: str) -> None:
+        """Test every kind of edit re-rates to exactly the full result."""
+        previous = rate_quote(_context()).unwrap().stages
+        edited = _context(**EDITS[edit])
+
+        incremental = rate_quote(edited, previous).unwrap()
+        assert _plain(incremental) == _plain(rate_quote(edited).unwrap())
+
+    def test_only_invalidated_stages_recompute(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a limit change reuses the factors and discount stages."""
+        previous = rate_quote(_context()).unwrap().stages
+        edited = _context(**EDITS["limit"])
+
+        changed = {
+            stage
+            for stage, key in stage_keys(edited).items()
+            if previous.keys[stage] != key
+        }
+        assert changed == {"coverage_premiums"}
+
+        def recomputed(*args: Any) -> None:
+            raise AssertionError("stage recomputed")
+
+        monkeypatch.setattr(kernel, "rating_factors", recomputed)
+        monkeypatch.setattr(kernel, "discount_schedule", recomputed)
+        monkeypatch.setattr(kernel, "surcharges", recomputed)
+        assert rate_quote(edited, previous).is_ok()
+
+
+class TestEngineRerating:
+    """Test the engine persists breakdowns and re-rates from them."""
+
+    @staticmethod
+    def _engine(context: RatingContext) -> RatingEngine:
+        cache = MagicMock()
+        cache.get = AsyncMock(return_value=None)
+        cache.set = AsyncMock(return_value=True)
+        engine = RatingEngine(MagicMock(), cache)
+        engine._state_rules = get_state_rule_book().compiled()
+        engine._load_context = AsyncMock(return_value=Ok(context))
+        return engine
+
+    @staticmethod
+    async def _rate(
+        engine: RatingEngine,
+        context: RatingContext,
+        previous: RatingBreakdown | None = None,
+    ) -> Any:
+        return await engine.calculate_premium(
+            state=context.state,
+            product_type=context.product_type,
+            vehicle_info=context.vehicle,
+            drivers=list(context.drivers),
+            coverage_selections=list(context.coverages),
+            previous=previous,
+        )
+
+    @pytest.mark.asyncio
+    async def test_rerate_skips_loading(self) -> None:
+        """Test an edited quote re-rates from its breakdown without I/O."""
+        original = _context()
+        engine = self._engine(original)
+        breakdown = (await self._rate(engine, original)).unwrap().breakdown
+        # Persisted as JSONB and read back
+        restored = RatingBreakdown.model_validate(breakdown.model_dump(mode="json"))
+        assert restored == breakdown
+
+        edited = _context(**EDITS["driver"])
+        engine._load_context = AsyncMock(side_effect=AssertionError("reloaded"))
+        result = (await self._rate(engine, edited, restored)).unwrap()
+
+        full = rate_quote(edited).unwrap()
+        assert result.total_premium == microcents_to_decimal(full.total_premium)
+        assert result.breakdown.stage_keys == stage_keys(edited)
+
+    @pytest.mark.asyncio
+    async def test_stale_breakdown_reloads(self) -> None:
+        """Test a breakdown for other facts or an old release is not reused."""
+        original = _context()
+        engine = self._engine(original)
+        breakdown = (await self._rate(engine, original)).unwrap().breakdown
+
+        moved = original._replace(
+            vehicle=original.vehicle.model_copy(update={"garage_zip": "73301"})
+        )
+        await self._rate(engine, moved, breakdown)
+        await self._rate(engine, original, breakdown.model_copy(update={"version": 99}))
+        assert engine._load_context.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_rate_change_retires_breakdowns(self) -> None:
+        """Test a breakdown rated before a rate table change is not reused."""
+        original = _context()
+        engine = self._engine(original)
+        cached: dict[str, Any] = {}
+        engine._cache.get = AsyncMock(side_effect=cached.get)
+        breakdown = (await self._rate(engine, original)).unwrap().breakdown
+
+        cache = MagicMock(spec=Cache)
+        cache.delete = AsyncMock()
+        cache.set = AsyncMock(
+            side_effect=lambda key, value, ttl: cached.update({key: value})
+        )
+        await RateTableService(MagicMock(spec=Database), cache)._invalidate_rate_cache(
+            "CA_auto_base_rates"
+        )
+
+        await self._rate(engine, original, breakdown)
+        assert engine._load_context.await_count == 2
+        # The breakdown rated under the new generation is reusable again
+        fresh = (await self._rate(engine, original)).unwrap().breakdown
+        await self._rate(engine, original, fresh)
+        assert engine._load_context.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_verification_mode(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test verification reloads, logs a difference and keeps the full rating."""
+        monkeypatch.setattr(
+            rating_engine_module,
+            "get_settings",
+            lambda: MagicMock(
+                rating_verify_incremental=True, rating_breakdown_ttl_seconds=3600
+            ),
+        )
+        logger = MagicMock()
+        monkeypatch.setattr(rating_engine_module, "logger", logger)
+        original = _context()
+        engine = self._engine(original)
+        breakdown = (await self._rate(engine, original)).unwrap().breakdown
+
+        # Facts that went stale in the database since the last rating
+        stale = breakdown.model_copy(update={"credit_factor": 1.2})
+        result = (await self._rate(engine, original, stale)).unwrap()
+
+        assert "differs from a full rating" in logger.error.call_args.args[0]
+        assert result.breakdown.credit_factor == 0.93
+        assert result.total_premium == microcents_to_decimal(
+            rate_quote(original).unwrap().total_premium
+        )
+        engine._load_context = AsyncMock(return_value=Err("database down"))
+        assert (await self._rate(engine, original, breakdown)).is_err()
@@ -0,0 +1,283 @@
+"""Unit tests for cached OAuth2 token introspection."""
+
+import asyncio
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from fakeredis import aioredis
+from fastapi import FastAPI
+
+from src.policy_core.api.v1 import oauth2 as oauth2_api
+from src.policy_core.core.auth.oauth2 import (
+    introspection_cache,
+    refresh_tokens,
+    token_verifier,
+)
+from src.policy_core.core.auth.oauth2 import server as server_module
+from src.policy_core.core.auth.oauth2.introspection_cache import (
+    IntrospectionCache,
+    token_digest,
+)
+from src.policy_core.core.auth.oauth2.refresh_tokens import RefreshTokenWriter
+from src.policy_core.core.auth.oauth2.server import OAuth2Server
+from src.policy_core.core.auth.oauth2.signing_keys import get_signing_key_ring
+from src.policy_core.core.auth.oauth2.token_verifier import TokenVerifier
+from src.policy_core.core.cache import Cache
+from src.policy_core.core.config import get_settings
+from src.policy_core.core.database import Database
+
+
+@pytest.fixture
+def redis() -> aioredis.FakeRedis:
+    """In-memory Redis shared by the cache and the revocation publisher."""
+    return aioredis.FakeRedis(decode_responses=True)
+
+
+@pytest.fixture
+def cache(redis: aioredis.FakeRedis) -> Cache:
+    """Cache backed by the in-memory Redis."""
+    return Cache(redis)
+
+
+@pytest.fixture
+def responses(
+    monkeypatch: pytest.MonkeyPatch, redis: aioredis.FakeRedis
+) -> IntrospectionCache:
+    """Give each test fresh singletons and route revocations to fakeredis."""
+    fresh = IntrospectionCache(ttl_seconds=60, negative_ttl_seconds=10)
+    monkeypatch.setattr(introspection_cache, "_introspection_cache", fresh)
+    monkeypatch.setattr(token_verifier, "_token_verifier", TokenVerifier())
+    monkeypatch.setattr(
+        refresh_tokens, "_refresh_token_writer", RefreshTokenWriter(max_batch=100)
+    )
+    monkeypatch.setattr(server_module, "get_redis_client", lambda: redis)
+    return fresh
+
+
+def _database(refresh_rows: list[dict] | None = None) -> MagicMock:
+    db = MagicMock(spec=Database)
+    db.fetchrow = AsyncMock(return_value=None)
+    db.fetch = AsyncMock(return_value=refresh_rows or [])
+    db.execute = AsyncMock(return_value="UPDATE 1")
+    return db
+
+
+def _access_token(lifetime: int = 900) -> str:
+    now = int(time.time())
+    return get_signing_key_ring().sign(
+        {
+            "sub": str(uuid.uuid4()),
+            "client_id": "svc",
+            "scope": "quote:read",
+            "iat": now,
+            "exp": now + lifetime,
+            "jti": uuid.uuid4().hex,
+        }
+    )
+
+
+def _refresh_row(token: str, revoked: bool = False) -> dict:
+    now = datetime.now(timezone.utc)
+    return {
+        "token_hash": token_digest(token),
+        "client_id": "svc",
+        "user_id": uuid.uuid4(),
+        "scopes": ["quote:read"],
+        "expires_at": now + timedelta(days=30),
+        "created_at": now,
+        "revoked_at": now if revoked else None,
+    }
+
+
+class TestIntrospectionCache:
+    """Test TTL handling of the response cache itself."""
+
+    def test_active_ttl_capped_by_token_expiry(self) -> None:
+        """Test an active response never outlives the token's exp."""
+        responses = IntrospectionCache(ttl_seconds=60, negative_ttl_seconds=10)
+        responses.put("a", {"active": True, "exp": time.time() - 1})
+        responses.put("b", {"active": True, "exp": time.time() + 30})
+
+        assert responses.get("a") is None
+        assert responses.get("b") == {
+            "active": True,
+            "exp": pytest.approx(time.time() + 30, abs=1),
+        }
+
+    def test_inactive_responses_use_negative_ttl(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test inactive responses expire after the negative TTL."""
+        responses = IntrospectionCache(ttl_seconds=60, negative_ttl_seconds=10)
+        responses.put("gone", {"active": False})
+        assert responses.get("gone") == {"active": False}
+
+        later = time.monotonic() + 11
+        monkeypatch.setattr(introspection_cache.time, "monotonic", lambda: later)
+        assert responses.get("gone") is None
+
+    def test_invalidate_all(self) -> None:
+        """Test the wildcard evicts every entry."""
+        responses = IntrospectionCache(ttl_seconds=60, negative_ttl_seconds=10)
+        responses.put("a", {"active": False})
+        responses.put("b", {"active": False})
+
+        responses.invalidate("*")
+
+        assert responses.get("a") is None and responses.get("b") is None
+
+
+class TestCachedIntrospection:
+    """Test OAuth2Server.introspect goes through the cache."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_token_hit_skips_database(
+        self, cache: Cache, responses: IntrospectionCache
+    ) -> None:
+        """Test a second introspection of a refresh token does not query."""
+        token = "opaque-refresh-token"
+        db = _database([_refresh_row(token)])
+        server = OAuth2Server(db, cache, get_settings())
+
+        first = await server.introspect(token)
+        second = await server.introspect(token)
+
+        assert first["active"] and first["token_type"] == "refresh_token"
+        assert second == first
+        assert db.fetch.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_token_cached_negatively(
+        self, cache: Cache, responses: IntrospectionCache
+    ) -> None:
+        """Test repeated introspection of garbage costs one lookup."""
+        db = _database()
+        server = OAuth2Server(db, cache, get_settings())
+
+        for _ in range(5):
+            assert await server.introspect("not-a-token") == {"active": False}
+
+        assert db.fetch.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_revoking_access_token_invalidates(
+        self, cache: Cache, responses: IntrospectionCache
+    ) -> None:
+        """Test an access token reads inactive right after revocation."""
+        server = OAuth2Server(_database(), cache, get_settings())
+        token = _access_token()
+
+        assert (await server.introspect(token))["active"] is True
+        assert (await server.revoke(token)).is_ok()
+
+        assert await server.introspect(token) == {"active": False}
+
+    @pytest.mark.asyncio
+    async def test_revocation_from_another_worker_is_honoured(
+        self, cache: Cache, responses: IntrospectionCache
+    ) -> None:
+        """Test a jti revoked elsewhere is not served from the cache."""
+        server = OAuth2Server(_database(), cache, get_settings())
+        token = _access_token()
+        assert (await server.introspect(token))["active"] is True
+
+        claims = get_signing_key_ring().decode(token)
+        token_verifier.get_token_verifier().mark_revoked(
+            claims["jti"], float(claims["exp"])
+        )
+
+        assert responses.get(token_digest(token)) is None
+
+    @pytest.mark.asyncio
+    async def test_revoking_refresh_token_invalidates(
+        self, cache: Cache, responses: IntrospectionCache
+    ) -> None:
+        """Test _revoke_refresh_token evicts the cached response."""
+        token = "opaque-refresh-token"
+        db = _database([_refresh_row(token)])
+        db.fetchrow = AsyncMock(return_value=_refresh_row(token))
+        server = OAuth2Server(db, cache, get_settings())
+
+        assert (await server.introspect(token))["active"] is True
+        assert (await server.revoke(token)).is_ok()
+
+        db.fetch = AsyncMock(return_value=[_refresh_row(token, revoked=True)])
+        assert await server.introspect(token) == {"active": False}
+
+
+class TestBatchIntrospection:
+    """Test OAuth2Server.introspect_many."""
+
+    @pytest.mark.asyncio
+    async def test_results_keep_request_order(
+        self, cache: Cache, responses: IntrospectionCache
+    ) -> None:
+        """Test mixed tokens come back in order with one refresh query."""
+        access = _access_token()
+        live, revoked = "refresh-live", "refresh-revoked"
+        db = _database([_refresh_row(revoked, revoked=True), _refresh_row(live)])
+        server = OAuth2Server(db, cache, get_settings())
+
+        results = await server.introspect_many([live, "junk", access, revoked])
+
+        assert [r["active"] for r in results] == [True, False, True, False]
+        assert results[0]["token_type"] == "refresh_token"
+        assert results[2]["token_type"] == "access_token"
+        assert db.fetch.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_endpoint_rejects_oversized_batch(
+        self, cache: Cache, responses: IntrospectionCache
+    ) -> None:
+        """Test the batch endpoint caps the number of tokens."""
+        server = OAuth2Server(_database(), cache, get_settings())
+        async with _client(server) as client:
+            response = await client.post(
+                "/oauth2/introspect/batch", json={"tokens": ["t"] * 101}
+            )
+        assert response.status_code == 422
+
+
+def _client(server: OAuth2Server) -> httpx.AsyncClient:
+    app = FastAPI()
+    app.include_router(oauth2_api.router)
+    app.dependency_overrides[oauth2_api.get_oauth2_server] = lambda: server
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    )
+
+
+class TestIntrospectionLatency:
+    """Latency of cached introspection through the HTTP endpoint."""
+
+    @pytest.mark.benchmark
+    def test_cached_introspection_performance(
+        self, cache: Cache, responses: IntrospectionCache, benchmark: Any
+    ) -> None:
+        """Test cached introspection stays well under a millisecond budget."""
+        token = "opaque-refresh-token"
+        db = _database([_refresh_row(token)])
+        server = OAuth2Server(db, cache, get_settings())
+        client = _client(server)
+        loop = asyncio.new_event_loop()
+
+        def introspect() -> None:
+            response = loop.run_until_complete(
+                client.post("/oauth2/introspect", data={"token": token})
+            )
+            assert response.json()["active"] is True
+
+        try:
+            benchmark.pedantic(introspect, rounds=500, iterations=1)
+        finally:
+            loop.run_until_complete(client.aclose())
+            loop.close()
+
+        assert db.fetch.await_count == 1
+        # Generous for CI; the in-process path itself is a dict lookup
+        assert benchmark.stats["mean"] < 0.005
@@ -0,0 +1,211 @@
+"""Unit tests for the offline IP intelligence index."""
+
+import os
+import timeit
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.policy_core.core.auth.mfa.ip_intel import (
+    FLAG_TOR,
+    FLAG_VPN,
+    IPIntelIndex,
+    IPRange,
+    build_ip_intel_index,
+    distance_km,
+    load_ip_ranges_csv,
+)
+
+RANGES = [
+    IPRange(
+        cidr="8.8.8.0/24",
+        country="US",
+        city="Mountain View",
+        latitude=37.386,
+        longitude=-122.084,
+        asn=15169,
+    ),
+    IPRange(cidr="185.220.101.0/24", country="DE", city="Berlin", flags=FLAG_TOR),
+    IPRange(cidr="45.0.0.0/16", country="NL", city="Amsterdam", flags=FLAG_VPN),
+    IPRange(cidr="2001:db8::/32", country="JP", city="Tokyo", asn=64500),
+]
+
+
+@pytest.fixture
+def index_path(tmp_path: Path) -> Path:
+    """Write the sample ranges to an index file."""
+    path = tmp_path / "ip_intel.bin"
+    assert build_ip_intel_index(RANGES, path).unwrap() == 4
+    return path
+
+
+class TestIPIntelIndex:
+    """Test range lookups against the memory-mapped table."""
+
+    def test_lookups(self, index_path: Path) -> None:
+        """Test v4/v6 hits, range edges and misses."""
+        index = IPIntelIndex(str(index_path), reload_seconds=60)
+        assert index.reload_if_changed().unwrap() is True
+
+        assert index.lookup("8.8.8.8").asn == 15169
+        assert index.lookup("8.8.8.255").city == "Mountain View"
+        assert index.lookup("8.8.9.0") is None
+        assert index.lookup("185.220.101.7").is_tor
+        assert index.lookup("45.0.200.1").is_vpn
+        assert index.lookup("2001:db8::1").country == "JP"
+        assert index.lookup("2001:db9::1") is None
+        assert index.lookup("not-an-ip") is None
+
+    def test_reload_swaps_atomically(self, index_path: Path) -> None:
+        """Test a replaced file is picked up and an unchanged one is not."""
+        index = IPIntelIndex(str(index_path), reload_seconds=60)
+        index.reload_if_changed()
+        assert index.reload_if_changed().unwrap() is False
+
+        build_ip_intel_index(
+            [IPRange(cidr="8.8.8.0/24", country="US", city="Ashburn")], index_path
+        )
+        os.utime(index_path, ns=(1, 1))
+
+        assert index.reload_if_changed().unwrap() is True
+        assert index.lookup("8.8.8.8").city == "Ashburn"
+        assert index.lookup("185.220.101.7") is None
+
+    def test_overlaps_rejected(self, tmp_path: Path) -> None:
+        """Test overlapping ranges cannot be written."""
+        result = build_ip_intel_index(
+            [IPRange(cidr="10.0.0.0/8"), IPRange(cidr="10.1.0.0/16")],
+            tmp_path / "bad.bin",
+        )
+
+        assert result.is_err()
+
+    def test_csv_source(self, tmp_path: Path) -> None:
+        """Test ranges and flag lists are read from CSV."""
+        source = tmp_path / "ranges.csv"
+        source.write_text(
+            "cidr,country,city,latitude,longitude,asn,flags\n"
+            "1.2.3.0/24,AU,Sydney,-33.87,151.21,13335,vpn|tor\n"
+        )
+
+        (row,) = load_ip_ranges_csv(source).unwrap()
+
+        assert row.flags == FLAG_VPN | FLAG_TOR
+        assert row.country == "AU"
+        assert row.latitude == -33.87
+
+        source.write_text(
+            "cidr,country,city,latitude,longitude,asn,flags\n" "1.2.3.0/24,AU,,,,,\n"
+        )
+        (row,) = load_ip_ranges_csv(source).unwrap()
+        assert row.latitude is None and row.longitude is None
+
+    def test_lookup_takes_microseconds(self, index_path: Path) -> None:
+        """Test a lookup stays well under 50 microseconds."""
+        index = IPIntelIndex(str(index_path), reload_seconds=60)
+        index.reload_if_changed()
+
+        per_call = min(
+            timeit.repeat(lambda: index.lookup("8.8.8.8"), number=2000, repeat=5)
+        )
+
+        assert per_call / 2000 < 50e-6
+
+
+class TestDistance:
+    """Test the memoized great-circle distance."""
+
+    def test_known_distance_and_symmetry(self) -> None:
+        """Test New York to London is about 5570 km either way."""
+        there = distance_km(40.7128, -74.0060, 51.5074, -0.1278)
+
+        assert 5500 < there < 5650
+        assert distance_km(51.5074, -0.1278, 40.7128, -74.0060) == there
+        assert distance_km(1.0, 1.0, 1.0, 1.0) == 0.0
+
+
+class TestRiskEngineSignals:
+    """Test the risk engine reads network signals from the index."""
+
+    def test_tor_and_vpn_flags(
+        self, index_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test flagged ranges drive the network factors."""
+        from src.policy_core.core.auth.mfa import ip_intel
+        from src.policy_core.core.auth.mfa.risk_engine import RiskEngine
+        from src.policy_core.core.config import get_settings
+
+        index = IPIntelIndex(str(index_path), reload_seconds=60)
+        index.reload_if_changed()
+        monkeypatch.setattr(ip_intel, "_ip_intel_index", index)
+        engine = RiskEngine(None, None, get_settings())  # type: ignore[arg-type]
+
+        assert engine._assess_network_risk("185.220.101.7") == {"tor_network": 0.9}
+        assert engine._assess_network_risk("45.0.1.1") == {"vpn_proxy": 0.6}
+        assert engine._get_location_from_ip("8.8.8.8")["city"] == "Mountain View"
+
+    @pytest.mark.asyncio
+    async def test_uncovered_address_is_not_travel(
+        self, index_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test an unknown location neither flags travel nor replaces the last."""
+        from src.policy_core.core.auth.mfa import ip_intel
+        from src.policy_core.core.auth.mfa.risk_engine import RiskEngine
+        from src.policy_core.core.config import get_settings
+
+        index = IPIntelIndex(str(index_path), reload_seconds=60)
+        index.reload_if_changed()
+        monkeypatch.setattr(ip_intel, "_ip_intel_index", index)
+        stored: dict[str, Any] = {}
+        cache = MagicMock()
+        cache.get = AsyncMock(side_effect=stored.get)
+        cache.set = AsyncMock(
+            side_effect=lambda key, value, ttl: stored.__setitem__(key, value)
+        )
+        engine = RiskEngine(None, cache, get_settings())  # type: ignore[arg-type]
+
+        assert await engine._assess_location_risk("u1", "8.8.8.8") == {
+            "new_location": 0.6
+        }
+        for uncovered in ("10.0.0.1", "2001:db9::1"):
+            assert await engine._assess_location_risk("u1", uncovered) == {}
+        assert stored["last_location:u1"]["location"]["city"] == "Mountain View"
+        assert engine._get_location_from_ip("10.0.0.1") is None
+
+    @pytest.mark.asyncio
+    async def test_ranges_without_coordinates_are_not_travel(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test country-only and flag-only ranges never flag travel."""
+        from src.policy_core.core.auth.mfa import ip_intel
+        from src.policy_core.core.auth.mfa.risk_engine import RiskEngine
+        from src.policy_core.core.config import get_settings
+
+        path = tmp_path / "ip_intel.bin"
+        build_ip_intel_index(
+            [
+                RANGES[0],
+                IPRange(cidr="9.9.9.0/24", country="US"),
+                IPRange(cidr="45.0.0.0/16", flags=FLAG_VPN),
+            ],
+            path,
+        ).unwrap()
+        index = IPIntelIndex(str(path), reload_seconds=60)
+        index.reload_if_changed()
+        assert index.lookup("9.9.9.9").latitude is None
+        monkeypatch.setattr(ip_intel, "_ip_intel_index", index)
+        stored: dict[str, Any] = {}
+        cache = MagicMock()
+        cache.get = AsyncMock(side_effect=stored.get)
+        cache.set = AsyncMock(
+            side_effect=lambda key, value, ttl: stored.__setitem__(key, value)
+        )
+        engine = RiskEngine(None, cache, get_settings())  # type: ignore[arg-type]
+
+        assert await engine._assess_location_risk("u1", "8.8.8.8") == {
+            "new_location": 0.6
+        }
+        for located in ("9.9.9.9", "45.0.1.1", "8.8.8.8"):
+            assert await engine._assess_location_risk("u1", located) == {}
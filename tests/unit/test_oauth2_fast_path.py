@@ -0,0 +1,278 @@
+"""Unit tests for the OAuth2 token endpoint fast path."""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from fakeredis import aioredis
+
+from src.policy_core.core.auth.oauth2 import client_registry, refresh_tokens
+from src.policy_core.core.auth.oauth2.client_registry import OAuth2ClientRegistry
+from src.policy_core.core.auth.oauth2.refresh_tokens import (
+    RefreshTokenRecord,
+    RefreshTokenWriter,
+)
+from src.policy_core.core.auth.oauth2.server import OAuth2Server, pwd_context
+from src.policy_core.core.cache import Cache
+from src.policy_core.core.config import get_settings
+from src.policy_core.core.database import Database
+
+SECRET = "service-secret"
+
+
+@pytest.fixture
+def cache() -> Cache:
+    """Cache backed by an in-memory Redis."""
+    return Cache(aioredis.FakeRedis(decode_responses=True))
+
+
+@pytest.fixture
+def writer(monkeypatch: pytest.MonkeyPatch) -> RefreshTokenWriter:
+    """Give each test its own client registry and refresh token writer."""
+    monkeypatch.setattr(
+        client_registry, "_client_registry", OAuth2ClientRegistry(ttl_seconds=60)
+    )
+    fresh = RefreshTokenWriter(flush_interval_seconds=1, max_batch=100)
+    monkeypatch.setattr(refresh_tokens, "_refresh_token_writer", fresh)
+    return fresh
+
+
+def _database(row: dict | None = None) -> MagicMock:
+    db = MagicMock(spec=Database)
+    db.fetchrow = AsyncMock(return_value=row)
+    db.execute = AsyncMock(return_value="INSERT 0 1")
+    db.conn = MagicMock()
+    db.conn.fetch = AsyncMock(return_value=[])
+
+    @asynccontextmanager
+    async def transaction() -> Any:
+        yield db.conn
+
+    db.transaction = transaction
+    return db
+
+
+@pytest.fixture(scope="module")
+def client_row() -> dict:
+    """A confidential service client with client_credentials enabled."""
+    return {
+        "client_id": "svc",
+        "client_secret_hash": pwd_context.hash(SECRET),
+        "client_name": "Service",
+        "client_type": "confidential",
+        "redirect_uris": [],
+        "allowed_grant_types": ["client_credentials", "password"],
+        "allowed_scopes": ["quote:read"],
+        "token_lifetime": 900,
+    }
+
+
+class TestClientCredentialsFastPath:
+    """Test repeated client_credentials grants skip redundant work."""
+
+    @pytest.mark.asyncio
+    async def test_client_loaded_and_verified_once(
+        self, cache: Cache, writer: RefreshTokenWriter, client_row: dict
+    ) -> None:
+        """Test many tokens cost one client query and no refresh token writes."""
+        db = _database(client_row)
+        server = OAuth2Server(db, cache, get_settings())
+
+        for _ in range(20):
+            assert (await server.validate_client_rate_limit("svc")).is_ok()
+            result = await server.token(
+                "client_credentials", "svc", SECRET, scope="quote:read"
+            )
+            assert "refresh_token" not in result.unwrap()
+
+        assert db.fetchrow.await_count == 1
+        db.execute.assert_not_awaited()
+        assert writer.pending_count == 0
+
+    @pytest.mark.asyncio
+    async def test_wrong_secret_still_rejected(
+        self, cache: Cache, writer: RefreshTokenWriter, client_row: dict
+    ) -> None:
+        """Test the verified-secret cache only admits the verified secret."""
+        server = OAuth2Server(_database(client_row), cache, get_settings())
+        await server.token("client_credentials", "svc", SECRET, scope="quote:read")
+
+        result = await server.token(
+            "client_credentials", "svc", "guess", scope="quote:read"
+        )
+
+        assert result.unwrap_err() == "invalid_client"
+
+    @pytest.mark.asyncio
+    async def test_invalidation_reloads_client(
+        self, cache: Cache, writer: RefreshTokenWriter, client_row: dict
+    ) -> None:
+        """Test an evicted client is fetched again."""
+        db = _database(client_row)
+        server = OAuth2Server(db, cache, get_settings())
+        await server.validate_client_rate_limit("svc")
+
+        client_registry.get_client_registry().invalidate("svc")
+        await server.validate_client_rate_limit("svc")
+
+        assert db.fetchrow.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_window(self, cache: Cache) -> None:
+        """Test the pipelined counter increments and sets a TTL once."""
+        assert await cache.incr_window("window", 60) == 1
+        assert await cache.incr_window("window", 60) == 2
+        assert 0 < await cache._redis.ttl("window") <= 60
+
+
+class TestRefreshTokenWriter:
+    """Test refresh tokens are written behind with read-your-writes."""
+
+    def _token(self, token_hash: str = "abc") -> RefreshTokenRecord:
+        now = datetime.now(timezone.utc)
+        return RefreshTokenRecord(
+            token_hash=token_hash,
+            client_id="svc",
+            scopes=["quote:read", "policy:read"],
+            expires_at=now + timedelta(days=30),
+            created_at=now,
+        )
+
+    @pytest.mark.asyncio
+    async def test_visible_to_other_workers_before_flush(self, cache: Cache) -> None:
+        """Test a second writer sees the token through the Redis mirror."""
+        await RefreshTokenWriter(1, 100).record(cache, self._token())
+
+        found = await RefreshTokenWriter(1, 100).lookup(cache, "abc")
+
+        assert found is not None and found.client_id == "svc"
+        assert found.scopes == ["quote:read", "policy:read"]
+
+    @pytest.mark.asyncio
+    async def test_flush_is_one_statement(self, cache: Cache) -> None:
+        """Test buffered tokens go out in a single unnest() insert."""
+        writer = RefreshTokenWriter(1, 100)
+        await writer.record(cache, self._token())
+        await writer.record(cache, self._token().model_copy(update={"token_hash": "d"}))
+        db = _database()
+
+        assert (await writer.flush(db)).unwrap() == 2
+
+        db.conn.fetch.assert_awaited_once()
+        args = db.conn.fetch.await_args.args
+        assert "unnest" in args[0] and "ON CONFLICT" in args[0]
+        assert args[4] == ["quote:read policy:read"] * 2
+        assert writer.pending_count == 0
+
+    @pytest.mark.asyncio
+    async def test_orphaned_tokens_are_not_retried(self, cache: Cache) -> None:
+        """Test tokens of deleted clients or users are dropped, not requeued."""
+        writer = RefreshTokenWriter(1, 100)
+        await writer.record(cache, self._token())
+        await writer.record(cache, self._token("d"))
+        db = _database()
+        db.conn.fetch.return_value = [{"token_hash": "d"}]
+
+        assert (await writer.flush(db)).unwrap() == 2
+        assert writer.pending_count == 0
+        assert "oauth2_clients" in db.conn.fetch.await_args.args[0]
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_is_bounded(self, cache: Cache) -> None:
+        """Test a failed flush requeues tokens up to the buffer bound."""
+        writer = RefreshTokenWriter(1, max_batch=2, max_pending=3)
+        for token_hash in "abc":
+            await writer.record(cache, self._token(token_hash))
+        db = _database()
+        db.conn.fetch.side_effect = ConnectionError("down")
+
+        assert (await writer.flush(db)).is_err()
+        await writer.record(cache, self._token("d"))
+
+        assert writer.pending_count == 3
+        assert await writer.lookup(cache, "a") is not None  # still mirrored
+        assert "a" not in writer._pending
+        db.conn.fetch.side_effect = None
+        assert (await writer.flush(db)).unwrap() == 3
+        assert db.conn.fetch.await_args.args[1] == ["b", "c", "d"]
+
+    @pytest.mark.asyncio
+    async def test_password_grant_refresh_round_trip(
+        self,
+        cache: Cache,
+        writer: RefreshTokenWriter,
+        client_row: dict,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test an unflushed refresh token can be redeemed and is then revoked."""
+        db = _database(client_row)
+        server = OAuth2Server(db, cache, get_settings())
+        user_id = uuid4()
+        monkeypatch.setattr(
+            server, "_authenticate_user", AsyncMock(return_value=user_id)
+        )
+        issued = (
+            await server.token(
+                "password",
+                "svc",
+                SECRET,
+                scope="quote:read",
+                username="user",
+                password="pw",
+            )
+        ).unwrap()
+        db.execute.assert_not_awaited()
+
+        # The database has no row yet; the buffer answers
+        db.fetchrow = AsyncMock(return_value=None)
+        refreshed = await server.token(
+            "refresh_token", "svc", SECRET, refresh_token=issued["refresh_token"]
+        )
+
+        assert refreshed.is_ok()
+        assert "ON CONFLICT (token_hash) DO UPDATE" in db.execute.await_args.args[0]
+        assert writer.pending_count == 1
+
+
+class TestHasherOverload:
+    """Test a full hashing queue surfaces as 429, not an error or a 500."""
+
+    @pytest.mark.asyncio
+    async def test_busy_hasher_maps_to_429(
+        self,
+        cache: Cache,
+        writer: RefreshTokenWriter,
+        client_row: dict,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test token, introspect and revoke all report overload."""
+        from fastapi import Response
+
+        from src.policy_core.api.v1 import oauth2 as oauth2_api
+        from src.policy_core.core.auth.oauth2 import server as server_module
+
+        # The server and the API module may import the error by different paths
+        busy = server_module.PasswordHasherBusyError
+        hasher = MagicMock()
+        hasher.run = AsyncMock(side_effect=busy("Too many"))
+        monkeypatch.setattr(server_module, "get_password_hasher", lambda: hasher)
+        monkeypatch.setattr(oauth2_api, "PasswordHasherBusyError", busy)
+        server = OAuth2Server(_database(client_row), cache, get_settings())
+
+        result = await server.token("client_credentials", "svc", SECRET)
+        assert result.unwrap_err().startswith("temporarily_unavailable")
+
+        for endpoint in (oauth2_api.introspect, oauth2_api.revoke):
+            response = Response()
+            await endpoint(
+                response,
+                token="t",
+                token_type_hint=None,
+                client_id="svc",
+                client_secret=SECRET,
+                oauth2_server=server,
+            )
+            assert response.status_code == 429
@@ -0,0 +1,94 @@
+"""Unit tests for keyset pagination cursors."""
+
+import base64
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.policy_core.core.pagination import (
+    KeysetCursor,
+    decode_cursor,
+    encode_cursor,
+    keyset_predicate,
+    next_cursor,
+)
+from src.policy_core.services.customer_service import CustomerService
+
+
+class TestCursorTokens:
+    """Test opaque cursor encoding and decoding."""
+
+    def test_round_trip(self) -> None:
+        """Test a cursor survives encode/decode unchanged."""
+        cursor = KeysetCursor(
+            created_at=datetime(2025, 7, 1, 12, 30, tzinfo=timezone.utc), id=uuid4()
+        )
+
+        token = encode_cursor(cursor)
+        decoded = decode_cursor(token)
+
+        assert decoded.is_ok()
+        assert decoded.ok_value == cursor
+        assert "=" not in token
+
+    def test_garbage_token_rejected(self) -> None:
+        """Test malformed tokens produce an error result."""
+        assert decode_cursor("not-a-cursor!!").is_err()
+        assert decode_cursor("").is_err()
+
+    def test_unknown_version_rejected(self) -> None:
+        """Test tokens from another cursor layout are refused."""
+        payload = json.dumps([99, "2025-07-01T00:00:00+00:00", uuid4().hex])
+        token = base64.urlsafe_b64encode(payload.encode()).decode()
+
+        result = decode_cursor(token)
+
+        assert result.is_err()
+        assert "invalid" in result.unwrap_err().lower()
+
+
+class TestKeysetHelpers:
+    """Test SQL and page helpers."""
+
+    def test_predicate_uses_row_comparison(self) -> None:
+        """Test the seek predicate binds created_at then id."""
+        assert keyset_predicate(3) == "(created_at, id) < ($3, $4)"
+        assert keyset_predicate(1, "q") == "(q.created_at, q.id) < ($1, $2)"
+
+    def test_next_cursor_only_on_full_page(self) -> None:
+        """Test a short page marks the end of the listing."""
+        rows = [
+            SimpleNamespace(created_at=datetime.now(timezone.utc), id=uuid4())
+            for _ in range(3)
+        ]
+
+        assert next_cursor(rows, 5) is None
+        assert next_cursor([], 5) is None
+
+        token = next_cursor(rows, 3)
+        assert token is not None
+        assert decode_cursor(token).ok_value.id == rows[-1].id
+
+
+class TestServiceKeysetQueries:
+    """Test services switch from OFFSET to a seek when given a cursor."""
+
+    @pytest.mark.asyncio
+    async def test_customer_listing_seeks_instead_of_offset(self) -> None:
+        """Test the cursor is bound and OFFSET is dropped."""
+        db = MagicMock()
+        db.fetch = AsyncMock(return_value=[])
+        service = CustomerService(db, MagicMock())
+        after = KeysetCursor(created_at=datetime.now(timezone.utc), id=uuid4())
+
+        result = await service.list_customers(limit=25, after=after)
+
+        assert result.is_ok()
+        query, *params = db.fetch.await_args.args
+        assert "OFFSET" not in query
+        assert "(created_at, id) < ($1, $2)" in query
+        assert params == [after.created_at, after.id, 25]
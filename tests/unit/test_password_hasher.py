@@ -0,0 +1,81 @@
+"""Unit tests for the off-loop password hasher."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.policy_core.core.password_hasher import (
+    PasswordHasher,
+    PasswordHasherBusyError,
+    bcrypt_cost,
+)
+
+
+class TestPasswordHasher:
+    """Test hashing, rehash detection and admission control."""
+
+    @pytest.mark.asyncio
+    async def test_hash_and_verify_round_trip(self) -> None:
+        """Test a hash verifies and a wrong password does not."""
+        hasher = PasswordHasher(rounds=4, workers=2, max_pending=4)
+
+        hashed = await hasher.hash_password("correct horse")
+
+        assert bcrypt_cost(hashed) == 4
+        assert (await hasher.verify_password("correct horse", hashed)).valid
+        assert not (await hasher.verify_password("wrong horse!", hashed)).valid
+        assert not (await hasher.verify_password("anything", "not-a-hash")).valid
+        assert hasher.metrics().completed_total == 4
+        hasher.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_rehash_flagged_when_rounds_change(self) -> None:
+        """Test hashes made at an old work factor are flagged on success only."""
+        old = PasswordHasher(rounds=4)
+        hashed = await old.hash_password("password123")
+        current = PasswordHasher(rounds=5)
+
+        assert (await current.verify_password("password123", hashed)).needs_rehash
+        assert not (await current.verify_password("password124", hashed)).needs_rehash
+        assert not (await old.verify_password("password123", hashed)).needs_rehash
+        old.shutdown()
+        current.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects_instead_of_queueing(self) -> None:
+        """Test callers beyond max_pending fail fast."""
+        hasher = PasswordHasher(rounds=4, workers=1, max_pending=1)
+        release = threading.Event()
+
+        blocked = asyncio.create_task(hasher.run(release.wait, 5))
+        await asyncio.sleep(0)
+
+        with pytest.raises(PasswordHasherBusyError):
+            await hasher.run(time.sleep, 0)
+
+        release.set()
+        await blocked
+        assert hasher.metrics().rejected_total == 1
+        hasher.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive(self) -> None:
+        """Test other coroutines keep running while hashes are computed."""
+        hasher = PasswordHasher(rounds=10, workers=2, max_pending=8)
+        ticks = 0
+
+        async def heartbeat() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        beat = asyncio.create_task(heartbeat())
+        await asyncio.gather(*(hasher.hash_password("password123") for _ in range(4)))
+        beat.cancel()
+
+        assert ticks > 2
+        assert hasher.metrics().p99_ms >= hasher.metrics().p50_ms > 0
+        hasher.shutdown()
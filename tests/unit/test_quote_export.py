@@ -0,0 +1,211 @@
+"""Unit tests for the streaming quote export pipeline."""
+
+import csv
+import gzip
+import io
+import json
+import zipfile
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.policy_core.services.quote_export import (
+    ExportFormat,
+    ExportJob,
+    ExportJobStatus,
+    QuoteExportFilters,
+    QuoteExportService,
+    XlsxStreamWriter,
+    build_export_query,
+    encode_csv,
+    encode_json_array,
+    encode_ndjson,
+    gzip_chunks,
+)
+
+
+def _rows(count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": uuid4(),
+            "quote_number": f"QUOT-2025-{i:06d}",
+            "total_premium": Decimal("1234.56"),
+            "drivers": [{"name": "A, B"}],
+            "created_at": datetime(2025, 7, 1, tzinfo=timezone.utc),
+            "notes": None,
+        }
+        for i in range(count)
+    ]
+
+
+async def _aiter(items: list[Any]) -> AsyncIterator[Any]:
+    for item in items:
+        yield item
+
+
+async def _collect(chunks: AsyncIterator[bytes]) -> list[bytes]:
+    return [chunk async for chunk in chunks]
+
+
+class TestEncoders:
+    """Test chunked encoders."""
+
+    @pytest.mark.asyncio
+    async def test_csv_is_chunked_by_row_count(self) -> None:
+        """Test CSV output is emitted in bounded chunks and parses back."""
+        chunks = await _collect(encode_csv(_aiter(_rows(25)), chunk_rows=10))
+
+        assert len(chunks) == 3
+        parsed = list(csv.DictReader(io.StringIO(b"".join(chunks).decode())))
+        assert len(parsed) == 25
+        assert json.loads(parsed[0]["drivers"]) == [{"name": "A, B"}]
+        assert parsed[0]["notes"] == ""
+
+    @pytest.mark.asyncio
+    async def test_json_array_and_ndjson_are_valid(self) -> None:
+        """Test both JSON encodings round-trip."""
+        rows = _rows(7)
+
+        array = b"".join(await _collect(encode_json_array(_aiter(rows), 3)))
+        lines = b"".join(await _collect(encode_ndjson(_aiter(rows), 3)))
+
+        assert len(json.loads(array)) == 7
+        assert [json.loads(line)["quote_number"] for line in lines.splitlines()] == [
+            row["quote_number"] for row in rows
+        ]
+
+    @pytest.mark.asyncio
+    async def test_empty_json_array(self) -> None:
+        """Test an empty export is still a valid JSON document."""
+        assert (
+            json.loads(b"".join(await _collect(encode_json_array(_aiter([]), 5)))) == []
+        )
+
+    @pytest.mark.asyncio
+    async def test_gzip_stream_decompresses(self) -> None:
+        """Test incremental gzip output is a single valid gzip member."""
+        plain = b"".join(await _collect(encode_ndjson(_aiter(_rows(50)), 10)))
+        compressed = b"".join(
+            await _collect(gzip_chunks(encode_ndjson(_aiter(_rows(50)), 10)))
+        )
+
+        assert len(gzip.decompress(compressed).splitlines()) == len(plain.splitlines())
+
+
+class TestXlsxWriter:
+    """Test the streaming XLSX writer."""
+
+    def test_workbook_structure(self, tmp_path: Path) -> None:
+        """Test the archive holds a worksheet with escaped inline strings."""
+        path = tmp_path / "export.xlsx"
+        writer = XlsxStreamWriter(path)
+        writer.write_row(["id", "note"], header=True)
+        writer.write_row(["1", "<b>&</b>"])
+        writer.close()
+
+        with zipfile.ZipFile(path) as archive:
+            assert "xl/workbook.xml" in archive.namelist()
+            sheet = archive.read("xl/worksheets/sheet1.xml").decode()
+
+        assert sheet.count("<row>") == 2
+        assert "&lt;b&gt;&amp;&lt;/b&gt;" in sheet
+        assert writer.rows_written == 2
+
+    @pytest.mark.asyncio
+    async def test_service_writes_rows_in_batches(self, tmp_path: Path) -> None:
+        """Test the service header and every batch, including a short last one."""
+        db = MagicMock()
+        db.stream = lambda query, *params, prefetch: _aiter(_rows(25))
+        service = QuoteExportService(db)
+        service._chunk_rows = 10
+        path = tmp_path / "export.xlsx"
+
+        assert await service._write_xlsx(QuoteExportFilters(), path) == 25
+
+        with zipfile.ZipFile(path) as archive:
+            sheet = archive.read("xl/worksheets/sheet1.xml").decode()
+        assert sheet.count("<row>") == 26
+        assert sheet.count(' s="1"') == len(_rows(1)[0])
+
+
+class TestExportQuery:
+    """Test export query construction."""
+
+    def test_filters_are_parameterized(self) -> None:
+        """Test filters bind positional parameters in order."""
+        after = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+        query, params = build_export_query(
+            QuoteExportFilters(status="quoted", created_after=after)
+        )
+
+        assert "status = $1" in query
+        assert "created_at >= $2" in query
+        assert params == ["quoted", after]
+
+
+class TestJobRetention:
+    """Test expired background jobs are dropped with their files."""
+
+    def test_unfinished_jobs_expire_on_creation_time(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test failed and cancelled jobs are purged; running jobs are kept."""
+        monkeypatch.setattr(QuoteExportService, "_jobs", {})
+        monkeypatch.setattr(QuoteExportService, "_tasks", {})
+        service = QuoteExportService(MagicMock())
+        service._export_dir = tmp_path
+        old = datetime.now(timezone.utc) - service._job_ttl - timedelta(minutes=1)
+
+        def job(status: ExportJobStatus) -> ExportJob:
+            created = ExportJob(
+                job_id=uuid4(),
+                format=ExportFormat.CSV,
+                requested_by=uuid4(),
+                filename="quotes.csv",
+                status=status,
+                created_at=old,
+            )
+            service._jobs[created.job_id] = created
+            service.job_file(created).write_bytes(b"partial")
+            return created
+
+        failed = job(ExportJobStatus.FAILED)
+        cancelled = job(ExportJobStatus.RUNNING)
+        running = job(ExportJobStatus.RUNNING)
+        service._tasks[running.job_id] = MagicMock()
+
+        service._purge_expired_jobs()
+
+        assert list(service._jobs) == [running.job_id]
+        assert not service.job_file(failed).exists()
+        assert not service.job_file(cancelled).exists()
+        assert service.job_file(running).exists()
+
+
+class TestJobAccess:
+    """Test background job handles are scoped to their requester."""
+
+    def test_jobs_are_private_to_their_requester(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test another admin cannot look up a job by its id."""
+        monkeypatch.setattr(QuoteExportService, "_jobs", {})
+        service = QuoteExportService(MagicMock())
+        owner = uuid4()
+        job = ExportJob(
+            job_id=uuid4(),
+            format=ExportFormat.CSV,
+            requested_by=owner,
+            filename="quotes.csv",
+        )
+        service._jobs[job.job_id] = job
+
+        assert service.get_job(job.job_id, owner).unwrap() == job
+        assert service.get_job(job.job_id, uuid4()).is_err()
@@ -0,0 +1,249 @@
+"""Unit tests for what-if pricing of coverage-term variations."""
+
+from decimal import Decimal
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.policy_core.core.result_types import Ok
+from src.policy_core.models.quote import (
+    CoverageSelection,
+    CoverageType,
+    DriverInfo,
+    VehicleInfo,
+)
+from src.policy_core.schemas.quote import CoverageTermAxis
+from src.policy_core.schemas.rating import CoverageRates
+from src.policy_core.services.quote_service import QuoteService
+from src.policy_core.services.rating.fixed_point import MICROCENTS_PER_DOLLAR
+from src.policy_core.services.rating.kernel import (
+    CustomerFacts,
+    RatingContext,
+    rate_quote,
+    rate_table,
+    rate_variants,
+)
+from src.policy_core.services.rating.state_rules import (
+    CompiledStateRules,
+    get_state_rule_book,
+)
+from src.policy_core.services.rating_engine import (
+    RatingEngine,
+    VariantPremium,
+    VariationPricing,
+)
+
+
+def _coverage(coverage_type: CoverageType, limit: str) -> CoverageSelection:
+    return CoverageSelection(
+        coverage_type=coverage_type,
+        limit=Decimal(limit),
+        deductible=Decimal("500"),
+    )
+
+
+def _context(**overrides: Any) -> RatingContext:
+    values: dict[str, Any] = {
+        "state": "TX",
+        "product_type": "auto",
+        "vehicle": VehicleInfo(
+            vin="1HGBH41JXMN109186",
+            year=2020,
+            make="Honda",
+            model="Accord",
+            usage="commute",
+            annual_mileage=12000,
+            garage_zip="75001",
+        ),
+        "drivers": (
+            DriverInfo(first_name="Jane", last_name="Doe", age=40, years_licensed=20),
+        ),
+        "coverages": (
+            _coverage(CoverageType.BODILY_INJURY, "100000"),
+            _coverage(CoverageType.PROPERTY_DAMAGE, "50000"),
+            _coverage(CoverageType.COLLISION, "30000"),
+        ),
+        "rates": rate_table(
+            CoverageRates(
+                bodily_injury=Decimal("5.1234"),
+                property_damage=Decimal("3.3"),
+                collision=Decimal("7.77"),
+            )
+        ),
+        "state_rules": get_state_rule_book().rules("TX"),
+        "minimum_premium": 100 * MICROCENTS_PER_DOLLAR,
+        "rating_year": 2025,
+        "territory_factor": 1.17,
+        "credit_factor": 0.93,
+        "customer": CustomerFacts(active_policies=1, tenure_years=7),
+    }
+    values.update(overrides)
+    return RatingContext(**values)
+
+
+class TestRateVariants:
+    """Test incremental repricing matches a full rating."""
+
+    @pytest.mark.parametrize("limit", ["30000", "50000", "250000", "1000000"])
+    def test_matches_full_rating(self, limit: str) -> None:
+        """Test a limit change prices exactly like rating the changed quote."""
+        context = _context()
+        anchor = rate_quote(context).unwrap()
+        change = _coverage(CoverageType.BODILY_INJURY, limit)
+
+        (variant,) = rate_variants(context, anchor, [[change]]).unwrap()
+        full = rate_quote(
+            context._replace(coverages=(change, *context.coverages[1:]))
+        ).unwrap()
+
+        assert variant.coverage_premiums == full.coverage_premiums
+        assert variant.base_premium == full.base_premium
+        assert variant.total_discount == full.total_discount
+        assert variant.total_premium == full.total_premium
+
+    def test_minimum_premium_and_unknown_coverage(self) -> None:
+        """Test variants respect the minimum and only replace rated coverages."""
+        context = _context(minimum_premium=2000 * MICROCENTS_PER_DOLLAR)
+        anchor = rate_quote(context).unwrap()
+
+        (low,) = rate_variants(
+            context, anchor, [[_coverage(CoverageType.COLLISION, "1000")]]
+        ).unwrap()
+        assert low.total_premium == 2000 * MICROCENTS_PER_DOLLAR
+
+        result = rate_variants(
+            context, anchor, [[_coverage(CoverageType.UNINSURED_MOTORIST, "50000")]]
+        )
+        assert "not on the rated quote" in result.unwrap_err()
+
+
+class TestPriceVariations:
+    """Test the engine and quote service build the premium matrix."""
+
+    @pytest.mark.asyncio
+    async def test_engine_loads_context_once(self) -> None:
+        """Test one context load prices every variant; low limits are flagged."""
+        context = _context()
+        engine = RatingEngine(MagicMock(), MagicMock())
+        engine._state_rules = get_state_rule_book().compiled()
+        engine._load_context = AsyncMock(return_value=Ok(context))
+
+        pricing = (
+            await engine.price_variations(
+                state="TX",
+                product_type="auto",
+                vehicle_info=context.vehicle,
+                drivers=list(context.drivers),
+                coverage_selections=list(context.coverages),
+                variants=[
+                    [_coverage(CoverageType.BODILY_INJURY, "25000")],
+                    [_coverage(CoverageType.BODILY_INJURY, "300000")],
+                ],
+            )
+        ).unwrap()
+
+        engine._load_context.assert_awaited_once()
+        below, above = pricing.variants
+        assert below.total_premium is None and "below state TX" in below.error
+        assert above.error is None and above.total_premium > pricing.total_premium
+
+    @pytest.mark.asyncio
+    async def test_limits_checked_against_engine_rules(self) -> None:
+        """Test variant limits use the engine's merged rules, not the rule book."""
+        context = _context()
+        engine = RatingEngine(MagicMock(), MagicMock())
+        engine._state_rules = get_state_rule_book().compiled()
+        tx = engine._state_rules["TX"]
+        engine._state_rules["TX"] = CompiledStateRules(
+            "TX",
+            tx.pack.model_copy(
+                update={
+                    "minimum_limits": {
+                        **tx.minimum_limits,
+                        "bodily_injury_per_person": Decimal("500000"),
+                    }
+                }
+            ),
+        )
+        engine._load_context = AsyncMock(return_value=Ok(context))
+
+        pricing = (
+            await engine.price_variations(
+                state="TX",
+                product_type="auto",
+                vehicle_info=context.vehicle,
+                drivers=list(context.drivers),
+                coverage_selections=list(context.coverages),
+                variants=[[_coverage(CoverageType.BODILY_INJURY, "300000")]],
+            )
+        ).unwrap()
+
+        (variant,) = pricing.variants
+        assert variant.total_premium is None and "below state TX" in variant.error
+
+    @pytest.mark.asyncio
+    async def test_service_grid_is_row_major(self) -> None:
+        """Test the cartesian product of the axes maps back onto the cells."""
+        quote = MagicMock(
+            state="TX",
+            product_type="auto",
+            vehicle_info=None,
+            drivers=[],
+            customer_id=None,
+            coverage_selections=[
+                _coverage(CoverageType.BODILY_INJURY, "100000"),
+                _coverage(CoverageType.COLLISION, "30000"),
+            ],
+        )
+        engine = MagicMock(_initialized=True)
+
+        async def price_variations(**kwargs: Any) -> Ok[VariationPricing]:
+            return Ok(
+                VariationPricing(
+                    base_premium=Decimal("100.00"),
+                    total_premium=Decimal("100.00"),
+                    rate_version="base",
+                    variants=[
+                        VariantPremium(
+                            base_premium=sum(c.limit for c in changes) / 1000,
+                            total_premium=changes[0].deductible,
+                        )
+                        for changes in kwargs["variants"]
+                    ],
+                )
+            )
+
+        engine.price_variations = price_variations
+        service = QuoteService(MagicMock(), MagicMock(), rating_engine=engine)
+        service.get_quote = AsyncMock(return_value=Ok(quote))
+
+        response = (
+            await service.price_quote_variations(
+                uuid4(),
+                [
+                    CoverageTermAxis(
+                        coverage_type=CoverageType.COLLISION,
+                        term="deductible",
+                        values=[Decimal("250"), Decimal("1000.001")],
+                    ),
+                    CoverageTermAxis(
+                        coverage_type=CoverageType.BODILY_INJURY,
+                        term="limit",
+                        values=[Decimal("50000"), Decimal("100000"), Decimal("300000")],
+                    ),
+                ],
+            )
+        ).unwrap()
+
+        assert response.shape == [2, 3]
+        assert [c.values for c in response.cells[:3]] == [
+            [Decimal("250"), Decimal("50000")],
+            [Decimal("250"), Decimal("100000")],
+            [Decimal("250"), Decimal("300000")],
+        ]
+        assert response.cells[1].total_premium == Decimal("250")
+        assert response.cells[1].base_premium == Decimal("130")
+        # Deductibles with sub-cent precision fail validation cell by cell
+        assert all(c.error and c.total_premium is None for c in response.cells[3:])
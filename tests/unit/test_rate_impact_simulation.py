@@ -0,0 +1,321 @@
+"""Unit tests for the book-of-business rate impact simulator."""
+
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from decimal import Decimal
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+import numpy as np
+import pytest
+from fakeredis import aioredis
+
+from src.policy_core.core.cache import Cache
+from src.policy_core.core.database import Database
+from src.policy_core.schemas.rating import RateTableData, RiskFactorData
+from src.policy_core.services.rating import impact_simulation
+from src.policy_core.services.rating.impact_simulation import (
+    GroupStats,
+    ImpactJobStatus,
+    ImpactPartial,
+    RateImpactSimulator,
+    build_rating_plan,
+    shutdown_impact_executor,
+    simulate_chunk,
+)
+from src.policy_core.services.rating.rate_tables import RateTableVersion
+
+CURRENT_ID = uuid4()
+PROPOSED_ID = uuid4()
+
+
+def _rates(bodily_injury: str, collision: str, age_max: float = 2.0) -> RateTableData:
+    return RateTableData(
+        coverages={
+            "bodily_injury": Decimal(bodily_injury),
+            "collision": Decimal(collision),
+        },
+        base_rates={"bodily_injury": Decimal(bodily_injury)},
+        factors={"age": RiskFactorData(min_value=0.5, max_value=age_max)},
+    )
+
+
+def _row(
+    source: str = "policy",
+    state: str = "CA",
+    zip_code: str = "90210",
+    tier: str = "standard",
+    liability: float = 100000,
+    collision: float = 0,
+    factors: dict[str, float] | None = None,
+    discount: float = 0,
+    surcharge: float = 0,
+) -> tuple[Any, ...]:
+    selections = [{"coverage_type": "liability", "limit": liability}]
+    if collision:
+        selections.append({"coverage_type": "collision", "limit": collision})
+    return (
+        source,
+        state,
+        zip_code,
+        tier,
+        json.dumps(selections),
+        json.dumps(factors or {"age": 1.0}),
+        Decimal("1000"),
+        Decimal(str(discount)),
+        Decimal(str(surcharge)),
+    )
+
+
+class TestSimulateChunk:
+    """Test the vectorized re-rating of a chunk."""
+
+    def test_rate_increase_flows_through(self) -> None:
+        """Test a 10% rate increase moves every row by 10%."""
+        plan = build_rating_plan(_rates("5", "3"), _rates("5.5", "3"))
+        partial = simulate_chunk([_row(), _row(state="TX", tier="preferred")], plan)
+
+        overall = partial.groups["overall"]["all"]
+        assert overall.count == 2 and overall.increased == 2
+        # 100k limit at $5 per $1000
+        assert overall.current == pytest.approx(1000.0)
+        assert overall.proposed == pytest.approx(1100.0)
+        assert set(partial.groups["state"]) == {"CA", "TX"}
+        assert set(partial.groups["coverage"]) == {"bodily_injury"}
+
+    def test_factor_bounds_discounts_and_surcharges(self) -> None:
+        """Test clipping per version and that discounts scale, surcharges don't."""
+        plan = build_rating_plan(_rates("5", "3", age_max=2.0), _rates("5", "3", 1.5))
+        row = _row(factors={"age": 2.0, "credit": 0.5}, discount=250, surcharge=40)
+        partial = simulate_chunk([row], plan)
+
+        stats = partial.groups["overall"]["all"]
+        # Stored: 1000 base x 2.0 x 0.5 = 1000 factored, so a 25% discount;
+        # credit is not in either version and keeps its stored value
+        assert stats.current == pytest.approx(500 * 2.0 * 0.5 * 0.75 + 40)
+        assert stats.proposed == pytest.approx(500 * 1.5 * 0.5 * 0.75 + 40)
+
+    def test_rows_without_rated_coverage_are_skipped(self) -> None:
+        """Test rows the versions cannot price do not skew the result."""
+        plan = build_rating_plan(_rates("5", "3"), _rates("6", "3"))
+        unpriced = _row(liability=0, surcharge=50)
+        partial = simulate_chunk([_row(), unpriced], plan)
+
+        assert partial.rows == 2 and partial.skipped == 1
+        assert partial.groups["overall"]["all"].count == 1
+
+    def test_territory_lookup(self) -> None:
+        """Test zips resolve to territories and unknown zips to the default."""
+        plan = build_rating_plan(
+            _rates("5", "3"), _rates("6", "3"), {("CA", "90210"): "LA-1"}
+        )
+        partial = simulate_chunk([_row(), _row(zip_code="00000")], plan)
+
+        assert set(partial.groups["territory"]) == {"CA:LA-1", "CA:default"}
+
+
+class TestDistributions:
+    """Test partials merge and summarize consistently."""
+
+    def test_merged_chunks_match_single_pass(self) -> None:
+        """Test splitting the book into chunks does not change the answer."""
+        plan = build_rating_plan(_rates("5", "3"), _rates("5.5", "2.4"))
+        rng = np.random.default_rng(7)
+        rows = [
+            _row(
+                state=str(rng.choice(["CA", "TX", "NY"])),
+                liability=float(rng.integers(25, 500) * 1000),
+                collision=float(rng.integers(0, 50) * 1000),
+                factors={"age": float(rng.uniform(0.4, 2.5))},
+            )
+            for _ in range(300)
+        ]
+
+        whole = simulate_chunk(rows, plan)
+        merged = ImpactPartial()
+        for start in range(0, len(rows), 64):
+            merged.merge(simulate_chunk(rows[start : start + 64], plan))
+
+        for dimension, groups in whole.groups.items():
+            for key, stats in groups.items():
+                other = merged.groups[dimension][key]
+                assert other.count == stats.count
+                assert other.proposed == pytest.approx(stats.proposed)
+                assert np.array_equal(other.histogram, stats.histogram)
+
+    def test_percentiles_from_histogram(self) -> None:
+        """Test histogram percentiles land within a bin of the exact value."""
+        changes = np.linspace(-20.0, 30.0, 1001)
+        current = np.full(len(changes), 100.0)
+        partial = ImpactPartial()
+        partial.add("overall", ["all"] * len(changes), current, current + changes)
+        stats: GroupStats = partial.groups["overall"]["all"]
+
+        for q in (5, 25, 50, 75, 95):
+            assert stats.percentile(q) == pytest.approx(
+                np.percentile(changes, q), abs=0.5
+            )
+        summary = stats.to_distribution()
+        assert summary.min_change_pct == -20.0 and summary.max_change_pct == 30.0
+        assert sum(summary.histogram) == 1001
+
+
+def _version(version_id: UUID, rate_data: RateTableData) -> RateTableVersion:
+    return RateTableVersion(
+        id=version_id,
+        table_name="CA_auto_base_rates",
+        version_number=1,
+        rate_data=rate_data,
+        effective_date=date(2025, 1, 1),
+        status="approved",
+        created_by=uuid4(),
+    )
+
+
+CURRENT = _version(CURRENT_ID, _rates("5", "3"))
+PROPOSED = _version(PROPOSED_ID, _rates("5.25", "3"))
+
+
+def _database(rows: list[tuple[Any, ...]]) -> MagicMock:
+    db = MagicMock(spec=Database)
+    db.fetch = AsyncMock(
+        return_value=[{"state": "CA", "territory_id": "LA-1", "zip_codes": '["90210"]'}]
+    )
+
+    async def stream(query: str, *args: Any, prefetch: int = 500):  # type: ignore[no-untyped-def]
+        db.stream_args = args
+        for row in rows:
+            yield row
+
+    db.stream = MagicMock(side_effect=stream)
+    return db
+
+
+@pytest.fixture
+def cache() -> Cache:
+    """Cache backed by an in-memory Redis."""
+    return Cache(aioredis.FakeRedis(decode_responses=True))
+
+
+class TestRateImpactSimulator:
+    """Test the streaming driver and result caching."""
+
+    @pytest.fixture(autouse=True)
+    def small_chunks(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Force several chunks for a small book."""
+        settings = impact_simulation.get_settings().model_copy(
+            update={"rating_impact_chunk_rows": 100, "rating_impact_workers": 2}
+        )
+        monkeypatch.setattr(impact_simulation, "get_settings", lambda: settings)
+
+    @pytest.mark.asyncio
+    async def test_simulation_cached_per_version_pair(self, cache: Cache) -> None:
+        """Test the second request for a pair is served from Redis."""
+        rows = [_row(source="policy")] * 250 + [_row(source="quote")] * 50
+        db = _database(rows)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            simulator = RateImpactSimulator(db, cache, executor)
+            first = (await simulator.simulate(CURRENT, PROPOSED)).unwrap()
+            second = await simulator.simulate(CURRENT, PROPOSED)
+
+        assert first.rows_simulated == 300
+        assert first.overall.premium_change_pct == pytest.approx(5.0)
+        assert first.by_source["policy"].count == 250
+        assert first.by_territory["CA:LA-1"].count == 300
+        # Scoped to the state and product named by the rate table
+        assert db.stream_args == ("CA", "auto")
+        assert second.unwrap() == first
+        assert db.stream.call_count == 1
+
+        other = await simulator.get_cached(PROPOSED_ID, CURRENT_ID)
+        assert other is None
+
+    @pytest.mark.asyncio
+    async def test_force_refresh_reruns(self, cache: Cache) -> None:
+        """Test force_refresh ignores and replaces the cached result."""
+        db = _database([_row()] * 10)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            simulator = RateImpactSimulator(db, cache, executor)
+            await simulator.simulate(CURRENT, PROPOSED)
+            db.stream.side_effect = _database([_row()] * 20).stream.side_effect
+            refreshed = await simulator.simulate(CURRENT, PROPOSED, force_refresh=True)
+
+        assert refreshed.unwrap().rows_simulated == 20
+        cached = await simulator.get_cached(CURRENT_ID, PROPOSED_ID)
+        assert cached is not None and cached.rows_simulated == 20
+
+    @pytest.mark.slow
+    @pytest.mark.asyncio
+    async def test_process_pool(self, cache: Cache) -> None:
+        """Test chunks re-rate in worker processes and throughput is sane."""
+        rows = [_row(tier=f"tier-{i % 4}", collision=20000) for i in range(20000)]
+        simulator = RateImpactSimulator(_database(rows), cache)
+
+        start = time.perf_counter()
+        try:
+            simulation = (await simulator.simulate(CURRENT, PROPOSED)).unwrap()
+        finally:
+            shutdown_impact_executor()
+        elapsed = time.perf_counter() - start
+
+        assert simulation.rows_simulated == 20000
+        assert set(simulation.by_tier) == {f"tier-{i}" for i in range(4)}
+        assert simulation.by_coverage["collision"].premium_change_pct == 0.0
+        # Includes spawning the workers; generous for CI
+        assert elapsed < 60
+
+
+class TestImpactJobs:
+    """Test simulations run as single-flight background jobs."""
+
+    @pytest.fixture(autouse=True)
+    def registry(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Give each test an empty job registry."""
+        monkeypatch.setattr(RateImpactSimulator, "_jobs", {})
+        monkeypatch.setattr(RateImpactSimulator, "_tasks", {})
+        monkeypatch.setattr(RateImpactSimulator, "_active", {})
+
+    @pytest.mark.asyncio
+    async def test_one_job_per_version_pair(self, cache: Cache) -> None:
+        """Test a second request joins the running job and sees its result."""
+        db = _database([_row()] * 10)
+        admin = uuid4()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            simulator = RateImpactSimulator(db, cache, executor)
+            first = simulator.start_job(CURRENT, PROPOSED, admin)
+            again = RateImpactSimulator(db, cache, executor).start_job(
+                CURRENT, PROPOSED, uuid4(), force_refresh=True
+            )
+            reverse = simulator.start_job(PROPOSED, CURRENT, admin)
+            assert again.job_id == first.job_id
+            assert reverse.job_id != first.job_id
+
+            await asyncio.gather(*RateImpactSimulator._tasks.values())
+
+        job = simulator.get_job(first.job_id).unwrap()
+        assert job.status == ImpactJobStatus.COMPLETED
+        assert job.requested_by == admin
+        assert job.result is not None and job.result.rows_simulated == 10
+        assert db.stream.call_count == 2
+        assert simulator.get_job(uuid4()).is_err()
+
+    @pytest.mark.asyncio
+    async def test_failed_job_reports_error(self, cache: Cache) -> None:
+        """Test a failing simulation ends the job with its error."""
+        db = _database([])
+        db.fetch.side_effect = ConnectionError("down")
+        simulator = RateImpactSimulator(db, cache, ThreadPoolExecutor(max_workers=1))
+
+        handle = simulator.start_job(CURRENT, PROPOSED, uuid4())
+        await asyncio.gather(*RateImpactSimulator._tasks.values())
+
+        job = simulator.get_job(handle.job_id).unwrap()
+        assert job.status == ImpactJobStatus.FAILED
+        assert "down" in (job.error or "")
+        # The pair is free for a new attempt
+        assert simulator.start_job(CURRENT, PROPOSED, uuid4()).job_id != job.job_id
+        await asyncio.gather(*RateImpactSimulator._tasks.values())
@@ -0,0 +1,172 @@
+"""Unit tests for the pure rating kernel."""
+
+import inspect
+import pickle
+import time
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from src.policy_core.models.quote import (
+    CoverageSelection,
+    CoverageType,
+    DiscountType,
+    DriverInfo,
+    VehicleInfo,
+)
+from src.policy_core.schemas.rating import CoverageRates
+from src.policy_core.services.rating import kernel
+from src.policy_core.services.rating.fixed_point import (
+    MICROCENTS_PER_DOLLAR,
+    factor_to_micro,
+    scale_by_micro,
+)
+from src.policy_core.services.rating.kernel import (
+    CustomerFacts,
+    RatingContext,
+    rate_quote,
+    rate_table,
+)
+from src.policy_core.services.rating.state_rules import get_state_rule_book
+
+RATING_YEAR = 2025
+
+
+def _context(**overrides: Any) -> RatingContext:
+    values: dict[str, Any] = {
+        "state": "TX",
+        "product_type": "auto",
+        "vehicle": VehicleInfo(
+            vin="1HGBH41JXMN109186",
+            year=RATING_YEAR - 5,
+            make="Honda",
+            model="Accord",
+            usage="commute",
+            annual_mileage=5000,
+            garage_zip="75001",
+            anti_theft=True,
+        ),
+        "drivers": (
+            DriverInfo(first_name="Jane", last_name="Doe", age=40, years_licensed=20),
+        ),
+        "coverages": (
+            CoverageSelection(
+                coverage_type=CoverageType.BODILY_INJURY,
+                limit=Decimal("100000.00"),
+                deductible=Decimal("0.00"),
+            ),
+        ),
+        "rates": rate_table(
+            CoverageRates(bodily_injury=Decimal("5"), property_damage=Decimal("3"))
+        ),
+        "state_rules": get_state_rule_book().rules("TX"),
+        "minimum_premium": 100 * MICROCENTS_PER_DOLLAR,
+        "rating_year": RATING_YEAR,
+        "territory_factor": 1.2,
+        "credit_factor": 0.9,
+        "claims_factor": 0.95,
+        "customer": CustomerFacts(
+            active_policies=1, tenure_years=6, coverage_lapse=True
+        ),
+    }
+    values.update(overrides)
+    return RatingContext(**values)
+
+
+class TestRateQuote:
+    """Test pricing from a loaded context."""
+
+    def test_premium_breakdown(self) -> None:
+        """Test factors, discounts and surcharges combine into the premium."""
+        rating = rate_quote(_context()).unwrap()
+
+        assert rating.coverage_premiums == {
+            "bodily_injury": 500 * MICROCENTS_PER_DOLLAR
+        }
+        factors = rating.factors
+        assert factors.territory == 1.2 and factors.credit == 0.9
+        assert factors.low_mileage == 0.90 and factors.vehicle_type == 0.95
+        assert {d.discount_type for d in rating.discounts} == {
+            DiscountType.MULTI_POLICY,
+            DiscountType.SAFE_DRIVER,
+            DiscountType.LOYALTY,
+        }
+        assert [s.surcharge_type for s in rating.surcharges] == ["coverage_lapse"]
+
+        composite = factor_to_micro(factors.calculate_composite_factor())
+        assert rating.composite_factor == composite
+        assert rating.factored_premium == scale_by_micro(rating.base_premium, composite)
+        expected = (
+            rating.factored_premium
+            - rating.total_discount
+            + 100 * MICROCENTS_PER_DOLLAR
+        )
+        assert rating.total_premium == expected
+        assert rating.total_discount == sum(d.amount for d in rating.discounts)
+
+    def test_state_rules_and_minimum_premium(self) -> None:
+        """Test prohibited factors are dropped and the minimum applies."""
+        rating = rate_quote(
+            _context(
+                state="CA",
+                state_rules=get_state_rule_book().rules("CA"),
+                minimum_premium=5000 * MICROCENTS_PER_DOLLAR,
+            )
+        ).unwrap()
+
+        assert rating.factors.credit is None
+        assert rating.total_premium == 5000 * MICROCENTS_PER_DOLLAR
+
+    def test_anonymous_quote_without_vehicle(self) -> None:
+        """Test missing customer and vehicle facts rate neutrally."""
+        rating = rate_quote(
+            _context(
+                vehicle=None, customer=None, credit_factor=None, claims_factor=None
+            )
+        ).unwrap()
+
+        assert rating.factors.territory == 1.0 and rating.factors.credit is None
+        assert [d.discount_type for d in rating.discounts] == [DiscountType.SAFE_DRIVER]
+        assert rating.surcharges == []
+
+    def test_unrated_coverage_is_an_error(self) -> None:
+        """Test a coverage without an approved rate fails the quote."""
+        collision = CoverageSelection(
+            coverage_type=CoverageType.COLLISION,
+            limit=Decimal("20000.00"),
+            deductible=Decimal("500.00"),
+        )
+        result = rate_quote(_context(coverages=(collision,)))
+
+        assert result.is_err()
+        assert "No approved rate found for coverage 'collision'" in result.unwrap_err()
+
+
+class TestKernelIsPure:
+    """Test the kernel can run anywhere the context can be shipped."""
+
+    def test_synchronous_and_picklable(self) -> None:
+        """Test no kernel function is a coroutine and contexts round-trip."""
+        for name, value in vars(kernel).items():
+            if inspect.isfunction(value) and value.__module__ == kernel.__name__:
+                assert not inspect.iscoroutinefunction(value), name
+
+        context = _context()
+        restored = pickle.loads(pickle.dumps(context))
+        assert (
+            rate_quote(restored).unwrap().total_premium
+            == rate_quote(context).unwrap().total_premium
+        )
+
+    @pytest.mark.slow
+    def test_throughput(self) -> None:
+        """Test thousands of quotes price without an event loop."""
+        context = _context()
+        start = time.perf_counter()
+        for _ in range(2000):
+            rate_quote(context)
+        elapsed = time.perf_counter() - start
+
+        # Business rule validation dominates; well under 1ms per quote
+        assert elapsed < 2.0
@@ -0,0 +1,233 @@
+"""Unit tests for the batch rating worker pool."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from decimal import Decimal
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+# Results handed back to service code must match its Result type
+from policy_core.core.result_types import Err, Ok
+from src.policy_core.models.quote import (
+    CoverageSelection,
+    CoverageType,
+    DriverInfo,
+    QuoteStatus,
+    VehicleInfo,
+)
+from src.policy_core.schemas.rating import CoverageRates
+from src.policy_core.services.quote_service import QuoteService
+from src.policy_core.services.rating import worker_pool
+from src.policy_core.services.rating.fixed_point import MICROCENTS_PER_DOLLAR
+from src.policy_core.services.rating.kernel import (
+    CustomerFacts,
+    RatingContext,
+    rate_quote,
+    rate_table,
+)
+from src.policy_core.services.rating.state_rules import get_state_rule_book
+from src.policy_core.services.rating.worker_pool import RatingJob, RatingWorkerPool
+from src.policy_core.services.rating_engine import PremiumRequest, RatingEngine
+
+
+def _context(age: int = 40, **overrides: Any) -> RatingContext:
+    values: dict[str, Any] = {
+        "state": "TX",
+        "product_type": "auto",
+        "vehicle": VehicleInfo(
+            vin="1HGBH41JXMN109186",
+            year=2020,
+            make="Honda",
+            model="Accord",
+            usage="commute",
+            annual_mileage=12000,
+            garage_zip="75001",
+        ),
+        "drivers": (
+            DriverInfo(
+                first_name="Jane",
+                last_name="Doe",
+                age=age,
+                years_licensed=min(age - 16, 20),
+            ),
+        ),
+        "coverages": (
+            CoverageSelection(
+                coverage_type=CoverageType.BODILY_INJURY,
+                limit=Decimal("100000"),
+                deductible=Decimal("500"),
+            ),
+            CoverageSelection(
+                coverage_type=CoverageType.PROPERTY_DAMAGE,
+                limit=Decimal("50000"),
+                deductible=Decimal("500"),
+            ),
+        ),
+        "rates": rate_table(
+            CoverageRates(
+                bodily_injury=Decimal("5.1234"), property_damage=Decimal("3.3")
+            )
+        ),
+        "state_rules": get_state_rule_book().rules("TX"),
+        "minimum_premium": 100 * MICROCENTS_PER_DOLLAR,
+        "rating_year": date.today().year,
+        "territory_factor": 1.17,
+        "credit_factor": 0.93,
+        "customer": CustomerFacts(active_policies=1, tenure_years=3),
+    }
+    values.update(overrides)
+    return RatingContext(**values)
+
+
+def _pool(**kwargs: Any) -> RatingWorkerPool:
+    return RatingWorkerPool(
+        workers=2, executor=ThreadPoolExecutor(max_workers=4), **kwargs
+    )
+
+
+class TestRatingWorkerPool:
+    """Test chunked, bounded rating on the pool."""
+
+    @pytest.mark.asyncio
+    async def test_results_in_input_order(self) -> None:
+        """Test chunks come back in order and one bad quote fails alone."""
+        contexts = [_context(age) for age in (18, 25, 40, 67, 80)]
+        jobs = [RatingJob(c) for c in contexts]
+        jobs.insert(2, RatingJob(_context(drivers=None)))
+
+        results = await _pool(chunk_size=2, max_chunks=2).rate(jobs)
+
+        assert len(results) == 6
+        assert "Rating calculation error" in results.pop(2).unwrap_err()
+        assert [r.unwrap().total_premium for r in results] == [
+            rate_quote(c).unwrap().total_premium for c in contexts
+        ]
+
+    @pytest.mark.asyncio
+    async def test_backpressure(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test no more than ``max_chunks`` chunks are in flight at once."""
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow_chunk(jobs: list[RatingJob]) -> list[Any]:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+            return [Ok(job.context.state) for job in jobs]
+
+        monkeypatch.setattr(worker_pool, "rate_chunk", slow_chunk)
+        pool = _pool(chunk_size=1, max_chunks=2)
+        # Two batch callers share the bound
+        first, second = await asyncio.gather(
+            pool.rate(RatingJob(_context()) for _ in range(6)),
+            pool.rate(RatingJob(_context(state="CA")) for _ in range(6)),
+        )
+
+        assert peak == 2
+        assert [r.unwrap() for r in first + second] == ["TX"] * 6 + ["CA"] * 6
+
+    @pytest.mark.asyncio
+    async def test_spawned_workers(self) -> None:
+        """Test contexts and results survive the trip to a worker process."""
+        pool = RatingWorkerPool(workers=1, chunk_size=2, max_chunks=1)
+        try:
+            contexts = [_context(age) for age in (22, 45, 70)]
+            results = await pool.rate(RatingJob(c) for c in contexts)
+        finally:
+            pool.shutdown()
+
+        assert [r.unwrap().total_premium for r in results] == [
+            rate_quote(c).unwrap().total_premium for c in contexts
+        ]
+
+
+class TestBatchRating:
+    """Test the engine's batch path matches interactive rating."""
+
+    @pytest.mark.asyncio
+    async def test_batch_matches_calculate_premium(self) -> None:
+        """Test batch results equal one-by-one ratings, in request order."""
+        cache = MagicMock()
+        cache.get = AsyncMock(return_value=None)
+        cache.set = AsyncMock(return_value=True)
+        engine = RatingEngine(MagicMock(), cache)
+        engine._state_rules = get_state_rule_book().compiled()
+        contexts = [_context(age) for age in (19, 35, 72)]
+        engine._load_context = AsyncMock(side_effect=[Ok(c) for c in contexts * 2])
+
+        requests = [
+            PremiumRequest(
+                state=c.state,
+                product_type=c.product_type,
+                vehicle_info=c.vehicle,
+                drivers=list(c.drivers),
+                coverage_selections=list(c.coverages),
+            )
+            for c in contexts
+        ]
+        invalid = requests[0].model_copy(update={"drivers": []})
+
+        batch = await engine.calculate_premium_batch(
+            [requests[0], invalid, *requests[1:]], pool=_pool(chunk_size=2)
+        )
+        single = [
+            await engine.calculate_premium(
+                state=r.state,
+                product_type=r.product_type,
+                vehicle_info=r.vehicle_info,
+                drivers=r.drivers,
+                coverage_selections=r.coverage_selections,
+            )
+            for r in requests
+        ]
+
+        assert batch.pop(1).is_err()
+        for batched, inline in zip(batch, single, strict=True):
+            assert batched.unwrap().total_premium == inline.unwrap().total_premium
+            assert batched.unwrap().breakdown == inline.unwrap().breakdown.model_copy(
+                update={"rated_at": batched.unwrap().breakdown.rated_at}
+            )
+
+    @pytest.mark.asyncio
+    async def test_recalculate_quotes(self) -> None:
+        """Test the service rates a batch at once and keeps results in order."""
+        context = _context()
+        quote = MagicMock(
+            state=context.state,
+            product_type=context.product_type,
+            vehicle_info=context.vehicle,
+            drivers=list(context.drivers),
+            coverage_selections=list(context.coverages),
+            customer_id=None,
+        )
+        engine = MagicMock(_initialized=True)
+        engine.calculate_premium_batch = AsyncMock(
+            return_value=[Ok("rated"), Err("rates unavailable")]
+        )
+        service = QuoteService(MagicMock(), MagicMock(), rating_engine=engine)
+        service.get_quote = AsyncMock(side_effect=[Ok(quote), Ok(None), Ok(quote)])
+        service._get_rating_breakdown = AsyncMock(return_value=None)
+        service._update_quote_status = AsyncMock()
+        service._apply_rating = AsyncMock(return_value=Ok(quote))
+
+        ids = [uuid4(), uuid4(), uuid4()]
+        rated, missing, failed = await service.recalculate_quotes(ids)
+
+        (requests,) = engine.calculate_premium_batch.await_args.args
+        assert len(requests) == 2
+        assert rated.unwrap() is quote
+        assert missing.unwrap_err() == "Quote not found"
+        assert failed.unwrap_err() == "rates unavailable"
+        service._apply_rating.assert_awaited_once_with(ids[0], "rated")
+        service._update_quote_status.assert_awaited_with(ids[2], QuoteStatus.DRAFT)
@@ -0,0 +1,204 @@
+"""Unit tests for concurrent, short-circuiting MFA risk assessment."""
+
+import asyncio
+import time
+from typing import Any
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.policy_core.core.auth.mfa import risk_engine as risk_engine_module
+from src.policy_core.core.auth.mfa.ip_intel import IPIntel
+from src.policy_core.core.auth.mfa.models import RiskLevel
+from src.policy_core.core.auth.mfa.risk_engine import RiskEngine, UserSignalCache
+from src.policy_core.core.config import get_settings
+
+
+class SlowCache:
+    """In-memory cache whose reads and writes each take ``delay`` seconds."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.data: dict[str, Any] = {}
+        self.reads: list[str] = []
+
+    async def get(self, key: str) -> Any:
+        self.reads.append(key)
+        await asyncio.sleep(self.delay)
+        return self.data.get(key)
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        await asyncio.sleep(self.delay)
+        self.data[key] = value
+
+
+class StubDB:
+    """Database stand-in; the risk engine never queries it directly."""
+
+    async def fetchrow(self, query: str, *args: Any) -> None:
+        return None
+
+    async def execute(self, query: str, *args: Any) -> None:
+        return None
+
+
+@pytest.fixture
+def signal_cache(monkeypatch: pytest.MonkeyPatch) -> UserSignalCache:
+    """Give each test its own user signal cache."""
+    cache = UserSignalCache()
+    monkeypatch.setattr(risk_engine_module, "_user_signal_cache", cache)
+    return cache
+
+
+def _engine(cache: SlowCache) -> RiskEngine:
+    engine = RiskEngine(StubDB(), cache, get_settings())  # type: ignore[arg-type]
+    # Locate every address, so the location signal does its cache I/O
+    engine._ip_intel = MagicMock()
+    engine._ip_intel.lookup.return_value = IPIntel(
+        country="US", city="Austin", latitude=30.267, longitude=-97.743
+    )
+    return engine
+
+
+class TestParallelAssessment:
+    """Test signals run concurrently under per-signal timeouts."""
+
+    @pytest.mark.asyncio
+    async def test_signals_overlap(self, signal_cache: UserSignalCache) -> None:
+        """Test total latency tracks the slowest signal, not the sum."""
+        cache = SlowCache(delay=0.02)
+        engine = _engine(cache)
+        engine._signal_timeout = 1.0
+
+        started = time.perf_counter()
+        result = await engine.assess_risk(
+            str(uuid4()), "192.168.1.1", "Mozilla/5.0", "device-1"
+        )
+        elapsed = time.perf_counter() - started
+
+        assert result.is_ok()
+        # Device and location each read then write; everything else reads once
+        assert len(cache.reads) >= 4
+        assert elapsed < 0.02 * len(cache.reads)
+
+    @pytest.mark.asyncio
+    async def test_slow_signal_counts_as_failed(
+        self, signal_cache: UserSignalCache
+    ) -> None:
+        """Test a signal over budget contributes its error factor."""
+        engine = _engine(SlowCache(delay=0.05))
+        engine._signal_timeout = 0.01
+
+        started = time.perf_counter()
+        assessment = (
+            await engine.assess_risk(str(uuid4()), "192.168.1.1", "Mozilla/5.0", "d")
+        ).unwrap()
+
+        assert time.perf_counter() - started < 0.05
+        # location_check_error folds into the location category
+        assert assessment.factors.location_risk == 0.4
+
+    @pytest.mark.asyncio
+    async def test_known_device_under_ten_milliseconds(
+        self, signal_cache: UserSignalCache
+    ) -> None:
+        """Test a warm, known-device login stays well inside the budget."""
+        user_id = str(uuid4())
+        cache = SlowCache()
+        engine = _engine(cache)
+        await engine.assess_risk(user_id, "192.168.1.1", "Mozilla/5.0", "device-1")
+
+        started = time.perf_counter()
+        result = await engine.assess_risk(
+            user_id, "192.168.1.1", "Mozilla/5.0", "device-1"
+        )
+
+        assert result.is_ok()
+        assert time.perf_counter() - started < 0.01
+
+
+class TestShortCircuit:
+    """Test definitive signals end the assessment early."""
+
+    @pytest.mark.asyncio
+    async def test_tor_skips_io_signals(
+        self, signal_cache: UserSignalCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a Tor exit node is critical without touching the cache."""
+        cache = SlowCache()
+        engine = _engine(cache)
+        monkeypatch.setattr(engine, "_is_tor_exit_node", lambda ip: True)
+
+        assessment = (
+            await engine.assess_risk(str(uuid4()), "8.8.8.8", "Mozilla/5.0", "d")
+        ).unwrap()
+
+        assert assessment.risk_level == RiskLevel.CRITICAL
+        assert cache.reads == []
+
+    @pytest.mark.asyncio
+    async def test_lockout_cancels_pending_signals(
+        self, signal_cache: UserSignalCache
+    ) -> None:
+        """Test maxed-out failed attempts end evaluation immediately."""
+        user_id = str(uuid4())
+        cache = SlowCache()
+        cache.data[f"failed_attempts:{user_id}"] = 5
+        engine = _engine(cache)
+
+        async def stalled(*args: Any) -> dict[str, float]:
+            await asyncio.sleep(10)
+            return {}
+
+        engine._assess_location_risk = stalled  # type: ignore[method-assign]
+        engine._signal_timeout = 10.0
+
+        started = time.perf_counter()
+        assessment = (
+            await engine.assess_risk(user_id, "192.168.1.1", "Mozilla/5.0", "d")
+        ).unwrap()
+
+        assert time.perf_counter() - started < 1.0
+        assert assessment.risk_level == RiskLevel.CRITICAL
+        assert assessment.risk_score >= 0.9
+
+
+class TestUserSignalCache:
+    """Test slow-changing per-user signals are cached."""
+
+    @pytest.mark.asyncio
+    async def test_signals_loaded_once(
+        self, signal_cache: UserSignalCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test account age, MFA status and login hours are read once."""
+        user_id = str(uuid4())
+        cache = SlowCache()
+        engine = _engine(cache)
+        calls: list[str] = []
+
+        async def account_age(uid: str) -> int:
+            calls.append("age")
+            return 90
+
+        monkeypatch.setattr(engine, "_get_account_age", account_age)
+
+        for _ in range(3):
+            await engine.assess_risk(user_id, "192.168.1.1", "Mozilla/5.0", "d")
+
+        assert calls == ["age"]
+        assert cache.reads.count(f"login_pattern:{user_id}") == 1
+
+        engine.invalidate_user_signals(user_id)
+        await engine.assess_risk(user_id, "192.168.1.1", "Mozilla/5.0", "d")
+
+        assert calls == ["age", "age"]
+
+    def test_none_is_cached_and_entries_expire(self) -> None:
+        """Test misses are cached too and honour the TTL."""
+        cache = UserSignalCache()
+        cache.put("typical_hours", "u", None, ttl=60)
+        cache.put("account_age", "u", 90, ttl=0)
+
+        assert cache.get("typical_hours", "u") is None
+        assert cache.get("account_age", "u") is risk_engine_module._MISSING
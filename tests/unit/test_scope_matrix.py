@@ -0,0 +1,96 @@
+"""Unit tests for the compiled OAuth2 scope matrix."""
+
+import itertools
+import timeit
+
+from src.policy_core.api.middleware.oauth2_middleware import required_scope_for
+from src.policy_core.core.auth.oauth2.scopes import (
+    SCOPES,
+    ScopeValidator,
+    parse_scope_string,
+    scope_bit,
+)
+
+
+def _reference_expand(scopes: list[str]) -> set[str]:
+    """Recursive expansion the compiled closure replaced."""
+    expanded: set[str] = set()
+
+    def visit(name: str) -> None:
+        if name in expanded:
+            return
+        expanded.add(name)
+        scope = SCOPES.get(name)
+        for included in scope.includes if scope else []:
+            visit(included)
+
+    for name in scopes:
+        visit(name)
+    return expanded
+
+
+class TestScopeMatrix:
+    """Test bitmask checks agree with recursive expansion."""
+
+    def test_every_pair_matches_reference(self) -> None:
+        """Test each granted/required pair over all defined scopes."""
+        names = list(SCOPES)
+        for granted, required in itertools.product(names, names):
+            assert ScopeValidator.check_scope_permission([granted], required) == (
+                required in _reference_expand([granted])
+            )
+
+    def test_transitive_includes(self) -> None:
+        """Test quote:convert reaches policy:read through policy:write."""
+        assert ScopeValidator.expand_scopes(["quote:convert"]) == {
+            "quote:convert",
+            "quote:read",
+            "policy:write",
+            "policy:read",
+        }
+
+    def test_unknown_scopes_only_match_themselves(self) -> None:
+        """Test names outside SCOPES behave as before."""
+        assert ScopeValidator.check_scope_permission(["partner:x"], "partner:x")
+        assert not ScopeValidator.check_scope_permission(["partner:x"], "quote:read")
+        assert not ScopeValidator.check_scope_permission(["quote:read"], "partner:y")
+
+    def test_scope_string_memoized(self) -> None:
+        """Test the claim string is parsed once and reused."""
+        names, mask = parse_scope_string("claim:approve user:read")
+
+        assert names == ("claim:approve", "user:read")
+        assert mask & scope_bit("claim:read")
+        assert parse_scope_string("claim:approve user:read")[1] is mask
+
+    def test_check_is_sub_microsecond(self) -> None:
+        """Test a memoized token check stays under a microsecond."""
+        claim = "quote:write policy:read"
+        parse_scope_string(claim)
+
+        per_call = min(
+            timeit.repeat(
+                lambda: parse_scope_string(claim)[1] & scope_bit("quote:read"),
+                number=10000,
+                repeat=5,
+            )
+        )
+
+        assert per_call / 10000 < 1e-6
+
+
+class TestRouteScopes:
+    """Test the compiled route-to-scope table."""
+
+    def test_matches_previous_mapping(self) -> None:
+        """Test representative paths and methods."""
+        assert required_scope_for("/api/v1/quotes/123", "GET") == "quote:read"
+        assert required_scope_for("/api/v1/quotes", "DELETE") == "quote:write"
+        assert required_scope_for("/api/v1/policies/9", "DELETE") == "policy:cancel"
+        assert required_scope_for("/api/v1/claims/1/approve", "POST") == "claim:write"
+        assert required_scope_for("/api/v1/claims/1/approve", "DELETE") == (
+            "claim:approve"
+        )
+        assert required_scope_for("/api/v1/admin/users", "GET") == "admin:clients"
+        assert required_scope_for("/api/v1/health", "GET") is None
+        assert required_scope_for("/docs", "GET") is None
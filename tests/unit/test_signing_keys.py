@@ -0,0 +1,129 @@
+"""Unit tests for asymmetric JWT signing keys and JWKS."""
+
+import os
+import time
+from pathlib import Path
+
+import jwt
+import pytest
+
+from src.policy_core.core.auth.oauth2 import signing_keys
+from src.policy_core.core.auth.oauth2.signing_keys import (
+    SigningKeyRing,
+    generate_signing_key,
+)
+from src.policy_core.core.auth.oauth2.token_verifier import TokenVerifier
+
+
+def _claims() -> dict:
+    now = int(time.time())
+    return {"sub": "user-1", "jti": "j1", "iat": now, "exp": now + 300}
+
+
+def _age(path: Path, seconds: float) -> None:
+    """Backdate ``path`` as if it was written ``seconds`` ago."""
+    written = time.time() - seconds
+    os.utime(path, (written, written))
+
+
+class TestSigningKeyRing:
+    """Test signing, rotation and JWKS publication."""
+
+    def test_eddsa_round_trip_with_kid(self, tmp_path: Path) -> None:
+        """Test tokens carry the active kid and verify against it."""
+        kid = generate_signing_key(tmp_path, "EdDSA").unwrap()
+        ring = SigningKeyRing(str(tmp_path))
+
+        token = ring.sign(_claims())
+
+        assert jwt.get_unverified_header(token) == {
+            "alg": "EdDSA",
+            "kid": kid,
+            "typ": "JWT",
+        }
+        assert ring.decode(token)["sub"] == "user-1"
+
+    def test_verify_only_node_uses_jwks(self, tmp_path: Path) -> None:
+        """Test another node validates tokens from the published key set."""
+        generate_signing_key(tmp_path, "ES256")
+        issuer = SigningKeyRing(str(tmp_path))
+        token = issuer.sign(_claims())
+
+        verifier = SigningKeyRing()
+        assert verifier.add_jwks(issuer.jwks()).unwrap() == 1
+
+        (key,) = issuer.jwks()["keys"]
+        assert key["kty"] == "EC" and "d" not in key
+        assert verifier.decode(token)["jti"] == "j1"
+
+    def test_rotation_keeps_old_tokens_valid(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a new key signs once published for the JWKS max-age."""
+        first = generate_signing_key(tmp_path, "EdDSA").unwrap()
+        ring = SigningKeyRing(str(tmp_path), reload_seconds=3600)
+        old_token = ring.sign(_claims())
+
+        _age(tmp_path / f"{first}.pem", 600)
+
+        second = generate_signing_key(tmp_path, "ES256").unwrap()
+        assert ring.reload_if_changed().unwrap() is True
+
+        # Published at once, but cached key sets may not have it yet
+        assert len(ring.jwks()["keys"]) == 2
+        assert ring.active_kid == first
+
+        later = time.time() + 301
+        monkeypatch.setattr(signing_keys.time, "time", lambda: later)
+        assert ring.reload_if_changed().unwrap() is False
+
+        assert ring.active_kid == second
+        assert jwt.get_unverified_header(ring.sign(_claims()))["kid"] == second
+        assert ring.decode(old_token)["sub"] == "user-1"
+
+    def test_unknown_kid_rejected(self, tmp_path: Path) -> None:
+        """Test a token from a key this ring never saw is refused."""
+        other = tmp_path / "other"
+        generate_signing_key(other, "EdDSA")
+        token = SigningKeyRing(str(other)).sign(_claims())
+        generate_signing_key(tmp_path / "mine", "EdDSA")
+
+        with pytest.raises(jwt.InvalidTokenError):
+            SigningKeyRing(str(tmp_path / "mine")).decode(token)
+
+    def test_symmetric_fallback(self) -> None:
+        """Test the shared secret still signs when no keys are configured."""
+        ring = SigningKeyRing()
+        token = ring.sign(_claims())
+
+        assert "kid" not in jwt.get_unverified_header(token)
+        assert ring.decode(token)["sub"] == "user-1"
+        assert ring.jwks() == {"keys": []}
+
+        ring._allow_symmetric = False
+        with pytest.raises(jwt.InvalidTokenError):
+            ring.decode(token)
+
+
+class TestVerificationFastPath:
+    """Test signature checks are memoized per token."""
+
+    def test_signature_checked_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test repeat verification of one token skips the signature check."""
+        generate_signing_key(tmp_path, "EdDSA")
+        ring = SigningKeyRing(str(tmp_path))
+        monkeypatch.setattr(signing_keys, "_signing_key_ring", ring)
+        token = ring.sign(_claims())
+        calls: list[str] = []
+        decode = ring.decode
+        monkeypatch.setattr(
+            ring, "decode", lambda t, **kw: calls.append(t) or decode(t, **kw)
+        )
+
+        verifier = TokenVerifier(max_entries=100)
+        for _ in range(5):
+            assert verifier.verify(token).unwrap()["sub"] == "user-1"
+
+        assert len(calls) == 1
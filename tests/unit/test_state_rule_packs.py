@@ -0,0 +1,130 @@
+"""Unit tests for table-driven state rating rules."""
+
+import json
+import pickle
+from decimal import Decimal
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pydantic import ValidationError
+
+from src.policy_core.models.quote import CoverageSelection, CoverageType
+from src.policy_core.services.rating import state_rules
+from src.policy_core.services.rating.state_rules import (
+    CompiledStateRules,
+    get_state_rule_book,
+    get_state_rules,
+    reload_state_rule_book,
+    validate_coverage_limits,
+)
+from src.policy_core.services.rating_engine import RatingEngine
+
+
+@pytest.fixture
+def bundled_rules(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Start each test from the bundled rules file."""
+    monkeypatch.setattr(state_rules, "_state_rule_book", None)
+
+
+class TestCompiledRules:
+    """Test rule packs adjust factors in one pass."""
+
+    def test_california_prop_103(self, bundled_rules: None) -> None:
+        """Test prohibited factors drop and secondary factors are pulled in."""
+        ca = get_state_rule_book().rules("CA")
+        adjusted = ca.apply(
+            {"credit": 0.7, "violations": 1.3, "territory": 1.5, "vehicle_age": 1.0}
+        )
+
+        assert "credit" not in adjusted
+        assert adjusted["violations"] == 1.3
+        # Secondary product 1.5 scaled back to the 1.2 band edge
+        assert adjusted["territory"] * adjusted["vehicle_age"] == pytest.approx(1.2)
+        assert not ca.is_factor_allowed("Credit_Score")
+
+    def test_caps_and_derived_factors(self, bundled_rules: None) -> None:
+        """Test Florida's coastal loading and credit caps from data."""
+        fl = get_state_rule_book().rules("FL")
+        assert fl.apply({"territory": 1.6, "credit": 0.5}) == {
+            "territory": 1.6,
+            "credit": 0.6,
+            "catastrophe_risk": 1.1,
+        }
+        assert fl.apply({"territory": 1.3})["catastrophe_risk"] == 1.05
+        assert "catastrophe_risk" not in fl.apply({"territory": 1.0})
+
+        tx = get_state_rule_book().rules("TX")
+        assert tx.apply({"credit": 1.6}) == {"credit": 1.6}
+
+    def test_compiled_rules_pickle(self, bundled_rules: None) -> None:
+        """Test compiled rules can be shipped to worker processes."""
+        ny = get_state_rule_book().rules("NY")
+        restored = pickle.loads(pickle.dumps(ny))
+
+        assert restored.apply({"credit": 1.5}) == {"credit": 1.25}
+        assert restored.required_coverages == ny.required_coverages
+
+
+class TestRuleData:
+    """Test states are added and changed through data alone."""
+
+    def test_new_state_from_data(self, tmp_path: Path, bundled_rules: None) -> None:
+        """Test a state added to the file is supported everywhere."""
+        assert get_state_rules("OR").is_err()
+
+        path = tmp_path / "rules.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "version": "test.1",
+                    "states": {
+                        "OR": {
+                            "required_coverages": ["bodily_injury"],
+                            "minimum_limits": {"bodily_injury_per_person": "25000"},
+                            "prohibited_factors": ["credit"],
+                        }
+                    },
+                }
+            )
+        )
+        reload_state_rule_book(path)
+
+        assert get_state_rules("OR").unwrap().apply({"credit": 0.9}) == {}
+        low_limit = CoverageSelection(
+            coverage_type=CoverageType.BODILY_INJURY,
+            limit=Decimal("20000"),
+            deductible=Decimal("0"),
+        )
+        assert "below state OR minimum" in (
+            validate_coverage_limits("OR", [low_limit]).unwrap_err()
+        )
+
+        path.write_text(json.dumps({"version": "bad", "states": {"Oregon": {}}}))
+        with pytest.raises(ValidationError):
+            reload_state_rule_book(path)
+        assert get_state_rule_book().version == "test.1"
+
+    @pytest.mark.asyncio
+    async def test_database_packs_override_bundled(self, bundled_rules: None) -> None:
+        """Test the engine compiles database rule packs over the bundled ones."""
+        db = MagicMock()
+        db.fetch = AsyncMock(
+            return_value=[
+                {
+                    "state": "TX",
+                    "rules_data": json.dumps({"prohibited_factors": ["credit"]}),
+                }
+            ]
+        )
+        engine = RatingEngine(db, MagicMock())
+
+        assert (await engine._load_state_rules()).is_ok()
+        assert isinstance(engine._state_rules["TX"], CompiledStateRules)
+        assert not engine._state_rules["TX"].is_factor_allowed("credit")
+        assert engine._state_rules["CA"] is get_state_rule_book().rules("CA")
+
+        db.fetch = AsyncMock(
+            return_value=[{"state": "TX", "rules_data": json.dumps({"caps": {}})}]
+        )
+        assert (await engine._load_state_rules()).is_err()
@@ -0,0 +1,167 @@
+"""Unit tests for local JWT verification and revocation."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import jwt
+import pytest
+from redis.asyncio import Redis
+
+from src.policy_core.core.auth.oauth2.token_verifier import (
+    REVOCATION_CHANNEL,
+    REVOCATION_INDEX_KEY,
+    BloomFilter,
+    TokenVerifier,
+)
+from src.policy_core.core.security import verify_jwt_token
+
+
+def _token(exp_offset: int = 300, jti: str = "jti-1") -> str:
+    # Sign with the same settings object the verifier reads
+    settings = TokenVerifier(max_entries=100)._settings
+    now = int(time.time())
+    return jwt.encode(
+        {
+            "sub": "user-1",
+            "iat": now,
+            "exp": now + exp_offset,
+            "jti": jti,
+            "scope": "quote:read policy:read",
+        },
+        settings.jwt_secret,
+        algorithm=settings.jwt_algorithm,
+    )
+
+
+class _PubSub:
+    """Pub/sub stub delivering queued messages."""
+
+    def __init__(self, messages: asyncio.Queue) -> None:
+        self.messages = messages
+        self.subscribe = AsyncMock()
+        self.close = AsyncMock()
+
+    async def listen(self):  # type: ignore[no-untyped-def]
+        while True:
+            yield await self.messages.get()
+
+
+class TestTokenVerifier:
+    """Test the verified-claims cache."""
+
+    def test_token_decoded_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test repeated verification is served from the LRU."""
+        verifier = TokenVerifier(max_entries=100)
+        token = _token()
+        decode = MagicMock(wraps=jwt.decode)
+        monkeypatch.setattr(jwt, "decode", decode)
+
+        for _ in range(5):
+            assert verifier.verify(token).unwrap()["sub"] == "user-1"
+
+        assert decode.call_count == 1
+        assert verifier.stats().cache_hits == 4
+
+    def test_cached_entry_expires_with_token(self) -> None:
+        """Test a cached token is rejected once its exp passes."""
+        verifier = TokenVerifier(max_entries=100)
+        token = _token()
+        verifier.verify(token)
+        key, (claims, _) = next(iter(verifier._claims.items()))
+        verifier._claims[key] = (claims, time.time() - 1)
+
+        assert verifier.verify(token).unwrap_err() == "Token has expired"
+
+    def test_rejects_bad_tokens(self) -> None:
+        """Test expired and malformed tokens keep the middleware messages."""
+        verifier = TokenVerifier(max_entries=100)
+
+        assert verifier.verify(_token(-10)).unwrap_err() == "Token has expired"
+        assert verifier.verify("not-a-jwt").unwrap_err() == "Invalid token"
+
+    def test_lru_is_bounded(self) -> None:
+        """Test the least recently used token is evicted first."""
+        verifier = TokenVerifier(max_entries=100)
+        tokens = [_token(jti=f"jti-{i}") for i in range(101)]
+        for token in tokens:
+            verifier.verify(token)
+
+        assert verifier.stats().cached_tokens == 100
+
+    @pytest.mark.asyncio
+    async def test_dependency_reuses_middleware_claims(self) -> None:
+        """Test verify_jwt_token maps provided claims without decoding."""
+        claims = jwt.decode(_token(), options={"verify_signature": False})
+
+        payload = await verify_jwt_token("ignored", "ignored", claims=claims)
+
+        assert payload.sub == "user-1"
+        assert payload.scopes == ["quote:read", "policy:read"]
+
+
+class TestRevocation:
+    """Test the bloom-filtered revocation set and its pub/sub sync."""
+
+    def test_bloom_filter_has_no_false_negatives(self) -> None:
+        """Test every added key is reported present."""
+        bloom = BloomFilter(1 << 12)
+        keys = [f"jti-{i}" for i in range(200)]
+        for key in keys:
+            bloom.add(key)
+
+        assert all(key in bloom for key in keys)
+        assert sum(f"other-{i}" in bloom for i in range(1000)) < 50
+
+    def test_revoked_token_rejected_from_cache(self) -> None:
+        """Test revocation applies to tokens already in the LRU."""
+        verifier = TokenVerifier(max_entries=100)
+        token = _token()
+        assert verifier.verify(token).is_ok()
+
+        verifier.mark_revoked("jti-1", time.time() + 300)
+
+        assert verifier.verify(token).unwrap_err() == "Token has been revoked"
+        assert verifier.verify(_token(jti="jti-2")).is_ok()
+
+    @pytest.mark.asyncio
+    async def test_sync_loads_snapshot_then_applies_messages(self) -> None:
+        """Test workers pick up existing and newly published revocations."""
+        messages: asyncio.Queue = asyncio.Queue()
+        pubsub = _PubSub(messages)
+        redis = MagicMock(spec=Redis)
+        redis.pubsub.return_value = pubsub
+        redis.zrangebyscore = AsyncMock(return_value=[("jti-old", time.time() + 60)])
+        verifier = TokenVerifier(max_entries=100)
+
+        await verifier.start(redis)
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert verifier.revocations_synced
+        assert verifier.is_revoked("jti-old")
+        pubsub.subscribe.assert_awaited_once_with(REVOCATION_CHANNEL)
+        assert redis.zrangebyscore.await_args.args[0] == REVOCATION_INDEX_KEY
+
+        await messages.put({"type": "message", "data": f"jti-new {time.time() + 60}"})
+        await asyncio.sleep(0)
+
+        assert verifier.is_revoked("jti-new")
+        await verifier.stop()
+        assert not verifier.revocations_synced
+
+    @pytest.mark.asyncio
+    async def test_publish_records_and_broadcasts(self) -> None:
+        """Test revocations go to the sorted set and the channel."""
+        redis = MagicMock(spec=Redis)
+        redis.zadd = AsyncMock()
+        redis.zremrangebyscore = AsyncMock()
+        redis.publish = AsyncMock()
+        verifier = TokenVerifier(max_entries=100)
+        exp = int(time.time()) + 300
+
+        await verifier.publish_revocation(redis, "jti-9", exp)
+
+        redis.zadd.assert_awaited_once_with(REVOCATION_INDEX_KEY, {"jti-9": exp})
+        redis.publish.assert_awaited_once_with(REVOCATION_CHANNEL, f"jti-9 {exp}")
+        assert verifier.is_revoked("jti-9")
@@ -0,0 +1,212 @@
+"""Unit tests for compiled SSO provisioning rules and group sync."""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from fakeredis import aioredis
+
+from src.policy_core.core.auth import sso_manager as sso_manager_module
+from src.policy_core.core.auth.sso_base import SSOUserInfo
+from src.policy_core.core.auth.sso_manager import SSOManager, SSOProviderConfig
+from src.policy_core.core.cache import Cache
+from src.policy_core.core.database import Database
+from src.policy_core.services import user_provisioning
+from src.policy_core.services.user_provisioning import (
+    ProvisioningActions,
+    ProvisioningConditions,
+    ProvisioningCustomFields,
+    UserProvisioningService,
+    compile_conditions,
+)
+
+PROVIDER_ID = uuid4()
+
+
+@pytest.fixture
+def cache() -> Cache:
+    """Cache backed by an in-memory Redis."""
+    return Cache(aioredis.FakeRedis(decode_responses=True))
+
+
+@pytest.fixture(autouse=True)
+def compiled_rule_sets(monkeypatch: pytest.MonkeyPatch) -> dict:
+    """Start every test with no compiled rules."""
+    fresh: dict = {}
+    monkeypatch.setattr(user_provisioning, "_compiled_rule_sets", fresh)
+    return fresh
+
+
+def _user(**overrides: object) -> SSOUserInfo:
+    data = {
+        "sub": "u-1",
+        "email": "jane@example.com",
+        "email_verified": True,
+        "provider": "google",
+        "provider_user_id": "u-1",
+        "groups": ["engineering", "staff"],
+    }
+    data.update(overrides)
+    return SSOUserInfo(**data)
+
+
+def _rule_row(name: str, priority: int, conditions: dict, actions: dict) -> dict:
+    return {
+        "id": uuid4(),
+        "provider_id": PROVIDER_ID,
+        "rule_name": name,
+        "conditions": conditions,
+        "actions": actions,
+        "priority": priority,
+        "is_enabled": True,
+    }
+
+
+class TestCompileConditions:
+    """Test compiled predicates match the documented condition semantics."""
+
+    def test_all_conditions_must_hold(self) -> None:
+        """Test each condition kind narrows the match."""
+        matches = compile_conditions(
+            ProvisioningConditions(
+                email_domains=["example.com"],
+                email_patterns=[r"^jane@"],
+                required_groups=["engineering"],
+                excluded_groups=["contractors"],
+                providers=["google"],
+                email_verified=True,
+            )
+        )
+
+        assert matches(_user(), "google")
+        assert not matches(_user(), "okta")
+        assert not matches(_user(email="jane@other.com"), "google")
+        assert not matches(_user(groups=["engineering", "contractors"]), "google")
+        assert not matches(_user(email_verified=False), "google")
+
+    def test_unreadable_custom_fields_fail_closed(self) -> None:
+        """Test claims that cannot be read as a mapping never match."""
+        matches = compile_conditions(
+            ProvisioningConditions(
+                custom_fields=ProvisioningCustomFields(department="claims")
+            )
+        )
+        assert not matches(_user(), "google")
+
+    def test_empty_conditions_match_everyone(self) -> None:
+        """Test a rule without conditions always applies."""
+        assert compile_conditions(ProvisioningConditions())(_user(), "any")
+
+    def test_invalid_pattern_never_matches(self) -> None:
+        """Test a broken regex fails closed instead of raising."""
+        matches = compile_conditions(ProvisioningConditions(email_patterns=["("]))
+        assert not matches(_user(), "google")
+
+
+class TestCompiledRuleCache:
+    """Test evaluate_provisioning reuses compiled rules per provider version."""
+
+    @pytest.mark.asyncio
+    async def test_rules_compiled_once_until_changed(self, cache: Cache) -> None:
+        """Test logins reuse compiled rules and a rule change recompiles."""
+        db = MagicMock(spec=Database)
+        db.fetch = AsyncMock(
+            return_value=[
+                _rule_row("default", 1, {}, {"groups": ["all-staff"]}),
+                _rule_row(
+                    "engineers",
+                    10,
+                    {"required_groups": ["engineering"]},
+                    {"role": "underwriter", "terminal": True},
+                ),
+            ]
+        )
+        db.fetchval = AsyncMock(return_value=None)
+        db.execute = AsyncMock(return_value="INSERT 0 1")
+        service = UserProvisioningService(db, cache)
+
+        for _ in range(5):
+            result = await service.evaluate_provisioning(_user(), "google", PROVIDER_ID)
+            outcome = result.unwrap()
+            assert outcome.applied_rules == ["engineers"]
+            assert outcome.role_assigned == "underwriter"
+        assert db.fetch.await_count == 1
+
+        created = await service.create_provisioning_rule(
+            PROVIDER_ID, "extra", ProvisioningConditions(), ProvisioningActions()
+        )
+        assert created.is_ok()
+
+        await service.evaluate_provisioning(_user(), "google", PROVIDER_ID)
+        assert db.fetch.await_count == 2
+
+
+class TestGroupSync:
+    """Test SSOManager reconciles groups in one statement."""
+
+    def _manager(self, db: MagicMock, cache: Cache) -> SSOManager:
+        manager = SSOManager(db, cache)
+        manager._providers["google"] = MagicMock()
+        manager._provider_configs["google"] = SSOProviderConfig(
+            provider_type="google",
+            provider_id=str(PROVIDER_ID),
+            client_id="client",
+            client_secret="secret",
+            redirect_uri="https://app.example.com/callback",
+        )
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_existing_user_login_round_trips(self, cache: Cache) -> None:
+        """Test a returning user costs a lookup, an upsert and one group sync."""
+        user_id = uuid4()
+        db = MagicMock(spec=Database)
+        db.transaction = MagicMock()
+        db.fetchrow = AsyncMock(
+            side_effect=[
+                {"id": user_id},
+                {
+                    "id": user_id,
+                    "email": "jane@example.com",
+                    "first_name": "Jane",
+                    "last_name": "Doe",
+                    "role": "agent",
+                    "is_active": True,
+                },
+            ]
+        )
+        db.fetchval = AsyncMock(return_value=["underwriter", "agent"])
+        db.execute = AsyncMock(return_value="UPDATE 1")
+        manager = self._manager(db, cache)
+
+        result = await manager.create_or_update_user(_user(), "google")
+
+        user = result.unwrap()
+        assert user.id == user_id and user.role == "underwriter"
+        assert db.fetchrow.await_count == 2
+        sync_args = db.fetchval.await_args.args
+        assert sync_args[1:] == (user_id, PROVIDER_ID, ["engineering", "staff"])
+        # Role write plus the auth log; no per-group statements
+        assert db.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_unchanged_role_is_not_rewritten(self, cache: Cache) -> None:
+        """Test a role already matching the mapped role skips the update."""
+        user_id = uuid4()
+        db = MagicMock(spec=Database)
+        db.fetchval = AsyncMock(return_value=["agent"])
+        db.execute = AsyncMock(return_value="UPDATE 1")
+        manager = self._manager(db, cache)
+        user = sso_manager_module.User(
+            id=user_id,
+            email="jane@example.com",
+            first_name="Jane",
+            last_name="Doe",
+            role="agent",
+        )
+
+        synced = await manager._sync_user_groups(user, "google", ["staff"] * 50)
+
+        assert synced == user
+        assert db.fetchval.await_args.args[3] == ["staff"]
+        db.execute.assert_not_awaited()